@@ -0,0 +1,32 @@
+"""Add partial index for active-subscription lookups by user.
+
+get_active_subscription and the per-user active lists filter
+vbwd_subscription on user_id and status ACTIVE/TRIALING and order by
+created_at. A partial index over just the live rows keeps those lookups
+to a short index range regardless of how much history a user has.
+
+Revision ID: 20261017_1000
+Revises: 20260422_1200
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_1000"
+down_revision = "20260422_1200"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_vbwd_subscription_user_active",
+        "vbwd_subscription",
+        ["user_id", "created_at"],
+        postgresql_where=sa.text("status IN ('ACTIVE', 'TRIALING')"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_vbwd_subscription_user_active", table_name="vbwd_subscription")
@@ -0,0 +1,33 @@
+"""Add composite index for per-user token transaction history.
+
+The transaction history endpoint filters vbwd_token_transaction on user_id
+and orders by (created_at, id) descending, paging by offset or by a
+(created_at, id) keyset cursor. An index on all three columns serves both
+without sorting the user's whole history.
+
+Revision ID: 20261017_1100
+Revises: 20261017_1000
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "20261017_1100"
+down_revision = "20261017_1000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_vbwd_token_transaction_user_created",
+        "vbwd_token_transaction",
+        ["user_id", "created_at", "id"],
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_vbwd_token_transaction_user_created",
+        table_name="vbwd_token_transaction",
+    )
@@ -0,0 +1,32 @@
+"""Add composite index for pending and overdue invoice lookups.
+
+find_pending filters vbwd_user_invoice on status, and find_overdue also
+filters and orders by expires_at. An index on (status, expires_at) serves
+both without scanning every invoice in that status.
+
+Revision ID: 20261017_1200
+Revises: 20261017_1100
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "20261017_1200"
+down_revision = "20261017_1100"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_vbwd_user_invoice_status_expires",
+        "vbwd_user_invoice",
+        ["status", "expires_at"],
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_vbwd_user_invoice_status_expires",
+        table_name="vbwd_user_invoice",
+    )
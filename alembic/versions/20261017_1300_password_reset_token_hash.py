@@ -0,0 +1,65 @@
+"""Store password reset tokens as SHA-256 digests.
+
+vbwd_password_reset_token.token held the plaintext token mailed to the
+user. It is replaced by token_hash, a 32-byte SHA-256 digest, so a
+database read no longer yields usable reset links and the unique index
+covers a fixed-width key. Outstanding tokens are carried over by hashing
+them in place.
+
+Revision ID: 20261017_1300
+Revises: 20261017_1200
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_1300"
+down_revision = "20261017_1200"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "vbwd_password_reset_token",
+        sa.Column("token_hash", sa.LargeBinary(length=32), nullable=True),
+    )
+    op.execute(
+        "UPDATE vbwd_password_reset_token "
+        "SET token_hash = sha256(convert_to(token, 'UTF8'))"
+    )
+    op.alter_column("vbwd_password_reset_token", "token_hash", nullable=False)
+    op.create_index(
+        op.f("ix_vbwd_password_reset_token_token_hash"),
+        "vbwd_password_reset_token",
+        ["token_hash"],
+        unique=True,
+    )
+    op.drop_index(
+        op.f("ix_vbwd_password_reset_token_token"),
+        table_name="vbwd_password_reset_token",
+    )
+    op.drop_column("vbwd_password_reset_token", "token")
+
+
+def downgrade():
+    # Plaintext tokens cannot be recovered; the hex digest keeps the column
+    # populated and unique, which invalidates every outstanding link
+    op.add_column(
+        "vbwd_password_reset_token",
+        sa.Column("token", sa.String(length=64), nullable=True),
+    )
+    op.execute("UPDATE vbwd_password_reset_token SET token = encode(token_hash, 'hex')")
+    op.alter_column("vbwd_password_reset_token", "token", nullable=False)
+    op.create_index(
+        op.f("ix_vbwd_password_reset_token_token"),
+        "vbwd_password_reset_token",
+        ["token"],
+        unique=True,
+    )
+    op.drop_index(
+        op.f("ix_vbwd_password_reset_token_token_hash"),
+        table_name="vbwd_password_reset_token",
+    )
+    op.drop_column("vbwd_password_reset_token", "token_hash")
@@ -2,7 +2,13 @@ import os
 
 bind = "0.0.0.0:5000"
 workers = int(os.getenv("GUNICORN_WORKERS", 4))
-worker_class = "sync"
+# Handlers are I/O bound (Postgres, Redis, payment-provider HTTP); gevent lets
+# each worker keep many requests in flight, so views such as checkout and
+# pay_invoice stay synchronous rather than async def (Flask would run those
+# on a per-request event loop without sharing it). Set
+# GUNICORN_WORKER_CLASS=sync to fall back.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
 timeout = 120
 keepalive = 5
 max_requests = 1000
@@ -15,3 +21,11 @@ loglevel = os.getenv("LOG_LEVEL", "info")
 
 # For development with reload
 reload = os.getenv("FLASK_ENV") == "development"
+
+
+def post_fork(server, worker):
+    """Make psycopg2 cooperative so DB waits yield to other greenlets."""
+    if worker_class == "gevent":
+        from psycogreen.gevent import patch_psycopg
+
+        patch_psycopg()
@@ -182,3 +182,20 @@ class TestDomainEventDispatcher:
         assert result.success is True
         assert isinstance(result.data, list)
         assert len(result.data) == 2
+
+    def test_emit_many_yields_results_lazily(self, dispatcher):
+        """emit_many should dispatch each event only when its result is read."""
+        handler = MockEventHandler()
+        dispatcher.register("test.event", handler)
+        events = [DomainEvent(name="test.event"), DomainEvent(name="other.event")]
+
+        results = dispatcher.emit_many(iter(events))
+        assert handler.handled_events == []
+
+        first = next(results)
+        assert first.success is True
+        assert handler.handled_events == [events[0]]
+
+        second = next(results)
+        assert second.error_type == "no_handler"
+        assert list(results) == []
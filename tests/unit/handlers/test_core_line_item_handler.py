@@ -95,6 +95,7 @@ class TestActivateTokenBundle:
         assert purchase.status == PurchaseStatus.COMPLETED
         assert token_balance.balance == 550
         assert result.data.get("tokens_credited") == 500
+        assert result.data["purchase_id"] == purchase.id
 
 
 class TestReverseTokenBundle:
@@ -119,6 +120,42 @@ class TestReverseTokenBundle:
         assert result.success is True
         assert purchase.status == PurchaseStatus.REFUNDED
 
+    def test_uses_prefetched_purchase(self, handler, context, container):
+        purchase = MagicMock()
+        purchase.id = uuid4()
+        purchase.status = PurchaseStatus.COMPLETED
+        purchase.token_amount = 200
+        context.prefetched[purchase.id] = purchase
+        container.token_service.return_value.refund_tokens.return_value = 200
+
+        result = handler.reverse_line_item(
+            _make_line_item(LineItemType.TOKEN_BUNDLE, purchase.id), context
+        )
+
+        assert result.success is True
+        assert purchase.status == PurchaseStatus.REFUNDED
+        purchase_repo = container.token_bundle_purchase_repository.return_value
+        purchase_repo.find_by_id.assert_not_called()
+
+    def test_defers_status_write_to_caller(self, handler, context, container):
+        purchase = MagicMock()
+        purchase.id = uuid4()
+        purchase.status = PurchaseStatus.COMPLETED
+        purchase.token_amount = 200
+        context.prefetched[purchase.id] = purchase
+        context.status_updates = {}
+        container.token_service.return_value.refund_tokens.return_value = 200
+
+        result = handler.reverse_line_item(
+            _make_line_item(LineItemType.TOKEN_BUNDLE, purchase.id), context
+        )
+
+        assert result.success is True
+        assert result.data["tokens_debited"] == 200
+        assert context.status_updates == {purchase.id: PurchaseStatus.REFUNDED}
+        purchase_repo = container.token_bundle_purchase_repository.return_value
+        purchase_repo.save.assert_not_called()
+
 
 class TestRestoreTokenBundle:
     def test_restores_refunded_purchase(self, handler, context, container):
@@ -144,3 +181,20 @@ class TestRestoreTokenBundle:
         assert result.success is True
         assert purchase.status == PurchaseStatus.COMPLETED
         assert token_balance.balance == 310
+
+    def test_defers_token_credit_to_caller(self, handler, context, container):
+        purchase = MagicMock()
+        purchase.id = uuid4()
+        purchase.status = PurchaseStatus.REFUNDED
+        purchase.token_amount = 300
+        context.prefetched[purchase.id] = purchase
+        context.token_credits = {}
+
+        result = handler.restore_line_item(
+            _make_line_item(LineItemType.TOKEN_BUNDLE, purchase.id), context
+        )
+
+        assert result.success is True
+        assert purchase.status == PurchaseStatus.COMPLETED
+        assert context.token_credits == {purchase.id: 300}
+        container.token_balance_repository.return_value.find_by_user_id.assert_not_called()
@@ -0,0 +1,27 @@
+"""Tests for the container-backed PaymentCapturedHandler."""
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from vbwd.events.payment_events import PaymentCapturedEvent
+from vbwd.handlers.payment_handler import PaymentCapturedHandler
+
+
+class TestPaymentCapturedHandlerErrors:
+    """Failures leave the session usable for the next event."""
+
+    def test_rolls_back_session_on_error(self):
+        """A database error is rolled back and reported as a failed result."""
+        container = MagicMock()
+        container.invoice_repository.return_value.find_by_id.side_effect = RuntimeError(
+            "connection lost"
+        )
+        session = container.db_session.return_value
+
+        result = PaymentCapturedHandler(container).handle(
+            PaymentCapturedEvent(invoice_id=uuid4(), payment_reference="PAY-1")
+        )
+
+        assert not result.success
+        assert result.error == "connection lost"
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
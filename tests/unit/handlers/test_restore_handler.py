@@ -25,8 +25,11 @@ class TestRefundReversedHandler:
             "tokens_credited": 0,
         }
 
-        # RestoreService is instantiated inside the handler with container
+        mock_restore_service = MagicMock()
+        mock_restore_service.process_restore.return_value = mock_result
+
         container = MagicMock()
+        container.restore_service.return_value = mock_restore_service
         handler = RefundReversedHandler(container)
 
         event = RefundReversedEvent(
@@ -34,24 +37,38 @@ class TestRefundReversedHandler:
             reason="stripe_refund_canceled",
         )
 
-        # Patch the RestoreService to return mock result
-        from unittest.mock import patch
+        result = handler.handle(event)
+
+        mock_restore_service.process_restore.assert_called_once_with(
+            invoice_id=invoice_id,
+            reason="stripe_refund_canceled",
+        )
+        assert result.success is True
 
-        with patch(
-            "vbwd.handlers.restore_handler.RestoreService"
-        ) as MockRestoreService:
-            mock_service = MagicMock()
-            mock_service.process_restore.return_value = mock_result
-            MockRestoreService.return_value = mock_service
+    def test_line_item_context_receives_container(self):
+        """Line item handlers get the container through the restore context."""
+        from vbwd.handlers.restore_handler import RefundReversedHandler
+        from vbwd.events.payment_events import RefundReversedEvent
+        from vbwd.models.enums import InvoiceStatus
+        from vbwd.services.restore_service import RestoreService
+
+        invoice = MagicMock(status=InvoiceStatus.REFUNDED, line_items=[MagicMock()])
+        registry = MagicMock()
+        container = MagicMock()
+        container.restore_service.side_effect = lambda **kwargs: RestoreService(
+            invoice_repo=MagicMock(find_by_id=MagicMock(return_value=invoice)),
+            purchase_repo=MagicMock(),
+            token_balance_repo=MagicMock(),
+            token_transaction_repo=MagicMock(),
+            registry=registry,
+            **kwargs,
+        )
+        handler = RefundReversedHandler(container)
 
-            result = handler.handle(event)
+        handler.handle(RefundReversedEvent(invoice_id=uuid4(), reason="test"))
 
-            MockRestoreService.assert_called_once_with(container)
-            mock_service.process_restore.assert_called_once_with(
-                invoice_id=invoice_id,
-                reason="stripe_refund_canceled",
-            )
-            assert result.success is True
+        context = registry.process_restoration.call_args[0][1]
+        assert context.container is container
 
     def test_handler_returns_error_on_service_failure(self):
         """Handler returns error when RestoreService reports failure."""
@@ -63,6 +80,9 @@ class TestRefundReversedHandler:
         mock_result.error = "Cannot restore: invoice status is paid, expected refunded"
 
         container = MagicMock()
+        container.restore_service.return_value.process_restore.return_value = (
+            mock_result
+        )
         handler = RefundReversedHandler(container)
 
         event = RefundReversedEvent(
@@ -70,19 +90,10 @@ class TestRefundReversedHandler:
             reason="test",
         )
 
-        from unittest.mock import patch
-
-        with patch(
-            "vbwd.handlers.restore_handler.RestoreService"
-        ) as MockRestoreService:
-            mock_service = MagicMock()
-            mock_service.process_restore.return_value = mock_result
-            MockRestoreService.return_value = mock_service
-
-            result = handler.handle(event)
+        result = handler.handle(event)
 
-            assert result.success is False
-            assert "cannot restore" in result.error.lower()
+        assert result.success is False
+        assert "cannot restore" in result.error.lower()
 
     def test_handler_returns_success_with_data(self):
         """Handler returns success result with invoice and items_restored."""
@@ -104,6 +115,9 @@ class TestRefundReversedHandler:
         }
 
         container = MagicMock()
+        container.restore_service.return_value.process_restore.return_value = (
+            mock_result
+        )
         handler = RefundReversedHandler(container)
 
         event = RefundReversedEvent(
@@ -111,21 +125,12 @@ class TestRefundReversedHandler:
             reason="refund_canceled",
         )
 
-        from unittest.mock import patch
+        result = handler.handle(event)
 
-        with patch(
-            "vbwd.handlers.restore_handler.RestoreService"
-        ) as MockRestoreService:
-            mock_service = MagicMock()
-            mock_service.process_restore.return_value = mock_result
-            MockRestoreService.return_value = mock_service
-
-            result = handler.handle(event)
-
-            assert result.success is True
-            assert result.data["invoice_id"] == str(invoice_id)
-            assert result.data["status"] == "paid"
-            assert result.data["items_restored"]["tokens_credited"] == 500
+        assert result.success is True
+        assert result.data["invoice_id"] == str(invoice_id)
+        assert result.data["status"] == "paid"
+        assert result.data["items_restored"]["tokens_credited"] == 500
 
     def test_handler_handles_exception(self):
         """Handler catches exception and returns error result."""
@@ -133,6 +138,7 @@ class TestRefundReversedHandler:
         from vbwd.events.payment_events import RefundReversedEvent
 
         container = MagicMock()
+        container.restore_service.side_effect = RuntimeError("Container wiring error")
         handler = RefundReversedHandler(container)
 
         event = RefundReversedEvent(
@@ -140,17 +146,10 @@ class TestRefundReversedHandler:
             reason="test",
         )
 
-        from unittest.mock import patch
-
-        with patch(
-            "vbwd.handlers.restore_handler.RestoreService"
-        ) as MockRestoreService:
-            MockRestoreService.side_effect = RuntimeError("Container wiring error")
+        result = handler.handle(event)
 
-            result = handler.handle(event)
-
-            assert result.success is False
-            assert "Container wiring error" in result.error
+        assert result.success is False
+        assert "Container wiring error" in result.error
 
     def test_handler_rejects_invalid_event_type(self):
         """Handler rejects events that are not RefundReversedEvent."""
@@ -0,0 +1,62 @@
+"""Tests for AddOnSubscription serialization."""
+from datetime import timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from vbwd.models.enums import SubscriptionStatus
+from vbwd.utils.datetime_utils import utcnow
+
+
+class TestAddOnSubscriptionSerialize:
+    """AddOnSubscription.serialize works for instances and plain rows."""
+
+    def test_row_matches_to_dict(self):
+        """A row with the same columns serializes like the ORM instance."""
+        from vbwd.models.addon_subscription import AddOnSubscription
+
+        addon_sub = AddOnSubscription(
+            id=uuid4(),
+            user_id=uuid4(),
+            addon_id=uuid4(),
+            invoice_id=uuid4(),
+            status=SubscriptionStatus.ACTIVE,
+            starts_at=utcnow(),
+            expires_at=utcnow() + timedelta(days=30),
+            created_at=utcnow(),
+        )
+        row = SimpleNamespace(
+            id=addon_sub.id,
+            user_id=addon_sub.user_id,
+            addon_id=addon_sub.addon_id,
+            subscription_id=None,
+            invoice_id=addon_sub.invoice_id,
+            status=addon_sub.status,
+            starts_at=addon_sub.starts_at,
+            expires_at=addon_sub.expires_at,
+            cancelled_at=None,
+            created_at=addon_sub.created_at,
+        )
+
+        data = AddOnSubscription.serialize(row)
+
+        assert data == addon_sub.to_dict()
+        assert data["is_valid"] is True
+
+    def test_pending_row_is_not_valid(self):
+        """Only active add-on subscriptions are valid."""
+        from vbwd.models.addon_subscription import AddOnSubscription
+
+        row = SimpleNamespace(
+            id=uuid4(),
+            user_id=uuid4(),
+            addon_id=uuid4(),
+            subscription_id=None,
+            invoice_id=None,
+            status=SubscriptionStatus.PENDING,
+            starts_at=None,
+            expires_at=None,
+            cancelled_at=None,
+            created_at=None,
+        )
+
+        assert AddOnSubscription.serialize(row)["is_valid"] is False
@@ -0,0 +1,32 @@
+"""Tests for BaseModel.to_dict."""
+from uuid import uuid4
+
+
+class TestBaseModelToDict:
+    """The default to_dict maps every column to its value."""
+
+    def test_matches_table_columns(self):
+        """Output has one entry per column, in table order."""
+        from vbwd.models.password_reset_token import PasswordResetToken
+
+        token = PasswordResetToken(
+            id=uuid4(),
+            user_id=uuid4(),
+            token_hash=PasswordResetToken.hash_token("abc"),
+        )
+
+        assert token.to_dict() == {
+            column.name: getattr(token, column.name)
+            for column in PasswordResetToken.__table__.columns
+        }
+        assert list(token.to_dict()) == [
+            column.name for column in PasswordResetToken.__table__.columns
+        ]
+
+    def test_getter_is_built_once_per_class(self):
+        """Repeated calls reuse the cached column getter."""
+        from vbwd.models.password_reset_token import PasswordResetToken
+
+        first = PasswordResetToken._column_getter()
+
+        assert PasswordResetToken._column_getter() is first
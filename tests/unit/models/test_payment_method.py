@@ -128,6 +128,28 @@ class TestPaymentMethodModel:
         # Config should NOT be in public dict (contains sensitive references)
         assert "config" not in data
 
+    def test_payment_method_build_public_dict_applies_translation(self):
+        """build_public_dict() overlays non-empty translated texts."""
+        from vbwd.models.payment_method import (
+            PaymentMethod,
+            PaymentMethodTranslation,
+        )
+
+        method = PaymentMethod(
+            code="invoice",
+            name="Invoice",
+            description="Pay by invoice",
+            is_active=True,
+        )
+        method.id = uuid4()
+        translation = PaymentMethodTranslation(locale="de", name="Rechnung")
+
+        data = method.build_public_dict(translation)
+
+        assert data["name"] == "Rechnung"
+        assert data["description"] == "Pay by invoice"
+        assert method.build_public_dict()["name"] == "Invoice"
+
     def test_payment_method_fee_calculation_none(self):
         """PaymentMethod with fee_type='none' should return zero fee."""
         from vbwd.models.payment_method import PaymentMethod
@@ -0,0 +1,64 @@
+"""Tests for Subscription serialization."""
+from datetime import timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from vbwd.models.enums import SubscriptionStatus
+from vbwd.utils.datetime_utils import utcnow
+
+
+class TestSubscriptionSerialize:
+    """Subscription.serialize works for instances and plain rows."""
+
+    def test_row_matches_to_dict(self):
+        """A row with the same columns serializes like the ORM instance."""
+        from vbwd.models.subscription import Subscription
+
+        subscription = Subscription(
+            id=uuid4(),
+            user_id=uuid4(),
+            tarif_plan_id=uuid4(),
+            status=SubscriptionStatus.ACTIVE,
+            started_at=utcnow(),
+            expires_at=utcnow() + timedelta(days=10, hours=1),
+        )
+        row = SimpleNamespace(
+            id=subscription.id,
+            user_id=subscription.user_id,
+            tarif_plan_id=subscription.tarif_plan_id,
+            pending_plan_id=None,
+            status=subscription.status,
+            started_at=subscription.started_at,
+            expires_at=subscription.expires_at,
+            trial_end_at=None,
+            cancelled_at=None,
+            paused_at=None,
+        )
+
+        data = Subscription.serialize(row)
+
+        assert data == subscription.to_dict()
+        assert data["is_valid"] is True
+        assert data["days_remaining"] == 10
+
+    def test_expired_row_is_not_valid(self):
+        """Validity is derived from status and expiry on rows too."""
+        from vbwd.models.subscription import Subscription
+
+        row = SimpleNamespace(
+            id=uuid4(),
+            user_id=uuid4(),
+            tarif_plan_id=uuid4(),
+            pending_plan_id=None,
+            status=SubscriptionStatus.ACTIVE,
+            started_at=None,
+            expires_at=utcnow() - timedelta(days=1),
+            trial_end_at=None,
+            cancelled_at=None,
+            paused_at=None,
+        )
+
+        data = Subscription.serialize(row)
+
+        assert data["is_valid"] is False
+        assert data["days_remaining"] == 0
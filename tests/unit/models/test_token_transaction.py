@@ -0,0 +1,38 @@
+"""Tests for TokenTransaction serialization."""
+from types import SimpleNamespace
+from uuid import uuid4
+
+from vbwd.models.enums import TokenTransactionType
+from vbwd.utils.datetime_utils import utcnow
+
+
+class TestTokenTransactionSerialize:
+    """TokenTransaction.serialize works for instances and plain rows."""
+
+    def test_row_matches_to_dict(self):
+        """A row with the same columns serializes like the ORM instance."""
+        from vbwd.models.user_token_balance import TokenTransaction
+
+        transaction = TokenTransaction(
+            id=uuid4(),
+            user_id=uuid4(),
+            amount=-5,
+            transaction_type=TokenTransactionType.USAGE,
+            reference_id=None,
+            description="Used",
+            created_at=utcnow(),
+        )
+        row = SimpleNamespace(
+            id=transaction.id,
+            user_id=transaction.user_id,
+            amount=transaction.amount,
+            transaction_type=transaction.transaction_type,
+            reference_id=None,
+            description=transaction.description,
+            created_at=transaction.created_at,
+        )
+
+        data = TokenTransaction.serialize(row)
+
+        assert data == transaction.to_dict()
+        assert data["transaction_type"] == TokenTransactionType.USAGE.value
@@ -0,0 +1,91 @@
+"""Unit tests for the admin invoice refund route."""
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from flask import Flask
+
+from vbwd.events.domain import EventResult
+from vbwd.models.enums import LineItemType, PurchaseStatus
+from vbwd.services.refund_service import RefundService
+from tests.fixtures.access import make_user_with_permissions
+
+
+@pytest.fixture
+def invoice():
+    line_item = MagicMock(item_type=LineItemType.TOKEN_BUNDLE, item_id=uuid4())
+    return MagicMock(
+        id=uuid4(), user_id=uuid4(), payment_method="basic", line_items=[line_item]
+    )
+
+
+@pytest.fixture
+def container(invoice):
+    purchase = MagicMock(status=PurchaseStatus.COMPLETED, token_amount=50)
+    container = MagicMock()
+    container.invoice_repository.return_value.find_by_id.return_value = invoice
+    container.token_bundle_purchase_repository.return_value.find_by_line_items.return_value = {
+        invoice.line_items[0].item_id: purchase
+    }
+    container.refund_service.return_value = RefundService(
+        invoice_repo=MagicMock(), token_service=MagicMock(), purchase_repo=MagicMock()
+    )
+    return container
+
+
+@pytest.fixture
+def client(container):
+    from vbwd.routes.admin.invoices import admin_invoices_bp
+
+    app = Flask(__name__)
+    app.register_blueprint(admin_invoices_bp)
+    app.container = container
+    return app.test_client()
+
+
+@patch("vbwd.middleware.auth.db")
+@patch("vbwd.middleware.auth.AuthService")
+@patch("vbwd.middleware.auth.UserRepository")
+class TestRefundInvoice:
+    """POST /admin/invoices/<id>/refund pre-checks the user's token balance."""
+
+    def _authenticate(self, mock_repo_cls, mock_auth_cls):
+        user = make_user_with_permissions("invoices.manage")
+        mock_repo_cls.return_value.find_by_id.return_value = user
+        mock_auth_cls.return_value.verify_token.return_value = str(uuid4())
+        return {"Authorization": "Bearer valid"}
+
+    def test_refund_emits_event_when_balance_covers_tokens(
+        self, mock_repo_cls, mock_auth_cls, _db, client, container, invoice
+    ):
+        container.token_service.return_value.get_balance.return_value = 50
+        container.event_dispatcher.return_value.emit.return_value = (
+            EventResult.success_result({"invoice": {"id": str(invoice.id)}})
+        )
+
+        response = client.post(
+            f"/api/v1/admin/invoices/{invoice.id}/refund",
+            json={},
+            headers=self._authenticate(mock_repo_cls, mock_auth_cls),
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["message"] == "Invoice refunded"
+        container.token_bundle_purchase_repository.return_value.find_by_line_items.assert_called_once_with(
+            invoice.line_items
+        )
+
+    def test_refund_rejected_when_balance_is_short(
+        self, mock_repo_cls, mock_auth_cls, _db, client, container, invoice
+    ):
+        container.token_service.return_value.get_balance.return_value = 10
+
+        response = client.post(
+            f"/api/v1/admin/invoices/{invoice.id}/refund",
+            json={},
+            headers=self._authenticate(mock_repo_cls, mock_auth_cls),
+        )
+
+        assert response.status_code == 400
+        assert "Insufficient token balance" in response.get_json()["error"]
+        container.event_dispatcher.return_value.emit.assert_not_called()
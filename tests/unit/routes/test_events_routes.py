@@ -0,0 +1,91 @@
+"""Unit tests for the frontend events routes."""
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from flask import Flask
+
+from vbwd.extensions import limiter
+from vbwd.routes.events import _parse_events_batch
+
+
+class TestParseEventsBatch:
+    """Tests for _parse_events_batch."""
+
+    def test_parses_valid_batch(self):
+        events, error = _parse_events_batch(
+            {
+                "events": [
+                    {
+                        "type": "auth:login",
+                        "data": {"a": 1},
+                        "timestamp": "2026-01-05T10:30:00.000Z",
+                    },
+                    {"type": "auth:logout"},
+                ]
+            }
+        )
+
+        assert error is None
+        assert events == [
+            ("auth:login", {"a": 1}, "2026-01-05T10:30:00.000Z"),
+            ("auth:logout", {}, None),
+        ]
+
+    def test_rejects_non_object_body(self):
+        events, error = _parse_events_batch(None)
+
+        assert events is None
+        assert error
+
+    def test_rejects_missing_events(self):
+        events, error = _parse_events_batch({})
+
+        assert events is None
+        assert "events" in error
+
+    def test_rejects_empty_or_long_type(self):
+        for event_type in ("", "x" * 101, 5):
+            events, error = _parse_events_batch({"events": [{"type": event_type}]})
+
+            assert events is None
+            assert "events[0].type" in error
+
+    def test_rejects_non_dict_data(self):
+        events, error = _parse_events_batch(
+            {"events": [{"type": "auth:login", "data": [1, 2]}]}
+        )
+
+        assert events is None
+        assert "events[0].data" in error
+
+
+@patch.object(limiter, "enabled", False)
+@patch("vbwd.middleware.auth.db")
+@patch("vbwd.middleware.auth.AuthService")
+@patch("vbwd.middleware.auth.UserRepository")
+class TestReceiveEvents:
+    """POST /events emits through the container's dispatcher."""
+
+    def test_emits_through_container_dispatcher(
+        self, mock_repo_cls, mock_auth_cls, _db
+    ):
+        from vbwd.routes.events import events_bp
+
+        app = Flask(__name__)
+        app.register_blueprint(events_bp)
+        app.container = MagicMock()
+        user = MagicMock(id=uuid4())
+        user.status.value = "ACTIVE"
+        mock_repo_cls.return_value.find_by_id.return_value = user
+        mock_auth_cls.return_value.verify_token.return_value = str(user.id)
+
+        response = app.test_client().post(
+            "/api/v1/events",
+            json={"events": [{"type": "auth:login"}]},
+            headers={"Authorization": "Bearer valid"},
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["processed"] == 1
+        emitted = app.container.event_dispatcher.return_value.emit.call_args[0][0]
+        assert emitted.name == "frontend:auth:login"
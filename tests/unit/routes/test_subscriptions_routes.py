@@ -0,0 +1,101 @@
+"""Tests for user subscription routes."""
+import json
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from flask import Flask
+
+from vbwd.routes.subscriptions import subscriptions_bp
+
+
+@pytest.fixture
+def client():
+    """Client for an app with only the subscriptions blueprint.
+
+    The core app does not register it; the subscription plugin does.
+    """
+    app = Flask(__name__)
+    app.register_blueprint(subscriptions_bp, url_prefix="/api/v1/user/subscriptions")
+    with patch("vbwd.middleware.auth.db"):
+        yield app.test_client()
+
+
+def _row(plan_id=None):
+    return MagicMock(tarif_plan_id=plan_id, created_at=None)
+
+
+@patch("vbwd.routes.subscriptions.Subscription.serialize")
+@patch("vbwd.routes.subscriptions._get_subscription_service")
+@patch("vbwd.routes.subscriptions._get_tarif_plan_repo")
+@patch("vbwd.middleware.auth.AuthService")
+@patch("vbwd.middleware.auth.UserRepository")
+class TestListSubscriptions:
+    """Tests for the streamed subscription list."""
+
+    def _get(self, client, mock_user_repo_class, mock_auth_class):
+        user = MagicMock(id=uuid4())
+        user.status.value = "ACTIVE"
+        mock_user_repo_class.return_value.find_by_id.return_value = user
+        mock_auth_class.return_value.verify_token.return_value = str(user.id)
+        return client.get(
+            "/api/v1/user/subscriptions",
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+    def test_plans_are_loaded_once(
+        self,
+        mock_user_repo_class,
+        mock_auth_class,
+        mock_plan_repo,
+        mock_service,
+        mock_serialize,
+        client,
+    ):
+        """Every row is enriched from one plan query, not a lookup per row."""
+        plan = MagicMock(
+            id=uuid4(), slug="pro", price=None, billing_period=None, categories=[]
+        )
+        plan.name = "Pro"
+        mock_plan_repo.return_value.find_by_subscriber.return_value = [plan]
+        mock_service.return_value.iter_user_subscription_rows.return_value = iter(
+            [_row(plan.id), _row(plan.id)]
+        )
+        mock_serialize.side_effect = lambda sub: {}
+
+        response = self._get(client, mock_user_repo_class, mock_auth_class)
+        body = json.loads(response.data)
+
+        assert response.status_code == 200
+        assert [item["plan"]["name"] for item in body["subscriptions"]] == [
+            "Pro",
+            "Pro",
+        ]
+        mock_plan_repo.return_value.find_by_subscriber.assert_called_once()
+        mock_plan_repo.return_value.find_by_id.assert_not_called()
+
+    def test_mid_stream_failure_ends_with_error_member(
+        self,
+        mock_user_repo_class,
+        mock_auth_class,
+        mock_plan_repo,
+        mock_service,
+        mock_serialize,
+        client,
+    ):
+        """A failure after the first row still yields valid JSON naming it."""
+
+        def rows():
+            yield _row()
+            raise RuntimeError("cursor lost")
+
+        mock_plan_repo.return_value.find_by_subscriber.return_value = []
+        mock_service.return_value.iter_user_subscription_rows.return_value = rows()
+        mock_serialize.side_effect = lambda sub: {}
+
+        response = self._get(client, mock_user_repo_class, mock_auth_class)
+
+        assert json.loads(response.data) == {
+            "subscriptions": [{"created_at": None}],
+            "error": "Failed to load all subscriptions",
+        }
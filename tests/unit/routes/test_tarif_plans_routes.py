@@ -0,0 +1,90 @@
+"""Unit tests for public tariff plan route helpers."""
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+class TestWarmPlanPricing:
+    """Tests for warm_plan_pricing."""
+
+    @patch("vbwd.routes.tarif_plans.redis_client")
+    @patch("vbwd.routes.tarif_plans.CountryRepository")
+    @patch("vbwd.routes.tarif_plans.CurrencyRepository")
+    @patch("vbwd.routes.tarif_plans._get_tarif_plan_service")
+    def test_caches_listing_per_currency_and_country(
+        self, mock_build, mock_currency_repo, mock_country_repo, mock_redis
+    ):
+        """One listing is cached per currency for no country and each country."""
+        from vbwd.routes.tarif_plans import PLANS_CACHE_TTL, warm_plan_pricing
+
+        plan = MagicMock()
+        service = mock_build.return_value
+        service.get_active_plans.return_value = [plan]
+        service.get_plans_with_pricing.return_value = [{"id": "p1"}]
+        mock_currency_repo.return_value.find_active.return_value = [
+            MagicMock(code="EUR"),
+            MagicMock(code="usd"),
+        ]
+        mock_country_repo.return_value.find_enabled.return_value = [
+            MagicMock(code="DE")
+        ]
+
+        assert warm_plan_pricing() == 4
+
+        keys = [c.args[0] for c in mock_redis.cache_set.call_args_list]
+        assert keys == [
+            "plans:v1:EUR:-:-",
+            "plans:v1:EUR:DE:-",
+            "plans:v1:USD:-:-",
+            "plans:v1:USD:DE:-",
+        ]
+        body, ttl = mock_redis.cache_set.call_args_list[1].args[1:]
+        assert ttl == PLANS_CACHE_TTL
+        assert json.loads(body) == {
+            "plans": [{"id": "p1"}],
+            "currency": "EUR",
+            "country": "DE",
+        }
+
+
+class TestPricingParams:
+    """Tests for query param normalization ahead of the Redis key."""
+
+    def _params(self, query):
+        from flask import Flask
+
+        from vbwd.routes.tarif_plans import _pricing_params
+
+        with Flask(__name__).test_request_context(query_string=query):
+            return _pricing_params()
+
+    def test_normalizes_case_and_defaults(self):
+        """Codes are upper-cased; currency defaults to EUR, country to None."""
+        assert self._params({"currency": " usd ", "country": "de"}) == ("USD", "DE")
+        assert self._params({}) == ("EUR", None)
+
+    def test_rejects_malformed_codes(self):
+        """Values that are not ISO-shaped never reach a cache key."""
+        with pytest.raises(ValueError, match="currency"):
+            self._params({"currency": "US$D"})
+        with pytest.raises(ValueError, match="country"):
+            self._params({"country": "DEU"})
+
+
+class TestListPlansValidation:
+    """Malformed params are rejected before Redis is consulted."""
+
+    @patch("vbwd.routes.tarif_plans.get_redis_json_response")
+    def test_bad_category_returns_400(self, mock_get_cached):
+        from flask import Flask
+
+        from vbwd.routes.tarif_plans import tarif_plans_bp
+
+        app = Flask(__name__)
+        app.register_blueprint(tarif_plans_bp, url_prefix="/api/v1/tarif-plans")
+
+        response = app.test_client().get("/api/v1/tarif-plans?category=a:b*")
+
+        assert response.status_code == 400
+        mock_get_cached.assert_not_called()
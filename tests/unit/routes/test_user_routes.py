@@ -0,0 +1,199 @@
+"""Unit tests for user route helpers."""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+
+class TestTransactionCursor:
+    """Tests for the token transaction keyset cursor."""
+
+    def test_round_trips_row_position(self):
+        """Decoding a row's cursor yields its (created_at, id)."""
+        from vbwd.routes.user import (
+            _decode_transaction_cursor,
+            _encode_transaction_cursor,
+        )
+
+        row = SimpleNamespace(created_at=datetime(2026, 1, 2, 3, 4, 5, 6), id=uuid4())
+
+        cursor = _encode_transaction_cursor(row)
+
+        assert _decode_transaction_cursor(cursor) == (row.created_at, row.id)
+
+    @pytest.mark.parametrize("cursor", ["not base64!", "Zm9v", "MjAyNnxub3BlCg=="])
+    def test_rejects_malformed_cursor(self, cursor):
+        """Anything that is not an encoded position raises ValueError."""
+        from vbwd.routes.user import _decode_transaction_cursor
+
+        with pytest.raises(ValueError):
+            _decode_transaction_cursor(cursor)
+
+
+class TestCheckoutErrorMessage:
+    """Tests for flattening checkout validation errors."""
+
+    def test_names_first_invalid_id(self):
+        """A bad list entry is reported with its singular field name and value."""
+        from vbwd.routes.user import _checkout_error_message
+
+        payload = {"token_bundle_ids": [str(uuid4()), "nope", "bad"]}
+        messages = {"token_bundle_ids": {2: ["Not a valid UUID."], 1: ["x"]}}
+
+        assert (
+            _checkout_error_message(messages, payload)
+            == "Invalid token_bundle_id: nope"
+        )
+
+    def test_reports_plan_before_lists(self):
+        """plan_id errors win over list errors, as the old checks ran first."""
+        from vbwd.routes.user import _checkout_error_message
+
+        messages = {"plan_id": ["Not a valid UUID."], "add_on_ids": {0: ["x"]}}
+
+        assert (
+            _checkout_error_message(messages, {"add_on_ids": ["bad"]})
+            == "Invalid plan_id format"
+        )
+
+
+@patch("vbwd.middleware.auth.AuthService")
+@patch("vbwd.middleware.auth.UserRepository")
+class TestValidationErrorResponses:
+    """Validation errors keep the {"error": "<message>"} response shape."""
+
+    def _authenticate(self, mock_user_repo_class, mock_auth_class):
+        user = MagicMock(id=uuid4())
+        user.status.value = "ACTIVE"
+        mock_user_repo_class.return_value.find_by_id.return_value = user
+        mock_auth_class.return_value.verify_token.return_value = str(user.id)
+        return {"Authorization": "Bearer valid_token"}
+
+    def test_change_password_missing_field(
+        self, mock_user_repo_class, mock_auth_class, client
+    ):
+        """A missing password reports the single string message."""
+        response = client.post(
+            "/api/v1/user/change-password",
+            json={"currentPassword": "old", "extra": 1},
+            headers=self._authenticate(mock_user_repo_class, mock_auth_class),
+        )
+
+        assert response.status_code == 400
+        assert response.get_json() == {
+            "error": "Current password and new password are required"
+        }
+
+    def test_checkout_invalid_id(self, mock_user_repo_class, mock_auth_class, client):
+        """An invalid ID is named in a string message."""
+        response = client.post(
+            "/api/v1/user/checkout",
+            json={"add_on_ids": ["nope"]},
+            headers=self._authenticate(mock_user_repo_class, mock_auth_class),
+        )
+
+        assert response.status_code == 400
+        assert response.get_json() == {"error": "Invalid add_on_id: nope"}
+
+    def test_checkout_without_items(
+        self, mock_user_repo_class, mock_auth_class, client
+    ):
+        """An empty checkout keeps the at-least-one-item message."""
+        response = client.post(
+            "/api/v1/user/checkout",
+            json={},
+            headers=self._authenticate(mock_user_repo_class, mock_auth_class),
+        )
+
+        assert response.status_code == 400
+        assert response.get_json() == {
+            "error": "At least one item required "
+            "(plan_id, token_bundle_ids, or add_on_ids)"
+        }
+
+
+@patch("vbwd.middleware.auth.AuthService")
+@patch("vbwd.middleware.auth.UserRepository")
+class TestProfileFromRequestUser:
+    """Profile reads serve the user require_auth loaded, never a stale copy."""
+
+    def test_profile_reflects_row_updates(self, mock_user_repo_class, mock_auth_class):
+        from flask import Flask
+
+        from vbwd.routes.user import user_bp
+
+        app = Flask(__name__)
+        app.register_blueprint(user_bp)
+        user = MagicMock(
+            id=uuid4(),
+            email="old@example.com",
+            role="user",
+            created_at=None,
+            updated_at=datetime(2026, 1, 1),
+            details=None,
+        )
+        user.status.value = "ACTIVE"
+        user.status.__str__ = lambda _: "ACTIVE"
+        mock_user_repo_class.return_value.find_by_id.return_value = user
+        mock_auth_class.return_value.verify_token.return_value = str(user.id)
+        headers = {"Authorization": "Bearer valid_token"}
+
+        with patch("vbwd.middleware.auth.db"):
+            client = app.test_client()
+            first = client.get("/api/v1/user/profile", headers=headers).get_json()
+            user.email = "new@example.com"
+            user.updated_at = datetime(2026, 1, 2)
+            second = client.get("/api/v1/user/profile", headers=headers).get_json()
+
+        assert first["user"]["email"] == "old@example.com"
+        assert second["user"]["email"] == "new@example.com"
+
+
+@patch("vbwd.middleware.auth.AuthService")
+@patch("vbwd.middleware.auth.UserRepository")
+class TestTokenBalanceFromRequestUser:
+    """The balance endpoint reads the request user's row, never a cached copy."""
+
+    def test_balance_reflects_credits(self, mock_user_repo_class, mock_auth_class):
+        from flask import Flask
+
+        from vbwd.routes.user import user_bp
+
+        app = Flask(__name__)
+        app.register_blueprint(user_bp)
+        user = MagicMock(id=uuid4(), token_balance=MagicMock(balance=10))
+        user.status.value = "ACTIVE"
+        mock_user_repo_class.return_value.find_by_id.return_value = user
+        mock_auth_class.return_value.verify_token.return_value = str(user.id)
+        headers = {"Authorization": "Bearer valid_token"}
+
+        with patch("vbwd.middleware.auth.db"):
+            client = app.test_client()
+            first = client.get("/api/v1/user/tokens/balance", headers=headers)
+            user.token_balance.balance = 25
+            second = client.get("/api/v1/user/tokens/balance", headers=headers)
+
+        assert first.get_json() == {"balance": 10}
+        assert second.get_json() == {"balance": 25}
+
+    def test_missing_balance_row_is_zero(self, mock_user_repo_class, mock_auth_class):
+        from flask import Flask
+
+        from vbwd.routes.user import user_bp
+
+        app = Flask(__name__)
+        app.register_blueprint(user_bp)
+        user = MagicMock(id=uuid4(), token_balance=None)
+        user.status.value = "ACTIVE"
+        mock_user_repo_class.return_value.find_by_id.return_value = user
+        mock_auth_class.return_value.verify_token.return_value = str(user.id)
+
+        with patch("vbwd.middleware.auth.db"):
+            response = app.test_client().get(
+                "/api/v1/user/tokens/balance",
+                headers={"Authorization": "Bearer valid_token"},
+            )
+
+        assert response.get_json() == {"balance": 0}
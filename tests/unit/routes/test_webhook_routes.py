@@ -0,0 +1,207 @@
+"""Tests for payment webhook routes."""
+import hashlib
+import hmac
+import json
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from dependency_injector import providers
+
+from vbwd.events.domain import EventResult
+
+WEBHOOK_SECRET = "test-webhook-secret"
+
+
+def _post_batch(app, client, body, signature=None):
+    """Post a signed NDJSON batch."""
+    app.config["PAYMENT_WEBHOOK_SECRET"] = WEBHOOK_SECRET
+    if signature is None:
+        signature = hmac.new(
+            WEBHOOK_SECRET.encode(), body.encode(), hashlib.sha256
+        ).hexdigest()
+    return client.post(
+        "/api/v1/webhooks/payment/batch",
+        data=body,
+        content_type="application/x-ndjson",
+        headers={"X-Webhook-Signature": signature},
+    )
+
+
+class TestPaymentBatchWebhook:
+    """Tests for the NDJSON batch payment webhook."""
+
+    def test_streams_one_result_per_line(self, app, client):
+        """Each input line gets a result line, in input order."""
+        invoice_id = uuid4()
+        dispatcher = MagicMock()
+        dispatcher.emit_many.side_effect = lambda events: (
+            EventResult.success_result([{"invoice_id": str(e.invoice_id)}])
+            for e in events
+        )
+        body = "\n".join(
+            [
+                json.dumps(
+                    {
+                        "invoice_id": str(invoice_id),
+                        "payment_reference": "PAY-1",
+                        "amount": "29.00",
+                    }
+                ),
+                "",
+                "{not json",
+                json.dumps({"invoice_id": "nope"}),
+            ]
+        )
+
+        with app.container.event_dispatcher.override(providers.Object(dispatcher)):
+            response = _post_batch(app, client, body)
+            lines = [json.loads(line) for line in response.data.splitlines()]
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert lines[0] == {
+            "line": 1,
+            "status": "success",
+            "invoice_id": str(invoice_id),
+        }
+        assert lines[1] == {"line": 3, "error": "Invalid JSON"}
+        assert lines[2] == {"line": 4, "error": "payment_reference is required"}
+
+    def test_nests_non_dict_results(self, app, client):
+        """A line whose handlers return several results nests them."""
+        dispatcher = MagicMock()
+        dispatcher.emit_many.side_effect = lambda events: (
+            EventResult.success_result([{"a": 1}, {"b": 2}]) for _ in events
+        )
+        body = json.dumps(
+            {
+                "invoice_id": str(uuid4()),
+                "payment_reference": "PAY-1",
+                "amount": "29.00",
+            }
+        )
+
+        with app.container.event_dispatcher.override(providers.Object(dispatcher)):
+            response = _post_batch(app, client, body)
+            lines = [json.loads(line) for line in response.data.splitlines()]
+
+        assert lines == [{"line": 1, "status": "success", "data": [{"a": 1}, {"b": 2}]}]
+
+    def test_rejects_non_ndjson_body(self, client):
+        """Only application/x-ndjson bodies are accepted."""
+        response = client.post("/api/v1/webhooks/payment/batch", json={})
+
+        assert response.status_code == 415
+
+    def test_rejects_invalid_signature(self, app, client):
+        """An unsigned or wrongly signed batch is not dispatched."""
+        dispatcher = MagicMock()
+        with app.container.event_dispatcher.override(providers.Object(dispatcher)):
+            response = _post_batch(app, client, "{}", signature="bad")
+
+        assert response.status_code == 401
+        dispatcher.emit_many.assert_not_called()
+
+    def test_rejects_oversized_body(self, app, client):
+        """A body over PAYMENT_BATCH_MAX_BYTES is refused with 413."""
+        app.config["PAYMENT_BATCH_MAX_BYTES"] = 8
+
+        response = _post_batch(app, client, "{}\n" * 8)
+
+        assert response.status_code == 413
+
+    def test_rejects_too_many_lines(self, app, client):
+        """A batch over PAYMENT_BATCH_MAX_LINES is refused with 413."""
+        app.config["PAYMENT_BATCH_MAX_LINES"] = 2
+
+        response = _post_batch(app, client, "{}\n{}\n\n{}")
+
+        assert response.status_code == 413
+
+
+class TestPaymentWebhook:
+    """Tests for the single payment webhook."""
+
+    def _post(self, app, client, result, body=None):
+        dispatcher = MagicMock()
+        dispatcher.emit.return_value = result
+        with app.container.event_dispatcher.override(providers.Object(dispatcher)):
+            return client.post(
+                "/api/v1/webhooks/payment",
+                json=body
+                or {
+                    "invoice_id": str(uuid4()),
+                    "payment_reference": "PAY-1",
+                    "amount": "29.00",
+                },
+            )
+
+    def test_success_body_merges_handler_data(self, app, client):
+        """The status prefix is followed by the handler's fields."""
+        response = self._post(
+            app,
+            client,
+            EventResult.success_result([{"invoice_id": "inv-1", "items": 2}]),
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/json"
+        assert response.get_json() == {
+            "status": "success",
+            "invoice_id": "inv-1",
+            "items": 2,
+        }
+
+    def test_success_body_without_handler_data(self, app, client):
+        """An empty result still produces valid JSON."""
+        response = self._post(app, client, EventResult.success_result({}))
+
+        assert response.status_code == 200
+        assert response.get_json() == {"status": "success"}
+
+    def test_success_body_nests_several_handler_results(self, app, client):
+        """Results from more than one handler are nested, not spliced."""
+        response = self._post(
+            app, client, EventResult.success_result([{"a": 1}, {"b": 2}])
+        )
+
+        assert response.status_code == 200
+        assert response.get_json() == {
+            "status": "success",
+            "data": [{"a": 1}, {"b": 2}],
+        }
+
+    def test_success_body_with_empty_result_list(self, app, client):
+        """Handlers that return no data still produce valid JSON."""
+        response = self._post(app, client, EventResult.success_result([]))
+
+        assert response.status_code == 200
+        assert response.get_json() == {"status": "success", "data": []}
+
+    def test_success_body_with_no_result_data(self, app, client):
+        """A result without data is reported as null data."""
+        response = self._post(app, client, EventResult.success_result())
+
+        assert response.status_code == 200
+        assert response.get_json() == {"status": "success", "data": None}
+
+    def test_failed_result_returns_400(self, app, client):
+        """A failed dispatch reports the handler error."""
+        response = self._post(
+            app, client, EventResult.error_result("Invoice not found")
+        )
+
+        assert response.status_code == 400
+        assert response.get_json() == {"error": "Invoice not found"}
+
+    def test_validation_error_is_a_string(self, app, client):
+        """Missing fields are reported before malformed ones, as one string."""
+        response = self._post(
+            app,
+            client,
+            EventResult.success_result({}),
+            body={"invoice_id": "nope", "payment_reference": "", "amount": "1"},
+        )
+
+        assert response.status_code == 400
+        assert response.get_json() == {"error": "payment_reference is required"}
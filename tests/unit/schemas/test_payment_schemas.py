@@ -0,0 +1,74 @@
+"""Tests for payment schemas."""
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from marshmallow import ValidationError
+
+from vbwd.schemas.payment_schemas import PaymentWebhookRequestSchema
+
+
+class TestPaymentWebhookRequestSchema:
+    """Tests for PaymentWebhookRequestSchema."""
+
+    def test_loads_invoice_id_as_uuid(self):
+        """invoice_id is parsed to a UUID and currency defaults to USD."""
+        invoice_id = uuid4()
+
+        data = PaymentWebhookRequestSchema().load(
+            {
+                "invoice_id": str(invoice_id),
+                "payment_reference": "PAY-123",
+                "amount": "29.00",
+            }
+        )
+
+        assert data == {
+            "invoice_id": invoice_id,
+            "payment_reference": "PAY-123",
+            "amount": Decimal("29.00"),
+            "currency": "USD",
+        }
+
+    def test_reports_missing_and_invalid_fields(self):
+        """Errors keep the route's previous messages."""
+        with pytest.raises(ValidationError) as exc_info:
+            PaymentWebhookRequestSchema().load({"invoice_id": "nope"})
+
+        assert exc_info.value.messages == {
+            "invoice_id": ["Invalid invoice_id format"],
+            "payment_reference": ["payment_reference is required"],
+            "amount": ["amount is required"],
+        }
+
+    def test_rejects_malformed_amount_and_currency(self):
+        """amount must be numeric and currency a 3-letter code."""
+        with pytest.raises(ValidationError) as exc_info:
+            PaymentWebhookRequestSchema().load(
+                {
+                    "invoice_id": str(uuid4()),
+                    "payment_reference": "PAY-123",
+                    "amount": "twenty",
+                    "currency": "US Dollar",
+                }
+            )
+
+        assert exc_info.value.messages == {
+            "amount": ["Invalid amount format"],
+            "currency": ["currency must be a 3-letter ISO code"],
+        }
+
+    def test_rejects_empty_payment_reference(self):
+        """An empty reference counts as missing."""
+        with pytest.raises(ValidationError) as exc_info:
+            PaymentWebhookRequestSchema().load(
+                {
+                    "invoice_id": str(uuid4()),
+                    "payment_reference": "",
+                    "amount": "29.00",
+                }
+            )
+
+        assert exc_info.value.messages == {
+            "payment_reference": ["payment_reference is required"]
+        }
@@ -2,10 +2,17 @@
 import pytest
 from uuid import uuid4
 from types import SimpleNamespace
+from datetime import datetime
+from vbwd.models.enums import UserRole, UserStatus
+from marshmallow import ValidationError
 from vbwd.schemas.user_schemas import (
+    ChangePasswordRequestSchema,
+    CheckoutRequestSchema,
     UserDetailsSchema,
     UserDetailsUpdateSchema,
     UserProfileSchema,
+    dump_user_details,
+    dump_user_profile,
 )
 
 
@@ -202,3 +209,108 @@ class TestUserProfileSchema:
 
         assert result["user"]["email"] == "test@example.com"
         assert result["details"] is None
+
+
+class TestDumpUserProfile:
+    """Tests for the plain-dict profile dumpers."""
+
+    def _user(self):
+        return SimpleNamespace(
+            id=uuid4(),
+            email="test@example.com",
+            status=UserStatus.ACTIVE,
+            role=UserRole.USER,
+            created_at=datetime(2024, 1, 2, 3, 4, 5),
+            updated_at=None,
+        )
+
+    def _details(self, user_id):
+        return SimpleNamespace(
+            id=uuid4(),
+            user_id=user_id,
+            first_name="Test",
+            last_name=None,
+            phone="+1234567890",
+            company=None,
+            tax_number=None,
+            address_line_1="123 Main St",
+            address_line_2=None,
+            city="New York",
+            postal_code="10001",
+            country="US",
+            created_at=datetime(2024, 1, 2, 3, 4, 5, 678),
+            updated_at=None,
+        )
+
+    def test_matches_profile_schema(self):
+        """dump_user_profile should equal UserProfileSchema output."""
+        user = self._user()
+        details = self._details(user.id)
+
+        expected = UserProfileSchema().dump({"user": user, "details": details})
+
+        assert dump_user_profile(user, details) == expected
+        assert dump_user_profile(user, None) == UserProfileSchema().dump(
+            {"user": user, "details": None}
+        )
+
+    def test_matches_details_schema(self):
+        """dump_user_details should equal UserDetailsSchema output."""
+        details = self._details(uuid4())
+
+        assert dump_user_details(details) == UserDetailsSchema().dump(details)
+
+
+class TestChangePasswordRequestSchema:
+    """Tests for ChangePasswordRequestSchema."""
+
+    def test_requires_both_passwords(self):
+        """Missing and empty passwords are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            ChangePasswordRequestSchema().load({"currentPassword": ""})
+
+        assert set(exc_info.value.messages) == {"currentPassword", "newPassword"}
+
+    def test_ignores_unknown_fields(self):
+        """Extra keys in the body are dropped rather than rejected."""
+        data = ChangePasswordRequestSchema().load(
+            {"currentPassword": "old", "newPassword": "new", "confirm": "new"}
+        )
+
+        assert data == {"currentPassword": "old", "newPassword": "new"}
+
+
+class TestCheckoutRequestSchema:
+    """Tests for CheckoutRequestSchema."""
+
+    def test_loads_ids_as_uuids_with_defaults(self):
+        """IDs are parsed to UUIDs; optional fields get defaults."""
+        plan_id, bundle_id = uuid4(), uuid4()
+
+        data = CheckoutRequestSchema().load(
+            {
+                "plan_id": str(plan_id),
+                "token_bundle_ids": [str(bundle_id)],
+                "extra": "ignored",
+            }
+        )
+
+        assert data == {
+            "plan_id": plan_id,
+            "token_bundle_ids": [bundle_id],
+            "add_on_ids": [],
+            "currency": "USD",
+            "payment_method_code": None,
+        }
+
+    def test_rejects_invalid_uuid(self):
+        """The offending list index is reported."""
+        with pytest.raises(ValidationError) as exc_info:
+            CheckoutRequestSchema().load({"add_on_ids": [str(uuid4()), "nope"]})
+
+        assert exc_info.value.messages == {"add_on_ids": {1: ["Not a valid UUID."]}}
+
+    def test_requires_at_least_one_item(self):
+        """An empty checkout is rejected."""
+        with pytest.raises(ValidationError, match="At least one item required"):
+            CheckoutRequestSchema().load({"currency": "EUR"})
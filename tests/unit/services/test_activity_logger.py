@@ -0,0 +1,65 @@
+"""Tests for ActivityLogger."""
+import logging
+from unittest.mock import patch
+
+
+class TestActivityLogger:
+    """ActivityLogger only builds entries that are consumed."""
+
+    def test_logs_action_with_entry_fields(self, caplog):
+        """Enabled INFO logging receives the action and entry as extras."""
+        from vbwd.services.activity_logger import ActivityLogger
+
+        with caplog.at_level(logging.INFO, logger="vbwd.services.activity_logger"):
+            ActivityLogger().log("password_reset_requested", user_id="u1")
+
+        record = caplog.records[-1]
+        assert record.getMessage() == "Activity: password_reset_requested"
+        assert record.user_id == "u1"
+        assert record.metadata == {}
+
+    def test_logger_only_path_does_not_stamp_time(self, caplog):
+        """The log record's own timestamp is used instead of utcnow."""
+        from vbwd.services.activity_logger import ActivityLogger
+
+        with caplog.at_level(
+            logging.INFO, logger="vbwd.services.activity_logger"
+        ), patch("vbwd.services.activity_logger.utcnow") as utcnow:
+            ActivityLogger().log("login")
+
+        utcnow.assert_not_called()
+        assert not hasattr(caplog.records[-1], "timestamp")
+
+    def test_skips_entry_when_nothing_consumes_it(self, caplog):
+        """With INFO disabled and no DB logging, no entry is built."""
+        from vbwd.services.activity_logger import ActivityLogger
+
+        with caplog.at_level(
+            logging.WARNING, logger="vbwd.services.activity_logger"
+        ), patch("vbwd.services.activity_logger.utcnow") as utcnow:
+            ActivityLogger().log("login")
+
+        utcnow.assert_not_called()
+        assert caplog.records == []
+
+    def test_background_logging_delivers_off_thread(self, caplog):
+        """Queued records reach the normal handlers via the listener."""
+        from vbwd.services.activity_logger import (
+            ActivityLogger,
+            start_background_logging,
+            stop_background_logging,
+        )
+
+        with caplog.at_level(logging.INFO, logger="vbwd.services.activity_logger"):
+            listener = start_background_logging()
+            try:
+                assert start_background_logging() is listener
+                ActivityLogger().log("login", user_id="u2")
+            finally:
+                # Stopping drains the queue before returning
+                stop_background_logging()
+
+        record = caplog.records[-1]
+        assert record.getMessage() == "Activity: login"
+        assert record.user_id == "u2"
+        assert logging.getLogger("vbwd.services.activity_logger").propagate is True
@@ -179,6 +179,27 @@ class TestAuthServiceLogin:
         # Verify repository was called
         mock_user_repo.find_by_email.assert_called_once_with(email)
 
+    def test_login_upgrades_legacy_bcrypt_hash(self, auth_service, mock_user_repo):
+        """Test successful login replaces a bcrypt hash with argon2id."""
+        import bcrypt
+
+        password = "SecurePassword123!"
+        mock_user = User()
+        mock_user.id = uuid4()
+        mock_user.email = "test@example.com"
+        mock_user.status = UserStatus.ACTIVE
+        mock_user.role = UserRole.USER
+        mock_user.password_hash = bcrypt.hashpw(
+            password.encode("utf-8"), bcrypt.gensalt()
+        ).decode("utf-8")
+        mock_user_repo.find_by_email.return_value = mock_user
+
+        result = auth_service.login(mock_user.email, password)
+
+        assert result.success is True
+        assert mock_user.password_hash.startswith("$argon2id$")
+        mock_user_repo.save.assert_called_once_with(mock_user)
+
     def test_login_fails_for_unknown_email(self, auth_service, mock_user_repo):
         """Test login fails for unknown email."""
         email = "unknown@example.com"
@@ -362,8 +383,8 @@ class TestAuthServicePassword:
 
         return AuthService(user_repository=mock_user_repo)
 
-    def test_hash_password_returns_bcrypt_hash(self, auth_service):
-        """Test password hashing returns bcrypt hash."""
+    def test_hash_password_returns_argon2id_hash(self, auth_service):
+        """Test password hashing returns argon2id hash."""
         password = "SecurePassword123!"
 
         # Hash password
@@ -372,9 +393,9 @@ class TestAuthServicePassword:
         # Assertions
         assert hashed is not None
         assert isinstance(hashed, str)
-        assert len(hashed) > 50  # bcrypt hash length
+        assert len(hashed) > 50
         assert hashed != password  # Not plaintext
-        assert hashed.startswith("$2b$")  # bcrypt signature
+        assert hashed.startswith("$argon2id$")  # argon2id signature
 
     def test_hash_password_generates_unique_salts(self, auth_service):
         """Test password hashing generates unique salts."""
@@ -413,3 +434,25 @@ class TestAuthServicePassword:
 
         # Assertions
         assert result is False
+
+    def test_verify_password_accepts_legacy_bcrypt_hash(self, auth_service):
+        """Test password verification still accepts bcrypt hashes."""
+        import bcrypt
+
+        password = "SecurePassword123!"
+        hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode(
+            "utf-8"
+        )
+
+        assert auth_service.verify_password(password, hashed) is True
+        assert auth_service.verify_password("WrongPassword123!", hashed) is False
+
+    def test_needs_rehash(self, auth_service):
+        """Test bcrypt hashes need rehashing and fresh argon2id hashes do not."""
+        import bcrypt
+
+        legacy = bcrypt.hashpw(b"SecurePassword123!", bcrypt.gensalt()).decode("utf-8")
+        current = auth_service.hash_password("SecurePassword123!")
+
+        assert auth_service.needs_rehash(legacy) is True
+        assert auth_service.needs_rehash(current) is False
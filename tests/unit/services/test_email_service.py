@@ -73,9 +73,7 @@ class TestEmailServiceSend:
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_email_success(self, mock_smtp_class, email_service):
         """Send email successfully."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_smtp = mock_smtp_class.return_value
 
         result = email_service.send_email(
             to_email="recipient@example.com",
@@ -90,10 +88,6 @@ class TestEmailServiceSend:
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_email_with_html(self, mock_smtp_class, email_service):
         """Send email with HTML body."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
-
         result = email_service.send_email(
             to_email="recipient@example.com",
             subject="Test Subject",
@@ -103,13 +97,30 @@ class TestEmailServiceSend:
 
         assert result.success is True
 
+    def test_build_message_with_attachment(self, email_service):
+        """Built message is bytes with alternative bodies and the attachment."""
+        from email import message_from_bytes, policy
+
+        raw = email_service._build_message(
+            "recipient@example.com",
+            "Test Subject",
+            "Test body",
+            "<p>Test body</p>",
+            [("invoice.pdf", b"%PDF-1.4", "application/pdf")],
+        )
+
+        assert isinstance(raw, bytes)
+        msg = message_from_bytes(raw, policy=policy.SMTP)
+        assert msg["From"] == "VBWD <noreply@example.com>"
+        assert msg["Subject"] == "Test Subject"
+        assert msg.get_body(preferencelist=("html",)) is not None
+        (attachment,) = msg.iter_attachments()
+        assert attachment.get_filename() == "invoice.pdf"
+        assert attachment.get_content() == b"%PDF-1.4"
+
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_email_with_attachment(self, mock_smtp_class, email_service):
         """Send email with attachment."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
-
         pdf_content = b"%PDF-1.4 test content"
         result = email_service.send_email(
             to_email="recipient@example.com",
@@ -123,10 +134,8 @@ class TestEmailServiceSend:
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_email_failure_logged(self, mock_smtp_class, email_service):
         """Failed email send is logged and returns error."""
-        mock_smtp = MagicMock()
+        mock_smtp = mock_smtp_class.return_value
         mock_smtp.sendmail.side_effect = Exception("SMTP error")
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
 
         result = email_service.send_email(
             to_email="recipient@example.com",
@@ -146,6 +155,23 @@ class TestEmailServiceSend:
         assert result.success is False
         assert "invalid" in result.error.lower()
 
+    @pytest.mark.parametrize(
+        "address,expected",
+        [
+            ("user@example.com", True),
+            ("first.last+tag@sub.example.co", True),
+            ("", False),
+            ("@example.com", False),
+            ("user@com", False),
+            ("user@.c", False),
+            ("user@exa mple.com", False),
+            ("a" * 250 + "@example.com", False),
+        ],
+    )
+    def test_validate_email(self, email_service, address, expected):
+        """Structural pre-checks agree with the full regex."""
+        assert email_service._validate_email(address) is expected
+
 
 class TestEmailServiceTemplates:
     """Tests for EmailService template rendering."""
@@ -213,6 +239,35 @@ class TestEmailServiceTemplates:
         assert "Alice" in text
         assert "Alice" in html
 
+    def test_templates_are_compiled_at_init(self, email_service_with_templates):
+        """Known templates are compiled up front and not reloaded per render."""
+        service = email_service_with_templates
+
+        assert "welcome" in service._templates
+        with patch.object(service, "_load_templates") as mock_load:
+            text, _ = service.render_template(
+                template_name="welcome", context={"first_name": "John"}
+            )
+
+        assert text == "Welcome John!"
+        mock_load.assert_not_called()
+
+    def test_template_added_later_is_loaded_on_demand(
+        self, email_service_with_templates, tmp_path
+    ):
+        """Templates outside the known list are compiled on first use."""
+        template_dir = tmp_path / "templates"
+        (template_dir / "custom.txt").write_text("Hi {{ name }}")
+        (template_dir / "custom.html").write_text("<p>Hi {{ name }}</p>")
+
+        text, html = email_service_with_templates.render_template(
+            template_name="custom", context={"name": "Bob"}
+        )
+
+        assert text == "Hi Bob"
+        assert html == "<p>Hi Bob</p>"
+        assert "custom" in email_service_with_templates._templates
+
 
 class TestEmailServiceConvenienceMethods:
     """Tests for EmailService convenience methods."""
@@ -252,10 +307,6 @@ class TestEmailServiceConvenienceMethods:
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_welcome_email(self, mock_smtp_class, email_service):
         """Send welcome email to new user."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
-
         result = email_service.send_welcome_email(
             to_email="user@example.com", first_name="John"
         )
@@ -265,10 +316,6 @@ class TestEmailServiceConvenienceMethods:
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_subscription_activated_email(self, mock_smtp_class, email_service):
         """Send subscription activation email."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
-
         result = email_service.send_subscription_activated(
             to_email="user@example.com",
             first_name="John",
@@ -281,10 +328,6 @@ class TestEmailServiceConvenienceMethods:
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_subscription_cancelled_email(self, mock_smtp_class, email_service):
         """Send subscription cancellation email."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
-
         result = email_service.send_subscription_cancelled(
             to_email="user@example.com", first_name="John", plan_name="Premium"
         )
@@ -294,10 +337,6 @@ class TestEmailServiceConvenienceMethods:
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_payment_receipt_email(self, mock_smtp_class, email_service):
         """Send payment receipt email."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
-
         result = email_service.send_payment_receipt(
             to_email="user@example.com",
             first_name="John",
@@ -310,10 +349,6 @@ class TestEmailServiceConvenienceMethods:
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_payment_failed_email(self, mock_smtp_class, email_service):
         """Send payment failed notification."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
-
         result = email_service.send_payment_failed(
             to_email="user@example.com",
             first_name="John",
@@ -326,10 +361,6 @@ class TestEmailServiceConvenienceMethods:
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_invoice_email(self, mock_smtp_class, email_service):
         """Send invoice email."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
-
         result = email_service.send_invoice(
             to_email="user@example.com",
             first_name="John",
@@ -343,9 +374,6 @@ class TestEmailServiceConvenienceMethods:
     @patch("vbwd.services.email_service.smtplib.SMTP")
     def test_send_renewal_reminder_email(self, mock_smtp_class, email_service):
         """Send renewal reminder email."""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = MagicMock(return_value=mock_smtp)
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
 
         result = email_service.send_renewal_reminder(
             to_email="user@example.com",
@@ -355,3 +383,239 @@ class TestEmailServiceConvenienceMethods:
         )
 
         assert result.success is True
+
+
+class TestEmailServiceBackground:
+    """Tests for delivery through an executor."""
+
+    @pytest.fixture
+    def executor(self):
+        """Executor that records submitted work without running it."""
+        return MagicMock()
+
+    @pytest.fixture
+    def email_service(self, executor):
+        """Create email service that delivers through the executor."""
+        from vbwd.services.email_service import EmailService
+
+        return EmailService(
+            smtp_host="smtp.example.com",
+            smtp_port=587,
+            smtp_user="user@example.com",
+            smtp_password="password",
+            from_email="noreply@example.com",
+            executor=executor,
+        )
+
+    @patch("vbwd.services.email_service.smtplib.SMTP")
+    def test_send_email_queues_built_message(
+        self, mock_smtp_class, email_service, executor
+    ):
+        """send_email returns once queued; SMTP runs in the submitted task."""
+        result = email_service.send_email(
+            to_email="recipient@example.com",
+            subject="Queued",
+            body_text="Test body",
+        )
+
+        assert result.success is True
+        mock_smtp_class.assert_not_called()
+        deliver, to_email, message = executor.submit.call_args[0]
+        assert to_email == "recipient@example.com"
+        assert b"Subject: Queued" in message
+
+        mock_smtp = mock_smtp_class.return_value
+        assert deliver(to_email, message).success is True
+        mock_smtp.sendmail.assert_called_once_with(
+            "noreply@example.com", "recipient@example.com", message
+        )
+
+    @patch("vbwd.services.email_service.smtplib.SMTP")
+    def test_send_email_sync_bypasses_executor(
+        self, mock_smtp_class, email_service, executor
+    ):
+        """send_email_sync delivers inline even with an executor."""
+        mock_smtp = mock_smtp_class.return_value
+
+        result = email_service.send_email_sync(
+            to_email="recipient@example.com",
+            subject="Inline",
+            body_text="Test body",
+        )
+
+        assert result.success is True
+        executor.submit.assert_not_called()
+        mock_smtp.sendmail.assert_called_once()
+
+    def test_invalid_recipient_is_not_queued(self, email_service, executor):
+        """Validation errors are returned before anything is queued."""
+        result = email_service.send_email(
+            to_email="not-an-email", subject="Test", body_text="Test"
+        )
+
+        assert result.success is False
+        executor.submit.assert_not_called()
+
+
+class TestEmailServiceConnectionPool:
+    """Tests for SMTP connection reuse."""
+
+    @pytest.fixture
+    def email_service(self):
+        """Create email service with the default pool."""
+        from vbwd.services.email_service import EmailService
+
+        return EmailService(
+            smtp_host="smtp.example.com",
+            smtp_port=587,
+            smtp_user="user@example.com",
+            smtp_password="password",
+            from_email="noreply@example.com",
+        )
+
+    @patch("vbwd.services.email_service.smtplib.SMTP")
+    def test_connection_is_reused(self, mock_smtp_class, email_service):
+        """Consecutive messages share one authenticated connection."""
+        mock_smtp = mock_smtp_class.return_value
+
+        for _ in range(3):
+            assert email_service.send_email(
+                to_email="recipient@example.com", subject="S", body_text="B"
+            ).success
+
+        mock_smtp_class.assert_called_once_with("smtp.example.com", 587)
+        mock_smtp.login.assert_called_once()
+        assert mock_smtp.sendmail.call_count == 3
+
+    @patch("vbwd.services.email_service.smtplib.SMTP")
+    def test_reconnects_when_server_dropped_session(
+        self, mock_smtp_class, email_service
+    ):
+        """A disconnected pooled session is replaced and the send retried."""
+        import smtplib
+
+        stale, fresh = MagicMock(), MagicMock()
+        stale.sendmail.side_effect = [None, smtplib.SMTPServerDisconnected()]
+        mock_smtp_class.side_effect = [stale, fresh]
+
+        for _ in range(2):
+            assert email_service.send_email(
+                to_email="recipient@example.com", subject="S", body_text="B"
+            ).success
+
+        fresh.login.assert_called_once()
+        fresh.sendmail.assert_called_once()
+
+    @patch("vbwd.services.email_service.time.monotonic")
+    @patch("vbwd.services.email_service.smtplib.SMTP")
+    def test_idle_connection_is_closed(
+        self, mock_smtp_class, mock_monotonic, email_service
+    ):
+        """Connections idle past the timeout are closed, not reused."""
+        from vbwd.services.email_service import SMTP_IDLE_TIMEOUT
+
+        old, new = MagicMock(), MagicMock()
+        mock_smtp_class.side_effect = [old, new]
+        mock_monotonic.side_effect = [0, SMTP_IDLE_TIMEOUT + 1, 0]
+
+        for _ in range(2):
+            email_service.send_email(
+                to_email="recipient@example.com", subject="S", body_text="B"
+            )
+
+        old.quit.assert_called_once()
+        new.sendmail.assert_called_once()
+
+
+class TestEmailServiceBufferedSend:
+    """Tests for coalescing messages with buffered_send."""
+
+    @pytest.fixture
+    def email_service(self):
+        """Create email service that delivers inline."""
+        from vbwd.services.email_service import EmailService
+
+        return EmailService(
+            smtp_host="smtp.example.com",
+            smtp_port=587,
+            smtp_user="user@example.com",
+            smtp_password="password",
+            from_email="noreply@example.com",
+        )
+
+    @patch("vbwd.services.email_service.smtplib.SMTP")
+    def test_messages_are_sent_when_block_exits(self, mock_smtp_class, email_service):
+        """Messages are held until the block exits, then sent over one session."""
+        mock_smtp = mock_smtp_class.return_value
+
+        with email_service.buffered_send():
+            for i in range(3):
+                assert email_service.send_email(
+                    to_email=f"user{i}@example.com", subject="S", body_text="B"
+                ).success
+            mock_smtp.sendmail.assert_not_called()
+
+        mock_smtp_class.assert_called_once()
+        recipients = [c.args[1] for c in mock_smtp.sendmail.call_args_list]
+        assert recipients == [f"user{i}@example.com" for i in range(3)]
+
+    @patch("vbwd.services.email_service.smtplib.SMTP")
+    def test_flushes_at_threshold(self, mock_smtp_class, email_service):
+        """Reaching the threshold sends the queued messages early."""
+        mock_smtp = mock_smtp_class.return_value
+
+        with email_service.buffered_send(flush_threshold=2):
+            for _ in range(3):
+                email_service.send_email(
+                    to_email="recipient@example.com", subject="S", body_text="B"
+                )
+            assert mock_smtp.sendmail.call_count == 2
+
+        assert mock_smtp.sendmail.call_count == 3
+
+    @patch("vbwd.services.email_service.smtplib.SMTP")
+    def test_failed_message_does_not_stop_batch(self, mock_smtp_class, email_service):
+        """A rejected message is logged and the remaining ones are still sent."""
+        import smtplib
+
+        first, second = MagicMock(), MagicMock()
+        first.sendmail.side_effect = smtplib.SMTPRecipientsRefused({})
+        mock_smtp_class.side_effect = [first, second]
+
+        with email_service.buffered_send():
+            for i in range(2):
+                email_service.send_email(
+                    to_email=f"user{i}@example.com", subject="S", body_text="B"
+                )
+
+        first.quit.assert_called_once()
+        second.sendmail.assert_called_once()
+        assert second.sendmail.call_args.args[1] == "user1@example.com"
+
+    def test_batch_is_submitted_to_executor(self):
+        """With an executor the whole batch is handed over as one task."""
+        from vbwd.services.email_service import EmailService
+
+        executor = MagicMock()
+        service = EmailService(
+            smtp_host="smtp.example.com",
+            smtp_port=587,
+            smtp_user="user@example.com",
+            smtp_password="password",
+            from_email="noreply@example.com",
+            executor=executor,
+        )
+
+        with service.buffered_send():
+            with service.buffered_send():
+                for i in range(2):
+                    service.send_email(
+                        to_email=f"user{i}@example.com", subject="S", body_text="B"
+                    )
+            executor.submit.assert_not_called()
+
+        deliver_batch, batch = executor.submit.call_args.args
+        assert [to_email for to_email, _ in batch] == [
+            "user0@example.com",
+            "user1@example.com",
+        ]
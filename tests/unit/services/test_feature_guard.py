@@ -93,7 +93,7 @@ class TestFeatureGuard:
         user_id = uuid4()
         mock_subscription.tarif_plan.features = {"limits": {"api_calls": 100}}
         mock_subscription_repo.find_active_by_user.return_value = mock_subscription
-        mock_usage_repo.get_monthly_usage.return_value = 99  # 1 remaining
+        mock_usage_repo.try_increment_within_limit.return_value = 100  # Now at limit
 
         allowed, remaining = feature_guard.check_usage_limit(user_id, "api_calls", 1)
 
@@ -107,6 +107,7 @@ class TestFeatureGuard:
         user_id = uuid4()
         mock_subscription.tarif_plan.features = {"limits": {"api_calls": 100}}
         mock_subscription_repo.find_active_by_user.return_value = mock_subscription
+        mock_usage_repo.try_increment_within_limit.return_value = None
         mock_usage_repo.get_monthly_usage.return_value = 100  # At limit
 
         allowed, remaining = feature_guard.check_usage_limit(user_id, "api_calls", 1)
@@ -138,10 +139,18 @@ class TestFeatureGuard:
             "limits": {"api_calls": 100, "exports": 10}
         }
         mock_subscription_repo.find_active_by_user.return_value = mock_subscription
-        mock_usage_repo.get_monthly_usage.side_effect = [50, 3]  # api_calls, exports
+        mock_usage_repo.get_monthly_usage_bulk.return_value = {
+            "api_calls": 50,
+            "exports": 3,
+        }
 
         result = feature_guard.get_feature_limits(user_id)
 
+        mock_usage_repo.get_monthly_usage.assert_not_called()
+        mock_usage_repo.get_monthly_usage_bulk.assert_called_once_with(
+            user_id, ["api_calls", "exports"], datetime(2024, 1, 1)
+        )
+
         assert "api_calls" in result
         assert result["api_calls"]["limit"] == 100
         assert result["api_calls"]["used"] == 50
@@ -152,6 +161,18 @@ class TestFeatureGuard:
         assert result["exports"]["used"] == 3
         assert result["exports"]["remaining"] == 7
 
+    def test_get_feature_limits_defaults_missing_usage_to_zero(
+        self, feature_guard, mock_subscription_repo, mock_usage_repo, mock_subscription
+    ):
+        """Features without a usage record report zero usage."""
+        mock_subscription.tarif_plan.features = {"limits": {"exports": 10}}
+        mock_subscription_repo.find_active_by_user.return_value = mock_subscription
+        mock_usage_repo.get_monthly_usage_bulk.return_value = {}
+
+        result = feature_guard.get_feature_limits(uuid4())
+
+        assert result["exports"] == {"limit": 10, "used": 0, "remaining": 10}
+
     def test_get_feature_limits_empty_without_subscription(
         self, feature_guard, mock_subscription_repo
     ):
@@ -197,8 +218,64 @@ class TestFeatureGuard:
         user_id = uuid4()
         mock_subscription.tarif_plan.features = {"limits": {"api_calls": 100}}
         mock_subscription_repo.find_active_by_user.return_value = mock_subscription
-        mock_usage_repo.get_monthly_usage.return_value = 50
+        mock_usage_repo.try_increment_within_limit.return_value = 55
+
+        allowed, remaining = feature_guard.check_usage_limit(user_id, "api_calls", 5)
+
+        assert allowed is True
+        assert remaining == 45
+        mock_usage_repo.try_increment_within_limit.assert_called_once_with(
+            user_id, "api_calls", datetime(2024, 1, 1), 5, 100
+        )
+        mock_usage_repo.get_monthly_usage.assert_not_called()
+
+    def test_active_subscription_is_looked_up_once_per_user(
+        self, feature_guard, mock_subscription_repo, mock_subscription
+    ):
+        """Repeated checks for one user reuse the loaded subscription."""
+        user_id = uuid4()
+        mock_subscription_repo.find_active_by_user.return_value = mock_subscription
+
+        assert feature_guard.can_access_feature(user_id, "premium_feature")
+        assert "api_access" in feature_guard.get_user_features(user_id)
+        feature_guard.get_feature_limits(user_id)
+
+        mock_subscription_repo.find_active_by_user.assert_called_once_with(user_id)
+
+    def test_missing_subscription_is_cached(
+        self, feature_guard, mock_subscription_repo
+    ):
+        """A user without a subscription is not re-queried either."""
+        user_id = uuid4()
+        mock_subscription_repo.find_active_by_user.return_value = None
+
+        feature_guard.can_access_feature(user_id, "basic_access")
+        feature_guard.get_user_features(user_id)
+
+        mock_subscription_repo.find_active_by_user.assert_called_once_with(user_id)
+
+    def test_free_tier_features_are_returned_without_copying(
+        self, feature_guard, mock_subscription_repo
+    ):
+        """Users without a subscription get the shared immutable free tier."""
+        mock_subscription_repo.find_active_by_user.return_value = None
+
+        result = feature_guard.get_user_features(uuid4())
+
+        assert result is FeatureGuard.FREE_TIER_FEATURES
+        assert isinstance(result, frozenset)
+
+    def test_effective_plan_features_are_reused(
+        self, feature_guard, mock_subscription_repo, mock_subscription
+    ):
+        """Merged plan features are built once per plan version."""
+        mock_subscription.tarif_plan.version = 1
+        mock_subscription_repo.find_active_by_user.return_value = mock_subscription
 
-        feature_guard.check_usage_limit(user_id, "api_calls", 5)
+        first = feature_guard.get_user_features(uuid4())
+        second = feature_guard.get_user_features(uuid4())
 
-        mock_usage_repo.increment_usage.assert_called_once()
+        assert first is second
+        assert first == {"premium_feature", "api_access"} | (
+            FeatureGuard.FREE_TIER_FEATURES
+        )
@@ -35,6 +35,42 @@ class TestInvoiceServiceCreation:
         assert result.invoice.status == InvoiceStatus.PENDING
         mock_repo.save.assert_called_once()
 
+    def test_create_invoice_parses_string_ids(self):
+        """String IDs are parsed once and stored as UUIDs."""
+        from vbwd.services.invoice_service import InvoiceService
+
+        mock_repo = MagicMock()
+        mock_repo.save.side_effect = lambda invoice: invoice
+        user_id = uuid4()
+
+        service = InvoiceService(invoice_repository=mock_repo)
+        result = service.create_invoice(
+            user_id=str(user_id),
+            subscription_id=None,
+            tarif_plan_id=uuid4(),
+            amount=Decimal("10.00"),
+        )
+
+        assert result.success is True
+        assert result.invoice.user_id == user_id
+        assert result.invoice.subscription_id is None
+
+    def test_create_invoice_rejects_malformed_id(self):
+        """A malformed string ID is reported without saving."""
+        from vbwd.services.invoice_service import InvoiceService
+
+        mock_repo = MagicMock()
+        service = InvoiceService(invoice_repository=mock_repo)
+        result = service.create_invoice(
+            user_id="not-a-uuid",
+            subscription_id=str(uuid4()),
+            tarif_plan_id=str(uuid4()),
+            amount=Decimal("10.00"),
+        )
+
+        assert result.success is False
+        mock_repo.save.assert_not_called()
+
     def test_create_invoice_generates_unique_number(self):
         """Create invoice generates unique invoice number."""
         from vbwd.services.invoice_service import InvoiceService
@@ -116,6 +152,10 @@ class TestInvoiceServiceCreation:
         expected = datetime.utcnow() + timedelta(days=30)
         diff = abs((saved_invoice.expires_at - expected).total_seconds())
         assert diff < 60  # Within 1 minute
+        # Both timestamps come from a single clock read
+        assert saved_invoice.expires_at - saved_invoice.invoiced_at == timedelta(
+            days=30
+        )
 
 
 class TestInvoiceServiceRetrieval:
@@ -190,6 +230,22 @@ class TestInvoiceServiceRetrieval:
         assert result == mock_invoices
         mock_repo.find_by_subscription.assert_called_once_with(str(subscription_id))
 
+    def test_iter_user_invoices_streams_from_repository(self):
+        """Iterating user invoices uses the streaming query, not the list."""
+        from vbwd.services.invoice_service import InvoiceService
+
+        user_id = str(uuid4())
+        mock_invoices = [MagicMock(), MagicMock()]
+        mock_repo = MagicMock()
+        mock_repo.iter_by_user.return_value = iter(mock_invoices)
+
+        service = InvoiceService(invoice_repository=mock_repo)
+        result = service.iter_user_invoices(user_id)
+
+        assert list(result) == mock_invoices
+        mock_repo.iter_by_user.assert_called_once_with(user_id)
+        mock_repo.find_by_user.assert_not_called()
+
 
 class TestInvoiceServiceStatusTransitions:
     """Tests for invoice status transitions."""
@@ -199,10 +255,9 @@ class TestInvoiceServiceStatusTransitions:
         from vbwd.services.invoice_service import InvoiceService
 
         invoice_id = uuid4()
-        mock_invoice = MagicMock(id=invoice_id, status=InvoiceStatus.PENDING)
+        mock_invoice = MagicMock(id=invoice_id, status=InvoiceStatus.PAID)
         mock_repo = MagicMock()
-        mock_repo.find_by_id.return_value = mock_invoice
-        mock_repo.save.return_value = mock_invoice
+        mock_repo.update_if.return_value = mock_invoice
 
         service = InvoiceService(invoice_repository=mock_repo)
         result = service.mark_paid(
@@ -212,17 +267,20 @@ class TestInvoiceServiceStatusTransitions:
         )
 
         assert result.success is True
-        mock_invoice.mark_paid.assert_called_once_with("pay_123abc", "stripe")
-        mock_repo.save.assert_called_once()
+        assert result.invoice is mock_invoice
+        # The status check and write are one conditional UPDATE
+        mock_repo.find_by_id.assert_not_called()
+        mock_repo.save.assert_not_called()
+        args, changes = mock_repo.update_if.call_args
+        assert args[0] == str(invoice_id)
+        assert "status" in str(args[1])
+        assert changes["status"] == InvoiceStatus.PAID
 
     def test_mark_paid_sets_payment_reference(self):
         """Mark paid stores payment reference."""
         from vbwd.services.invoice_service import InvoiceService
 
-        mock_invoice = MagicMock(status=InvoiceStatus.PENDING)
         mock_repo = MagicMock()
-        mock_repo.find_by_id.return_value = mock_invoice
-        mock_repo.save.return_value = mock_invoice
 
         service = InvoiceService(invoice_repository=mock_repo)
         service.mark_paid(
@@ -231,7 +289,10 @@ class TestInvoiceServiceStatusTransitions:
             payment_method="paypal",
         )
 
-        mock_invoice.mark_paid.assert_called_with("pay_ref_xyz", "paypal")
+        changes = mock_repo.update_if.call_args.kwargs
+        assert changes["payment_ref"] == "pay_ref_xyz"
+        assert changes["payment_method"] == "paypal"
+        assert changes["paid_at"] is not None
 
     def test_mark_paid_already_paid(self):
         """Mark paid returns error if already paid."""
@@ -239,6 +300,7 @@ class TestInvoiceServiceStatusTransitions:
 
         mock_invoice = MagicMock(status=InvoiceStatus.PAID)
         mock_repo = MagicMock()
+        mock_repo.update_if.return_value = None
         mock_repo.find_by_id.return_value = mock_invoice
 
         service = InvoiceService(invoice_repository=mock_repo)
@@ -256,6 +318,7 @@ class TestInvoiceServiceStatusTransitions:
         from vbwd.services.invoice_service import InvoiceService
 
         mock_repo = MagicMock()
+        mock_repo.update_if.return_value = None
         mock_repo.find_by_id.return_value = None
 
         service = InvoiceService(invoice_repository=mock_repo)
@@ -268,44 +331,70 @@ class TestInvoiceServiceStatusTransitions:
         assert result.success is False
         assert "not found" in result.error.lower()
 
+    def test_failure_results_are_not_shared(self):
+        """Each call gets its own failed result."""
+        from vbwd.services.invoice_service import InvoiceService
+
+        mock_repo = MagicMock()
+        mock_repo.update_if.return_value = None
+        mock_repo.find_by_id.return_value = None
+        service = InvoiceService(invoice_repository=mock_repo)
+
+        first = service.mark_paid(str(uuid4()), "pay", "stripe")
+        first.error = "changed by caller"
+        second = service.mark_paid(str(uuid4()), "pay", "stripe")
+
+        assert second is not first
+        assert second.error == "Invoice not found"
+
+    def test_results_use_slots(self):
+        """Results carry no per-instance __dict__."""
+        from vbwd.services.invoice_service import InvoiceResult
+        from vbwd.services.password_reset_service import ResetResult
+        from vbwd.services.refund_service import RefundResult
+        from vbwd.services.restore_service import RestoreResult
+
+        for result in (
+            InvoiceResult(success=True),
+            RefundResult(success=True),
+            RestoreResult(success=True),
+            ResetResult(success=True),
+        ):
+            assert not hasattr(result, "__dict__")
+
     def test_mark_failed(self):
         """Mark invoice as failed (PENDING → FAILED)."""
         from vbwd.services.invoice_service import InvoiceService
 
-        mock_invoice = MagicMock(status=InvoiceStatus.PENDING)
         mock_repo = MagicMock()
-        mock_repo.find_by_id.return_value = mock_invoice
-        mock_repo.save.return_value = mock_invoice
 
         service = InvoiceService(invoice_repository=mock_repo)
         result = service.mark_failed(str(uuid4()))
 
         assert result.success is True
-        mock_invoice.mark_failed.assert_called_once()
+        args, changes = mock_repo.update_if.call_args
+        assert len(args) == 1  # any current status
+        assert changes == {"status": InvoiceStatus.FAILED}
 
     def test_mark_cancelled(self):
         """Mark invoice as cancelled (PENDING → CANCELLED)."""
         from vbwd.services.invoice_service import InvoiceService
 
-        mock_invoice = MagicMock(status=InvoiceStatus.PENDING)
         mock_repo = MagicMock()
-        mock_repo.find_by_id.return_value = mock_invoice
-        mock_repo.save.return_value = mock_invoice
 
         service = InvoiceService(invoice_repository=mock_repo)
         result = service.mark_cancelled(str(uuid4()))
 
         assert result.success is True
-        mock_invoice.mark_cancelled.assert_called_once()
+        args, changes = mock_repo.update_if.call_args
+        assert len(args) == 1  # any current status
+        assert changes == {"status": InvoiceStatus.CANCELLED}
 
     def test_mark_refunded(self):
         """Mark invoice as refunded (PAID → REFUNDED)."""
         from vbwd.services.invoice_service import InvoiceService
 
-        mock_invoice = MagicMock(status=InvoiceStatus.PAID)
         mock_repo = MagicMock()
-        mock_repo.find_by_id.return_value = mock_invoice
-        mock_repo.save.return_value = mock_invoice
 
         service = InvoiceService(invoice_repository=mock_repo)
         result = service.mark_refunded(
@@ -313,7 +402,10 @@ class TestInvoiceServiceStatusTransitions:
         )
 
         assert result.success is True
-        mock_invoice.mark_refunded.assert_called_once()
+        mock_repo.find_by_id.assert_not_called()
+        assert mock_repo.update_if.call_args.kwargs == {
+            "status": InvoiceStatus.REFUNDED
+        }
 
     def test_mark_refunded_not_paid(self):
         """Mark refunded returns error if not paid."""
@@ -321,6 +413,7 @@ class TestInvoiceServiceStatusTransitions:
 
         mock_invoice = MagicMock(status=InvoiceStatus.PENDING)
         mock_repo = MagicMock()
+        mock_repo.update_if.return_value = None
         mock_repo.find_by_id.return_value = mock_invoice
 
         service = InvoiceService(invoice_repository=mock_repo)
@@ -334,6 +427,72 @@ class TestInvoiceServiceStatusTransitions:
             or "cannot refund" in result.error.lower()
         )
 
+    def test_mark_paid_retries_after_concurrent_modification(self):
+        """Mark paid reloads and retries when the save hits a stale version."""
+        from vbwd.models.base import ConcurrentModificationError
+        from vbwd.services.invoice_service import InvoiceService
+
+        stale = MagicMock(status=InvoiceStatus.PENDING)
+        fresh = MagicMock(status=InvoiceStatus.PENDING)
+        mock_repo = MagicMock()
+        mock_repo.update_if.return_value = None
+        mock_repo.find_by_id.side_effect = [stale, fresh]
+        mock_repo.save.side_effect = [ConcurrentModificationError("stale"), fresh]
+
+        service = InvoiceService(invoice_repository=mock_repo)
+        result = service.mark_paid(
+            invoice_id=str(uuid4()),
+            payment_reference="pay_123",
+            payment_method="stripe",
+        )
+
+        assert result.success is True
+        assert result.invoice is fresh
+        fresh.mark_paid.assert_called_once_with("pay_123", "stripe")
+
+    def test_mark_paid_revalidates_after_concurrent_modification(self):
+        """A concurrent payment is reported instead of paying twice."""
+        from vbwd.models.base import ConcurrentModificationError
+        from vbwd.services.invoice_service import InvoiceService
+
+        stale = MagicMock(status=InvoiceStatus.PENDING)
+        paid = MagicMock(status=InvoiceStatus.PAID)
+        mock_repo = MagicMock()
+        mock_repo.update_if.return_value = None
+        mock_repo.find_by_id.side_effect = [stale, paid]
+        mock_repo.save.side_effect = ConcurrentModificationError("stale")
+
+        service = InvoiceService(invoice_repository=mock_repo)
+        result = service.mark_paid(
+            invoice_id=str(uuid4()),
+            payment_reference="pay_123",
+            payment_method="stripe",
+        )
+
+        assert result.success is False
+        assert "already paid" in result.error.lower()
+        paid.mark_paid.assert_not_called()
+
+    def test_mark_failed_gives_up_after_repeated_conflicts(self):
+        """Persistent conflicts surface as an error rather than looping."""
+        from vbwd.models.base import ConcurrentModificationError
+        from vbwd.services.invoice_service import (
+            INVOICE_UPDATE_ATTEMPTS,
+            InvoiceService,
+        )
+
+        mock_repo = MagicMock()
+        mock_repo.update_if.return_value = None
+        mock_repo.find_by_id.return_value = MagicMock(status=InvoiceStatus.PENDING)
+        mock_repo.save.side_effect = ConcurrentModificationError("stale")
+
+        service = InvoiceService(invoice_repository=mock_repo)
+        result = service.mark_failed(str(uuid4()))
+
+        assert result.success is False
+        assert "concurrently" in result.error.lower()
+        assert mock_repo.save.call_count == INVOICE_UPDATE_ATTEMPTS
+
 
 class TestInvoiceServiceQueries:
     """Tests for invoice queries."""
@@ -148,6 +148,21 @@ class TestPasswordResetService:
         assert result.error == "Invalid token"
         assert result.failure_reason == "invalid"
 
+    def test_reset_password_failures_are_shared_and_frozen(
+        self, service, mock_reset_repo
+    ):
+        """Static failures reuse one immutable result."""
+        import dataclasses
+
+        mock_reset_repo.find_by_token.return_value = None
+
+        first = service.reset_password("a", "NewPassword123!")
+        second = service.reset_password("b", "NewPassword123!")
+
+        assert first is second
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.success = True
+
     def test_reset_password_with_expired_token(self, service, mock_reset_repo):
         """Password reset fails with expired token."""
         # Arrange
@@ -204,6 +219,35 @@ class TestPasswordResetService:
         # Assert
         mock_user_repo.update.assert_called_once()
 
+    def test_reset_password_uses_injected_auth_service(
+        self, mock_user_repo, mock_reset_repo
+    ):
+        """New password is hashed by the injected auth service."""
+        from vbwd.services.password_reset_service import PasswordResetService
+
+        # Arrange
+        auth_service = Mock()
+        auth_service.hash_password.return_value = "hashed"
+        service = PasswordResetService(
+            user_repository=mock_user_repo,
+            reset_repository=mock_reset_repo,
+            auth_service=auth_service,
+        )
+        mock_user = Mock()
+        mock_token = Mock()
+        mock_token.expires_at = datetime.utcnow() + timedelta(hours=1)
+        mock_token.used_at = None
+        mock_reset_repo.find_by_token.return_value = mock_token
+        mock_user_repo.find_by_id.return_value = mock_user
+
+        # Act
+        result = service.reset_password("valid_token", "NewPassword123!")
+
+        # Assert
+        assert result.success is True
+        auth_service.hash_password.assert_called_once_with("NewPassword123!")
+        assert mock_user.password_hash == "hashed"
+
     def test_reset_password_marks_token_as_used(
         self, service, mock_user_repo, mock_reset_repo
     ):
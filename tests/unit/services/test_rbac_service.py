@@ -23,21 +23,27 @@ class TestRBACService:
     ):
         """User with role that has permission returns True."""
         user_id = uuid4()
-        mock_role_repo.user_has_role.return_value = False
-        mock_role_repo.get_user_permissions.return_value = {"users.view", "users.edit"}
+        mock_role_repo.get_user_permissions_with_admin.return_value = (
+            {"users.view", "users.edit"},
+            False,
+        )
 
         result = rbac_service.has_permission(user_id, "users.view")
 
         assert result is True
-        mock_role_repo.get_user_permissions.assert_called_once_with(user_id)
+        mock_role_repo.get_user_permissions_with_admin.assert_called_once_with(
+            user_id, "admin"
+        )
 
     def test_has_permission_returns_false_when_user_lacks_permission(
         self, rbac_service, mock_role_repo
     ):
         """User without permission returns False."""
         user_id = uuid4()
-        mock_role_repo.user_has_role.return_value = False
-        mock_role_repo.get_user_permissions.return_value = {"users.view"}
+        mock_role_repo.get_user_permissions_with_admin.return_value = (
+            {"users.view"},
+            False,
+        )
 
         result = rbac_service.has_permission(user_id, "users.delete")
 
@@ -46,20 +52,24 @@ class TestRBACService:
     def test_admin_has_all_permissions(self, rbac_service, mock_role_repo):
         """Admin role has all permissions."""
         user_id = uuid4()
-        mock_role_repo.user_has_role.return_value = True  # Is admin
+        mock_role_repo.get_user_permissions_with_admin.return_value = (
+            set(),
+            True,
+        )  # Is admin
 
         result = rbac_service.has_permission(user_id, "any.permission")
 
         assert result is True
-        mock_role_repo.user_has_role.assert_called_with(user_id, "admin")
 
     def test_has_any_permission_returns_true_when_has_one(
         self, rbac_service, mock_role_repo
     ):
         """Returns True when user has at least one permission."""
         user_id = uuid4()
-        mock_role_repo.user_has_role.return_value = False
-        mock_role_repo.get_user_permissions.return_value = {"users.view"}
+        mock_role_repo.get_user_permissions_with_admin.return_value = (
+            {"users.view"},
+            False,
+        )
 
         result = rbac_service.has_any_permission(user_id, ["users.view", "users.edit"])
 
@@ -70,8 +80,10 @@ class TestRBACService:
     ):
         """Returns False when user has no matching permissions."""
         user_id = uuid4()
-        mock_role_repo.user_has_role.return_value = False
-        mock_role_repo.get_user_permissions.return_value = {"reports.view"}
+        mock_role_repo.get_user_permissions_with_admin.return_value = (
+            {"reports.view"},
+            False,
+        )
 
         result = rbac_service.has_any_permission(user_id, ["users.view", "users.edit"])
 
@@ -82,12 +94,14 @@ class TestRBACService:
     ):
         """Returns True when user has all permissions."""
         user_id = uuid4()
-        mock_role_repo.user_has_role.return_value = False
-        mock_role_repo.get_user_permissions.return_value = {
-            "users.view",
-            "users.edit",
-            "reports.view",
-        }
+        mock_role_repo.get_user_permissions_with_admin.return_value = (
+            {
+                "users.view",
+                "users.edit",
+                "reports.view",
+            },
+            False,
+        )
 
         result = rbac_service.has_all_permissions(user_id, ["users.view", "users.edit"])
 
@@ -98,8 +112,10 @@ class TestRBACService:
     ):
         """Returns False when user is missing a permission."""
         user_id = uuid4()
-        mock_role_repo.user_has_role.return_value = False
-        mock_role_repo.get_user_permissions.return_value = {"users.view"}
+        mock_role_repo.get_user_permissions_with_admin.return_value = (
+            {"users.view"},
+            False,
+        )
 
         result = rbac_service.has_all_permissions(user_id, ["users.view", "users.edit"])
 
@@ -129,7 +145,7 @@ class TestRBACService:
         """Returns set of permission names."""
         user_id = uuid4()
         expected = {"users.view", "reports.view"}
-        mock_role_repo.get_user_permissions.return_value = expected
+        mock_role_repo.get_user_permissions_with_admin.return_value = (expected, False)
 
         result = rbac_service.get_user_permissions(user_id)
 
@@ -151,18 +167,70 @@ class TestRBACService:
     def test_is_admin_returns_true_for_admin(self, rbac_service, mock_role_repo):
         """Returns True for admin user."""
         user_id = uuid4()
-        mock_role_repo.user_has_role.return_value = True
+        mock_role_repo.get_user_permissions_with_admin.return_value = (set(), True)
 
         result = rbac_service.is_admin(user_id)
 
         assert result is True
-        mock_role_repo.user_has_role.assert_called_with(user_id, "admin")
+        mock_role_repo.get_user_permissions_with_admin.assert_called_with(
+            user_id, "admin"
+        )
 
     def test_is_admin_returns_false_for_non_admin(self, rbac_service, mock_role_repo):
         """Returns False for non-admin user."""
         user_id = uuid4()
-        mock_role_repo.user_has_role.return_value = False
+        mock_role_repo.get_user_permissions_with_admin.return_value = (set(), False)
 
         result = rbac_service.is_admin(user_id)
 
         assert result is False
+
+    def test_permission_checks_reuse_loaded_access(self, rbac_service, mock_role_repo):
+        """Repeated checks for a user hit the repository once."""
+        user_id = uuid4()
+        mock_role_repo.get_user_permissions_with_admin.return_value = (
+            {"users.view"},
+            False,
+        )
+
+        assert rbac_service.has_permission(user_id, "users.view") is True
+        assert rbac_service.has_any_permission(user_id, ["users.edit"]) is False
+        assert rbac_service.has_all_permissions(user_id, ["users.view"]) is True
+
+        mock_role_repo.get_user_permissions_with_admin.assert_called_once_with(
+            user_id, "admin"
+        )
+
+    def test_admin_and_permissions_load_together(self, rbac_service, mock_role_repo):
+        """One repository call answers both the admin and permission checks."""
+        user_id = uuid4()
+        mock_role_repo.get_user_permissions_with_admin.return_value = (set(), True)
+
+        assert rbac_service.has_permission(user_id, "users.view") is True
+        assert rbac_service.has_all_permissions(user_id, ["a", "b"]) is True
+        assert rbac_service.get_user_permissions(user_id) == frozenset()
+
+        mock_role_repo.get_user_permissions_with_admin.assert_called_once()
+        mock_role_repo.user_has_role.assert_not_called()
+        mock_role_repo.get_user_permissions.assert_not_called()
+
+    def test_role_change_invalidates_cached_access(self, rbac_service, mock_role_repo):
+        """Assigning or revoking a role reloads the user's access."""
+        user_id = uuid4()
+        mock_role_repo.get_user_permissions_with_admin.return_value = (
+            {"users.view"},
+            False,
+        )
+        assert rbac_service.has_permission(user_id, "users.edit") is False
+
+        mock_role_repo.get_user_permissions_with_admin.return_value = (
+            {"users.edit"},
+            False,
+        )
+        rbac_service.assign_role(user_id, "editor")
+        assert rbac_service.has_permission(user_id, "users.edit") is True
+
+        mock_role_repo.get_user_permissions_with_admin.return_value = (set(), False)
+        rbac_service.revoke_role(user_id, "editor")
+        assert rbac_service.has_permission(user_id, "users.edit") is False
+        assert mock_role_repo.get_user_permissions_with_admin.call_count == 3
@@ -53,7 +53,9 @@ def _make_service(
     invoice_repo.find_by_id.return_value = invoice
 
     subscription_repo = subscription_repo or MagicMock()
-    purchase_repo = purchase_repo or MagicMock()
+    purchase_repo = purchase_repo or MagicMock(
+        find_by_line_items=MagicMock(return_value={})
+    )
     addon_sub_repo = addon_sub_repo or MagicMock()
     token_service = token_service or MagicMock()
 
@@ -143,7 +145,7 @@ class TestRefundServiceProcessRefund:
         purchase.token_amount = 500
 
         purchase_repo = MagicMock()
-        purchase_repo.find_by_id.return_value = purchase
+        purchase_repo.find_by_line_items.return_value = {purchase.id: purchase}
 
         token_service = MagicMock()
         token_service.get_balance.return_value = 100  # less than 500 needed
@@ -175,7 +177,7 @@ class TestRefundServiceProcessRefund:
         purchase.token_amount = 500
 
         purchase_repo = MagicMock()
-        purchase_repo.find_by_id.return_value = purchase
+        purchase_repo.find_by_line_items.return_value = {purchase.id: purchase}
 
         token_service = MagicMock()
         token_service.get_balance.return_value = 500
@@ -192,9 +194,14 @@ class TestRefundServiceProcessRefund:
         )
 
         assert result.success is True
-        assert purchase.status == PurchaseStatus.REFUNDED
+        purchase_repo.bulk_update_status.assert_called_once_with(
+            [purchase_id],
+            PurchaseStatus.REFUNDED,
+            expected_status=PurchaseStatus.COMPLETED,
+        )
+        purchase_repo.save.assert_not_called()
         assert result.items_reversed["tokens_debited"] == 500
-        assert str(purchase_id) in result.items_reversed["token_bundles"]
+        assert purchase_id in result.items_reversed["token_bundles"]
 
     def test_refund_cancels_addon(self):
         """Refund cancels an active add-on subscription."""
@@ -255,7 +262,7 @@ class TestRefundServiceProcessRefund:
         purchase.token_amount = 1000
 
         purchase_repo = MagicMock()
-        purchase_repo.find_by_id.return_value = purchase
+        purchase_repo.find_by_line_items.return_value = {purchase.id: purchase}
 
         token_service = MagicMock()
         token_service.get_balance.return_value = 1000
@@ -302,7 +309,9 @@ class TestRefundServiceProcessRefund:
         addon_sub = MagicMock(id=addon_id, status=SubscriptionStatus.ACTIVE)
 
         sub_repo = MagicMock(find_by_id=MagicMock(return_value=subscription))
-        purchase_repo = MagicMock(find_by_id=MagicMock(return_value=purchase))
+        purchase_repo = MagicMock(
+            find_by_line_items=MagicMock(return_value={purchase.id: purchase})
+        )
         addon_repo = MagicMock(find_by_id=MagicMock(return_value=addon_sub))
         token_service = MagicMock()
         token_service.get_balance.return_value = 500
@@ -322,6 +331,90 @@ class TestRefundServiceProcessRefund:
 
         assert result.success is True
         assert result.items_reversed["subscription"] == str(sub_id)
-        assert str(purchase_id) in result.items_reversed["token_bundles"]
+        assert purchase_id in result.items_reversed["token_bundles"]
         assert str(addon_id) in result.items_reversed["add_ons"]
         assert result.items_reversed["tokens_debited"] == 300
+
+    def test_refund_revalidates_after_concurrent_modification(self):
+        """A refund that loses a version race re-checks the reloaded invoice."""
+        from vbwd.models.base import ConcurrentModificationError
+
+        stale = _make_invoice(InvoiceStatus.PAID)
+        refunded = _make_invoice(InvoiceStatus.REFUNDED)
+        service = _make_service()
+        service._invoice_repo.find_by_id.side_effect = [stale, refunded]
+        service._invoice_repo.save.side_effect = ConcurrentModificationError("stale")
+
+        result = service.process_refund(invoice_id=stale.id, refund_reference="REF_009")
+
+        assert result.success is False
+        assert "cannot refund" in result.error.lower()
+        refunded.mark_refunded.assert_not_called()
+
+    def test_refund_retries_after_concurrent_modification(self):
+        """A refund retries the save against a freshly loaded invoice."""
+        from vbwd.models.base import ConcurrentModificationError
+
+        stale = _make_invoice(InvoiceStatus.PAID)
+        fresh = _make_invoice(InvoiceStatus.PAID)
+        service = _make_service()
+        service._invoice_repo.find_by_id.side_effect = [stale, fresh]
+        service._invoice_repo.save.side_effect = [
+            ConcurrentModificationError("stale"),
+            fresh,
+        ]
+
+        result = service.process_refund(invoice_id=stale.id, refund_reference="REF_010")
+
+        assert result.success is True
+        assert result.invoice == fresh
+        fresh.mark_refunded.assert_called_once()
+
+    def test_refund_commits_once_in_unit_of_work(self):
+        """With a session, the whole refund commits as one transaction."""
+        invoice = _make_invoice(InvoiceStatus.PAID)
+        service = _make_service(invoice=invoice)
+        session = MagicMock()
+        session.info = {}
+        service._session = session
+
+        result = service.process_refund(
+            invoice_id=invoice.id, refund_reference="REF_011"
+        )
+
+        assert result.success is True
+        session.commit.assert_called_once()
+        session.rollback.assert_not_called()
+        assert session.info == {}
+
+    def test_refund_fails_when_purchase_changed_concurrently(self):
+        """A purchase that left COMPLETED mid-refund fails the whole refund."""
+        from vbwd.models.base import ConcurrentModificationError
+
+        purchase_id = uuid4()
+        line_item = _make_line_item(LineItemType.TOKEN_BUNDLE, purchase_id)
+        invoice = _make_invoice(InvoiceStatus.PAID, [line_item])
+
+        purchase = MagicMock()
+        purchase.id = purchase_id
+        purchase.status = PurchaseStatus.COMPLETED
+        purchase.token_amount = 100
+        purchase_repo = MagicMock()
+        purchase_repo.find_by_line_items.return_value = {purchase.id: purchase}
+        purchase_repo.bulk_update_status.side_effect = ConcurrentModificationError(
+            "changed"
+        )
+        token_service = MagicMock()
+        token_service.get_balance.return_value = 100
+        token_service.refund_tokens.return_value = 100
+
+        service = _make_service(
+            invoice=invoice, purchase_repo=purchase_repo, token_service=token_service
+        )
+
+        result = service.process_refund(
+            invoice_id=invoice.id, refund_reference="REF_012"
+        )
+
+        assert result.success is False
+        assert "modified concurrently" in result.error
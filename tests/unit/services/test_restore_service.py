@@ -51,7 +51,9 @@ def _make_container(**overrides):
         "addon_subscription_repository",
     ]:
         if name not in overrides:
-            getattr(container, name).return_value = MagicMock()
+            getattr(container, name).return_value = MagicMock(
+                find_by_line_items=MagicMock(return_value={})
+            )
     for name, repo in overrides.items():
         getattr(container, name).return_value = repo
     return container
@@ -64,7 +66,14 @@ def _make_service(container):
     registry = LineItemHandlerRegistry()
     registry.register(CoreLineItemHandler(container))
     registry.register(SubscriptionLineItemHandler(container))
-    return RestoreService(container, registry=registry)
+    return RestoreService(
+        invoice_repo=container.invoice_repository(),
+        purchase_repo=container.token_bundle_purchase_repository(),
+        token_balance_repo=container.token_balance_repository(),
+        token_transaction_repo=container.token_transaction_repository(),
+        container=container,
+        registry=registry,
+    )
 
 
 class TestRestoreServiceProcessRestore:
@@ -144,7 +153,7 @@ class TestRestoreServiceProcessRestore:
         invoice_repo = MagicMock()
         invoice_repo.find_by_id.return_value = invoice
 
-        purchase_repo = MagicMock()
+        purchase_repo = MagicMock(find_by_line_items=MagicMock(return_value={}))
         purchase_repo.find_by_id.return_value = purchase
 
         token_balance_repo = MagicMock()
@@ -170,8 +179,8 @@ class TestRestoreServiceProcessRestore:
         purchase_repo.save.assert_called_with(purchase)
         assert balance.balance == 600
         token_balance_repo.save.assert_called()
-        token_tx_repo.save.assert_called_once()
-        assert str(purchase_id) in result.items_restored["token_bundles"]
+        token_tx_repo.create_many.assert_called_once()
+        assert purchase_id in result.items_restored["token_bundles"]
         assert result.items_restored["tokens_credited"] == 500
 
     def test_restore_creates_balance_if_none(self):
@@ -189,7 +198,7 @@ class TestRestoreServiceProcessRestore:
         invoice_repo = MagicMock()
         invoice_repo.find_by_id.return_value = invoice
 
-        purchase_repo = MagicMock()
+        purchase_repo = MagicMock(find_by_line_items=MagicMock(return_value={}))
         purchase_repo.find_by_id.return_value = purchase
 
         token_balance_repo = MagicMock()
@@ -211,6 +220,50 @@ class TestRestoreServiceProcessRestore:
         saved_balance = token_balance_repo.save.call_args[0][0]
         assert saved_balance.balance == 300
 
+    def test_restore_credits_all_bundles_with_one_balance_write(self):
+        """Several bundles update the balance once, with a row per purchase."""
+        user_id = uuid4()
+        purchases = [
+            MagicMock(id=uuid4(), status=PurchaseStatus.REFUNDED, token_amount=amount)
+            for amount in (100, 250)
+        ]
+        invoice = _make_invoice(
+            InvoiceStatus.REFUNDED,
+            [
+                _make_line_item(LineItemType.TOKEN_BUNDLE, purchase.id)
+                for purchase in purchases
+            ],
+            user_id=user_id,
+        )
+
+        balance = MagicMock()
+        balance.balance = 10
+        token_balance_repo = MagicMock(find_by_user_id=MagicMock(return_value=balance))
+        token_tx_repo = MagicMock()
+        container = _make_container(
+            invoice_repository=MagicMock(find_by_id=MagicMock(return_value=invoice)),
+            token_bundle_purchase_repository=MagicMock(
+                find_by_line_items=MagicMock(
+                    return_value={purchase.id: purchase for purchase in purchases}
+                )
+            ),
+            token_balance_repository=token_balance_repo,
+            token_transaction_repository=token_tx_repo,
+        )
+        service = _make_service(container)
+
+        result = service.process_restore(
+            invoice_id=invoice.id, reason="refund_canceled"
+        )
+
+        assert result.success is True
+        assert balance.balance == 360
+        token_balance_repo.find_by_user_id.assert_called_once_with(user_id)
+        token_balance_repo.save.assert_called_once_with(balance)
+        transactions = token_tx_repo.create_many.call_args[0][0]
+        assert [tx.reference_id for tx in transactions] == [p.id for p in purchases]
+        assert result.items_restored["tokens_credited"] == 350
+
     def test_restore_reactivates_addon(self):
         """Restore re-activates a cancelled add-on subscription."""
         addon_id = uuid4()
@@ -303,7 +356,10 @@ class TestRestoreServiceProcessRestore:
         balance.balance = 50
 
         sub_repo = MagicMock(find_by_id=MagicMock(return_value=subscription))
-        purchase_repo = MagicMock(find_by_id=MagicMock(return_value=purchase))
+        purchase_repo = MagicMock(
+            find_by_id=MagicMock(return_value=purchase),
+            find_by_line_items=MagicMock(return_value={}),
+        )
         addon_repo = MagicMock(find_by_id=MagicMock(return_value=addon_sub))
         token_balance_repo = MagicMock(find_by_user_id=MagicMock(return_value=balance))
 
@@ -325,7 +381,7 @@ class TestRestoreServiceProcessRestore:
 
         assert result.success is True
         assert result.items_restored["subscription"] == str(sub_id)
-        assert str(purchase_id) in result.items_restored["token_bundles"]
+        assert purchase_id in result.items_restored["token_bundles"]
         assert str(addon_id) in result.items_restored["add_ons"]
         assert result.items_restored["tokens_credited"] == 200
         assert invoice.status == InvoiceStatus.PAID
@@ -333,3 +389,37 @@ class TestRestoreServiceProcessRestore:
         assert purchase.status == PurchaseStatus.COMPLETED
         assert addon_sub.status == SubscriptionStatus.ACTIVE
         assert balance.balance == 250
+
+    def test_restore_rolls_back_everything_on_failure(self):
+        """With a session, a failing restore rolls back the invoice write too."""
+        purchase_id = uuid4()
+        line_item = _make_line_item(LineItemType.TOKEN_BUNDLE, purchase_id)
+        invoice = _make_invoice(InvoiceStatus.REFUNDED, [line_item])
+        invoice_repo = MagicMock()
+        invoice_repo.find_by_id.return_value = invoice
+
+        purchase = MagicMock()
+        purchase.id = purchase_id
+        purchase.status = PurchaseStatus.REFUNDED
+        purchase.token_amount = 100
+        purchase_repo = MagicMock()
+        purchase_repo.find_by_line_items.return_value = {purchase.id: purchase}
+
+        balance_repo = MagicMock()
+        balance_repo.save.side_effect = RuntimeError("db down")
+
+        container = _make_container(
+            invoice_repository=invoice_repo,
+            token_bundle_purchase_repository=purchase_repo,
+            token_balance_repository=balance_repo,
+        )
+        service = _make_service(container)
+        session = MagicMock()
+        session.info = {}
+        service._session = session
+
+        with pytest.raises(RuntimeError):
+            service.process_restore(invoice_id=invoice.id, reason="test")
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
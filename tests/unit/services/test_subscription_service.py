@@ -0,0 +1,153 @@
+"""Tests for SubscriptionService owned-update methods."""
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from vbwd.models.enums import SubscriptionStatus
+from vbwd.services.subscription_service import SubscriptionService
+
+
+def _make_subscription(user_id, status=SubscriptionStatus.ACTIVE):
+    """Create a mock subscription."""
+    subscription = MagicMock()
+    subscription.id = uuid4()
+    subscription.user_id = user_id
+    subscription.status = status
+    return subscription
+
+
+class TestOwnedUpdates:
+    """Tests for the single-statement owned update methods."""
+
+    def test_cancel_returns_updated_subscription(self):
+        """A matched row is returned without a separate ownership lookup."""
+        user_id = uuid4()
+        subscription = _make_subscription(user_id)
+        repo = MagicMock()
+        repo.update_owned.return_value = subscription
+        service = SubscriptionService(subscription_repo=repo)
+
+        result = service.cancel_subscription_owned(subscription.id, user_id)
+
+        assert result.success is True
+        assert result.subscription is subscription
+        repo.find_by_id.assert_not_called()
+        kwargs = repo.update_owned.call_args.kwargs
+        assert kwargs["status"] == SubscriptionStatus.CANCELLED
+
+    def test_cancel_returns_none_when_not_owned(self):
+        """No matched row means not found or not owned."""
+        repo = MagicMock()
+        repo.update_owned.return_value = None
+        service = SubscriptionService(subscription_repo=repo)
+
+        assert service.cancel_subscription_owned(uuid4(), uuid4()) is None
+
+    def test_pause_reports_status_error_for_owner(self):
+        """A guard miss on an owned subscription yields the usual error."""
+        user_id = uuid4()
+        subscription = _make_subscription(user_id, SubscriptionStatus.PAUSED)
+        repo = MagicMock()
+        repo.update_owned.return_value = None
+        repo.find_by_id.return_value = subscription
+        service = SubscriptionService(subscription_repo=repo)
+
+        result = service.pause_subscription_owned(subscription.id, user_id)
+
+        assert result.success is False
+        assert result.error == "Subscription is already paused"
+
+    def test_pause_returns_none_for_other_user(self):
+        """A guard miss on someone else's subscription is reported as missing."""
+        subscription = _make_subscription(uuid4())
+        repo = MagicMock()
+        repo.update_owned.return_value = None
+        repo.find_by_id.return_value = subscription
+        service = SubscriptionService(subscription_repo=repo)
+
+        assert service.pause_subscription_owned(subscription.id, uuid4()) is None
+
+
+class TestSubscriptionRows:
+    """Tests for list-row access."""
+
+    def test_iter_rows_streams_from_repository(self):
+        """Iterating rows uses the streaming query, not the list."""
+        user_id = uuid4()
+        rows = [MagicMock(), MagicMock()]
+        repo = MagicMock()
+        repo.iter_rows_by_user.return_value = iter(rows)
+        service = SubscriptionService(subscription_repo=repo)
+
+        assert list(service.iter_user_subscription_rows(user_id)) == rows
+        repo.iter_rows_by_user.assert_called_once_with(user_id)
+
+
+class TestExpireSubscriptions:
+    """Tests for the bulk expiry sweep."""
+
+    def test_expires_with_one_bulk_update(self):
+        """A short first batch finishes the sweep without per-row saves."""
+        from vbwd.services.subscription_service import EXPIRY_BATCH_SIZE
+
+        expired_ids = [uuid4(), uuid4()]
+        repo = MagicMock()
+        repo.bulk_expire.return_value = expired_ids
+        service = SubscriptionService(subscription_repo=repo)
+
+        result = service.expire_subscriptions()
+
+        assert result == expired_ids
+        repo.bulk_expire.assert_called_once_with(limit=EXPIRY_BATCH_SIZE)
+        repo.find_expired.assert_not_called()
+        repo.save.assert_not_called()
+
+    def test_sweeps_in_batches_until_short_batch(self, monkeypatch):
+        """Full batches are followed by another until one comes back short."""
+        from vbwd.services import subscription_service
+
+        monkeypatch.setattr(subscription_service, "EXPIRY_BATCH_SIZE", 2)
+        batches = [[uuid4(), uuid4()], [uuid4(), uuid4()], []]
+        repo = MagicMock()
+        repo.bulk_expire.side_effect = batches
+        service = SubscriptionService(subscription_repo=repo)
+
+        result = service.expire_subscriptions()
+
+        assert result == batches[0] + batches[1]
+        assert repo.bulk_expire.call_count == 3
+
+    def test_runs_callback_for_each_expired_id(self):
+        """The per-subscription hook sees every expired ID, in order."""
+        expired_ids = [uuid4(), uuid4()]
+        repo = MagicMock()
+        repo.bulk_expire.return_value = expired_ids
+        service = SubscriptionService(subscription_repo=repo)
+        seen = []
+
+        service.expire_subscriptions(on_expired=seen.append)
+
+        assert seen == expired_ids
+
+
+class TestPeriodDays:
+    """Tests for the shared billing period duration table."""
+
+    def test_known_and_missing_periods(self):
+        """Known periods map to their length; anything else gets the default."""
+        from vbwd.models.enums import BillingPeriod
+        from vbwd.services.subscription_service import (
+            DEFAULT_PERIOD_DAYS,
+            period_days,
+        )
+
+        assert period_days(BillingPeriod.YEARLY) == 365
+        assert period_days(None) == DEFAULT_PERIOD_DAYS
+
+    def test_table_is_read_only(self):
+        """The class-level table cannot be mutated by callers."""
+        from vbwd.models.enums import BillingPeriod
+
+        with pytest.raises(TypeError):
+            SubscriptionService.PERIOD_DAYS[BillingPeriod.MONTHLY] = 31
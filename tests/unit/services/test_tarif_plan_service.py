@@ -0,0 +1,70 @@
+"""Tests for TarifPlanService."""
+import pytest
+from unittest.mock import Mock
+from decimal import Decimal
+from uuid import uuid4
+
+
+class TestTarifPlanServicePricing:
+    """Test cases for plan pricing."""
+
+    @pytest.fixture
+    def mock_tax_repo(self):
+        """Mock TaxRepository."""
+        return Mock()
+
+    @pytest.fixture
+    def mock_currency_service(self):
+        """Mock CurrencyService returning EUR."""
+        service = Mock()
+        service.get_currency_by_code.return_value = Mock(code="EUR")
+        return service
+
+    @pytest.fixture
+    def tarif_plan_service(self, mock_tax_repo, mock_currency_service):
+        """Create TarifPlanService with mocked dependencies."""
+        from vbwd.services.tarif_plan_service import TarifPlanService
+        from vbwd.services.tax_service import TaxService
+
+        return TarifPlanService(
+            tarif_plan_repo=Mock(),
+            currency_service=mock_currency_service,
+            tax_service=TaxService(tax_repo=mock_tax_repo),
+        )
+
+    @staticmethod
+    def _plan(price):
+        return Mock(id=uuid4(), slug="plan", price_float=price)
+
+    def test_get_plans_with_pricing_resolves_currency_and_tax_once(
+        self, tarif_plan_service, mock_tax_repo, mock_currency_service
+    ):
+        """Currency and tax are looked up once for the whole list."""
+        from vbwd.models.tax import Tax
+
+        vat_de = Tax()
+        vat_de.code = "VAT_DE"
+        vat_de.rate = Decimal("19.0")
+        vat_de.region_code = None
+        mock_tax_repo.find_by_country.return_value = [vat_de]
+
+        result = tarif_plan_service.get_plans_with_pricing(
+            [self._plan(100.0), self._plan(10.0)], "EUR", "DE"
+        )
+
+        assert mock_currency_service.get_currency_by_code.call_count == 1
+        assert mock_tax_repo.find_by_country.call_count == 1
+        assert [r["gross_price"] for r in result] == [
+            Decimal("119.00"),
+            Decimal("11.90"),
+        ]
+        assert all(r["tax_rate"] == Decimal("19.0") for r in result)
+
+    def test_get_plans_with_pricing_unknown_currency_raises(
+        self, tarif_plan_service, mock_currency_service
+    ):
+        """Unknown currency raises ValueError."""
+        mock_currency_service.get_currency_by_code.return_value = None
+
+        with pytest.raises(ValueError, match="Unknown currency"):
+            tarif_plan_service.get_plans_with_pricing([self._plan(1.0)], "XXX")
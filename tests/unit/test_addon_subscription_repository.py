@@ -0,0 +1,69 @@
+"""Tests for AddOnSubscriptionRepository.cancel_owned."""
+from unittest.mock import Mock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+
+class TestCancelOwned:
+    """cancel_owned cancels with a single owner-scoped UPDATE."""
+
+    def test_update_is_scoped_to_owner_and_cancellable_status(self):
+        """Ownership and status are checked in the WHERE clause."""
+        from vbwd.repositories.addon_subscription_repository import (
+            AddOnSubscriptionRepository,
+        )
+
+        session = Mock()
+        session.execute.return_value.scalar_one_or_none.return_value = None
+
+        result = AddOnSubscriptionRepository(session).cancel_owned(uuid4(), uuid4())
+
+        assert result is None
+        session.commit.assert_not_called()
+        sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE vbwd_addon_subscription SET")
+        assert "vbwd_addon_subscription.user_id = " in sql
+        assert "vbwd_addon_subscription.status IN " in sql
+        assert "RETURNING" in sql
+
+    def test_returns_cancelled_row_and_commits(self):
+        """A matched row is committed and returned."""
+        from vbwd.models.addon_subscription import AddOnSubscription
+        from vbwd.models.enums import SubscriptionStatus
+        from vbwd.repositories.addon_subscription_repository import (
+            AddOnSubscriptionRepository,
+        )
+
+        addon_sub = AddOnSubscription(
+            id=uuid4(), user_id=uuid4(), status=SubscriptionStatus.CANCELLED
+        )
+        session = Mock()
+        session.execute.return_value.scalar_one_or_none.return_value = addon_sub
+
+        result = AddOnSubscriptionRepository(session).cancel_owned(
+            addon_sub.id, addon_sub.user_id
+        )
+
+        assert result is addon_sub
+        session.commit.assert_called_once()
+
+
+class TestFindDetailById:
+    """find_detail_by_id loads only the add-on relationship."""
+
+    def test_loads_addon_and_raises_on_other_relationships(self):
+        """The lookup goes through session.get with loader options."""
+        from vbwd.repositories.addon_subscription_repository import (
+            AddOnSubscriptionRepository,
+        )
+
+        session = Mock()
+        addon_sub_id = uuid4()
+
+        result = AddOnSubscriptionRepository(session).find_detail_by_id(addon_sub_id)
+
+        assert result is session.get.return_value
+        args, kwargs = session.get.call_args
+        assert args[1] == addon_sub_id
+        assert len(kwargs["options"]) == 2
@@ -0,0 +1,62 @@
+"""Tests for FeatureUsageRepository.try_increment_within_limit."""
+from datetime import datetime
+from unittest.mock import Mock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+
+class TestTryIncrementWithinLimit:
+    """try_increment_within_limit checks and increments in one upsert."""
+
+    def test_upsert_is_guarded_by_limit(self):
+        """The conflict update only applies while usage stays in the limit."""
+        from vbwd.repositories.feature_usage_repository import (
+            FeatureUsageRepository,
+        )
+
+        session = Mock()
+        session.execute.return_value.scalar_one_or_none.return_value = None
+
+        result = FeatureUsageRepository(session).try_increment_within_limit(
+            uuid4(), "api_calls", datetime(2024, 1, 1), 1, 100
+        )
+
+        assert result is None
+        session.commit.assert_not_called()
+        sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO vbwd_feature_usage")
+        assert "ON CONFLICT ON CONSTRAINT uq_user_feature_period DO UPDATE" in sql
+        assert "WHERE vbwd_feature_usage.usage_count + " in sql
+        assert "RETURNING vbwd_feature_usage.usage_count" in sql
+
+    def test_returns_new_count_and_commits(self):
+        """An accepted increment is committed and returns the new count."""
+        from vbwd.repositories.feature_usage_repository import (
+            FeatureUsageRepository,
+        )
+
+        session = Mock()
+        session.execute.return_value.scalar_one_or_none.return_value = 42
+
+        result = FeatureUsageRepository(session).try_increment_within_limit(
+            uuid4(), "api_calls", datetime(2024, 1, 1), 2, 100
+        )
+
+        assert result == 42
+        session.commit.assert_called_once()
+
+    def test_amount_above_limit_is_rejected_without_query(self):
+        """An increment larger than the limit never reaches the database."""
+        from vbwd.repositories.feature_usage_repository import (
+            FeatureUsageRepository,
+        )
+
+        session = Mock()
+
+        result = FeatureUsageRepository(session).try_increment_within_limit(
+            uuid4(), "exports", datetime(2024, 1, 1), 11, 10
+        )
+
+        assert result is None
+        session.execute.assert_not_called()
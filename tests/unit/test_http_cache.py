@@ -0,0 +1,152 @@
+"""Tests for HTTP caching helpers."""
+from unittest.mock import patch
+
+from flask import Flask
+
+
+class TestConditionalJsonResponse:
+    """Tests for conditional_json_response."""
+
+    def test_returns_body_with_etag(self):
+        """First request gets the full body, ETag and Cache-Control."""
+        from vbwd.utils.http_cache import CachedJSON, conditional_json_response
+
+        cached = CachedJSON({"a": 1})
+        app = Flask(__name__)
+        with app.test_request_context("/"):
+            response = conditional_json_response(cached, max_age=60)
+
+        assert response.status_code == 200
+        assert response.get_json() == {"a": 1}
+        assert response.headers["ETag"] == f'"{cached.etag}"'
+        assert "max-age=60" in response.headers["Cache-Control"]
+        assert "public" in response.headers["Cache-Control"]
+
+    def test_returns_304_when_etag_matches(self):
+        """Matching If-None-Match short-circuits to 304 without a body."""
+        from vbwd.utils.http_cache import CachedJSON, conditional_json_response
+
+        cached = CachedJSON({"a": 1})
+        app = Flask(__name__)
+        with app.test_request_context(
+            "/", headers={"If-None-Match": f'"{cached.etag}"'}
+        ):
+            response = conditional_json_response(cached)
+
+        assert response.status_code == 304
+        assert response.data == b""
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_get_returns_stored_entry(self):
+        """Stored payload is returned until it expires."""
+        from vbwd.utils.http_cache import ResponseCache
+
+        cache = ResponseCache(ttl=60)
+        stored = cache.set("key", {"x": 1})
+
+        assert cache.get("key") is stored
+        assert cache.get("missing") is None
+
+    def test_get_drops_expired_entry(self):
+        """Entries past their TTL are treated as missing."""
+        from vbwd.utils.http_cache import ResponseCache
+
+        cache = ResponseCache(ttl=10)
+        with patch("vbwd.utils.http_cache.time.monotonic", return_value=100.0):
+            cache.set("key", {"x": 1})
+        with patch("vbwd.utils.http_cache.time.monotonic", return_value=111.0):
+            assert cache.get("key") is None
+
+    def test_clear_drops_all_entries(self):
+        """clear() empties the cache."""
+        from vbwd.utils.http_cache import ResponseCache
+
+        cache = ResponseCache()
+        cache.set("key", {"x": 1})
+        cache.clear()
+
+        assert cache.get("key") is None
+
+    def test_set_bounds_number_of_entries(self):
+        """Cache is reset when max_entries is reached."""
+        from vbwd.utils.http_cache import ResponseCache
+
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+
+class TestSerializeJson:
+    """Tests for serialize_json and CachedJSON.from_body."""
+
+    def test_matches_jsonify_output(self):
+        """Serialized bytes match Flask's jsonify body."""
+        import decimal
+        import uuid
+        from flask import jsonify
+        from vbwd.utils.http_cache import serialize_json
+
+        payload = {"b": decimal.Decimal("1.50"), "a": uuid.uuid4(), "c": [1, None]}
+        app = Flask(__name__)
+        with app.app_context():
+            expected = jsonify(payload).get_data().rstrip(b"\n")
+
+        assert serialize_json(payload) == expected
+
+    def test_from_body_keeps_body_and_etag(self):
+        """Wrapping a serialized body yields the same ETag as serializing."""
+        from vbwd.utils.http_cache import CachedJSON, serialize_json
+
+        original = CachedJSON({"x": 1})
+        wrapped = CachedJSON.from_body(serialize_json({"x": 1}))
+
+        assert wrapped.body == original.body
+        assert wrapped.etag == original.etag
+
+
+class TestRedisJsonResponse:
+    """Tests for the Redis-backed JSON response helpers."""
+
+    @patch("vbwd.utils.http_cache.redis_client")
+    def test_plain_response_without_max_age(self, mock_redis):
+        """Without max_age the cached body is returned as-is."""
+        from vbwd.utils.http_cache import get_redis_json_response
+
+        mock_redis.cache_get.return_value = '{"a":1}'
+        app = Flask(__name__)
+        with app.test_request_context("/"):
+            response = get_redis_json_response("k")
+
+        assert response.get_json() == {"a": 1}
+        assert "ETag" not in response.headers
+
+    @patch("vbwd.utils.http_cache.redis_client")
+    def test_set_then_get_returns_304_for_matching_etag(self, mock_redis):
+        """The ETag from a fresh render validates the cached copy."""
+        from vbwd.utils.http_cache import (
+            get_redis_json_response,
+            set_redis_json_response,
+        )
+
+        app = Flask(__name__)
+        with app.test_request_context("/"):
+            fresh = set_redis_json_response("k", {"a": 1}, ttl=60, max_age=0)
+        body = mock_redis.cache_set.call_args.args[1]
+        mock_redis.cache_get.return_value = body
+
+        with app.test_request_context(
+            "/", headers={"If-None-Match": fresh.headers["ETag"]}
+        ):
+            response = get_redis_json_response("k", max_age=0)
+
+        assert fresh.status_code == 200
+        assert "max-age=0" in fresh.headers["Cache-Control"]
+        assert response.status_code == 304
+        assert response.data == b""
@@ -0,0 +1,93 @@
+"""Tests for InvoiceRepository queries and conditional updates."""
+from unittest.mock import Mock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+
+class TestOverdueQuery:
+    """find_overdue pushes its predicates into SQL served by one index."""
+
+    def test_filters_and_orders_in_sql(self):
+        """Status and expiry are WHERE predicates, sorted by expires_at."""
+        from vbwd.repositories.invoice_repository import InvoiceRepository
+
+        query = InvoiceRepository(Session())._overdue_query()
+        sql = str(query.statement.compile(dialect=postgresql.dialect()))
+
+        assert "WHERE vbwd_user_invoice.status = " in sql
+        assert "AND vbwd_user_invoice.expires_at < " in sql
+        assert sql.endswith("ORDER BY vbwd_user_invoice.expires_at ASC")
+
+    def test_status_expires_index_is_declared(self):
+        """The model declares the (status, expires_at) composite index."""
+        from vbwd.models.invoice import UserInvoice
+
+        indexes = {
+            index.name: [column.name for column in index.columns]
+            for index in UserInvoice.__table__.indexes
+        }
+
+        assert indexes["ix_vbwd_user_invoice_status_expires"] == [
+            "status",
+            "expires_at",
+        ]
+
+
+class TestStreamingQueries:
+    """iter_by_* stream the same queries as their find_by_* lists."""
+
+    def test_iter_by_user_uses_server_side_cursor(self):
+        """A user's invoices stream newest first in yield_per batches."""
+        from vbwd.repositories.invoice_repository import InvoiceRepository
+
+        repo = InvoiceRepository(Session())
+        user_id = uuid4()
+        query = repo._by_user_query(user_id)
+        sql = str(query.statement.compile(dialect=postgresql.dialect()))
+
+        assert "WHERE vbwd_user_invoice.user_id = " in sql
+        assert sql.endswith("ORDER BY vbwd_user_invoice.created_at DESC")
+
+        repo._stream = Mock(return_value=iter([]))
+        repo.iter_by_user(user_id, batch_size=100)
+        streamed_query, batch_size = repo._stream.call_args.args
+        assert str(streamed_query) == str(query)
+        assert batch_size == 100
+
+    def test_subscription_query_filters_by_subscription(self):
+        """A subscription's invoices are filtered and sorted in SQL."""
+        from vbwd.repositories.invoice_repository import InvoiceRepository
+
+        query = InvoiceRepository(Session())._by_subscription_query(uuid4())
+        sql = str(query.statement.compile(dialect=postgresql.dialect()))
+
+        assert "WHERE vbwd_user_invoice.subscription_id = " in sql
+        assert sql.endswith("ORDER BY vbwd_user_invoice.created_at DESC")
+
+
+class TestUpdateIf:
+    """update_if checks and writes in one UPDATE ... RETURNING."""
+
+    def test_condition_is_part_of_the_update(self):
+        """Expected status lands in the WHERE clause; no match commits nothing."""
+        from vbwd.models import InvoiceStatus, UserInvoice
+        from vbwd.repositories.invoice_repository import InvoiceRepository
+
+        session = Mock()
+        session.execute.return_value.scalar_one_or_none.return_value = None
+
+        result = InvoiceRepository(session).update_if(
+            uuid4(),
+            UserInvoice.status == InvoiceStatus.PENDING,
+            status=InvoiceStatus.PAID,
+        )
+
+        assert result is None
+        session.commit.assert_not_called()
+        sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE vbwd_user_invoice SET")
+        assert "vbwd_user_invoice.status = " in sql.split("WHERE")[1]
+        assert "version=(vbwd_user_invoice.version + " in sql
+        assert "RETURNING" in sql
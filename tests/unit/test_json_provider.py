@@ -0,0 +1,68 @@
+"""Tests for the orjson-backed Flask JSON provider."""
+import datetime
+import decimal
+import json
+import math
+import uuid
+
+import pytest
+from flask import Flask, jsonify
+
+
+def _payload():
+    return {
+        "b": decimal.Decimal("9.99"),
+        "a": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "when": datetime.datetime(2024, 1, 2, 3, 4, 5),
+        "day": datetime.date(2024, 1, 2),
+        "nested": {"z": [1, 2.5, None, True], "y": "text"},
+    }
+
+
+class TestOrjsonProvider:
+    """OrjsonProvider output matches Flask's default provider."""
+
+    def test_jsonify_matches_default_provider(self):
+        from vbwd.utils.json_provider import OrjsonProvider
+
+        default_app = Flask(__name__)
+        orjson_app = Flask(__name__)
+        orjson_app.json = OrjsonProvider(orjson_app)
+
+        with default_app.app_context():
+            expected = jsonify(_payload()).get_data().rstrip(b"\n")
+        with orjson_app.app_context():
+            response = jsonify(_payload())
+
+        assert response.mimetype == "application/json"
+        assert response.get_data() == expected
+
+    def test_dumps_with_kwargs_uses_stdlib(self):
+        from vbwd.utils.json_provider import OrjsonProvider
+
+        app = Flask(__name__)
+        provider = OrjsonProvider(app)
+
+        assert provider.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+    def test_dumps_json_falls_back_for_big_integers(self):
+        from vbwd.utils.json_provider import dumps_json
+
+        assert dumps_json({"n": 2**70}) == b'{"n":1180591620717411303424}'
+
+    def test_loads_matches_stdlib(self):
+        from vbwd.utils.json_provider import OrjsonProvider
+
+        provider = OrjsonProvider(Flask(__name__))
+        body = b'{"a": [1, 2.5, null, true], "b": "\\u00e9", "n": 18446744073709551616}'
+
+        assert provider.loads(body) == json.loads(body)
+        assert math.isnan(provider.loads('{"x": NaN}')["x"])
+
+    def test_loads_invalid_json_raises(self):
+        from vbwd.utils.json_provider import OrjsonProvider
+
+        provider = OrjsonProvider(Flask(__name__))
+
+        with pytest.raises(ValueError):
+            provider.loads(b"{not json")
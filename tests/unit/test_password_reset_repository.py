@@ -0,0 +1,43 @@
+"""Tests for PasswordResetRepository token hashing."""
+import hashlib
+from datetime import datetime
+from unittest.mock import Mock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+
+class TestTokenHashing:
+    """Reset tokens are stored and looked up by SHA-256 digest."""
+
+    def test_create_token_stores_only_the_digest(self):
+        """The saved row carries the digest, never the plaintext."""
+        from vbwd.repositories.password_reset_repository import (
+            PasswordResetRepository,
+        )
+
+        session = Mock()
+
+        reset_token = PasswordResetRepository(session).create_token(
+            user_id=uuid4(), token="plain-token", expires_at=datetime.utcnow()
+        )
+
+        assert reset_token.token_hash == hashlib.sha256(b"plain-token").digest()
+        assert not hasattr(reset_token, "token")
+        session.add.assert_called_once_with(reset_token)
+
+    def test_find_by_token_filters_on_digest(self):
+        """The lookup binds the digest of the presented token."""
+        from vbwd.repositories.password_reset_repository import (
+            PasswordResetRepository,
+        )
+
+        session = Mock()
+        PasswordResetRepository(session).find_by_token("plain-token")
+
+        criterion = session.query.return_value.filter.call_args[0][0]
+        compiled = criterion.compile(dialect=postgresql.dialect())
+        assert str(compiled).startswith("vbwd_password_reset_token.token_hash = ")
+        assert list(compiled.params.values()) == [
+            hashlib.sha256(b"plain-token").digest()
+        ]
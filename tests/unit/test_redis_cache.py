@@ -0,0 +1,87 @@
+"""Tests for the fail-open cache helpers on RedisClient."""
+from unittest.mock import MagicMock
+
+import redis
+
+from vbwd.utils.redis_client import RedisClient
+
+
+def _client_with(mock_redis) -> RedisClient:
+    client = RedisClient(url="redis://localhost:6379/0")
+    client._client = mock_redis
+    return client
+
+
+class TestRedisClientCache:
+    """Tests for cache_get / cache_set / cache_delete_pattern."""
+
+    def test_cache_get_returns_value(self):
+        mock_redis = MagicMock()
+        mock_redis.get.return_value = '{"a":1}'
+
+        assert _client_with(mock_redis).cache_get("k") == '{"a":1}'
+
+    def test_cache_get_fails_open(self):
+        mock_redis = MagicMock()
+        mock_redis.get.side_effect = redis.ConnectionError("down")
+
+        assert _client_with(mock_redis).cache_get("k") is None
+
+    def test_cache_set_uses_ttl(self):
+        mock_redis = MagicMock()
+
+        _client_with(mock_redis).cache_set("k", "v", 300)
+
+        mock_redis.set.assert_called_once_with("k", "v", ex=300)
+
+    def test_cache_set_ignores_errors(self):
+        mock_redis = MagicMock()
+        mock_redis.set.side_effect = redis.ConnectionError("down")
+
+        _client_with(mock_redis).cache_set("k", "v", 300)
+
+    def test_cache_delete_deletes_keys(self):
+        mock_redis = MagicMock()
+
+        _client_with(mock_redis).cache_delete("a", "b")
+
+        mock_redis.delete.assert_called_once_with("a", "b")
+
+    def test_cache_delete_ignores_errors(self):
+        mock_redis = MagicMock()
+        mock_redis.delete.side_effect = redis.ConnectionError("down")
+
+        _client_with(mock_redis).cache_delete("a")
+
+    def test_cache_delete_pattern_deletes_matches(self):
+        mock_redis = MagicMock()
+        mock_redis.scan_iter.return_value = iter(["plans:v1:a", "plans:v1:b"])
+
+        _client_with(mock_redis).cache_delete_pattern("plans:v1:*")
+
+        mock_redis.delete.assert_called_once_with("plans:v1:a", "plans:v1:b")
+
+    def test_cache_delete_pattern_skips_delete_without_matches(self):
+        mock_redis = MagicMock()
+        mock_redis.scan_iter.return_value = iter([])
+
+        _client_with(mock_redis).cache_delete_pattern("plans:v1:*")
+
+        mock_redis.delete.assert_not_called()
+
+
+class TestRedisClientClaim:
+    """Tests for claim."""
+
+    def test_claim_sets_key_only_if_absent(self):
+        mock_redis = MagicMock()
+        mock_redis.set.return_value = True
+
+        assert _client_with(mock_redis).claim("job", 290) is True
+        mock_redis.set.assert_called_once_with("claim:job", "1", ex=290, nx=True)
+
+    def test_claim_fails_when_held(self):
+        mock_redis = MagicMock()
+        mock_redis.set.return_value = None
+
+        assert _client_with(mock_redis).claim("job", 290) is False
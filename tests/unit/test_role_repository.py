@@ -0,0 +1,43 @@
+"""Tests for RoleRepository access lookups."""
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+
+class TestGetUserPermissionsWithAdmin:
+    """Permissions and admin status come from one role/permission query."""
+
+    def _repo(self, rows):
+        from vbwd.repositories.role_repository import RoleRepository
+
+        session = MagicMock()
+        query = session.query.return_value.select_from.return_value
+        query.join.return_value.outerjoin.return_value.outerjoin.return_value.filter.return_value.all.return_value = (
+            rows
+        )
+        return RoleRepository(session), session
+
+    def test_collects_permissions_and_admin_flag(self):
+        """Rows of (role, permission) fold into a set and an admin flag."""
+        repo, session = self._repo(
+            [
+                ("admin", None),
+                ("editor", "posts.edit"),
+                ("editor", "posts.view"),
+                ("viewer", "posts.view"),
+            ]
+        )
+
+        permissions, is_admin = repo.get_user_permissions_with_admin(uuid4(), "admin")
+
+        assert permissions == {"posts.edit", "posts.view"}
+        assert is_admin is True
+        session.query.assert_called_once()
+
+    def test_user_without_roles(self):
+        """A user without roles has no permissions and is not an admin."""
+        repo, _ = self._repo([])
+
+        permissions, is_admin = repo.get_user_permissions_with_admin(uuid4(), "admin")
+
+        assert permissions == set()
+        assert is_admin is False
@@ -0,0 +1,33 @@
+"""Tests for the core background scheduler jobs."""
+from unittest.mock import patch
+
+from flask import Flask
+
+
+class TestPlanPricingJob:
+    """Tests for the plan pricing warm-up job."""
+
+    @patch("vbwd.routes.tarif_plans.warm_plan_pricing")
+    @patch("vbwd.utils.redis_client.redis_client")
+    def test_runs_when_claim_is_won(self, mock_redis, mock_warm):
+        """The process that wins the interval's claim warms the listings."""
+        from vbwd.scheduler import _run_plan_pricing_jobs
+
+        mock_redis.claim.return_value = True
+        mock_warm.return_value = 2
+
+        _run_plan_pricing_jobs(Flask(__name__))
+
+        mock_warm.assert_called_once_with()
+
+    @patch("vbwd.routes.tarif_plans.warm_plan_pricing")
+    @patch("vbwd.utils.redis_client.redis_client")
+    def test_skips_when_another_process_holds_claim(self, mock_redis, mock_warm):
+        """Other workers leave the warm-up to the claim holder."""
+        from vbwd.scheduler import _run_plan_pricing_jobs
+
+        mock_redis.claim.return_value = False
+
+        _run_plan_pricing_jobs(Flask(__name__))
+
+        mock_warm.assert_not_called()
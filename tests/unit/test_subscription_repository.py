@@ -0,0 +1,74 @@
+"""Tests for SubscriptionRepository bulk writes and list streaming."""
+from unittest.mock import Mock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+
+class TestBulkExpire:
+    """bulk_expire expires every overdue subscription in one UPDATE."""
+
+    def test_single_update_returning_ids(self):
+        """Status and expiry are checked in SQL; expired IDs are returned."""
+        from vbwd.repositories.subscription_repository import SubscriptionRepository
+
+        expired_ids = [uuid4(), uuid4()]
+        session = Mock()
+        session.execute.return_value.scalars.return_value = iter(expired_ids)
+
+        result = SubscriptionRepository(session).bulk_expire()
+
+        assert result == expired_ids
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
+        sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE vbwd_subscription SET")
+        assert "vbwd_subscription.status = " in sql
+        assert "vbwd_subscription.expires_at < " in sql
+        assert sql.endswith("RETURNING vbwd_subscription.id")
+
+    def test_limit_picks_batch_with_skip_locked(self):
+        """A limited sweep expires one locked batch selected by a subquery."""
+        from vbwd.repositories.subscription_repository import SubscriptionRepository
+
+        session = Mock()
+        session.execute.return_value.scalars.return_value = iter([uuid4()])
+
+        SubscriptionRepository(session).bulk_expire(limit=4096)
+
+        sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "WHERE vbwd_subscription.id IN (SELECT vbwd_subscription.id" in sql
+        assert "LIMIT %(param_1)s FOR UPDATE SKIP LOCKED)" in sql
+
+    def test_nothing_expired_commits_nothing(self):
+        """No matched rows means no commit."""
+        from vbwd.repositories.subscription_repository import SubscriptionRepository
+
+        session = Mock()
+        session.execute.return_value.scalars.return_value = iter([])
+
+        assert SubscriptionRepository(session).bulk_expire() == []
+        session.commit.assert_not_called()
+
+
+class TestIterRowsByUser:
+    """iter_rows_by_user streams list rows instead of building a list."""
+
+    def test_uses_server_side_cursor(self):
+        """The list query runs with stream_results and yield_per."""
+        from vbwd.repositories.subscription_repository import SubscriptionRepository
+
+        rows = [Mock(), Mock()]
+        session = Mock()
+        session.execute.return_value = iter(rows)
+        user_id = uuid4()
+
+        result = SubscriptionRepository(session).iter_rows_by_user(user_id, 50)
+
+        assert list(result) == rows
+        args, kwargs = session.execute.call_args
+        assert args == (SubscriptionRepository._LIST_ROWS_BY_USER, {"user_id": user_id})
+        assert kwargs["execution_options"] == {
+            "stream_results": True,
+            "yield_per": 50,
+        }
@@ -0,0 +1,25 @@
+"""Tests for TarifPlanRepository."""
+from unittest.mock import Mock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+
+class TestFindBySubscriber:
+    """find_by_subscriber loads a user's plans with one query."""
+
+    def test_filters_plans_by_subscription_subquery(self):
+        """Plans are selected through a subquery on the user's subscriptions."""
+        from vbwd.repositories.tarif_plan_repository import TarifPlanRepository
+
+        session = Mock()
+        plans = [Mock(), Mock()]
+        session.query.return_value.filter.return_value.all.return_value = plans
+
+        assert TarifPlanRepository(session).find_by_subscriber(uuid4()) == plans
+
+        session.query.assert_called_once()
+        criterion = session.query.return_value.filter.call_args[0][0]
+        sql = str(criterion.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("vbwd_tarif_plan.id IN (SELECT ")
+        assert "vbwd_subscription.user_id = " in sql
@@ -0,0 +1,37 @@
+"""Tests for the token balance and transaction repositories."""
+from datetime import datetime
+from unittest.mock import Mock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+
+class TestTransactionRowsKeyset:
+    """find_rows_by_user_id pages by (created_at, id) when given a position."""
+
+    @staticmethod
+    def _sql(**kwargs):
+        from vbwd.repositories.token_repository import TokenTransactionRepository
+
+        session = Mock()
+        session.execute.return_value = []
+        TokenTransactionRepository(session).find_rows_by_user_id(uuid4(), **kwargs)
+        stmt = session.execute.call_args[0][0]
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    def test_after_uses_row_comparison_without_offset(self):
+        sql = self._sql(limit=20, after=(datetime(2026, 1, 1), uuid4()))
+
+        assert (
+            "(vbwd_token_transaction.created_at, vbwd_token_transaction.id) < " in sql
+        )
+        assert "OFFSET" not in sql
+
+    def test_offset_page_keeps_stable_order(self):
+        sql = self._sql(limit=20, offset=40)
+
+        assert (
+            "ORDER BY vbwd_token_transaction.created_at DESC, "
+            "vbwd_token_transaction.id DESC" in sql
+        )
+        assert "OFFSET" in sql
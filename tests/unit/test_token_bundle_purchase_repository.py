@@ -0,0 +1,93 @@
+"""Tests for TokenBundlePurchaseRepository batch reads and writes."""
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from sqlalchemy.dialects import postgresql
+
+from vbwd.models.enums import LineItemType, PurchaseStatus
+
+
+class TestBulkUpdateStatus:
+    """bulk_update_status writes every purchase in one UPDATE."""
+
+    def test_single_update_over_all_ids(self):
+        """One IN-scoped UPDATE checks the prior status, bumps version, commits."""
+        from vbwd.repositories.token_bundle_purchase_repository import (
+            TokenBundlePurchaseRepository,
+        )
+
+        ids = [uuid4(), uuid4()]
+        session = Mock()
+        session.execute.return_value.scalars.return_value = iter(ids)
+
+        updated = TokenBundlePurchaseRepository(session).bulk_update_status(
+            ids, PurchaseStatus.REFUNDED, PurchaseStatus.COMPLETED
+        )
+
+        assert updated == 2
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
+        sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE vbwd_token_bundle_purchase SET")
+        assert "version=(vbwd_token_bundle_purchase.version + " in sql
+        assert "vbwd_token_bundle_purchase.id IN " in sql
+        assert "AND vbwd_token_bundle_purchase.status = " in sql
+        assert sql.endswith("RETURNING vbwd_token_bundle_purchase.id")
+
+    def test_partial_match_rolls_back_and_raises(self):
+        """A purchase no longer in the expected status aborts the write."""
+        from vbwd.models.base import ConcurrentModificationError
+        from vbwd.repositories.token_bundle_purchase_repository import (
+            TokenBundlePurchaseRepository,
+        )
+
+        ids = [uuid4(), uuid4()]
+        session = Mock()
+        session.execute.return_value.scalars.return_value = iter(ids[:1])
+
+        with pytest.raises(ConcurrentModificationError):
+            TokenBundlePurchaseRepository(session).bulk_update_status(
+                ids, PurchaseStatus.REFUNDED, PurchaseStatus.COMPLETED
+            )
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
+
+    def test_no_ids_skips_the_query(self):
+        """An empty ID list touches nothing."""
+        from vbwd.repositories.token_bundle_purchase_repository import (
+            TokenBundlePurchaseRepository,
+        )
+
+        session = Mock()
+
+        assert (
+            TokenBundlePurchaseRepository(session).bulk_update_status(
+                [], PurchaseStatus.REFUNDED, PurchaseStatus.COMPLETED
+            )
+            == 0
+        )
+        session.execute.assert_not_called()
+
+
+class TestFindByLineItems:
+    """find_by_line_items loads an invoice's purchases in one query."""
+
+    def test_keys_token_bundle_purchases_by_id(self):
+        """Only token bundle items are looked up; results are keyed by ID."""
+        from vbwd.repositories.token_bundle_purchase_repository import (
+            TokenBundlePurchaseRepository,
+        )
+
+        purchase = Mock(id=uuid4())
+        line_items = [
+            Mock(item_type=LineItemType.TOKEN_BUNDLE, item_id=purchase.id),
+            Mock(item_type=LineItemType.SUBSCRIPTION, item_id=uuid4()),
+        ]
+        repo = TokenBundlePurchaseRepository(Mock())
+        repo.find_by_ids = Mock(return_value=[purchase])
+
+        assert repo.find_by_line_items(line_items) == {purchase.id: purchase}
+        repo.find_by_ids.assert_called_once_with([purchase.id])
@@ -195,3 +195,48 @@ class TestUnitOfWork:
 
         # Should be called at least once (explicit + auto on exit)
         assert mock_session.commit.call_count >= 1
+
+    def test_unit_of_work_marks_session_while_open(self):
+        """in_unit_of_work reports the session only inside the context."""
+        from vbwd.utils.transaction import UnitOfWork, in_unit_of_work
+
+        mock_session = MagicMock()
+        mock_session.info = {}
+
+        with UnitOfWork(mock_session):
+            assert in_unit_of_work(mock_session) is True
+
+        assert in_unit_of_work(mock_session) is False
+
+    def test_nested_unit_of_work_defers_to_outer(self):
+        """An inner UnitOfWork neither commits nor rolls back itself."""
+        from vbwd.utils.transaction import UnitOfWork, in_unit_of_work
+
+        mock_session = MagicMock()
+        mock_session.info = {}
+
+        with UnitOfWork(mock_session):
+            with UnitOfWork(mock_session):
+                pass
+            mock_session.commit.assert_not_called()
+            assert in_unit_of_work(mock_session) is True
+
+        mock_session.commit.assert_called_once()
+
+    def test_repository_save_only_flushes_inside_unit_of_work(self):
+        """BaseRepository.save flushes and leaves the commit to the UnitOfWork."""
+        from vbwd.repositories.base import BaseRepository
+        from vbwd.utils.transaction import UnitOfWork
+
+        mock_session = MagicMock()
+        mock_session.info = {}
+        repo = BaseRepository(mock_session, MagicMock)
+        entity = MagicMock()
+
+        with UnitOfWork(mock_session):
+            repo.save(entity)
+            repo.save(entity)
+            mock_session.commit.assert_not_called()
+            assert mock_session.flush.call_count == 2
+
+        mock_session.commit.assert_called_once()
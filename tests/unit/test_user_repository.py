@@ -0,0 +1,23 @@
+"""Tests for UserRepository loading options."""
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+
+class TestRequestUserLoadOptions:
+    """The per-request user skips details columns no response reads."""
+
+    def test_details_config_and_balance_are_not_selected(self):
+        from vbwd.models import User
+        from vbwd.repositories.user_repository import REQUEST_USER_LOAD_OPTIONS
+
+        sql = str(
+            select(User)
+            .options(*REQUEST_USER_LOAD_OPTIONS)
+            .compile(dialect=postgresql.dialect())
+        )
+
+        assert "vbwd_user_details_1.first_name" in sql
+        assert "vbwd_user_details_1.updated_at" in sql
+        assert "vbwd_user_details_1.config" not in sql
+        assert "vbwd_user_details_1.balance" not in sql
+        assert "vbwd_user.password_hash" in sql
@@ -96,6 +96,10 @@ def create_app(config: Optional[Dict[str, Any]] = None) -> Flask:
     """
     app = Flask(__name__)
 
+    from vbwd.utils.json_provider import OrjsonProvider
+
+    app.json = OrjsonProvider(app)
+
     # Disable strict slashes to prevent redirects that break nginx proxy
     app.url_map.strict_slashes = False
 
@@ -315,6 +319,10 @@ def create_app(config: Optional[Dict[str, Any]] = None) -> Flask:
     app.cli.add_command(plugins_cli)
 
     if not app.config.get("TESTING"):
+        from vbwd.services.activity_logger import start_background_logging
+
+        start_background_logging()
+
         from vbwd.scheduler import start_booking_scheduler
 
         start_booking_scheduler(app)
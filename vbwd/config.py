@@ -5,6 +5,8 @@ from typing import Optional, Type
 # Constants - avoid magic numbers
 DEFAULT_JWT_EXPIRATION_HOURS = 24
 DEFAULT_SECRET_KEY = "dev-secret-key-change-in-production"
+DEFAULT_PAYMENT_BATCH_MAX_BYTES = 1024 * 1024
+DEFAULT_PAYMENT_BATCH_MAX_LINES = 1000
 
 # Internationalization
 AVAILABLE_LANGUAGES = [
@@ -34,10 +36,13 @@ def get_redis_url() -> str:
 DATABASE_CONFIG = {
     "url": get_database_url(),
     "isolation_level": "READ_COMMITTED",  # PostgreSQL default (explicit)
-    "pool_size": 20,  # Per Flask instance
-    "max_overflow": 40,  # Additional connections under load
+    # Per gunicorn worker; workers * (pool_size + max_overflow) must stay
+    # below the server's (or pgbouncer's) connection limit
+    "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 20)),  # Burst connections
     "pool_pre_ping": True,  # Verify connections before use
-    "pool_recycle": 3600,  # Recycle connections after 1 hour
+    "pool_recycle": 1800,  # Recycle connections after 30 minutes
+    "query_cache_size": 1200,  # Compiled-statement cache entries per engine
 }
 
 
@@ -51,10 +56,12 @@ class Config:
     SQLALCHEMY_DATABASE_URI = get_database_url()
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ENGINE_OPTIONS = {
+        "isolation_level": DATABASE_CONFIG["isolation_level"],
         "pool_size": DATABASE_CONFIG["pool_size"],
         "max_overflow": DATABASE_CONFIG["max_overflow"],
         "pool_pre_ping": DATABASE_CONFIG["pool_pre_ping"],
         "pool_recycle": DATABASE_CONFIG["pool_recycle"],
+        "query_cache_size": DATABASE_CONFIG["query_cache_size"],
     }
 
     # Redis
@@ -73,6 +80,16 @@ class Config:
     JWT_HEADER_TYPE = "Bearer"
     JWT_IDENTITY_CLAIM = "user_id"  # Match the claim name used in tokens
 
+    # Batch payment webhook: HMAC-SHA256 signing secret (the endpoint is
+    # disabled while unset) and per-request limits
+    PAYMENT_WEBHOOK_SECRET = os.getenv("PAYMENT_WEBHOOK_SECRET", "")
+    PAYMENT_BATCH_MAX_BYTES = int(
+        os.getenv("PAYMENT_BATCH_MAX_BYTES", DEFAULT_PAYMENT_BATCH_MAX_BYTES)
+    )
+    PAYMENT_BATCH_MAX_LINES = int(
+        os.getenv("PAYMENT_BATCH_MAX_LINES", DEFAULT_PAYMENT_BATCH_MAX_LINES)
+    )
+
     # Celery
     CELERY_BROKER_URL = get_redis_url()
     CELERY_RESULT_BACKEND = get_redis_url()
@@ -36,6 +36,7 @@ from vbwd.services.token_service import TokenService
 from vbwd.services.invoice_service import InvoiceService
 from vbwd.services.pdf_service import PdfService, build_default_template_env
 from vbwd.services.refund_service import RefundService
+from vbwd.services.restore_service import RestoreService
 
 from vbwd.events.domain import DomainEventDispatcher
 
@@ -139,6 +140,16 @@ class Container(containers.DeclarativeContainer):
         invoice_repo=invoice_repository,
         token_service=token_service,
         purchase_repo=token_bundle_purchase_repository,
+        session=db_session,
+    )
+
+    restore_service = providers.Factory(
+        RestoreService,
+        invoice_repo=invoice_repository,
+        purchase_repo=token_bundle_purchase_repository,
+        token_balance_repo=token_balance_repository,
+        token_transaction_repo=token_transaction_repository,
+        session=db_session,
     )
 
     # ==================
@@ -164,6 +175,7 @@ class Container(containers.DeclarativeContainer):
         PasswordResetService,
         user_repository=user_repository,
         reset_repository=password_reset_repository,
+        auth_service=auth_service,
     )
 
     # ==================
@@ -5,6 +5,28 @@ from flask import current_app, jsonify, g
 from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 
 
+def _get_feature_guard() -> Any:
+    """Get the request-scoped feature guard.
+
+    Sharing one guard across stacked decorators lets it reuse the active
+    subscription it already loaded for this request.
+    """
+    if "feature_guard" not in g:
+        g.feature_guard = getattr(current_app, "container").feature_guard()
+    return g.feature_guard
+
+
+def _get_rbac_service() -> Any:
+    """Get the request-scoped RBAC service.
+
+    Stacked permission decorators then share its memoized admin status and
+    permission set instead of querying roles again for every check.
+    """
+    if "rbac_service" not in g:
+        g.rbac_service = getattr(current_app, "container").rbac_service()
+    return g.rbac_service
+
+
 def require_permission(*permissions: str) -> Callable:
     """
     Decorator to require at least one of the specified permissions.
@@ -27,7 +49,7 @@ def require_permission(*permissions: str) -> Callable:
             verify_jwt_in_request()
             user_id = get_jwt_identity()
 
-            rbac = getattr(current_app, "container").rbac_service()
+            rbac = _get_rbac_service()
 
             if not rbac.has_any_permission(user_id, list(permissions)):
                 return (
@@ -70,7 +92,7 @@ def require_all_permissions(*permissions: str) -> Callable:
             verify_jwt_in_request()
             user_id = get_jwt_identity()
 
-            rbac = getattr(current_app, "container").rbac_service()
+            rbac = _get_rbac_service()
 
             if not rbac.has_all_permissions(user_id, list(permissions)):
                 return (
@@ -113,7 +135,7 @@ def require_role(*roles: str) -> Callable:
             verify_jwt_in_request()
             user_id = get_jwt_identity()
 
-            rbac = getattr(current_app, "container").rbac_service()
+            rbac = _get_rbac_service()
             user_roles = rbac.get_user_roles(user_id)
 
             if not any(role in user_roles for role in roles):
@@ -157,7 +179,7 @@ def require_feature(feature_name: str) -> Callable:
             verify_jwt_in_request()
             user_id = get_jwt_identity()
 
-            guard = getattr(current_app, "container").feature_guard()
+            guard = _get_feature_guard()
 
             if not guard.can_access_feature(user_id, feature_name):
                 return (
@@ -202,7 +224,7 @@ def check_usage_limit(feature_name: str, amount: int = 1) -> Callable:
             verify_jwt_in_request()
             user_id = get_jwt_identity()
 
-            guard = getattr(current_app, "container").feature_guard()
+            guard = _get_feature_guard()
             allowed, remaining = guard.check_usage_limit(user_id, feature_name, amount)
 
             if not allowed:
@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from vbwd.utils.datetime_utils import utcnow
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, Iterator, Optional, List
 from abc import ABC, abstractmethod
 from vbwd.events.dispatcher import Event as BaseEvent
 
@@ -217,3 +217,19 @@ class DomainEventDispatcher:
             return EventResult.no_handler()
 
         return EventResult.combine(results)
+
+    def emit_many(self, events: Iterable[DomainEvent]) -> Iterator[EventResult]:
+        """
+        Emit events one at a time, yielding each result as it is produced.
+
+        Events are pulled from ``events`` lazily, so a streamed batch is
+        dispatched without holding every event in memory.
+
+        Args:
+            events: Domain events to emit, in order
+
+        Yields:
+            EventResult for each event, in the same order
+        """
+        for event in events:
+            yield self.emit(event)
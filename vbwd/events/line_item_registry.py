@@ -7,7 +7,7 @@ at startup via BasePlugin.register_line_item_handlers().
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Optional, List
+from typing import Any, Dict, Optional, List
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
@@ -20,6 +20,16 @@ class LineItemContext:
     invoice: Any
     user_id: UUID
     container: Any
+    # Entities bulk-loaded by the caller, keyed by line item ``item_id``;
+    # handlers fall back to their own lookup for anything missing
+    prefetched: Dict[Any, Any] = field(default_factory=dict)
+    # When set, handlers record prefetched entities' new status here
+    # ({item_id: status}) instead of saving each one; the caller writes
+    # them in bulk afterwards
+    status_updates: Optional[Dict[Any, Any]] = None
+    # When set, handlers record token credits here ({purchase id: tokens})
+    # and the caller applies them to the user's balance in one write
+    token_credits: Optional[Dict[Any, int]] = None
 
 
 @dataclass
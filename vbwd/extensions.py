@@ -48,6 +48,7 @@ def create_db_engine():
         max_overflow=DATABASE_CONFIG["max_overflow"],
         pool_pre_ping=DATABASE_CONFIG["pool_pre_ping"],
         pool_recycle=DATABASE_CONFIG["pool_recycle"],
+        query_cache_size=DATABASE_CONFIG["query_cache_size"],
         echo=False,
     )
 
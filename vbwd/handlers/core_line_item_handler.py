@@ -42,13 +42,20 @@ class CoreLineItemHandler(ILineItemHandler):
     def restore_line_item(self, line_item, context: LineItemContext) -> LineItemResult:
         return self._restore_token_bundle(line_item, context)
 
+    def _find_purchase(self, purchase_repo, line_item, context: LineItemContext):
+        """Purchase for a line item, preferring the caller's bulk-loaded copy."""
+        purchase = context.prefetched.get(line_item.item_id)
+        if purchase is None:
+            purchase = purchase_repo.find_by_id(line_item.item_id)
+        return purchase
+
     # ── Activation ────────────────────────────────────────────────────────
 
     def _activate_token_bundle(
         self, line_item, context: LineItemContext
     ) -> LineItemResult:
         purchase_repo = self._container.token_bundle_purchase_repository()
-        purchase = purchase_repo.find_by_id(line_item.item_id)
+        purchase = self._find_purchase(purchase_repo, line_item, context)
         if not purchase or purchase.status != PurchaseStatus.PENDING:
             return LineItemResult(success=True, data={})
 
@@ -57,31 +64,16 @@ class CoreLineItemHandler(ILineItemHandler):
         purchase.tokens_credited = True
         purchase_repo.save(purchase)
 
-        from vbwd.models.user_token_balance import UserTokenBalance, TokenTransaction
-
-        token_repo = self._container.token_balance_repository()
-        token_transaction_repo = self._container.token_transaction_repository()
-
-        balance = token_repo.find_by_user_id(context.user_id)
-        if not balance:
-            balance = UserTokenBalance(id=uuid4(), user_id=context.user_id, balance=0)
-        balance.balance += purchase.token_amount
-        token_repo.save(balance)
-
-        transaction = TokenTransaction(
-            id=uuid4(),
-            user_id=context.user_id,
-            amount=purchase.token_amount,
-            transaction_type=TokenTransactionType.PURCHASE,
-            reference_id=purchase.id,
-            description=f"Token bundle purchase: {purchase.token_amount} tokens",
+        self._credit_tokens(
+            context.user_id,
+            purchase,
+            f"Token bundle purchase: {purchase.token_amount} tokens",
         )
-        token_transaction_repo.save(transaction)
 
         return LineItemResult(
             success=True,
             data={
-                "purchase_id": str(purchase.id),
+                "purchase_id": purchase.id,
                 "tokens_credited": purchase.token_amount,
             },
         )
@@ -92,12 +84,15 @@ class CoreLineItemHandler(ILineItemHandler):
         self, line_item, context: LineItemContext
     ) -> LineItemResult:
         purchase_repo = self._container.token_bundle_purchase_repository()
-        purchase = purchase_repo.find_by_id(line_item.item_id)
+        purchase = self._find_purchase(purchase_repo, line_item, context)
         if not purchase or purchase.status != PurchaseStatus.COMPLETED:
             return LineItemResult(success=True, data={})
 
-        purchase.status = PurchaseStatus.REFUNDED
-        purchase_repo.save(purchase)
+        if context.status_updates is None:
+            purchase.status = PurchaseStatus.REFUNDED
+            purchase_repo.save(purchase)
+        else:
+            context.status_updates[purchase.id] = PurchaseStatus.REFUNDED
 
         token_service = self._container.token_service()
         actual_debited = token_service.refund_tokens(
@@ -110,7 +105,7 @@ class CoreLineItemHandler(ILineItemHandler):
         return LineItemResult(
             success=True,
             data={
-                "purchase_id": str(purchase.id),
+                "purchase_id": purchase.id,
                 "tokens_debited": actual_debited,
             },
         )
@@ -121,7 +116,7 @@ class CoreLineItemHandler(ILineItemHandler):
         self, line_item, context: LineItemContext
     ) -> LineItemResult:
         purchase_repo = self._container.token_bundle_purchase_repository()
-        purchase = purchase_repo.find_by_id(line_item.item_id)
+        purchase = self._find_purchase(purchase_repo, line_item, context)
         if not purchase or purchase.status != PurchaseStatus.REFUNDED:
             return LineItemResult(success=True, data={})
 
@@ -129,31 +124,42 @@ class CoreLineItemHandler(ILineItemHandler):
         purchase.tokens_credited = True
         purchase_repo.save(purchase)
 
+        if context.token_credits is None:
+            self._credit_tokens(
+                context.user_id,
+                purchase,
+                f"Refund reversed: {purchase.token_amount} tokens restored",
+            )
+        else:
+            context.token_credits[purchase.id] = purchase.token_amount
+
+        return LineItemResult(
+            success=True,
+            data={
+                "purchase_id": purchase.id,
+                "tokens_credited": purchase.token_amount,
+            },
+        )
+
+    def _credit_tokens(self, user_id, purchase, description: str) -> None:
+        """Add a purchase's tokens to the user's balance and log it."""
         from vbwd.models.user_token_balance import UserTokenBalance, TokenTransaction
 
         token_repo = self._container.token_balance_repository()
         token_transaction_repo = self._container.token_transaction_repository()
 
-        balance = token_repo.find_by_user_id(context.user_id)
+        balance = token_repo.find_by_user_id(user_id)
         if not balance:
-            balance = UserTokenBalance(id=uuid4(), user_id=context.user_id, balance=0)
+            balance = UserTokenBalance(id=uuid4(), user_id=user_id, balance=0)
         balance.balance += purchase.token_amount
         token_repo.save(balance)
 
         transaction = TokenTransaction(
             id=uuid4(),
-            user_id=context.user_id,
+            user_id=user_id,
             amount=purchase.token_amount,
             transaction_type=TokenTransactionType.PURCHASE,
             reference_id=purchase.id,
-            description=f"Refund reversed: {purchase.token_amount} tokens restored",
+            description=description,
         )
         token_transaction_repo.save(transaction)
-
-        return LineItemResult(
-            success=True,
-            data={
-                "purchase_id": str(purchase.id),
-                "tokens_credited": purchase.token_amount,
-            },
-        )
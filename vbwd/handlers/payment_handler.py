@@ -76,23 +76,28 @@ class PaymentCapturedHandler(IEventHandler):
                 if invoice.paid_at
                 else utcnow().date().isoformat()
             )
-            event_bus.publish(
-                "invoice.paid",
-                {
-                    "user_name": user_name,
-                    "user_email": user_email,
-                    "invoice_id": str(
-                        getattr(invoice, "invoice_number", None) or invoice.id
-                    ),
-                    "amount": str(invoice.amount),
-                    "paid_date": paid_date,
-                    "invoice_url": f"/invoices/{invoice.id}",
-                },
-            )
+            payload = {
+                "user_name": user_name,
+                "user_email": user_email,
+                "invoice_id": str(
+                    getattr(invoice, "invoice_number", None) or invoice.id
+                ),
+                "amount": str(invoice.amount),
+                "paid_date": paid_date,
+                "invoice_url": f"/invoices/{invoice.id}",
+            }
+            invoice_id = str(invoice.id)
+
+            # All writes are committed; end the read transaction so the
+            # pooled connection is released while subscribers run their
+            # external IO (e.g. sending email)
+            self._container.db_session().commit()
+
+            event_bus.publish("invoice.paid", payload)
 
             return EventResult.success_result(
                 {
-                    "invoice_id": str(invoice.id),
+                    "invoice_id": invoice_id,
                     "status": "paid",
                     "payment_reference": event.payment_reference,
                     "items_activated": items_activated,
@@ -100,6 +105,9 @@ class PaymentCapturedHandler(IEventHandler):
             )
 
         except Exception as exception:
+            # Discard the failed transaction so the session stays usable for
+            # the next event (e.g. the following line of a batch webhook)
+            self._container.db_session().rollback()
             return EventResult.error_result(str(exception))
 
     def _collect_activation_result(self, result, items_activated: dict) -> None:
@@ -1,7 +1,6 @@
 """Refund reversal event handler — restores invoice and items."""
 from vbwd.events.domain import DomainEvent, EventResult, IEventHandler
 from vbwd.events.payment_events import RefundReversedEvent
-from vbwd.services.restore_service import RestoreService
 
 
 class RefundReversedHandler(IEventHandler):
@@ -28,8 +27,10 @@ class RefundReversedHandler(IEventHandler):
         try:
             if event.invoice_id is None:
                 return EventResult.error_result("Invoice ID is required")
-            service = RestoreService(self._container)
-            result = service.process_restore(
+            # Line item handlers (including plugins') reach the container
+            # through the restore context
+            restore_service = self._container.restore_service(container=self._container)
+            result = restore_service.process_restore(
                 invoice_id=event.invoice_id,
                 reason=event.reason,
             )
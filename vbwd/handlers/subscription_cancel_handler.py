@@ -34,8 +34,10 @@ class SubscriptionCancelledHandler(IEventHandler):
             if not subscription or subscription.status == SubscriptionStatus.CANCELLED:
                 return EventResult.success_result()
 
+            # One timestamp for the subscription and every add-on it cancels
+            now = utcnow()
             subscription.status = SubscriptionStatus.CANCELLED
-            subscription.cancelled_at = utcnow()
+            subscription.cancelled_at = now
             repos["subscription"].save(subscription)
 
             # Cancel linked add-on subscriptions
@@ -45,7 +47,7 @@ class SubscriptionCancelledHandler(IEventHandler):
             for addon_sub in addon_subs:
                 if addon_sub.status == SubscriptionStatus.ACTIVE:
                     addon_sub.status = SubscriptionStatus.CANCELLED
-                    addon_sub.cancelled_at = utcnow()
+                    addon_sub.cancelled_at = now
                     repos["addon_subscription"].save(addon_sub)
 
             return EventResult.success_result(
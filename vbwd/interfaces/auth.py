@@ -51,7 +51,7 @@ class IAuthService(ABC):
 
     @abstractmethod
     def hash_password(self, password: str) -> str:
-        """Hash password using bcrypt."""
+        """Hash password."""
         pass
 
     @abstractmethod
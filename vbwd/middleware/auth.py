@@ -1,11 +1,20 @@
 """Authentication middleware."""
 from functools import wraps
+from uuid import UUID
 from flask import request, jsonify, g
 from vbwd.services.auth_service import AuthService
-from vbwd.repositories.user_repository import UserRepository
+from vbwd.repositories.user_repository import (
+    REQUEST_USER_LOAD_OPTIONS,
+    UserRepository,
+)
 from vbwd.extensions import db
 
 
+def _as_uuid(user_id) -> UUID:
+    """Normalize a token subject to a UUID so handlers never re-parse it."""
+    return user_id if isinstance(user_id, UUID) else UUID(str(user_id))
+
+
 def require_auth(f):
     """Decorator to require authentication for a route.
 
@@ -45,15 +54,16 @@ def require_auth(f):
             return jsonify({"error": "Invalid or expired token"}), 401
 
         # Verify user exists and is active
-        user = user_repo.find_by_id(user_id)
+        user = user_repo.find_by_id(user_id, *REQUEST_USER_LOAD_OPTIONS)
         if not user:
             return jsonify({"error": "User not found"}), 401
 
         if user.status.value != "ACTIVE":
             return jsonify({"error": "User account is not active"}), 401
 
-        # Store user_id in Flask's g object for use in route
-        g.user_id = user_id
+        # Store user_id in Flask's g object for use in route; always a UUID
+        # so ownership checks compare UUIDs directly
+        g.user_id = _as_uuid(user_id)
         g.user = user
 
         return f(*args, **kwargs)
@@ -191,9 +201,9 @@ def optional_auth(f):
         user_id = auth_service.verify_token(token)
         if user_id:
             # Valid token, load user
-            user = user_repo.find_by_id(user_id)
+            user = user_repo.find_by_id(user_id, *REQUEST_USER_LOAD_OPTIONS)
             if user and user.status.value == "ACTIVE":
-                g.user_id = user_id
+                g.user_id = _as_uuid(user_id)
                 g.user = user
 
         # Continue with or without auth
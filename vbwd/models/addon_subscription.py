@@ -3,11 +3,20 @@ from datetime import timedelta
 from vbwd.utils.datetime_utils import utcnow
 from sqlalchemy.dialects.postgresql import UUID
 from vbwd.extensions import db
-from vbwd.models.base import BaseModel
+from vbwd.models.base import BaseModel, OptimisticLockMixin
 from vbwd.models.enums import SubscriptionStatus
 
 
-class AddOnSubscription(BaseModel):
+def _is_valid(status, expires_at) -> bool:
+    """Check validity from raw status/expiry values."""
+    if status != SubscriptionStatus.ACTIVE:
+        return False
+    if expires_at and expires_at < utcnow():
+        return False
+    return True
+
+
+class AddOnSubscription(OptimisticLockMixin, BaseModel):
     """
     Add-on subscription model.
 
@@ -67,11 +76,7 @@ class AddOnSubscription(BaseModel):
     @property
     def is_valid(self) -> bool:
         """Check if add-on subscription is currently valid."""
-        if self.status != SubscriptionStatus.ACTIVE:
-            return False
-        if self.expires_at and self.expires_at < utcnow():
-            return False
-        return True
+        return _is_valid(self.status, self.expires_at)
 
     def activate(self, duration_days: int) -> None:
         """Activate add-on subscription."""
@@ -91,22 +96,32 @@ class AddOnSubscription(BaseModel):
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        return self.serialize(self)
+
+    @staticmethod
+    def serialize(source) -> dict:
+        """
+        Build the dictionary form from an add-on subscription or a result row.
+
+        ``source`` only needs the column attributes, so list queries can pass
+        Core rows and skip ORM instance construction.
+        """
         return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
-            "addon_id": str(self.addon_id),
-            "subscription_id": str(self.subscription_id)
-            if self.subscription_id
+            "id": str(source.id),
+            "user_id": str(source.user_id),
+            "addon_id": str(source.addon_id),
+            "subscription_id": str(source.subscription_id)
+            if source.subscription_id
             else None,
-            "invoice_id": str(self.invoice_id) if self.invoice_id else None,
-            "status": self.status.value,
-            "is_valid": self.is_valid,
-            "starts_at": self.starts_at.isoformat() if self.starts_at else None,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-            "cancelled_at": self.cancelled_at.isoformat()
-            if self.cancelled_at
+            "invoice_id": str(source.invoice_id) if source.invoice_id else None,
+            "status": source.status.value,
+            "is_valid": _is_valid(source.status, source.expires_at),
+            "starts_at": source.starts_at.isoformat() if source.starts_at else None,
+            "expires_at": source.expires_at.isoformat() if source.expires_at else None,
+            "cancelled_at": source.cancelled_at.isoformat()
+            if source.cancelled_at
             else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": source.created_at.isoformat() if source.created_at else None,
         }
 
     def __repr__(self) -> str:
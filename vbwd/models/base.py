@@ -1,8 +1,11 @@
 """Base model with common fields and optimistic locking."""
 from vbwd.utils.datetime_utils import utcnow
+from operator import attrgetter
 from uuid import uuid4
+from typing import TYPE_CHECKING, Any, Dict
 from sqlalchemy import Column, DateTime, Integer, event
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import declared_attr
 from vbwd.extensions import db
 
 
@@ -40,9 +43,50 @@ class BaseModel(db.Model):  # type: ignore[name-defined]
 
     def to_dict(self) -> dict:
         """Convert model to dictionary."""
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
+        names, getter = self._column_getter()
+        return dict(zip(names, getter(self)))
+
+    @classmethod
+    def _column_getter(cls):
+        """
+        Column names and a getter returning their values as a tuple.
+
+        Built once per model class so to_dict does not walk
+        ``__table__.columns`` on every call.
+        """
+        cached = cls.__dict__.get("_to_dict_columns")
+        if cached is None:
+            names = tuple(column.name for column in cls.__table__.columns)
+            # Every table has at least the id/timestamp/version columns, so
+            # attrgetter always returns a tuple
+            cached = (names, attrgetter(*names))
+            cls._to_dict_columns = cached
+        return cached
+
+
+class OptimisticLockMixin:
+    """
+    Enforce the version column on every ORM flush.
+
+    UPDATE and DELETE statements for the model include ``WHERE version =
+    <loaded version>``; if another transaction changed the row first, no
+    row matches and SQLAlchemy raises ``StaleDataError`` (surfaced by
+    ``BaseRepository.save`` as ``ConcurrentModificationError``). The
+    ``increment_version`` listener below still supplies the new value.
+
+    Mix in before ``BaseModel``::
+
+        class UserInvoice(OptimisticLockMixin, BaseModel):
+    """
+
+    if TYPE_CHECKING:
+        # Supplied by BaseModel; declared here for the type checker only, so
+        # declarative mapping does not see a second column
+        version: Column[int]
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        return {"version_id_col": cls.version, "version_id_generator": False}
 
 
 # Auto-increment version on update
@@ -3,11 +3,11 @@ from vbwd.utils.datetime_utils import utcnow
 import uuid
 from sqlalchemy.dialects.postgresql import UUID
 from vbwd.extensions import db
-from vbwd.models.base import BaseModel
+from vbwd.models.base import BaseModel, OptimisticLockMixin
 from vbwd.models.enums import InvoiceStatus
 
 
-class UserInvoice(BaseModel):
+class UserInvoice(OptimisticLockMixin, BaseModel):
     """
     User invoice model.
 
@@ -15,6 +15,11 @@ class UserInvoice(BaseModel):
     """
 
     __tablename__ = "vbwd_user_invoice"
+    __table_args__ = (
+        # Serves the pending and overdue sweeps: equality on status, then a
+        # range scan ordered by expires_at
+        db.Index("ix_vbwd_user_invoice_status_expires", "status", "expires_at"),
+    )
 
     user_id = db.Column(
         UUID(as_uuid=True),
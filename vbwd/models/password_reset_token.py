@@ -1,4 +1,6 @@
 """Password reset token model."""
+import hashlib
+
 from sqlalchemy.dialects.postgresql import UUID
 from vbwd.extensions import db
 from vbwd.models.base import BaseModel
@@ -10,6 +12,8 @@ class PasswordResetToken(BaseModel):
     Password reset token model.
 
     Stores tokens for password reset requests with expiration and usage tracking.
+    Only the SHA-256 digest of a token is kept; the plaintext exists solely
+    in the link mailed to the user.
     """
 
     __tablename__ = "vbwd_password_reset_token"
@@ -20,13 +24,18 @@ class PasswordResetToken(BaseModel):
         nullable=False,
         index=True,
     )
-    token = db.Column(db.String(64), unique=True, nullable=False, index=True)
+    token_hash = db.Column(db.LargeBinary(32), unique=True, nullable=False, index=True)
     expires_at = db.Column(db.DateTime, nullable=False)
     used_at = db.Column(db.DateTime, nullable=True)
 
     # Relationship
     user = db.relationship("User", backref=db.backref("reset_tokens", lazy="dynamic"))
 
+    @staticmethod
+    def hash_token(token: str) -> bytes:
+        """Digest under which a plaintext token is stored and looked up."""
+        return hashlib.sha256(token.encode()).digest()
+
     def __repr__(self) -> str:
         return f"<PasswordResetToken(id={self.id}, user_id={self.user_id})>"
 
@@ -211,19 +211,28 @@ class PaymentMethod(BaseModel):
         Excludes sensitive fields like config.
         Applies translation if locale provided.
         """
-        # Get translation if available
+        translation = self.get_translation(locale) if locale else None
+        return self.build_public_dict(translation)
+
+    def build_public_dict(
+        self, translation: Optional["PaymentMethodTranslation"] = None
+    ) -> dict:
+        """
+        Build the public dictionary from an already-resolved translation.
+
+        Args:
+            translation: Translation to overlay, or None for base texts
+        """
         name = self.name
         description = self.description
         short_description = self.short_description
         instructions = self.instructions
 
-        if locale:
-            translation = self.get_translation(locale)
-            if translation:
-                name = translation.name or name
-                description = translation.description or description
-                short_description = translation.short_description or short_description
-                instructions = translation.instructions or instructions
+        if translation:
+            name = translation.name or name
+            description = translation.description or description
+            short_description = translation.short_description or short_description
+            instructions = translation.instructions or instructions
 
         return {
             "id": str(self.id),
@@ -3,11 +3,29 @@ from datetime import timedelta
 from vbwd.utils.datetime_utils import utcnow
 from sqlalchemy.dialects.postgresql import UUID
 from vbwd.extensions import db
-from vbwd.models.base import BaseModel
+from vbwd.models.base import BaseModel, OptimisticLockMixin
 from vbwd.models.enums import SubscriptionStatus
 
+_VALID_STATUSES = (SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING)
 
-class Subscription(BaseModel):
+
+def _is_valid(status, expires_at) -> bool:
+    """Check validity from raw status/expiry values."""
+    if status not in _VALID_STATUSES:
+        return False
+    if expires_at and expires_at < utcnow():
+        return False
+    return True
+
+
+def _days_remaining(expires_at) -> int:
+    """Days until expiry from a raw expiry value."""
+    if not expires_at:
+        return 0
+    return max(0, (expires_at - utcnow()).days)
+
+
+class Subscription(OptimisticLockMixin, BaseModel):
     """
     User subscription model.
 
@@ -16,6 +34,17 @@ class Subscription(BaseModel):
 
     __tablename__ = "vbwd_subscription"
 
+    # Active-subscription lookups filter on user and live status and order by
+    # created_at; the partial index holds only the live rows
+    __table_args__ = (
+        db.Index(
+            "ix_vbwd_subscription_user_active",
+            "user_id",
+            "created_at",
+            postgresql_where=db.text("status IN ('ACTIVE', 'TRIALING')"),
+        ),
+    )
+
     user_id = db.Column(
         UUID(as_uuid=True),
         db.ForeignKey("vbwd_user.id", ondelete="CASCADE"),
@@ -63,11 +92,7 @@ class Subscription(BaseModel):
     @property
     def is_valid(self) -> bool:
         """Check if subscription is currently valid (ACTIVE or TRIALING)."""
-        if self.status not in (SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING):
-            return False
-        if self.expires_at and self.expires_at < utcnow():
-            return False
-        return True
+        return _is_valid(self.status, self.expires_at)
 
     @property
     def is_trialing(self) -> bool:
@@ -77,10 +102,7 @@ class Subscription(BaseModel):
     @property
     def days_remaining(self) -> int:
         """Calculate days remaining until expiration."""
-        if not self.expires_at:
-            return 0
-        delta = self.expires_at - utcnow()
-        return max(0, delta.days)
+        return _days_remaining(self.expires_at)
 
     def start_trial(self, trial_days: int) -> None:
         """
@@ -128,24 +150,34 @@ class Subscription(BaseModel):
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        return self.serialize(self)
+
+    @staticmethod
+    def serialize(source) -> dict:
+        """
+        Build the dictionary form from a subscription or a result row.
+
+        ``source`` only needs the column attributes, so list queries can pass
+        Core rows and skip ORM instance construction.
+        """
         return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "tarif_plan_id": self.tarif_plan_id,
-            "pending_plan_id": self.pending_plan_id,
-            "status": self.status.value,
-            "is_valid": self.is_valid,
-            "is_trialing": self.is_trialing,
-            "days_remaining": self.days_remaining,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-            "trial_end_at": self.trial_end_at.isoformat()
-            if self.trial_end_at
+            "id": source.id,
+            "user_id": source.user_id,
+            "tarif_plan_id": source.tarif_plan_id,
+            "pending_plan_id": source.pending_plan_id,
+            "status": source.status.value,
+            "is_valid": _is_valid(source.status, source.expires_at),
+            "is_trialing": source.status == SubscriptionStatus.TRIALING,
+            "days_remaining": _days_remaining(source.expires_at),
+            "started_at": source.started_at.isoformat() if source.started_at else None,
+            "expires_at": source.expires_at.isoformat() if source.expires_at else None,
+            "trial_end_at": source.trial_end_at.isoformat()
+            if source.trial_end_at
             else None,
-            "cancelled_at": self.cancelled_at.isoformat()
-            if self.cancelled_at
+            "cancelled_at": source.cancelled_at.isoformat()
+            if source.cancelled_at
             else None,
-            "paused_at": self.paused_at.isoformat() if self.paused_at else None,
+            "paused_at": source.paused_at.isoformat() if source.paused_at else None,
         }
 
     def __repr__(self) -> str:
@@ -24,16 +24,21 @@ class TokenBundle(BaseModel):
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        return self.serialize(self)
+
+    @staticmethod
+    def serialize(source) -> dict:
+        """Build the dictionary form from a bundle or a result row."""
         return {
-            "id": str(self.id),
-            "name": self.name,
-            "description": self.description,
-            "token_amount": self.token_amount,
-            "price": str(self.price),
-            "is_active": self.is_active,
-            "sort_order": self.sort_order,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "id": str(source.id),
+            "name": source.name,
+            "description": source.description,
+            "token_amount": source.token_amount,
+            "price": str(source.price),
+            "is_active": source.is_active,
+            "sort_order": source.sort_order,
+            "created_at": source.created_at.isoformat() if source.created_at else None,
+            "updated_at": source.updated_at.isoformat() if source.updated_at else None,
         }
 
     def __repr__(self) -> str:
@@ -2,11 +2,11 @@
 from vbwd.utils.datetime_utils import utcnow
 from sqlalchemy.dialects.postgresql import UUID
 from vbwd.extensions import db
-from vbwd.models.base import BaseModel
+from vbwd.models.base import BaseModel, OptimisticLockMixin
 from vbwd.models.enums import PurchaseStatus
 
 
-class TokenBundlePurchase(BaseModel):
+class TokenBundlePurchase(OptimisticLockMixin, BaseModel):
     """
     Token bundle purchase model.
 
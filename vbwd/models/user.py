@@ -3,6 +3,13 @@ from vbwd.extensions import db
 from vbwd.models.base import BaseModel
 from vbwd.models.enums import UserStatus, UserRole
 
+_ADMIN_ROLES = frozenset((UserRole.SUPER_ADMIN, UserRole.ADMIN))
+
+
+def _permission_names(levels: list) -> list[str]:
+    """Collect the sorted, de-duplicated permission names of access levels."""
+    return sorted({perm.name for level in levels for perm in level.permissions})
+
 
 class User(BaseModel):
     """
@@ -79,22 +86,21 @@ class User(BaseModel):
     @property
     def is_admin(self) -> bool:
         """Check if user can access admin panel."""
-        return self.role in (UserRole.SUPER_ADMIN, UserRole.ADMIN)
+        return self.role in _ADMIN_ROLES
 
     @property
     def effective_permissions(self) -> list[str]:
         """Get effective permissions based on role."""
+        return self._admin_permissions(self._get_access_levels())
+
+    def _admin_permissions(self, access_levels: list) -> list[str]:
+        """Resolve admin permissions from already-loaded access levels."""
         if self.role == UserRole.SUPER_ADMIN:
             return ["*"]
-        access_levels = self._get_access_levels()
         # Legacy fallback: ADMIN with no RBAC roles gets all permissions
         if self.role == UserRole.ADMIN and not access_levels:
             return ["*"]
-        permissions: set[str] = set()
-        for access_level in access_levels:
-            for perm in list(access_level.permissions):
-                permissions.add(perm.name)
-        return sorted(permissions)
+        return _permission_names(access_levels)
 
     def has_permission(self, permission_name: str) -> bool:
         """Check if user has a specific admin permission."""
@@ -119,11 +125,7 @@ class User(BaseModel):
     @property
     def effective_user_permissions(self) -> list[str]:
         """Get all user-facing permissions from assigned user access levels."""
-        permissions: set[str] = set()
-        for level in self._get_user_access_levels():
-            for perm in list(level.permissions):
-                permissions.add(perm.name)
-        return sorted(permissions)
+        return _permission_names(self._get_user_access_levels())
 
     def has_user_permission(self, permission_name: str) -> bool:
         """Check if user has a specific user-facing permission."""
@@ -134,13 +136,19 @@ class User(BaseModel):
 
     def to_dict(self) -> dict:
         """Convert to dictionary, excluding sensitive data."""
+        # Read each relationship once; every access goes through the
+        # instrumented attribute machinery
+        details = self.details
+        access_levels = self._get_access_levels()
+        user_access_levels = self._get_user_access_levels()
+        created_at = self.created_at
+        updated_at = self.updated_at
+
         name = None
-        if self.details:
-            name_parts = []
-            if self.details.first_name:
-                name_parts.append(self.details.first_name)
-            if self.details.last_name:
-                name_parts.append(self.details.last_name)
+        if details:
+            name_parts = [
+                part for part in (details.first_name, details.last_name) if part
+            ]
             name = " ".join(name_parts) if name_parts else None
 
         result = {
@@ -148,33 +156,33 @@ class User(BaseModel):
             "email": self.email,
             "name": name,
             "status": self.status.value,
-            "is_active": self.is_active,
+            "is_active": self.status == UserStatus.ACTIVE,
             "role": self.role.value,
-            "is_admin": self.is_admin,
+            "is_admin": self.role in _ADMIN_ROLES,
             "access_levels": [
                 {
                     "id": str(r.id),
                     "slug": r.slug,
                     "name": r.name,
                 }
-                for r in self._get_access_levels()
+                for r in access_levels
             ],
-            "permissions": self.effective_permissions,
+            "permissions": self._admin_permissions(access_levels),
             "user_access_levels": [
                 {
                     "id": str(level.id),
                     "slug": level.slug,
                     "name": level.name,
                 }
-                for level in self._get_user_access_levels()
+                for level in user_access_levels
             ],
-            "user_permissions": self.effective_user_permissions,
-            "created_at": (self.created_at.isoformat() if self.created_at else None),
-            "updated_at": (self.updated_at.isoformat() if self.updated_at else None),
+            "user_permissions": _permission_names(user_access_levels),
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None,
         }
 
-        if self.details:
-            result["details"] = self.details.to_dict()
+        if details:
+            result["details"] = details.to_dict()
 
         tb = getattr(self, "token_balance", None)
         result["token_balance"] = tb.balance if tb else 0
@@ -49,6 +49,16 @@ class TokenTransaction(BaseModel):
     """
 
     __tablename__ = "vbwd_token_transaction"
+    __table_args__ = (
+        # Serves the per-user history ordered by (created_at, id) DESC,
+        # scanned backwards, for both offset and keyset pages
+        db.Index(
+            "ix_vbwd_token_transaction_user_created",
+            "user_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     user_id = db.Column(
         UUID(as_uuid=True),
@@ -76,16 +86,21 @@ class TokenTransaction(BaseModel):
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        return self.serialize(self)
+
+    @staticmethod
+    def serialize(source) -> dict:
+        """Build the dictionary form from a transaction or a result row."""
         return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
-            "amount": self.amount,
-            "transaction_type": self.transaction_type.value
-            if self.transaction_type
+            "id": str(source.id),
+            "user_id": str(source.user_id),
+            "amount": source.amount,
+            "transaction_type": source.transaction_type.value
+            if source.transaction_type
             else None,
-            "reference_id": str(self.reference_id) if self.reference_id else None,
-            "description": self.description,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "reference_id": str(source.reference_id) if source.reference_id else None,
+            "description": source.description,
+            "created_at": source.created_at.isoformat() if source.created_at else None,
         }
 
     def __repr__(self) -> str:
@@ -44,6 +44,7 @@ def validate_invoice_for_payment(invoice_id_str, user_id):
 
     Every payment create-session route calls this after parsing request body.
     Uses DI container from current_app for request-scoped repository.
+    ``user_id`` is a UUID, as set on ``g.user_id`` by require_auth.
 
     Returns:
         (invoice, None) if valid
@@ -67,7 +68,7 @@ def validate_invoice_for_payment(invoice_id_str, user_id):
             jsonify({"error": f"Invoice is {invoice.status.value}, expected PENDING"}),
             400,
         )
-    if str(invoice.user_id) != str(user_id):
+    if invoice.user_id != user_id:
         return None, (jsonify({"error": "Invoice does not belong to this user"}), 403)
 
     return invoice, None
@@ -1,14 +1,47 @@
 """AddOnSubscription repository implementation."""
-from typing import List
+from typing import List, Optional
 from uuid import UUID
+from sqlalchemy import Row, bindparam, select, update
+from sqlalchemy.orm import joinedload, raiseload
 from vbwd.repositories.base import BaseRepository
+from vbwd.models.addon import AddOn
 from vbwd.models.addon_subscription import AddOnSubscription
 from vbwd.models.enums import SubscriptionStatus
+from vbwd.utils.datetime_utils import utcnow
+
+# Statuses an add-on subscription can still be cancelled from
+CANCELLABLE_STATUSES = (SubscriptionStatus.ACTIVE, SubscriptionStatus.PENDING)
 
 
 class AddOnSubscriptionRepository(BaseRepository[AddOnSubscription]):
     """Repository for AddOnSubscription entity operations."""
 
+    # Column projection for the user's add-on list: enough for
+    # AddOnSubscription.serialize plus the add-on summary, in one query and
+    # without building ORM instances (or selectin-loading each add-on's plans)
+    _LIST_ROWS_BY_USER = (
+        select(
+            AddOnSubscription.id,
+            AddOnSubscription.user_id,
+            AddOnSubscription.addon_id,
+            AddOnSubscription.subscription_id,
+            AddOnSubscription.invoice_id,
+            AddOnSubscription.status,
+            AddOnSubscription.starts_at,
+            AddOnSubscription.expires_at,
+            AddOnSubscription.cancelled_at,
+            AddOnSubscription.created_at,
+            AddOn.name.label("addon_name"),
+            AddOn.slug.label("addon_slug"),
+            AddOn.description.label("addon_description"),
+            AddOn.price.label("addon_price"),
+            AddOn.billing_period.label("addon_billing_period"),
+        )
+        .join(AddOn, AddOn.id == AddOnSubscription.addon_id)
+        .where(AddOnSubscription.user_id == bindparam("user_id"))
+        .order_by(AddOnSubscription.created_at.desc())
+    )
+
     def __init__(self, session):
         super().__init__(session=session, model=AddOnSubscription)
 
@@ -21,6 +54,28 @@ class AddOnSubscriptionRepository(BaseRepository[AddOnSubscription]):
             .all()
         )
 
+    def find_detail_by_id(self, addon_sub_id: UUID) -> Optional[AddOnSubscription]:
+        """
+        Find an add-on subscription with its add-on for the detail view.
+
+        Only the add-on is loaded; any other relationship access (including
+        the add-on's tarif_plans) raises instead of issuing a lazy SELECT.
+        """
+        return self._session.get(
+            AddOnSubscription,
+            addon_sub_id,
+            options=[
+                joinedload(AddOnSubscription.addon).raiseload("*"),  # type: ignore[arg-type]
+                raiseload("*"),
+            ],
+        )
+
+    def find_rows_by_user(self, user_id: UUID) -> List[Row]:
+        """Find a user's add-on subscriptions with add-on columns, newest first."""
+        return list(
+            self._session.execute(self._LIST_ROWS_BY_USER, {"user_id": user_id})
+        )
+
     def find_by_subscription(self, subscription_id: UUID) -> List[AddOnSubscription]:
         """Find all add-on subscriptions for a parent subscription."""
         return (
@@ -71,6 +126,35 @@ class AddOnSubscriptionRepository(BaseRepository[AddOnSubscription]):
             .all()
         )
 
+    def cancel_owned(
+        self, addon_sub_id: UUID, user_id: UUID
+    ) -> Optional[AddOnSubscription]:
+        """
+        Cancel a user's add-on subscription in one ``UPDATE ... RETURNING``.
+
+        Ownership and the cancellable status are part of the WHERE clause,
+        so no prior SELECT is needed.
+
+        Returns:
+            The cancelled add-on subscription, or None if it does not exist,
+            belongs to another user or is not cancellable.
+        """
+        stmt = (
+            update(AddOnSubscription)
+            .where(
+                AddOnSubscription.id == addon_sub_id,
+                AddOnSubscription.user_id == user_id,
+                AddOnSubscription.status.in_(CANCELLABLE_STATUSES),
+            )
+            .values(
+                version=AddOnSubscription.version + 1,
+                status=SubscriptionStatus.CANCELLED,
+                cancelled_at=utcnow(),
+            )
+            .returning(AddOnSubscription)
+        )
+        return self._commit_update_returning(stmt)
+
     def create(self, addon_subscription: AddOnSubscription) -> AddOnSubscription:
         """Create a new add-on subscription."""
         self._session.add(addon_subscription)
@@ -1,8 +1,11 @@
 """Base repository implementation with optimistic locking."""
-from typing import Any, Generic, TypeVar, Optional, List, Type, Union
+from typing import Any, Generic, Iterable, TypeVar, Optional, List, Type, Union
 from uuid import UUID
+from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.orm.exc import StaleDataError
 from vbwd.models.base import ConcurrentModificationError
+from vbwd.utils.transaction import in_unit_of_work
 
 T = TypeVar("T")
 
@@ -25,10 +28,30 @@ class BaseRepository(Generic[T]):
         self._session = session
         self._model = model
 
-    def find_by_id(self, id: Union[UUID, str]) -> Optional[T]:
-        """Find entity by ID."""
+    def _commit(self) -> None:
+        """Commit the session, or only flush it inside a UnitOfWork."""
+        if in_unit_of_work(self._session):
+            self._session.flush()
+        else:
+            self._session.commit()
+
+    def find_by_id(self, id: Union[UUID, str], *options: Any) -> Optional[T]:
+        """Find entity by ID, applying any loader ``options``."""
+        if options:
+            return self._session.get(self._model, id, options=options)
         return self._session.get(self._model, id)
 
+    def find_by_ids(self, ids: Iterable[Union[UUID, str]]) -> List[T]:
+        """Find entities by ID with one ``IN`` query; unknown IDs are skipped."""
+        ids = list(ids)
+        if not ids:
+            return []
+        return (
+            self._session.query(self._model)
+            .filter(self._model.id.in_(ids))  # type: ignore[attr-defined]
+            .all()
+        )
+
     def find_all(self, limit: int = 100, offset: int = 0) -> List[T]:
         """Find all entities with pagination."""
         return self._session.query(self._model).limit(limit).offset(offset).all()
@@ -70,7 +93,7 @@ class BaseRepository(Generic[T]):
 
             if object_session(entity) is None or inspect(entity).transient:  # type: ignore[union-attr]
                 self._session.add(entity)
-            self._session.commit()
+            self._commit()
             self._session.refresh(entity)
             return entity
         except StaleDataError:
@@ -89,15 +112,43 @@ class BaseRepository(Generic[T]):
         Returns:
             Updated entity
         """
-        self._session.commit()
+        self._commit()
         self._session.refresh(entity)
         return entity
 
+    def _commit_update_returning(self, stmt) -> Optional[T]:
+        """
+        Execute an ORM ``UPDATE ... RETURNING`` of this model and commit.
+
+        Inside a UnitOfWork the change is only flushed.
+
+        Args:
+            stmt: ``update(Model)...returning(Model)`` statement.
+
+        Returns:
+            The updated entity, or None if no row matched (nothing is
+            committed then).
+        """
+        entity = self._session.execute(stmt).scalar_one_or_none()
+        if entity is None:
+            return None
+
+        loaded = {
+            attr.key: getattr(entity, attr.key)
+            for attr in inspect(self._model).column_attrs  # type: ignore[union-attr]
+        }
+        self._commit()
+        # Commit expires the instance; keep the RETURNING values instead of
+        # re-selecting the row
+        for key, value in loaded.items():
+            set_committed_value(entity, key, value)
+        return entity
+
     def delete(self, id: Union[UUID, str]) -> bool:
         """Delete entity by ID."""
         entity = self.find_by_id(id)
         if entity:
             self._session.delete(entity)
-            self._session.commit()
+            self._commit()
             return True
         return False
@@ -1,9 +1,11 @@
 """Feature usage repository."""
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
+from sqlalchemy.dialects.postgresql import insert
 from vbwd.repositories.base import BaseRepository
 from vbwd.models.feature_usage import FeatureUsage
+from vbwd.utils.datetime_utils import utcnow
 
 
 class FeatureUsageRepository(BaseRepository[FeatureUsage]):
@@ -54,6 +56,36 @@ class FeatureUsageRepository(BaseRepository[FeatureUsage]):
         record = self.get_usage(user_id, feature_name, period_start)
         return record.usage_count if record else 0
 
+    def get_monthly_usage_bulk(
+        self, user_id: UUID, feature_names: List[str], period_start: datetime
+    ) -> Dict[str, int]:
+        """
+        Get usage counts for several features in one query.
+
+        Args:
+            user_id: User UUID
+            feature_names: Names of the features
+            period_start: Start of billing period
+
+        Returns:
+            Dictionary of feature_name -> usage_count (features without a
+            record are omitted)
+        """
+        if not feature_names:
+            return {}
+
+        rows = (
+            self._session.query(FeatureUsage.feature_name, FeatureUsage.usage_count)
+            .filter(
+                FeatureUsage.user_id == user_id,
+                FeatureUsage.feature_name.in_(feature_names),
+                FeatureUsage.period_start == period_start,
+            )
+            .all()
+        )
+
+        return {feature_name: usage_count for feature_name, usage_count in rows}
+
     def increment_usage(
         self, user_id: UUID, feature_name: str, period_start: datetime, amount: int = 1
     ) -> int:
@@ -87,6 +119,59 @@ class FeatureUsageRepository(BaseRepository[FeatureUsage]):
         self._session.commit()
         return record.usage_count
 
+    def try_increment_within_limit(
+        self,
+        user_id: UUID,
+        feature_name: str,
+        period_start: datetime,
+        amount: int,
+        limit: int,
+    ) -> Optional[int]:
+        """
+        Increment usage only if the result stays within the limit.
+
+        Check and increment happen in one ``INSERT ... ON CONFLICT DO
+        UPDATE ... WHERE`` on the user/feature/period unique constraint, so
+        concurrent requests cannot push usage past the limit.
+
+        Args:
+            user_id: User UUID
+            feature_name: Name of the feature
+            period_start: Start of billing period
+            amount: Amount to increment
+            limit: Maximum allowed usage for the period
+
+        Returns:
+            New usage count, or None if the increment would exceed the limit
+            (nothing is committed then)
+        """
+        if amount > limit:
+            return None
+
+        insert_stmt = insert(FeatureUsage).values(
+            user_id=user_id,
+            feature_name=feature_name,
+            period_start=period_start,
+            usage_count=amount,
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            constraint="uq_user_feature_period",
+            set_={
+                "usage_count": FeatureUsage.usage_count
+                + insert_stmt.excluded.usage_count,
+                "version": FeatureUsage.version + 1,
+                "updated_at": utcnow(),
+            },
+            where=FeatureUsage.usage_count + amount <= limit,
+        ).returning(FeatureUsage.usage_count)
+
+        new_count = self._session.execute(stmt).scalar_one_or_none()
+        if new_count is None:
+            return None
+
+        self._session.commit()
+        return new_count
+
     def reset_usage(
         self, user_id: UUID, feature_name: str, period_start: datetime
     ) -> bool:
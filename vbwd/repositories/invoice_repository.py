@@ -1,6 +1,8 @@
 """Invoice repository implementation."""
-from typing import Optional, List, Union, Tuple
+from typing import Iterator, Optional, List, Union, Tuple
 from uuid import UUID
+from sqlalchemy import update
+from sqlalchemy.orm import raiseload
 from vbwd.utils.datetime_utils import utcnow
 from vbwd.repositories.base import BaseRepository
 from vbwd.models import UserInvoice, InvoiceStatus
@@ -12,14 +14,49 @@ class InvoiceRepository(BaseRepository[UserInvoice]):
     def __init__(self, session):
         super().__init__(session=session, model=UserInvoice)
 
+    def find_header_by_id(self, invoice_id: Union[UUID, str]) -> Optional[UserInvoice]:
+        """
+        Find an invoice without its line items.
+
+        For summaries that only read invoice columns; touching any
+        relationship raises instead of issuing a lazy SELECT.
+        """
+        return self._session.get(UserInvoice, invoice_id, options=[raiseload("*")])
+
+    def update_if(
+        self, invoice_id: Union[UUID, str], *conditions, **changes
+    ) -> Optional[UserInvoice]:
+        """
+        Update an invoice only if it matches ``conditions``.
+
+        The check and the write are issued as a single
+        ``UPDATE ... RETURNING`` statement.
+
+        Args:
+            invoice_id: Invoice UUID.
+            *conditions: Additional WHERE criteria (e.g. required status).
+            **changes: Column values to set.
+
+        Returns:
+            The updated invoice, or None if no row matched.
+        """
+        stmt = (
+            update(UserInvoice)
+            .where(UserInvoice.id == invoice_id, *conditions)
+            .values(version=UserInvoice.version + 1, **changes)
+            .returning(UserInvoice)
+        )
+        return self._commit_update_returning(stmt)
+
     def find_by_user(self, user_id: Union[UUID, str]) -> List[UserInvoice]:
         """Find all invoices for a user."""
-        return (
-            self._session.query(UserInvoice)
-            .filter(UserInvoice.user_id == user_id)
-            .order_by(UserInvoice.created_at.desc())
-            .all()
-        )
+        return self._by_user_query(user_id).all()
+
+    def iter_by_user(
+        self, user_id: Union[UUID, str], batch_size: int = 500
+    ) -> Iterator[UserInvoice]:
+        """Stream a user's invoices from a server-side cursor in batches."""
+        return self._stream(self._by_user_query(user_id), batch_size)
 
     def find_by_invoice_number(self, invoice_number: str) -> Optional[UserInvoice]:
         """Find invoice by invoice number."""
@@ -33,12 +70,13 @@ class InvoiceRepository(BaseRepository[UserInvoice]):
         self, subscription_id: Union[UUID, str]
     ) -> List[UserInvoice]:
         """Find all invoices for a subscription."""
-        return (
-            self._session.query(UserInvoice)
-            .filter(UserInvoice.subscription_id == subscription_id)
-            .order_by(UserInvoice.created_at.desc())
-            .all()
-        )
+        return self._by_subscription_query(subscription_id).all()
+
+    def iter_by_subscription(
+        self, subscription_id: Union[UUID, str], batch_size: int = 500
+    ) -> Iterator[UserInvoice]:
+        """Stream a subscription's invoices from a server-side cursor in batches."""
+        return self._stream(self._by_subscription_query(subscription_id), batch_size)
 
     def find_by_provider_session_id(
         self, provider_session_id: str
@@ -52,11 +90,11 @@ class InvoiceRepository(BaseRepository[UserInvoice]):
 
     def find_pending(self) -> List[UserInvoice]:
         """Find all pending invoices."""
-        return (
-            self._session.query(UserInvoice)
-            .filter(UserInvoice.status == InvoiceStatus.PENDING)
-            .all()
-        )
+        return self._pending_query().all()
+
+    def iter_pending(self, batch_size: int = 500) -> Iterator[UserInvoice]:
+        """Stream pending invoices from a server-side cursor in batches."""
+        return self._stream(self._pending_query(), batch_size)
 
     def find_unpaid_by_user(self, user_id: Union[UUID, str]) -> List[UserInvoice]:
         """Find unpaid invoices for a user."""
@@ -72,16 +110,44 @@ class InvoiceRepository(BaseRepository[UserInvoice]):
 
     def find_overdue(self) -> List[UserInvoice]:
         """Find invoices past due date."""
+        return self._overdue_query().all()
+
+    def iter_overdue(self, batch_size: int = 500) -> Iterator[UserInvoice]:
+        """Stream overdue invoices from a server-side cursor in batches."""
+        return self._stream(self._overdue_query(), batch_size)
+
+    def _by_user_query(self, user_id: Union[UUID, str]):
         return (
             self._session.query(UserInvoice)
-            .filter(
-                UserInvoice.status == InvoiceStatus.PENDING,
-                UserInvoice.expires_at < utcnow(),
-            )
+            .filter(UserInvoice.user_id == user_id)
+            .order_by(UserInvoice.created_at.desc())
+        )
+
+    def _by_subscription_query(self, subscription_id: Union[UUID, str]):
+        return (
+            self._session.query(UserInvoice)
+            .filter(UserInvoice.subscription_id == subscription_id)
+            .order_by(UserInvoice.created_at.desc())
+        )
+
+    def _pending_query(self):
+        return self._session.query(UserInvoice).filter(
+            UserInvoice.status == InvoiceStatus.PENDING
+        )
+
+    def _overdue_query(self):
+        # Both predicates and the sort are served by the (status, expires_at)
+        # index
+        return (
+            self._pending_query()
+            .filter(UserInvoice.expires_at < utcnow())
             .order_by(UserInvoice.expires_at.asc())
-            .all()
         )
 
+    @staticmethod
+    def _stream(query, batch_size: int) -> Iterator[UserInvoice]:
+        return iter(query.execution_options(stream_results=True).yield_per(batch_size))
+
     def find_all_paginated(
         self,
         limit: int = 20,
@@ -19,6 +19,9 @@ class PasswordResetRepository(BaseRepository[PasswordResetToken]):
         """
         Find password reset token by token string.
 
+        The lookup is by the token's SHA-256 digest, so the database never
+        compares against the plaintext.
+
         Args:
             token: The token string to find
 
@@ -27,7 +30,9 @@ class PasswordResetRepository(BaseRepository[PasswordResetToken]):
         """
         return (
             self._session.query(PasswordResetToken)
-            .filter(PasswordResetToken.token == token)
+            .filter(
+                PasswordResetToken.token_hash == PasswordResetToken.hash_token(token)
+            )
             .first()
         )
 
@@ -39,7 +44,7 @@ class PasswordResetRepository(BaseRepository[PasswordResetToken]):
 
         Args:
             user_id: UUID of the user requesting reset
-            token: Secure random token string
+            token: Secure random token string; only its digest is stored
             expires_at: Token expiration datetime
 
         Returns:
@@ -47,7 +52,7 @@ class PasswordResetRepository(BaseRepository[PasswordResetToken]):
         """
         reset_token = PasswordResetToken()
         reset_token.user_id = user_id
-        reset_token.token = token
+        reset_token.token_hash = PasswordResetToken.hash_token(token)
         reset_token.expires_at = expires_at
 
         self._session.add(reset_token)
@@ -82,6 +82,35 @@ class PaymentMethodRepository(BaseRepository[PaymentMethod]):
             m for m in methods if m.is_available(amount, currency_code, country_code)
         ]
 
+    def to_public_dicts(
+        self, methods: List[PaymentMethod], locale: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Render public dicts for methods, loading translations in one query.
+
+        Args:
+            methods: Payment methods to render
+            locale: Locale for translations (optional)
+
+        Returns:
+            List of public payment method dicts, in input order
+        """
+        translations = {}
+        if locale and methods:
+            rows = (
+                self._session.query(PaymentMethodTranslation)
+                .filter(
+                    PaymentMethodTranslation.payment_method_id.in_(
+                        [m.id for m in methods]
+                    ),
+                    PaymentMethodTranslation.locale == locale,
+                )
+                .all()
+            )
+            translations = {t.payment_method_id: t for t in rows}
+
+        return [m.build_public_dict(translations.get(m.id)) for m in methods]
+
     def find_default(self) -> Optional[PaymentMethod]:
         """
         Find the default payment method.
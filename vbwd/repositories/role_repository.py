@@ -1,8 +1,8 @@
 """Role repository for RBAC operations."""
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Tuple
 from uuid import UUID
 from vbwd.repositories.base import BaseRepository
-from vbwd.models.role import Role, Permission, user_roles
+from vbwd.models.role import Role, Permission, role_permissions, user_roles
 
 
 class RoleRepository(BaseRepository[Role]):
@@ -34,6 +34,32 @@ class RoleRepository(BaseRepository[Role]):
                 permissions.add(perm.name)
         return permissions
 
+    def get_user_permissions_with_admin(
+        self, user_id: UUID, admin_role: str
+    ) -> Tuple[Set[str], bool]:
+        """
+        Get a user's permission names and admin status with one query.
+
+        Args:
+            user_id: User UUID
+            admin_role: Name of the role that grants every permission
+
+        Returns:
+            (permission names, True if the user has ``admin_role``)
+        """
+        rows = (
+            self._session.query(Role.name, Permission.name)
+            .select_from(Role)
+            .join(user_roles, user_roles.c.role_id == Role.id)
+            .outerjoin(role_permissions, role_permissions.c.role_id == Role.id)
+            .outerjoin(Permission, Permission.id == role_permissions.c.permission_id)
+            .filter(user_roles.c.user_id == user_id)
+            .all()
+        )
+        permissions = {perm for _, perm in rows if perm is not None}
+        is_admin = any(role == admin_role for role, _ in rows)
+        return permissions, is_admin
+
     def assign_role(self, user_id: UUID, role_name: str) -> bool:
         """
         Assign a role to a user.
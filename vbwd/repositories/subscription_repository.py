@@ -1,31 +1,136 @@
 """Subscription repository implementation."""
 from datetime import timedelta
-from typing import Optional, List, Union, Tuple
+from typing import Iterator, Optional, List, Union, Tuple
 from uuid import UUID
+from sqlalchemy import ColumnElement, Row, bindparam, select, update
+from sqlalchemy.orm import joinedload
 from vbwd.utils.datetime_utils import utcnow
 from vbwd.repositories.base import BaseRepository
 from vbwd.models import Subscription, SubscriptionStatus
 
 
+_ACTIVE_STATUSES = (SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING)
+
+
 class SubscriptionRepository(BaseRepository[Subscription]):
     """Repository for Subscription entity operations."""
 
+    # Per-user lookups run on every subscription page; build them once so
+    # each call reuses the same statement and its compiled-cache entry
+    _FIND_BY_USER = (
+        select(Subscription)
+        .where(Subscription.user_id == bindparam("user_id"))
+        .order_by(Subscription.created_at.desc())
+    )
+    # Column projection for list pages: enough for Subscription.serialize
+    # plus created_at, without building ORM instances
+    _LIST_ROWS_BY_USER = (
+        select(
+            Subscription.id,
+            Subscription.user_id,
+            Subscription.tarif_plan_id,
+            Subscription.pending_plan_id,
+            Subscription.status,
+            Subscription.started_at,
+            Subscription.expires_at,
+            Subscription.trial_end_at,
+            Subscription.cancelled_at,
+            Subscription.paused_at,
+            Subscription.created_at,
+        )
+        .where(Subscription.user_id == bindparam("user_id"))
+        .order_by(Subscription.created_at.desc())
+    )
+    _FIND_ACTIVE_BY_USER = (
+        select(Subscription)
+        .where(
+            Subscription.user_id == bindparam("user_id"),
+            Subscription.status.in_(_ACTIVE_STATUSES),
+        )
+        .limit(1)
+    )
+    _FIND_ALL_ACTIVE_BY_USER = (
+        select(Subscription)
+        .where(
+            Subscription.user_id == bindparam("user_id"),
+            Subscription.status.in_(_ACTIVE_STATUSES),
+        )
+        .order_by(Subscription.created_at.desc())
+    )
+
     def __init__(self, session):
         super().__init__(session=session, model=Subscription)
 
     def find_by_user(self, user_id: Union[UUID, str]) -> List[Subscription]:
         """Find all subscriptions for a user."""
-        return (
-            self._session.query(Subscription)
-            .filter(Subscription.user_id == user_id)
-            .order_by(Subscription.created_at.desc())
-            .all()
+        return list(
+            self._session.execute(self._FIND_BY_USER, {"user_id": user_id}).scalars()
+        )
+
+    def iter_rows_by_user(
+        self, user_id: Union[UUID, str], batch_size: int = 100
+    ) -> Iterator[Row]:
+        """Stream a user's subscription rows from a server-side cursor in batches."""
+        return iter(
+            self._session.execute(
+                self._LIST_ROWS_BY_USER,
+                {"user_id": user_id},
+                execution_options={"stream_results": True, "yield_per": batch_size},
+            )
+        )
+
+    def update_owned(
+        self,
+        subscription_id: Union[UUID, str],
+        user_id: Union[UUID, str],
+        *conditions,
+        **changes,
+    ) -> Optional[Subscription]:
+        """
+        Update a subscription only if it belongs to the given user.
+
+        The ownership check, any extra ``conditions`` and the write are issued
+        as a single ``UPDATE ... RETURNING`` statement.
+
+        Args:
+            subscription_id: Subscription UUID.
+            user_id: Owner UUID the subscription must belong to.
+            *conditions: Additional WHERE criteria (e.g. required status).
+            **changes: Column values to set.
+
+        Returns:
+            The updated subscription, or None if no row matched.
+        """
+        stmt = (
+            update(Subscription)
+            .where(
+                Subscription.id == subscription_id,
+                Subscription.user_id == user_id,
+                *conditions,
+            )
+            .values(version=Subscription.version + 1, **changes)
+            .returning(Subscription)
         )
+        return self._commit_update_returning(stmt)
 
     def find_active_by_user(self, user_id: Union[UUID, str]) -> Optional[Subscription]:
         """Find active or trialing subscription for a user."""
+        return (
+            self._session.execute(self._FIND_ACTIVE_BY_USER, {"user_id": user_id})
+            .scalars()
+            .first()
+        )
+
+    def find_active_by_user_with_plans(
+        self, user_id: Union[UUID, str]
+    ) -> Optional[Subscription]:
+        """Find active or trialing subscription with its current and pending plan."""
         return (
             self._session.query(Subscription)
+            .options(
+                joinedload(Subscription.tarif_plan),  # type: ignore[attr-defined]
+                joinedload(Subscription.pending_plan),  # type: ignore[attr-defined]
+            )
             .filter(
                 Subscription.user_id == user_id,
                 Subscription.status.in_(
@@ -72,6 +177,52 @@ class SubscriptionRepository(BaseRepository[Subscription]):
             .all()
         )
 
+    def bulk_expire(self, limit: Optional[int] = None) -> List[UUID]:
+        """
+        Mark active subscriptions past their expiry date as expired.
+
+        Issued as a single ``UPDATE ... RETURNING`` statement instead of
+        loading and saving each row. With ``limit``, at most that many rows
+        are expired; they are picked with ``FOR UPDATE SKIP LOCKED`` so
+        concurrent sweeps take disjoint batches.
+
+        Args:
+            limit: Maximum number of subscriptions to expire, or None for all.
+
+        Returns:
+            IDs of the subscriptions that were expired.
+        """
+        overdue: Tuple[ColumnElement[bool], ...] = (
+            Subscription.status == SubscriptionStatus.ACTIVE,
+            Subscription.expires_at < utcnow(),
+        )
+        where: Tuple[ColumnElement[bool], ...]
+        if limit is None:
+            where = overdue
+        else:
+            batch = (
+                select(Subscription.id)
+                .where(*overdue)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            where = (Subscription.id.in_(batch),)
+
+        stmt = (
+            update(Subscription)
+            .where(*where)
+            .values(
+                status=SubscriptionStatus.EXPIRED,
+                version=Subscription.version + 1,
+            )
+            .returning(Subscription.id)
+            .execution_options(synchronize_session=False)
+        )
+        expired_ids = list(self._session.execute(stmt).scalars())
+        if expired_ids:
+            self._commit()
+        return expired_ids
+
     def find_expired_trials(self) -> List[Subscription]:
         """Find trialing subscriptions whose trial has ended."""
         return (
@@ -125,19 +276,10 @@ class SubscriptionRepository(BaseRepository[Subscription]):
 
     def find_all_active_by_user(self, user_id: Union[UUID, str]) -> List[Subscription]:
         """Find all active/trialing subscriptions for a user (across all categories)."""
-        return (
-            self._session.query(Subscription)
-            .filter(
-                Subscription.user_id == user_id,
-                Subscription.status.in_(
-                    [
-                        SubscriptionStatus.ACTIVE,
-                        SubscriptionStatus.TRIALING,
-                    ]
-                ),
-            )
-            .order_by(Subscription.created_at.desc())
-            .all()
+        return list(
+            self._session.execute(
+                self._FIND_ALL_ACTIVE_BY_USER, {"user_id": user_id}
+            ).scalars()
         )
 
     def find_dunning_candidates(self, days_since_failure: int) -> List[Subscription]:
@@ -1,7 +1,9 @@
 """TarifPlan repository implementation."""
-from typing import Optional, List
+from typing import Optional, List, Union
+from uuid import UUID
+from sqlalchemy import select
 from vbwd.repositories.base import BaseRepository
-from vbwd.models import TarifPlan
+from vbwd.models import Subscription, TarifPlan
 
 
 class TarifPlanRepository(BaseRepository[TarifPlan]):
@@ -14,6 +16,13 @@ class TarifPlanRepository(BaseRepository[TarifPlan]):
         """Find tariff plan by slug."""
         return self._session.query(TarifPlan).filter(TarifPlan.slug == slug).first()
 
+    def find_by_subscriber(self, user_id: Union[UUID, str]) -> List[TarifPlan]:
+        """Find every plan a user has a subscription to, in one query."""
+        subscribed = select(Subscription.tarif_plan_id).where(
+            Subscription.user_id == user_id
+        )
+        return self._session.query(TarifPlan).filter(TarifPlan.id.in_(subscribed)).all()
+
     def find_active(self) -> List[TarifPlan]:
         """Find all active tariff plans."""
         return (
@@ -1,9 +1,11 @@
 """TokenBundlePurchase repository implementation."""
-from typing import List
+from typing import Any, Dict, Iterable, List, cast
 from uuid import UUID
+from sqlalchemy import update
 from vbwd.repositories.base import BaseRepository
+from vbwd.models.base import ConcurrentModificationError
 from vbwd.models.token_bundle_purchase import TokenBundlePurchase
-from vbwd.models.enums import PurchaseStatus
+from vbwd.models.enums import LineItemType, PurchaseStatus
 
 
 class TokenBundlePurchaseRepository(BaseRepository[TokenBundlePurchase]):
@@ -29,6 +31,28 @@ class TokenBundlePurchaseRepository(BaseRepository[TokenBundlePurchase]):
             .all()
         )
 
+    def find_by_line_items(
+        self, line_items: Iterable[Any]
+    ) -> Dict[UUID, TokenBundlePurchase]:
+        """
+        Load the purchases behind an invoice's token bundle line items.
+
+        Args:
+            line_items: Invoice line items; other item types are ignored.
+
+        Returns:
+            Purchases keyed by ID, loaded with one ``IN`` query.
+        """
+        purchase_ids = [
+            line_item.item_id
+            for line_item in line_items
+            if line_item.item_type == LineItemType.TOKEN_BUNDLE
+        ]
+        return {
+            cast(UUID, purchase.id): purchase
+            for purchase in self.find_by_ids(purchase_ids)
+        }
+
     def find_pending_by_user(self, user_id: UUID) -> List[TokenBundlePurchase]:
         """Find all pending purchases for a user."""
         return (
@@ -54,6 +78,52 @@ class TokenBundlePurchaseRepository(BaseRepository[TokenBundlePurchase]):
     def create(self, purchase: TokenBundlePurchase) -> TokenBundlePurchase:
         """Create a new purchase."""
         self._session.add(purchase)
-        self._session.commit()
+        self._commit()
         self._session.refresh(purchase)
         return purchase
+
+    def bulk_update_status(
+        self,
+        ids: Iterable[UUID],
+        status: PurchaseStatus,
+        expected_status: PurchaseStatus,
+    ) -> int:
+        """
+        Move every listed purchase from ``expected_status`` to ``status``.
+
+        Issued as one UPDATE that only matches rows still in
+        ``expected_status``, then committed. If any purchase has already
+        moved on (e.g. a concurrent refund and restore), nothing is written.
+
+        Args:
+            ids: Purchase IDs.
+            status: New status.
+            expected_status: Status every purchase must currently have.
+
+        Returns:
+            Number of rows updated.
+
+        Raises:
+            ConcurrentModificationError: If not every purchase matched; the
+                session is rolled back.
+        """
+        expected_ids = set(ids)
+        if not expected_ids:
+            return 0
+        updated = self._session.execute(
+            update(TokenBundlePurchase)
+            .where(
+                TokenBundlePurchase.id.in_(expected_ids),
+                TokenBundlePurchase.status == expected_status,
+            )
+            .values(status=status, version=TokenBundlePurchase.version + 1)
+            .returning(TokenBundlePurchase.id)
+        ).scalars()
+        if set(updated) != expected_ids:
+            self._session.rollback()
+            raise ConcurrentModificationError(
+                f"Token bundle purchases changed concurrently; expected all "
+                f"{len(expected_ids)} to be {expected_status.value}"
+            )
+        self._commit()
+        return len(expected_ids)
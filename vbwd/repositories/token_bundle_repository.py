@@ -1,5 +1,6 @@
 """TokenBundle repository implementation."""
 from typing import List, Tuple
+from sqlalchemy import Row, select
 from vbwd.repositories.base import BaseRepository
 from vbwd.models import TokenBundle
 
@@ -19,6 +20,25 @@ class TokenBundleRepository(BaseRepository[TokenBundle]):
             .all()
         )
 
+    def find_active_rows(self) -> List[Row]:
+        """Find active bundles as column rows, without building ORM instances."""
+        stmt = (
+            select(
+                TokenBundle.id,
+                TokenBundle.name,
+                TokenBundle.description,
+                TokenBundle.token_amount,
+                TokenBundle.price,
+                TokenBundle.is_active,
+                TokenBundle.sort_order,
+                TokenBundle.created_at,
+                TokenBundle.updated_at,
+            )
+            .where(TokenBundle.is_active.is_(True))
+            .order_by(TokenBundle.sort_order, TokenBundle.name)
+        )
+        return list(self._session.execute(stmt))
+
     def find_all_paginated(
         self,
         page: int = 1,
@@ -1,6 +1,8 @@
 """Token balance and transaction repository."""
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from uuid import UUID
+from sqlalchemy import Row, select, tuple_
 from vbwd.repositories.base import BaseRepository
 from vbwd.models.user_token_balance import UserTokenBalance, TokenTransaction
 
@@ -47,6 +49,44 @@ class TokenTransactionRepository(BaseRepository[TokenTransaction]):
             .all()
         )
 
+    def find_rows_by_user_id(
+        self,
+        user_id: UUID,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Row]:
+        """
+        Find transactions by user ID as column rows, without ORM instances.
+
+        Rows are ordered newest first by ``(created_at, id)``. When ``after``
+        is given, rows strictly older than that ``(created_at, id)`` position
+        are returned and ``offset`` is ignored, so deep pages cost no more
+        than the first one.
+        """
+        stmt = (
+            select(
+                TokenTransaction.id,
+                TokenTransaction.user_id,
+                TokenTransaction.amount,
+                TokenTransaction.transaction_type,
+                TokenTransaction.reference_id,
+                TokenTransaction.description,
+                TokenTransaction.created_at,
+            )
+            .where(TokenTransaction.user_id == user_id)
+            .order_by(TokenTransaction.created_at.desc(), TokenTransaction.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(TokenTransaction.created_at, TokenTransaction.id)
+                < tuple_(*after)  # type: ignore[arg-type]
+            )
+        else:
+            stmt = stmt.offset(offset)
+        return list(self._session.execute(stmt))
+
     def find_by_reference_id(self, reference_id: UUID) -> Optional[TokenTransaction]:
         """Find transaction by reference ID."""
         return (
@@ -58,3 +98,10 @@ class TokenTransactionRepository(BaseRepository[TokenTransaction]):
     def create(self, transaction: TokenTransaction) -> TokenTransaction:
         """Create a new transaction."""
         return self.save(transaction)
+
+    def create_many(self, transactions: List[TokenTransaction]) -> None:
+        """Insert several transactions in one flush and commit."""
+        if not transactions:
+            return
+        self._session.add_all(transactions)
+        self._commit()
@@ -1,19 +1,69 @@
 """User repository implementation."""
-from typing import Optional, List, Tuple
+from typing import Any, Optional, List, Tuple
+from uuid import UUID
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import defaultload, joinedload, selectinload
 from vbwd.repositories.base import BaseRepository
-from vbwd.models import User
+from vbwd.models import User, UserDetails
 from vbwd.models.enums import UserStatus
 
+# Loader options for the user require_auth loads on every request: only the
+# details columns the profile/details responses serialize are fetched; the
+# rest (config JSONB, balance) load on first access
+_REQUEST_DETAILS_COLUMNS: Tuple[Any, ...] = (
+    UserDetails.id,
+    UserDetails.user_id,
+    UserDetails.first_name,
+    UserDetails.last_name,
+    UserDetails.phone,
+    UserDetails.company,
+    UserDetails.tax_number,
+    UserDetails.address_line_1,
+    UserDetails.address_line_2,
+    UserDetails.city,
+    UserDetails.postal_code,
+    UserDetails.country,
+    UserDetails.created_at,
+    UserDetails.updated_at,
+)
+REQUEST_USER_LOAD_OPTIONS = (
+    defaultload(User.details).load_only(*_REQUEST_DETAILS_COLUMNS),  # type: ignore[arg-type]
+)
+
 
 class UserRepository(BaseRepository[User]):
     """Repository for User entity operations."""
 
+    # Built once so each lookup reuses the same statement object and hits
+    # the engine's compiled-statement cache directly
+    _FIND_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
     def __init__(self, session):
         super().__init__(session=session, model=User)
 
+    def update_password_hash(self, user_id: UUID, password_hash: str) -> bool:
+        """
+        Store a new password hash with a single UPDATE.
+
+        Returns:
+            True if the user row was updated.
+        """
+        result = self._session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(password_hash=password_hash, version=User.version + 1)
+        )
+        self._session.commit()
+        return bool(result.rowcount)
+
     def find_by_email(self, email: str) -> Optional[User]:
         """Find user by email address."""
-        return self._session.query(User).filter(User.email == email).first()
+        return (
+            self._session.execute(self._FIND_BY_EMAIL, {"email": email})
+            .unique()
+            .scalars()
+            .first()
+        )
 
     def find_by_status(self, status: str) -> List[User]:
         """Find users by status."""
@@ -21,7 +71,11 @@ class UserRepository(BaseRepository[User]):
 
     def email_exists(self, email: str) -> bool:
         """Check if email is already registered."""
-        return self._session.query(User).filter(User.email == email).count() > 0
+        return bool(
+            self._session.query(
+                self._session.query(User.id).filter(User.email == email).exists()
+            ).scalar()
+        )
 
     def find_all_paginated(
         self,
@@ -56,10 +110,23 @@ class UserRepository(BaseRepository[User]):
         if search:
             query = query.filter(User.email.ilike(f"%{search}%"))
 
-        # Get total count before pagination
-        total = query.count()
+        # Apply pagination; eager-load everything User.to_dict() touches so
+        # the page is hydrated without a per-row lazy load. The window count
+        # returns the total alongside the page in the same round-trip.
+        rows = (
+            query.add_columns(func.count().over().label("total"))
+            .options(
+                joinedload(User.details),  # type: ignore[arg-type]
+                selectinload(User.token_balance),  # type: ignore[attr-defined]
+            )
+            .order_by(User.created_at.desc())
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
 
-        # Apply pagination
-        users = query.order_by(User.created_at.desc()).offset(offset).limit(limit).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
 
-        return users, total
+        # Empty page: only a page past the end needs a separate count
+        return [], query.count() if offset else 0
@@ -5,6 +5,7 @@ from vbwd.repositories.tarif_plan_category_repository import TarifPlanCategoryRe
 from vbwd.repositories.tarif_plan_repository import TarifPlanRepository
 from vbwd.services.tarif_plan_category_service import TarifPlanCategoryService
 from vbwd.extensions import db
+from vbwd.routes.tarif_plans import invalidate_plans_cache
 
 admin_categories_bp = Blueprint(
     "admin_categories",
@@ -13,6 +14,14 @@ admin_categories_bp = Blueprint(
 )
 
 
+@admin_categories_bp.after_request
+def _invalidate_public_cache(response):
+    """Drop cached public plan listings after any successful write."""
+    if request.method != "GET" and response.status_code < 400:
+        invalidate_plans_cache()
+    return response
+
+
 def _get_service() -> TarifPlanCategoryService:
     """Get category service with current request session."""
     return TarifPlanCategoryService(
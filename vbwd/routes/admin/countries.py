@@ -3,12 +3,26 @@ from flask import Blueprint, jsonify, request
 from vbwd.middleware.auth import require_auth, require_admin, require_permission
 from vbwd.repositories.country_repository import CountryRepository
 from vbwd.extensions import db
+from vbwd.routes.settings import countries_cache
+from vbwd.routes.tarif_plans import invalidate_plans_cache
 
 admin_countries_bp = Blueprint(
     "admin_countries", __name__, url_prefix="/api/v1/admin/countries"
 )
 
 
+@admin_countries_bp.after_request
+def _invalidate_public_cache(response):
+    """Drop cached public country and plan listings after any successful write.
+
+    Warmed plan listings are rendered per enabled country.
+    """
+    if request.method != "GET" and response.status_code < 400:
+        countries_cache.clear()
+        invalidate_plans_cache()
+    return response
+
+
 @admin_countries_bp.route("/", methods=["GET"])
 @require_auth
 @require_admin
@@ -322,7 +322,10 @@ def refund_invoice(invoice_id):
 
     # Pre-check: ensure user has enough tokens before calling payment provider
     refund_service = container.refund_service()
-    tokens_needed = refund_service._calculate_tokens_to_debit(invoice)
+    purchases = container.token_bundle_purchase_repository().find_by_line_items(
+        invoice.line_items
+    )
+    tokens_needed = refund_service._calculate_tokens_to_debit(invoice, purchases)
     if tokens_needed > 0:
         token_service = container.token_service()
         current_balance = token_service.get_balance(invoice.user_id)
@@ -8,12 +8,21 @@ from vbwd.repositories.payment_method_repository import (
 )
 from vbwd.extensions import db
 from vbwd.models import PaymentMethod
+from vbwd.routes.settings import payment_methods_cache
 
 admin_payment_methods_bp = Blueprint(
     "admin_payment_methods", __name__, url_prefix="/api/v1/admin/payment-methods"
 )
 
 
+@admin_payment_methods_bp.after_request
+def _invalidate_public_cache(response):
+    """Drop cached public payment-method listings after any successful write."""
+    if request.method != "GET" and response.status_code < 400:
+        payment_methods_cache.clear()
+    return response
+
+
 @admin_payment_methods_bp.route("/", methods=["GET"])
 @require_auth
 @require_admin
@@ -11,12 +11,21 @@ from vbwd.extensions import db
 from vbwd.models import TarifPlan
 from vbwd.models.subscription import Subscription
 from vbwd.models.enums import SubscriptionStatus
+from vbwd.routes.tarif_plans import invalidate_plans_cache
 
 admin_plans_bp = Blueprint(
     "admin_plans", __name__, url_prefix="/api/v1/admin/tarif-plans"
 )
 
 
+@admin_plans_bp.after_request
+def _invalidate_public_cache(response):
+    """Drop cached public plan listings after any successful write."""
+    if request.method != "GET" and response.status_code < 400:
+        invalidate_plans_cache()
+    return response
+
+
 @admin_plans_bp.route("/", methods=["GET"])
 @require_auth
 @require_admin
@@ -5,10 +5,19 @@ from flask import Blueprint, jsonify, request
 from vbwd.extensions import db
 from vbwd.middleware.auth import require_auth, require_permission
 from vbwd.models.tax import Tax, TaxClass
+from vbwd.routes.tarif_plans import invalidate_plans_cache
 
 admin_tax_bp = Blueprint("admin_tax", __name__, url_prefix="/api/v1/admin/tax")
 
 
+@admin_tax_bp.after_request
+def _invalidate_public_cache(response):
+    """Drop cached public plan listings (they include tax) after any write."""
+    if request.method != "GET" and response.status_code < 400:
+        invalidate_plans_cache()
+    return response
+
+
 # ── Tax Rates ──────────────────────────────────────────────────────────
 
 
@@ -98,7 +107,7 @@ def update_rate(rate_id):
     if "code" in data:
         new_code = data["code"].strip().upper()
         existing = db.session.query(Tax).filter_by(code=new_code).first()
-        if existing and str(existing.id) != str(tax.id):
+        if existing and existing.id != tax.id:
             return (
                 jsonify({"error": f"Tax code '{new_code}' already exists"}),
                 400,
@@ -208,7 +217,7 @@ def update_class(class_id):
     if "code" in data:
         new_code = data["code"].strip().lower()
         existing = db.session.query(TaxClass).filter_by(code=new_code).first()
-        if existing and str(existing.id) != str(tax_class.id):
+        if existing and existing.id != tax_class.id:
             return (
                 jsonify({"error": (f"Tax class code '{new_code}' already exists")}),
                 400,
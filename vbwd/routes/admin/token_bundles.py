@@ -5,12 +5,21 @@ from vbwd.middleware.auth import require_auth, require_admin, require_permission
 from vbwd.repositories.token_bundle_repository import TokenBundleRepository
 from vbwd.extensions import db
 from vbwd.models import TokenBundle
+from vbwd.routes.token_bundles import invalidate_bundles_cache
 
 admin_token_bundles_bp = Blueprint(
     "admin_token_bundles", __name__, url_prefix="/api/v1/admin/token-bundles"
 )
 
 
+@admin_token_bundles_bp.after_request
+def _invalidate_public_cache(response):
+    """Drop the cached public bundle catalog after any successful write."""
+    if request.method != "GET" and response.status_code < 400:
+        invalidate_bundles_cache()
+    return response
+
+
 @admin_token_bundles_bp.route("/", methods=["GET"])
 @require_auth
 @require_admin
@@ -1,6 +1,4 @@
 """Admin user management routes."""
-import bcrypt
-from uuid import UUID
 from flask import Blueprint, jsonify, request, current_app
 from vbwd.middleware.auth import require_auth, require_admin, require_permission
 from vbwd.repositories.user_repository import UserRepository
@@ -9,9 +7,23 @@ from vbwd.models.user import User
 from vbwd.models.user_details import UserDetails
 from vbwd.models.user_token_balance import UserTokenBalance
 from vbwd.models.enums import UserStatus, UserRole
+from vbwd.events.user_events import UserCreatedEvent
+from vbwd.services.auth_service import password_hasher
 
 admin_users_bp = Blueprint("admin_users", __name__, url_prefix="/api/v1/admin/users")
 
+# UserDetails fields accepted on admin user creation
+_DETAILS_FIELDS = (
+    "first_name",
+    "last_name",
+    "address_line_1",
+    "address_line_2",
+    "city",
+    "postal_code",
+    "country",
+    "phone",
+)
+
 
 @admin_users_bp.route("/", methods=["POST"])
 @require_auth
@@ -51,8 +63,7 @@ def create_user():
         return jsonify({"error": "User with this email already exists"}), 409
 
     # Hash password
-    password_bytes = data["password"].encode("utf-8")
-    password_hash = bcrypt.hashpw(password_bytes, bcrypt.gensalt()).decode("utf-8")
+    password_hash = password_hasher.hash(data["password"])
 
     # Parse status
     status_str = data.get("status", "ACTIVE")
@@ -75,38 +86,25 @@ def create_user():
     user.status = status
     user.role = role
 
-    created_user = user_repo.save(user)
-
-    # Create user details if provided
+    # Attach details before saving so user and details are written in a
+    # single transaction (the relationship cascades the insert)
     details_data = data.get("details")
     if details_data:
-        user_details = UserDetails()
-        user_details.user_id = created_user.id
-        user_details.first_name = details_data.get("first_name")
-        user_details.last_name = details_data.get("last_name")
-        user_details.address_line_1 = details_data.get("address_line_1")
-        user_details.address_line_2 = details_data.get("address_line_2")
-        user_details.city = details_data.get("city")
-        user_details.postal_code = details_data.get("postal_code")
-        user_details.country = details_data.get("country")
-        user_details.phone = details_data.get("phone")
-        db.session.add(user_details)
-        db.session.commit()
-        created_user.details = user_details
+        user.details = UserDetails(
+            **{field: details_data.get(field) for field in _DETAILS_FIELDS}
+        )
 
-    # Dispatch user:created event
-    try:
-        dispatcher = current_app.container.event_dispatcher()
-        dispatcher.emit(
-            "user:created",
-            {
-                "user_id": str(created_user.id),
-                "email": created_user.email,
-                "role": created_user.role.value,
-            },
+    created_user = user_repo.save(user)
+
+    # Dispatch user.created event
+    dispatcher = current_app.container.event_dispatcher()
+    dispatcher.emit(
+        UserCreatedEvent(
+            user_id=created_user.id,
+            email=created_user.email,
+            role=created_user.role.value,
         )
-    except Exception:
-        pass  # Don't fail if event dispatcher not configured
+    )
 
     # Build response
     response = {
@@ -244,10 +242,7 @@ def update_user(user_id):
     if "password" in data and data["password"]:
         if len(data["password"]) < 8:
             return jsonify({"error": "Password must be at least 8 characters"}), 400
-        password_bytes = data["password"].encode("utf-8")
-        user.password_hash = bcrypt.hashpw(password_bytes, bcrypt.gensalt()).decode(
-            "utf-8"
-        )
+        user.password_hash = password_hasher.hash(data["password"])
 
     # Collect detail field names that can be updated
     detail_fields = [
@@ -558,9 +553,7 @@ def get_user_addons(user_id):
     addon_sub_repo = container.addon_subscription_repository()
     invoice_repo = container.invoice_repository()
 
-    addon_subs = addon_sub_repo.find_by_user(
-        UUID(user_id) if isinstance(user_id, str) else user_id
-    )
+    addon_subs = addon_sub_repo.find_by_user(user.id)
 
     result = []
     for addon_sub in addon_subs:
@@ -23,6 +23,21 @@ login_schema = LoginRequestSchema()
 auth_response_schema = AuthResponseSchema()
 
 
+def _get_auth_service() -> AuthService:
+    """
+    Return the app-wide AuthService, creating it on first use.
+
+    The service is stateless apart from its repository, which is bound to
+    the scoped ``db.session`` proxy and therefore resolves to the current
+    request's session on every call.
+    """
+    auth_service = current_app.extensions.get("auth_service")
+    if auth_service is None:
+        auth_service = AuthService(user_repository=UserRepository(db.session))
+        current_app.extensions["auth_service"] = auth_service
+    return auth_service
+
+
 @auth_bp.route("/register", methods=["POST"])
 @limiter.limit("5000 per minute")
 def register():
@@ -52,12 +67,10 @@ def register():
     except ValidationError as err:
         return jsonify({"success": False, "error": str(err.messages)}), 400
 
-    # Initialize service
-    user_repo = UserRepository(db.session)
-    auth_service = AuthService(user_repository=user_repo)
-
     # Register user
-    result = auth_service.register(email=data["email"], password=data["password"])
+    result = _get_auth_service().register(
+        email=data["email"], password=data["password"]
+    )
 
     # Return response
     if result.success:
@@ -95,12 +108,8 @@ def login():
     except ValidationError as err:
         return jsonify({"success": False, "error": str(err.messages)}), 400
 
-    # Initialize service
-    user_repo = UserRepository(db.session)
-    auth_service = AuthService(user_repository=user_repo)
-
     # Login user
-    result = auth_service.login(email=data["email"], password=data["password"])
+    result = _get_auth_service().login(email=data["email"], password=data["password"])
 
     # Return response
     if result.success:
@@ -141,9 +150,8 @@ def check_email():
         return jsonify({"error": "Email required"}), 400
 
     user_repo = UserRepository(db.session)
-    user = user_repo.find_by_email(email)
 
-    return jsonify({"exists": user is not None})
+    return jsonify({"exists": user_repo.email_exists(email)})
 
 
 @auth_bp.route("/forgot-password", methods=["POST"])
@@ -174,21 +182,20 @@ def forgot_password():
     if not email:
         return jsonify({"error": "Email required"}), 400
 
-    # Get dispatcher from container
-    try:
-        dispatcher = current_app.container.event_dispatcher()
+    dispatcher = current_app.container.event_dispatcher()
 
+    try:
         # Emit event - handler will do the work
         result = dispatcher.emit(
             PasswordResetRequestEvent(email=email, request_ip=request.remote_addr)
         )
-
-        # Always return success (don't reveal if email exists)
-        return jsonify(result.data or {"message": "If email exists, reset link sent"})
     except Exception:
         # Even on error, don't reveal information
         return jsonify({"message": "If email exists, reset link sent"})
 
+    # Always return success (don't reveal if email exists)
+    return jsonify(result.data or {"message": "If email exists, reset link sent"})
+
 
 @auth_bp.route("/reset-password", methods=["POST"])
 @limiter.limit("5000 per minute")
@@ -220,19 +227,18 @@ def reset_password():
     if not token or not new_password:
         return jsonify({"error": "Token and new password required"}), 400
 
-    # Get dispatcher from container
-    try:
-        dispatcher = current_app.container.event_dispatcher()
+    dispatcher = current_app.container.event_dispatcher()
 
+    try:
         # Emit event - handler will do the work
         result = dispatcher.emit(
             PasswordResetExecuteEvent(
                 token=token, new_password=new_password, reset_ip=request.remote_addr
             )
         )
-
-        if result.success:
-            return jsonify(result.data or {"message": "Password reset successful"})
-        return jsonify({"error": result.error}), 400
     except Exception:
         return jsonify({"error": "Password reset failed"}), 400
+
+    if result.success:
+        return jsonify(result.data or {"message": "Password reset successful"})
+    return jsonify({"error": result.error}), 400
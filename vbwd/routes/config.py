@@ -1,9 +1,14 @@
 """Configuration routes for public settings."""
-from flask import Blueprint, jsonify
+from flask import Blueprint
 from vbwd.config import AVAILABLE_LANGUAGES, DEFAULT_LANGUAGE
+from vbwd.utils.http_cache import CachedJSON, conditional_json_response
 
 config_bp = Blueprint("config", __name__, url_prefix="/api/v1/config")
 
+_LANGUAGES_RESPONSE = CachedJSON(
+    {"languages": AVAILABLE_LANGUAGES, "default": DEFAULT_LANGUAGE}
+)
+
 
 @config_bp.route("/languages", methods=["GET"])
 def get_languages():
@@ -14,5 +19,6 @@ def get_languages():
 
     Returns:
         200: List of available languages and default
+        304: Not modified (If-None-Match matches)
     """
-    return jsonify({"languages": AVAILABLE_LANGUAGES, "default": DEFAULT_LANGUAGE}), 200
+    return conditional_json_response(_LANGUAGES_RESPONSE)
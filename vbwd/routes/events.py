@@ -3,8 +3,10 @@
 Receives events from frontend EventBus and dispatches them
 to the backend event system for processing.
 """
+import sys
+from typing import Any, List, Optional, Tuple
+
 from flask import Blueprint, request, jsonify, current_app, g
-from marshmallow import Schema, fields, ValidationError, validate
 from vbwd.middleware.auth import require_auth
 from vbwd.extensions import limiter
 from vbwd.events.dispatcher import Event
@@ -14,25 +16,6 @@ from vbwd.events.dispatcher import Event
 events_bp = Blueprint("events", __name__, url_prefix="/api/v1/events")
 
 
-class FrontendEventSchema(Schema):
-    """Schema for a single frontend event."""
-
-    type = fields.Str(required=True, validate=validate.Length(min=1, max=100))
-    data = fields.Dict(required=False, load_default={})
-    timestamp = fields.Str(required=False)
-
-
-class EventsBatchSchema(Schema):
-    """Schema for batch of frontend events."""
-
-    events = fields.List(fields.Nested(FrontendEventSchema), required=True)
-
-
-# Initialize schemas
-event_schema = FrontendEventSchema()
-events_batch_schema = EventsBatchSchema()
-
-
 # Allowed frontend event types (whitelist for security)
 ALLOWED_EVENT_TYPES = {
     # Auth events
@@ -63,6 +46,66 @@ ALLOWED_EVENT_TYPES = {
     "plugin:stopped",
 }
 
+# Backend event names keyed by frontend type; doubles as the whitelist lookup
+_FRONTEND_EVENT_NAMES = {
+    event_type: sys.intern("frontend:" + event_type)
+    for event_type in ALLOWED_EVENT_TYPES
+}
+
+MAX_EVENT_TYPE_LENGTH = 100
+
+# (type, data, timestamp)
+ParsedEvent = Tuple[str, dict, Optional[str]]
+
+
+def _parse_events_batch(
+    payload: Any,
+) -> Tuple[Optional[List[ParsedEvent]], Optional[str]]:
+    """
+    Validate a frontend events batch in a single pass.
+
+    Args:
+        payload: Decoded JSON request body
+
+    Returns:
+        Tuple of (events, None) on success or (None, error message)
+    """
+    if not isinstance(payload, dict):
+        return None, "Request body must be a JSON object"
+
+    raw_events = payload.get("events")
+    if not isinstance(raw_events, list):
+        return None, "'events' must be a list"
+
+    events: List[ParsedEvent] = []
+    for index, item in enumerate(raw_events):
+        if not isinstance(item, dict):
+            return None, f"events[{index}] must be an object"
+
+        event_type = item.get("type")
+        if (
+            not isinstance(event_type, str)
+            or not 1 <= len(event_type) <= MAX_EVENT_TYPE_LENGTH
+        ):
+            return None, (
+                f"events[{index}].type must be a string of 1-"
+                f"{MAX_EVENT_TYPE_LENGTH} characters"
+            )
+
+        data = item.get("data")
+        if data is None:
+            data = {}
+        elif not isinstance(data, dict):
+            return None, f"events[{index}].data must be an object"
+
+        timestamp = item.get("timestamp")
+        if timestamp is not None and not isinstance(timestamp, str):
+            return None, f"events[{index}].timestamp must be a string"
+
+        events.append((event_type, data, timestamp))
+
+    return events, None
+
 
 @events_bp.route("", methods=["POST"])
 @require_auth
@@ -93,55 +136,42 @@ def receive_events():
             "errors": ["Event type 'invalid:event' not allowed"]
         }
     """
-    try:
-        data = events_batch_schema.load(request.json)
-    except ValidationError as err:
-        return jsonify({"success": False, "error": str(err.messages)}), 400
+    events, error = _parse_events_batch(request.get_json(silent=True))
+    if events is None:
+        return jsonify({"success": False, "error": error}), 400
 
-    events = data.get("events", [])
     user_id = g.user_id
 
-    # Get dispatcher from container
-    try:
-        dispatcher = current_app.container.event_dispatcher()
-    except Exception:
-        # Fallback if container not configured
-        dispatcher = None
+    dispatcher = current_app.container.event_dispatcher()
 
     received = len(events)
     processed = 0
     errors = []
 
-    for event_data in events:
-        event_type = event_data.get("type")
-
+    for event_type, event_payload, timestamp in events:
         # Validate event type against whitelist
-        if event_type not in ALLOWED_EVENT_TYPES:
+        event_name = _FRONTEND_EVENT_NAMES.get(event_type)
+        if event_name is None:
             errors.append(f"Event type '{event_type}' not allowed")
             continue
 
         # Create backend event
         backend_event = Event(
-            name=f"frontend:{event_type}",
+            name=event_name,
             data={
                 "user_id": user_id,
-                "frontend_data": event_data.get("data", {}),
-                "timestamp": event_data.get("timestamp"),
+                "frontend_data": event_payload,
+                "timestamp": timestamp,
                 "source": "frontend",
             },
         )
 
         # Dispatch event
-        if dispatcher:
-            try:
-                dispatcher.dispatch(backend_event)
-                processed += 1
-            except Exception as e:
-                errors.append(f"Error processing '{event_type}': {str(e)}")
-        else:
-            # No dispatcher - just log
-            current_app.logger.info(f"Frontend event: {event_type} from user {user_id}")
+        try:
+            dispatcher.emit(backend_event)
             processed += 1
+        except Exception as e:
+            errors.append(f"Error processing '{event_type}': {str(e)}")
 
     return (
         jsonify(
@@ -129,7 +129,7 @@ def get_invoices():
     """
     invoice_repo = InvoiceRepository(db.session)
     invoice_service = InvoiceService(invoice_repository=invoice_repo)
-    invoices = invoice_service.get_user_invoices(str(g.user_id))
+    invoices = invoice_service.get_user_invoices(g.user_id)
     return jsonify({"invoices": [inv.to_dict() for inv in invoices]}), 200
 
 
@@ -152,7 +152,7 @@ def get_invoice(invoice_id):
     if not invoice:
         return jsonify({"error": "Invoice not found"}), 404
 
-    if str(invoice.user_id) != str(g.user_id):
+    if invoice.user_id != g.user_id:
         return jsonify({"error": "Access denied"}), 403
 
     return jsonify({"invoice": invoice.to_dict()}), 200
@@ -177,7 +177,7 @@ def download_invoice_pdf(invoice_id):
     if not invoice:
         return jsonify({"error": "Invoice not found"}), 404
 
-    if str(invoice.user_id) != str(g.user_id):
+    if invoice.user_id != g.user_id:
         return jsonify({"error": "Access denied"}), 403
 
     # Pull the authenticated user record to populate billing-party fields.
@@ -185,7 +185,7 @@ def download_invoice_pdf(invoice_id):
     if user is None:
         from vbwd.repositories.user_repository import UserRepository
 
-        user = UserRepository(db.session).find_by_id(str(g.user_id))
+        user = UserRepository(db.session).find_by_id(g.user_id)
 
     pdf_service = get_pdf_service()
     context = _build_invoice_pdf_context(invoice, user)
@@ -3,9 +3,53 @@ from flask import Blueprint, jsonify, request
 from vbwd.repositories.payment_method_repository import PaymentMethodRepository
 from vbwd.repositories.country_repository import CountryRepository
 from vbwd.extensions import db
+from vbwd.utils.http_cache import (
+    CachedJSON,
+    ResponseCache,
+    conditional_json_response,
+)
 
 settings_bp = Blueprint("settings", __name__, url_prefix="/api/v1/settings")
 
+# Seconds public clients may reuse admin-editable listings
+SETTINGS_CACHE_TTL = 60
+
+# Process-level caches, cleared by the admin countries/payment-methods routes
+countries_cache = ResponseCache(ttl=SETTINGS_CACHE_TTL)
+payment_methods_cache = ResponseCache(ttl=SETTINGS_CACHE_TTL)
+
+TERMS_CONTENT = """
+## Terms and Conditions
+
+### 1. Acceptance of Terms
+By accessing and using this service, you accept and agree to be bound by these Terms and Conditions.
+
+### 2. Subscription Services
+- Subscriptions are billed according to the selected billing period
+- You may cancel your subscription at any time
+- Refunds are handled according to our refund policy
+
+### 3. Payment
+- Payment is due upon checkout completion
+- We accept the payment methods listed during checkout
+- All prices include applicable taxes unless stated otherwise
+
+### 4. Privacy
+Your use of our services is also governed by our Privacy Policy.
+
+### 5. Limitation of Liability
+Our liability is limited to the amount paid for the service.
+
+### 6. Changes to Terms
+We reserve the right to modify these terms at any time.
+
+Last updated: 2026-01-01
+"""
+
+_TERMS_RESPONSE = CachedJSON(
+    {"title": "Terms and Conditions", "content": TERMS_CONTENT.strip()}
+)
+
 
 @settings_bp.route("/payment-methods", methods=["GET"])
 def get_payment_methods():
@@ -22,14 +66,20 @@ def get_payment_methods():
 
     Returns:
         200: { "methods": [...] }
+        304: Not modified (If-None-Match matches)
     """
-    repo = PaymentMethodRepository(db.session)
-
     # Get optional filters
     locale = request.args.get("locale")
     currency = request.args.get("currency")
     country = request.args.get("country")
 
+    cache_key = (locale, currency, country)
+    cached = payment_methods_cache.get(cache_key)
+    if cached is not None:
+        return conditional_json_response(cached, max_age=SETTINGS_CACHE_TTL)
+
+    repo = PaymentMethodRepository(db.session)
+
     # Get available methods (already filtered by is_active)
     if currency or country:
         methods = repo.find_available(
@@ -40,7 +90,10 @@ def get_payment_methods():
         methods = repo.find_active()
 
     # Convert to public dict (excludes sensitive config, applies translation)
-    return jsonify({"methods": [m.to_public_dict(locale=locale) for m in methods]}), 200
+    cached = payment_methods_cache.set(
+        cache_key, {"methods": repo.to_public_dicts(methods, locale=locale)}
+    )
+    return conditional_json_response(cached, max_age=SETTINGS_CACHE_TTL)
 
 
 @settings_bp.route("/payment-methods/<code>", methods=["GET"])
@@ -73,39 +126,9 @@ def get_terms():
 
     Returns:
         200: { "title": "...", "content": "..." }
+        304: Not modified (If-None-Match matches)
     """
-    terms_content = """
-## Terms and Conditions
-
-### 1. Acceptance of Terms
-By accessing and using this service, you accept and agree to be bound by these Terms and Conditions.
-
-### 2. Subscription Services
-- Subscriptions are billed according to the selected billing period
-- You may cancel your subscription at any time
-- Refunds are handled according to our refund policy
-
-### 3. Payment
-- Payment is due upon checkout completion
-- We accept the payment methods listed during checkout
-- All prices include applicable taxes unless stated otherwise
-
-### 4. Privacy
-Your use of our services is also governed by our Privacy Policy.
-
-### 5. Limitation of Liability
-Our liability is limited to the amount paid for the service.
-
-### 6. Changes to Terms
-We reserve the right to modify these terms at any time.
-
-Last updated: 2026-01-01
-"""
-
-    return (
-        jsonify({"title": "Terms and Conditions", "content": terms_content.strip()}),
-        200,
-    )
+    return conditional_json_response(_TERMS_RESPONSE)
 
 
 @settings_bp.route("/countries", methods=["GET"])
@@ -118,8 +141,14 @@ def get_countries():
 
     Returns:
         200: { "countries": [{"code": "DE", "name": "Germany"}, ...] }
+        304: Not modified (If-None-Match matches)
     """
-    repo = CountryRepository(db.session)
-    countries = repo.find_enabled()
+    cached = countries_cache.get("enabled")
+    if cached is None:
+        repo = CountryRepository(db.session)
+        countries = repo.find_enabled()
+        cached = countries_cache.set(
+            "enabled", {"countries": [c.to_public_dict() for c in countries]}
+        )
 
-    return jsonify({"countries": [c.to_public_dict() for c in countries]}), 200
+    return conditional_json_response(cached, max_age=SETTINGS_CACHE_TTL)
@@ -1,15 +1,82 @@
 """User subscription routes."""
-from flask import Blueprint, jsonify, g, request
+from typing import Dict, Iterator
+from uuid import UUID
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    g,
+    jsonify,
+    request,
+    stream_with_context,
+)
 from vbwd.extensions import db
 from vbwd.middleware.auth import require_auth
+from vbwd.models.subscription import Subscription
+from vbwd.models.tarif_plan import TarifPlan
 from vbwd.repositories.subscription_repository import SubscriptionRepository
 from vbwd.repositories.tarif_plan_repository import TarifPlanRepository
 from vbwd.services.subscription_service import SubscriptionService
+from vbwd.utils.json_provider import dumps_json
 from vbwd.utils.validation import parse_uuid
 
 subscriptions_bp = Blueprint("subscriptions", __name__)
 
 
+def _get_subscription_repo() -> SubscriptionRepository:
+    """Get the request-scoped subscription repository."""
+    if "subscription_repo" not in g:
+        g.subscription_repo = SubscriptionRepository(db.session)
+    return g.subscription_repo
+
+
+def _get_tarif_plan_repo() -> TarifPlanRepository:
+    """Get the request-scoped tariff plan repository."""
+    if "tarif_plan_repo" not in g:
+        g.tarif_plan_repo = TarifPlanRepository(db.session)
+    return g.tarif_plan_repo
+
+
+def _get_subscription_service() -> SubscriptionService:
+    """Get the request-scoped subscription service."""
+    if "subscription_service" not in g:
+        g.subscription_service = SubscriptionService(
+            subscription_repo=_get_subscription_repo(),
+            tarif_plan_repo=_get_tarif_plan_repo(),
+        )
+    return g.subscription_service
+
+
+def _subscription_item(sub, plans: Dict[UUID, TarifPlan]) -> dict:
+    """Serialize one subscription row for the list response."""
+    data = Subscription.serialize(sub)
+    # Include created_at for reliable frontend sorting (started_at may be null)
+    data["created_at"] = sub.created_at.isoformat() if sub.created_at else None
+    # Enrich with plan details
+    if sub.tarif_plan_id:
+        plan = plans.get(sub.tarif_plan_id)
+        if plan:
+            data["plan"] = {
+                "id": str(plan.id),
+                "name": plan.name,
+                "slug": plan.slug,
+                "price": float(plan.price) if plan.price else 0,
+                "billing_period": plan.billing_period.value
+                if plan.billing_period
+                else None,
+                "categories": [
+                    {
+                        "id": str(c.id),
+                        "slug": c.slug,
+                        "name": c.name,
+                        "is_single": c.is_single,
+                    }
+                    for c in getattr(plan, "categories", [])
+                ],
+            }
+    return data
+
+
 @subscriptions_bp.route("", methods=["GET"])
 @require_auth
 def list_subscriptions():
@@ -19,54 +86,40 @@ def list_subscriptions():
     GET /api/v1/user/subscriptions
     Authorization: Bearer <token>
 
+    The JSON array is streamed: rows are read from a server-side cursor
+    and each subscription is sent as soon as it is serialized. Plans and
+    the first batch of rows are loaded before the response starts, so
+    those failures still get a normal error response. A later failure
+    ends the body with an "error" member after the rows sent so far.
+
     Returns:
         200: List of all user subscriptions with plan details
     """
-    # Initialize services
-    subscription_repo = SubscriptionRepository(db.session)
-    tarif_plan_repo = TarifPlanRepository(db.session)
-    subscription_service = SubscriptionService(subscription_repo=subscription_repo)
-
-    # Get user subscriptions
-    subscriptions = subscription_service.get_user_subscriptions(g.user_id)
-
-    result = []
-    for sub in subscriptions:
-        data = sub.to_dict()
-        # Include created_at for reliable frontend sorting (started_at may be null)
-        data["created_at"] = sub.created_at.isoformat() if sub.created_at else None
-        # Enrich with plan details
-        if sub.tarif_plan_id:
-            plan = tarif_plan_repo.find_by_id(sub.tarif_plan_id)
-            if plan:
-                data["plan"] = {
-                    "id": str(plan.id),
-                    "name": plan.name,
-                    "slug": plan.slug,
-                    "price": float(plan.price) if plan.price else 0,
-                    "billing_period": plan.billing_period.value
-                    if plan.billing_period
-                    else None,
-                    "categories": [
-                        {
-                            "id": str(c.id),
-                            "slug": c.slug,
-                            "name": c.name,
-                            "is_single": c.is_single,
-                        }
-                        for c in getattr(plan, "categories", [])
-                    ],
-                }
-        result.append(data)
-
-    return (
-        jsonify(
-            {
-                "subscriptions": result,
-            }
-        ),
-        200,
-    )
+    plans = {
+        plan.id: plan for plan in _get_tarif_plan_repo().find_by_subscriber(g.user_id)
+    }
+    # Get user subscriptions as plain rows; no ORM instances are built
+    rows = _get_subscription_service().iter_user_subscription_rows(g.user_id)
+    first = next(rows, None)
+    if first is None:
+        return Response(
+            b'{"subscriptions":[]}', status=200, mimetype="application/json"
+        )
+    first_item = dumps_json(_subscription_item(first, plans))
+
+    @stream_with_context
+    def generate() -> Iterator[bytes]:
+        yield b'{"subscriptions":[' + first_item
+        try:
+            for sub in rows:
+                yield b"," + dumps_json(_subscription_item(sub, plans))
+        except Exception:
+            current_app.logger.exception("Streaming subscriptions failed")
+            yield b'],"error":"Failed to load all subscriptions"}'
+            return
+        yield b"]}"
+
+    return Response(generate(), status=200, mimetype="application/json")
 
 
 @subscriptions_bp.route("/active", methods=["GET"])
@@ -81,12 +134,9 @@ def get_active_subscription():
     Returns:
         200: Active subscription with plan details or None
     """
-    # Initialize services
-    subscription_repo = SubscriptionRepository(db.session)
-    tarif_plan_repo = TarifPlanRepository(db.session)
-    subscription_service = SubscriptionService(subscription_repo=subscription_repo)
+    subscription_service = _get_subscription_service()
 
-    # Get active subscription
+    # Get active subscription; plan and pending plan are eager-loaded
     subscription = subscription_service.get_active_subscription(g.user_id)
 
     if not subscription:
@@ -96,28 +146,26 @@ def get_active_subscription():
     subscription_data = subscription.to_dict()
 
     # Add plan details if available
-    if subscription.tarif_plan_id:
-        plan = tarif_plan_repo.find_by_id(subscription.tarif_plan_id)
-        if plan:
-            subscription_data["plan"] = {
-                "id": str(plan.id),
-                "name": plan.name,
-                "slug": plan.slug,
-                "price": float(plan.price) if plan.price else 0,
-                "billing_period": plan.billing_period.value
-                if plan.billing_period
-                else "monthly",
-            }
+    plan = subscription.tarif_plan
+    if plan:
+        subscription_data["plan"] = {
+            "id": str(plan.id),
+            "name": plan.name,
+            "slug": plan.slug,
+            "price": float(plan.price) if plan.price else 0,
+            "billing_period": plan.billing_period.value
+            if plan.billing_period
+            else "monthly",
+        }
 
     # Add pending plan details if available
-    if subscription.pending_plan_id:
-        pending_plan = tarif_plan_repo.find_by_id(subscription.pending_plan_id)
-        if pending_plan:
-            subscription_data["pending_plan"] = {
-                "id": str(pending_plan.id),
-                "name": pending_plan.name,
-                "slug": pending_plan.slug,
-            }
+    pending_plan = subscription.pending_plan
+    if pending_plan:
+        subscription_data["pending_plan"] = {
+            "id": str(pending_plan.id),
+            "name": pending_plan.name,
+            "slug": pending_plan.slug,
+        }
 
     return (
         jsonify(
@@ -141,9 +189,8 @@ def get_all_active_subscriptions():
     Returns:
         200: List of all active/trialing subscriptions with plan + categories
     """
-    subscription_repo = SubscriptionRepository(db.session)
-    tarif_plan_repo = TarifPlanRepository(db.session)
-    subscription_service = SubscriptionService(subscription_repo=subscription_repo)
+    tarif_plan_repo = _get_tarif_plan_repo()
+    subscription_service = _get_subscription_service()
 
     subscriptions = subscription_service.get_active_subscriptions(g.user_id)
 
@@ -177,9 +224,9 @@ def get_all_active_subscriptions():
     return jsonify({"subscriptions": result}), 200
 
 
-@subscriptions_bp.route("/<subscription_id>/cancel", methods=["POST"])
+@subscriptions_bp.route("/<uuid:subscription_id>/cancel", methods=["POST"])
 @require_auth
-def cancel_subscription(subscription_id: str):
+def cancel_subscription(subscription_id: UUID):
     """
     Cancel user's subscription.
 
@@ -193,20 +240,13 @@ def cancel_subscription(subscription_id: str):
         200: Cancelled subscription
         404: Subscription not found or not owned by user
     """
-    subscription_uuid = parse_uuid(subscription_id)
-
-    # Initialize services
-    subscription_repo = SubscriptionRepository(db.session)
-    subscription_service = SubscriptionService(subscription_repo=subscription_repo)
+    subscription_service = _get_subscription_service()
 
-    # Verify ownership
-    subscription = subscription_repo.find_by_id(subscription_uuid)
-    if not subscription or subscription.user_id != g.user_id:
+    # Ownership check and cancellation run as one UPDATE
+    result = subscription_service.cancel_subscription_owned(subscription_id, g.user_id)
+    if result is None:
         return jsonify({"error": "Subscription not found"}), 404
 
-    # Cancel subscription
-    result = subscription_service.cancel_subscription(subscription_uuid)
-
     if not result.success:
         return jsonify({"error": result.error}), 400
 
@@ -221,9 +261,9 @@ def cancel_subscription(subscription_id: str):
     )
 
 
-@subscriptions_bp.route("/<subscription_id>/pause", methods=["POST"])
+@subscriptions_bp.route("/<uuid:subscription_id>/pause", methods=["POST"])
 @require_auth
-def pause_subscription(subscription_id: str):
+def pause_subscription(subscription_id: UUID):
     """
     Pause user's subscription.
 
@@ -235,18 +275,12 @@ def pause_subscription(subscription_id: str):
         400: Cannot pause subscription
         404: Subscription not found
     """
-    subscription_uuid = parse_uuid(subscription_id)
+    subscription_service = _get_subscription_service()
 
-    subscription_repo = SubscriptionRepository(db.session)
-    subscription_service = SubscriptionService(subscription_repo=subscription_repo)
-
-    # Verify ownership
-    subscription = subscription_repo.find_by_id(subscription_uuid)
-    if not subscription or subscription.user_id != g.user_id:
+    result = subscription_service.pause_subscription_owned(subscription_id, g.user_id)
+    if result is None:
         return jsonify({"error": "Subscription not found"}), 404
 
-    result = subscription_service.pause_subscription(subscription_uuid)
-
     if not result.success:
         return jsonify({"error": result.error}), 400
 
@@ -261,9 +295,9 @@ def pause_subscription(subscription_id: str):
     )
 
 
-@subscriptions_bp.route("/<subscription_id>/resume", methods=["POST"])
+@subscriptions_bp.route("/<uuid:subscription_id>/resume", methods=["POST"])
 @require_auth
-def resume_subscription(subscription_id: str):
+def resume_subscription(subscription_id: UUID):
     """
     Resume user's paused subscription.
 
@@ -275,18 +309,12 @@ def resume_subscription(subscription_id: str):
         400: Cannot resume subscription
         404: Subscription not found
     """
-    subscription_uuid = parse_uuid(subscription_id)
-
-    subscription_repo = SubscriptionRepository(db.session)
-    subscription_service = SubscriptionService(subscription_repo=subscription_repo)
+    subscription_service = _get_subscription_service()
 
-    # Verify ownership
-    subscription = subscription_repo.find_by_id(subscription_uuid)
-    if not subscription or subscription.user_id != g.user_id:
+    result = subscription_service.resume_subscription_owned(subscription_id, g.user_id)
+    if result is None:
         return jsonify({"error": "Subscription not found"}), 404
 
-    result = subscription_service.resume_subscription(subscription_uuid)
-
     if not result.success:
         return jsonify({"error": result.error}), 400
 
@@ -301,9 +329,9 @@ def resume_subscription(subscription_id: str):
     )
 
 
-@subscriptions_bp.route("/<subscription_id>/upgrade", methods=["POST"])
+@subscriptions_bp.route("/<uuid:subscription_id>/upgrade", methods=["POST"])
 @require_auth
-def upgrade_subscription(subscription_id: str):
+def upgrade_subscription(subscription_id: UUID):
     """
     Upgrade subscription to higher tier plan.
 
@@ -316,8 +344,6 @@ def upgrade_subscription(subscription_id: str):
         400: Cannot upgrade
         404: Subscription not found
     """
-    subscription_uuid = parse_uuid(subscription_id)
-
     data = request.get_json() or {}
     plan_id = data.get("plan_id")
 
@@ -326,19 +352,14 @@ def upgrade_subscription(subscription_id: str):
 
     plan_uuid = parse_uuid(plan_id)
 
-    subscription_repo = SubscriptionRepository(db.session)
-    tarif_plan_repo = TarifPlanRepository(db.session)
-    subscription_service = SubscriptionService(
-        subscription_repo=subscription_repo, tarif_plan_repo=tarif_plan_repo
-    )
+    subscription_service = _get_subscription_service()
 
-    # Verify ownership
-    subscription = subscription_repo.find_by_id(subscription_uuid)
-    if not subscription or subscription.user_id != g.user_id:
+    result = subscription_service.upgrade_subscription_owned(
+        subscription_id, g.user_id, plan_uuid
+    )
+    if result is None:
         return jsonify({"error": "Subscription not found"}), 404
 
-    result = subscription_service.upgrade_subscription(subscription_uuid, plan_uuid)
-
     if not result.success:
         return jsonify({"error": result.error}), 400
 
@@ -353,9 +374,9 @@ def upgrade_subscription(subscription_id: str):
     )
 
 
-@subscriptions_bp.route("/<subscription_id>/downgrade", methods=["POST"])
+@subscriptions_bp.route("/<uuid:subscription_id>/downgrade", methods=["POST"])
 @require_auth
-def downgrade_subscription(subscription_id: str):
+def downgrade_subscription(subscription_id: UUID):
     """
     Downgrade subscription to lower tier plan at next renewal.
 
@@ -368,8 +389,6 @@ def downgrade_subscription(subscription_id: str):
         400: Cannot downgrade
         404: Subscription not found
     """
-    subscription_uuid = parse_uuid(subscription_id)
-
     data = request.get_json() or {}
     plan_id = data.get("plan_id")
 
@@ -378,19 +397,14 @@ def downgrade_subscription(subscription_id: str):
 
     plan_uuid = parse_uuid(plan_id)
 
-    subscription_repo = SubscriptionRepository(db.session)
-    tarif_plan_repo = TarifPlanRepository(db.session)
-    subscription_service = SubscriptionService(
-        subscription_repo=subscription_repo, tarif_plan_repo=tarif_plan_repo
-    )
+    subscription_service = _get_subscription_service()
 
-    # Verify ownership
-    subscription = subscription_repo.find_by_id(subscription_uuid)
-    if not subscription or subscription.user_id != g.user_id:
+    result = subscription_service.downgrade_subscription_owned(
+        subscription_id, g.user_id, plan_uuid
+    )
+    if result is None:
         return jsonify({"error": "Subscription not found"}), 404
 
-    result = subscription_service.downgrade_subscription(subscription_uuid, plan_uuid)
-
     if not result.success:
         return jsonify({"error": result.error}), 400
 
@@ -405,9 +419,9 @@ def downgrade_subscription(subscription_id: str):
     )
 
 
-@subscriptions_bp.route("/<subscription_id>/proration", methods=["GET"])
+@subscriptions_bp.route("/<uuid:subscription_id>/proration", methods=["GET"])
 @require_auth
-def get_proration(subscription_id: str):
+def get_proration(subscription_id: UUID):
     """
     Get proration calculation for plan change.
 
@@ -419,28 +433,21 @@ def get_proration(subscription_id: str):
         400: Invalid request
         404: Subscription not found
     """
-    subscription_uuid = parse_uuid(subscription_id)
-
     new_plan_id = request.args.get("new_plan_id")
     if not new_plan_id:
         return jsonify({"error": "new_plan_id query parameter is required"}), 400
 
     new_plan_uuid = parse_uuid(new_plan_id)
 
-    subscription_repo = SubscriptionRepository(db.session)
-    tarif_plan_repo = TarifPlanRepository(db.session)
-    subscription_service = SubscriptionService(
-        subscription_repo=subscription_repo, tarif_plan_repo=tarif_plan_repo
-    )
+    subscription_repo = _get_subscription_repo()
+    subscription_service = _get_subscription_service()
 
     # Verify ownership
-    subscription = subscription_repo.find_by_id(subscription_uuid)
+    subscription = subscription_repo.find_by_id(subscription_id)
     if not subscription or subscription.user_id != g.user_id:
         return jsonify({"error": "Subscription not found"}), 404
 
-    proration = subscription_service.calculate_proration(
-        subscription_uuid, new_plan_uuid
-    )
+    proration = subscription_service.calculate_proration(subscription_id, new_plan_uuid)
 
     if not proration:
         return jsonify({"error": "Unable to calculate proration"}), 400
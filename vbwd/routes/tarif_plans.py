@@ -1,7 +1,12 @@
 """Tariff plan routes."""
+import re
 import uuid
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from flask import Blueprint, request, jsonify
 from vbwd.extensions import db
+from vbwd.models.tarif_plan import TarifPlan
+from vbwd.repositories.country_repository import CountryRepository
 from vbwd.repositories.tarif_plan_repository import TarifPlanRepository
 from vbwd.repositories.tarif_plan_category_repository import TarifPlanCategoryRepository
 from vbwd.repositories.currency_repository import CurrencyRepository
@@ -9,9 +14,164 @@ from vbwd.repositories.tax_repository import TaxRepository
 from vbwd.services.tarif_plan_service import TarifPlanService
 from vbwd.services.currency_service import CurrencyService
 from vbwd.services.tax_service import TaxService
+from vbwd.utils.http_cache import (
+    get_redis_json_response,
+    serialize_json,
+    set_redis_json_response,
+)
+from vbwd.utils.redis_client import redis_client
 
 tarif_plans_bp = Blueprint("tarif_plans", __name__)
 
+# Seconds a rendered plan listing/detail stays in Redis; also bounds how
+# long FX and tax changes take to show up
+PLANS_CACHE_TTL = 300
+# Seconds between plan listing warm-ups; warmed listings share
+# PLANS_CACHE_TTL, so currency and FX changes, which have no invalidation
+# hook, are never served for longer than an on-demand listing would be
+PLANS_PRICING_WARM_INTERVAL = PLANS_CACHE_TTL
+# Browser max-age for plan responses; zero makes clients revalidate with
+# the ETag on every load, so admin edits show up at once but unchanged
+# listings cost only an empty 304
+PLANS_CLIENT_MAX_AGE = 0
+PLANS_CACHE_PATTERNS = ("plans:v1:*", "plan:v1:*")
+
+# Query and path values that end up in Redis keys; anything else is
+# rejected so arbitrary input cannot mint new cache entries
+_CURRENCY_CODE = re.compile(r"[A-Z]{3}")
+_COUNTRY_CODE = re.compile(r"[A-Z]{2}")
+_SLUG = re.compile(r"[A-Za-z0-9_-]{1,100}")
+
+
+def invalidate_plans_cache() -> None:
+    """Drop all cached public plan listings and plan details."""
+    for pattern in PLANS_CACHE_PATTERNS:
+        redis_client.cache_delete_pattern(pattern)
+
+
+def _plans_cache_key(
+    currency_code: str, country_code: Optional[str], category_slug: Optional[str]
+) -> str:
+    """Build the Redis key for a rendered plan listing."""
+    return f"plans:v1:{currency_code}:{country_code or '-'}:{category_slug or '-'}"
+
+
+def _pricing_params() -> Tuple[str, Optional[str]]:
+    """
+    Read the currency and country query params, normalized to upper case.
+
+    Returns:
+        (currency_code, country_code); country_code is None when not given.
+
+    Raises:
+        ValueError: If either is not a well-formed ISO code.
+    """
+    currency_code = request.args.get("currency", "EUR").strip().upper()
+    country_code = request.args.get("country", "").strip().upper() or None
+    if not _CURRENCY_CODE.fullmatch(currency_code):
+        raise ValueError("Invalid currency code")
+    if country_code is not None and not _COUNTRY_CODE.fullmatch(country_code):
+        raise ValueError("Invalid country code")
+    return currency_code, country_code
+
+
+@lru_cache(maxsize=None)
+def _get_tarif_plan_service() -> TarifPlanService:
+    """
+    Return the shared TarifPlanService wired with currency and tax services.
+
+    The services keep no state beyond their repositories, and those hold the
+    ``db.session`` scoped-session proxy, which resolves to the current app
+    context's session on every call, so one instance serves every request.
+    """
+    currency_repo = CurrencyRepository(db.session)  # type: ignore[arg-type]
+    tax_repo = TaxRepository(db.session)  # type: ignore[arg-type]
+    return TarifPlanService(
+        tarif_plan_repo=TarifPlanRepository(db.session),
+        currency_service=CurrencyService(currency_repo=currency_repo),
+        tax_service=TaxService(tax_repo=tax_repo),
+    )
+
+
+def _render_plan_listing(
+    tarif_plan_service: TarifPlanService,
+    currency_code: str,
+    country_code: Optional[str],
+    plans: List[TarifPlan],
+) -> Tuple[dict, bool]:
+    """
+    Render the public listing payload for the given plans.
+
+    Returns:
+        The payload, and whether every plan was priced. Unpriced listings
+        (e.g. an unknown currency) are not cached.
+    """
+    priced = True
+    try:
+        result = tarif_plan_service.get_plans_with_pricing(
+            plans,
+            currency_code=currency_code,
+            country_code=country_code,
+        )
+    except ValueError as e:
+        # Currency not found - use default
+        priced = False
+        result = [
+            {
+                "id": str(plan.id),
+                "name": plan.name,
+                "slug": plan.slug,
+                "description": plan.description,
+                "price": plan.price_float,
+                "billing_period": plan.billing_period.value,
+                "is_active": plan.is_active,
+                "error": str(e),
+            }
+            for plan in plans
+        ]
+
+    return {
+        "plans": result,
+        "currency": currency_code,
+        "country": country_code,
+    }, priced
+
+
+def warm_plan_pricing() -> int:
+    """
+    Pre-render the uncategorized plan listing into Redis.
+
+    Covers every active currency with no country and with each enabled
+    country, so ``list_plans`` is a pure cache lookup for those requests.
+
+    Returns:
+        Number of listings cached.
+    """
+    tarif_plan_service = _get_tarif_plan_service()
+    plans = tarif_plan_service.get_active_plans()
+    currencies = CurrencyRepository(db.session).find_active()  # type: ignore[arg-type]
+    country_codes: List[Optional[str]] = [None]
+    country_codes.extend(
+        country.code.upper() for country in CountryRepository(db.session).find_enabled()
+    )
+
+    warmed = 0
+    for currency in currencies:
+        currency_code = currency.code.upper()
+        for country_code in country_codes:
+            payload, priced = _render_plan_listing(
+                tarif_plan_service, currency_code, country_code, plans
+            )
+            if not priced:
+                continue
+            redis_client.cache_set(
+                _plans_cache_key(currency_code, country_code, None),
+                serialize_json(payload).decode("utf-8"),
+                PLANS_CACHE_TTL,
+            )
+            warmed += 1
+    return warmed
+
 
 @tarif_plans_bp.route("", methods=["GET"])
 def list_plans():
@@ -27,23 +187,22 @@ def list_plans():
 
     Returns:
         200: List of plans with pricing in specified currency
+        400: Malformed currency, country or category
     """
-    currency_code = request.args.get("currency", "EUR").upper()
-    country_code = request.args.get("country", "").upper() or None
-    category_slug = request.args.get("category")
+    try:
+        currency_code, country_code = _pricing_params()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    category_slug = request.args.get("category") or None
+    if category_slug is not None and not _SLUG.fullmatch(category_slug):
+        return jsonify({"error": "Invalid category"}), 400
 
-    # Initialize services
-    plan_repo = TarifPlanRepository(db.session)
-    currency_repo = CurrencyRepository(db.session)  # type: ignore[arg-type]
-    tax_repo = TaxRepository(db.session)  # type: ignore[arg-type]
+    cache_key = _plans_cache_key(currency_code, country_code, category_slug)
+    cached = get_redis_json_response(cache_key, PLANS_CLIENT_MAX_AGE)
+    if cached is not None:
+        return cached
 
-    currency_service = CurrencyService(currency_repo=currency_repo)
-    tax_service = TaxService(tax_repo=tax_repo)
-    tarif_plan_service = TarifPlanService(
-        tarif_plan_repo=plan_repo,
-        currency_service=currency_service,
-        tax_service=tax_service,
-    )
+    tarif_plan_service = _get_tarif_plan_service()
 
     # Get active plans, optionally filtered by category
     if category_slug:
@@ -55,39 +214,13 @@ def list_plans():
     else:
         plans = tarif_plan_service.get_active_plans()
 
-    # Add pricing info to each plan
-    result = []
-    for plan in plans:
-        try:
-            plan_data = tarif_plan_service.get_plan_with_pricing(
-                plan,
-                currency_code=currency_code,
-                country_code=country_code,
-            )
-            result.append(plan_data)
-        except ValueError as e:
-            # Currency not found - use default
-            plan_data = {
-                "id": str(plan.id),
-                "name": plan.name,
-                "slug": plan.slug,
-                "description": plan.description,
-                "price": plan.price_float,
-                "billing_period": plan.billing_period.value,
-                "is_active": plan.is_active,
-                "error": str(e),
-            }
-            result.append(plan_data)
-
-    return (
-        jsonify(
-            {
-                "plans": result,
-                "currency": currency_code,
-                "country": country_code,
-            }
-        ),
-        200,
+    payload, priced = _render_plan_listing(
+        tarif_plan_service, currency_code, country_code, plans
+    )
+    if not priced:
+        return jsonify(payload)
+    return set_redis_json_response(
+        cache_key, payload, PLANS_CACHE_TTL, PLANS_CLIENT_MAX_AGE
     )
 
 
@@ -108,30 +241,35 @@ def get_plan(slug_or_id: str):
 
     Returns:
         200: Plan details with pricing
+        400: Malformed currency or country
         404: Plan not found
     """
-    currency_code = request.args.get("currency", "EUR").upper()
-    country_code = request.args.get("country", "").upper() or None
+    try:
+        currency_code, country_code = _pricing_params()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    # Initialize services
-    plan_repo = TarifPlanRepository(db.session)
-    currency_repo = CurrencyRepository(db.session)  # type: ignore[arg-type]
-    tax_repo = TaxRepository(db.session)  # type: ignore[arg-type]
+    # Key UUIDs in canonical form so spellings of one ID share an entry
+    plan_id: Optional[uuid.UUID]
+    try:
+        plan_id = uuid.UUID(slug_or_id)
+        slug_or_id = str(plan_id)
+    except ValueError:
+        plan_id = None
+        if not _SLUG.fullmatch(slug_or_id):
+            return jsonify({"error": "Plan not found"}), 404
 
-    currency_service = CurrencyService(currency_repo=currency_repo)
-    tax_service = TaxService(tax_repo=tax_repo)
-    tarif_plan_service = TarifPlanService(
-        tarif_plan_repo=plan_repo,
-        currency_service=currency_service,
-        tax_service=tax_service,
-    )
+    cache_key = f"plan:v1:{slug_or_id}:{currency_code}:{country_code or '-'}"
+    cached = get_redis_json_response(cache_key, PLANS_CLIENT_MAX_AGE)
+    if cached is not None:
+        return cached
+
+    tarif_plan_service = _get_tarif_plan_service()
 
     # Get plan by UUID or slug
-    plan = None
-    try:
-        uuid.UUID(slug_or_id)
-        plan = plan_repo.find_by_id(slug_or_id)
-    except ValueError:
+    if plan_id is not None:
+        plan = tarif_plan_service.get_plan_by_id(plan_id)
+    else:
         plan = tarif_plan_service.get_plan_by_slug(slug_or_id)
 
     if not plan:
@@ -146,7 +284,9 @@ def get_plan(slug_or_id: str):
             country_code=country_code,
         )
         plan_data.update(pricing)
-        return jsonify(plan_data), 200
+        return set_redis_json_response(
+            cache_key, plan_data, PLANS_CACHE_TTL, PLANS_CLIENT_MAX_AGE
+        )
     except ValueError as e:
         return (
             jsonify(
@@ -1,12 +1,28 @@
 """Public token bundle routes (for user checkout)."""
 from flask import Blueprint, jsonify
+from vbwd.models import TokenBundle
 from vbwd.repositories.token_bundle_repository import TokenBundleRepository
 from vbwd.extensions import db
+from vbwd.utils.http_cache import get_redis_json_response, set_redis_json_response
+from vbwd.utils.validation import parse_uuid_or_none
+from vbwd.utils.redis_client import redis_client
 
 token_bundles_bp = Blueprint(
     "token_bundles", __name__, url_prefix="/api/v1/token-bundles"
 )
 
+# Seconds the public bundle catalog stays in Redis
+BUNDLES_CACHE_TTL = 600
+ACTIVE_BUNDLES_CACHE_KEY = "bundles:active:v1"
+# Browser max-age; zero makes clients revalidate with the ETag each time
+BUNDLES_CLIENT_MAX_AGE = 0
+
+
+def invalidate_bundles_cache() -> None:
+    """Drop the cached active-bundle list and all cached bundle details."""
+    redis_client.cache_delete_pattern(ACTIVE_BUNDLES_CACHE_KEY)
+    redis_client.cache_delete_pattern("bundle:v1:*")
+
 
 @token_bundles_bp.route("/", methods=["GET"])
 def list_active_bundles():
@@ -19,10 +35,19 @@ def list_active_bundles():
     Returns:
         200: List of active token bundles
     """
+    cached = get_redis_json_response(ACTIVE_BUNDLES_CACHE_KEY, BUNDLES_CLIENT_MAX_AGE)
+    if cached is not None:
+        return cached
+
     bundle_repo = TokenBundleRepository(db.session)
-    bundles = bundle_repo.find_active()
+    rows = bundle_repo.find_active_rows()
 
-    return jsonify({"bundles": [bundle.to_dict() for bundle in bundles]}), 200
+    return set_redis_json_response(
+        ACTIVE_BUNDLES_CACHE_KEY,
+        {"bundles": [TokenBundle.serialize(row) for row in rows]},
+        BUNDLES_CACHE_TTL,
+        BUNDLES_CLIENT_MAX_AGE,
+    )
 
 
 @token_bundles_bp.route("/<bundle_id>", methods=["GET"])
@@ -37,13 +62,29 @@ def get_token_bundle(bundle_id):
         200: Token bundle details
         404: Token bundle not found
     """
+    # Key by the canonical UUID so malformed or differently spelled IDs
+    # never get cache entries of their own
+    bundle_uuid = parse_uuid_or_none(bundle_id)
+    if bundle_uuid is None:
+        return jsonify({"error": "Token bundle not found"}), 404
+
+    cache_key = f"bundle:v1:{bundle_uuid}"
+    cached = get_redis_json_response(cache_key, BUNDLES_CLIENT_MAX_AGE)
+    if cached is not None:
+        return cached
+
     try:
         bundle_repo = TokenBundleRepository(db.session)
-        bundle = bundle_repo.find_by_id(bundle_id)
+        bundle = bundle_repo.find_by_id(bundle_uuid)
     except Exception:
         return jsonify({"error": "Token bundle not found"}), 404
 
     if not bundle:
         return jsonify({"error": "Token bundle not found"}), 404
 
-    return jsonify({"bundle": bundle.to_dict()}), 200
+    return set_redis_json_response(
+        cache_key,
+        {"bundle": bundle.to_dict()},
+        BUNDLES_CACHE_TTL,
+        BUNDLES_CLIENT_MAX_AGE,
+    )
@@ -1,29 +1,98 @@
 """User management routes."""
+import base64
+import binascii
+import hmac
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
 from flask import Blueprint, request, jsonify, g, current_app
 from marshmallow import ValidationError
-from uuid import UUID
 from vbwd.middleware.auth import require_auth
 from vbwd.schemas.user_schemas import (
-    UserSchema,
-    UserDetailsSchema,
+    ChangePasswordRequestSchema,
+    CheckoutRequestSchema,
     UserDetailsUpdateSchema,
-    UserProfileSchema,
+    dump_user_details,
+    dump_user_profile,
 )
-from vbwd.services.user_service import UserService
-from vbwd.services.auth_service import AuthService
-from vbwd.repositories.user_repository import UserRepository
-from vbwd.repositories.user_details_repository import UserDetailsRepository
-from vbwd.extensions import db
+from vbwd.models.addon_subscription import AddOnSubscription
+from vbwd.models.user_token_balance import TokenTransaction
 from vbwd.events.checkout_events import CheckoutRequestedEvent
+from vbwd.utils.http_cache import ResponseCache
 
 # Create blueprint
 user_bp = Blueprint("user", __name__, url_prefix="/api/v1/user")
 
 # Initialize schemas
-user_schema = UserSchema()
-user_details_schema = UserDetailsSchema()
 user_details_update_schema = UserDetailsUpdateSchema()
-user_profile_schema = UserProfileSchema()
+change_password_schema = ChangePasswordRequestSchema()
+checkout_schema = CheckoutRequestSchema()
+
+# Seconds a serialized profile/details body stays in the process cache;
+# entries are keyed by row version, so this only bounds memory
+USER_BODY_CACHE_TTL = 300
+
+# Serialized profile/details bodies, keyed by the rows' updated_at stamps so
+# any edit yields a new key and a stale body is never served
+user_body_cache = ResponseCache(ttl=USER_BODY_CACHE_TTL, max_entries=4096)
+
+_EMPTY_DETAILS = {
+    "first_name": None,
+    "last_name": None,
+    "phone": None,
+    "address_line1": None,
+    "address_line2": None,
+    "city": None,
+    "state": None,
+    "postal_code": None,
+    "country": None,
+}
+
+
+def _encode_transaction_cursor(row) -> str:
+    """Encode a transaction row's (created_at, id) position as a cursor."""
+    position = f"{row.created_at.isoformat()}|{row.id}"
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def _decode_transaction_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor from _encode_transaction_cursor; ValueError if invalid."""
+    try:
+        position = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    created_at, _, row_id = position.partition("|")
+    return datetime.fromisoformat(created_at), UUID(row_id)
+
+
+# Checkout ID list fields and the singular name used in their error messages
+_CHECKOUT_ID_LISTS = (
+    ("token_bundle_ids", "token_bundle_id"),
+    ("add_on_ids", "add_on_id"),
+)
+
+
+def _checkout_error_message(messages: dict, payload: dict) -> str:
+    """Flatten checkout validation errors into the endpoint's string messages.
+
+    Errors are reported in the order the fields used to be checked, naming
+    the first invalid ID of a list.
+    """
+    if "_schema" in messages:
+        return messages["_schema"][0]
+    if "plan_id" in messages:
+        return "Invalid plan_id format"
+    for field_name, item_name in _CHECKOUT_ID_LISTS:
+        if field_name not in messages:
+            continue
+        raw = payload.get(field_name)
+        errors = messages[field_name]
+        if isinstance(errors, dict) and isinstance(raw, list):
+            return f"Invalid {item_name}: {raw[min(errors)]}"
+        return f"Invalid {field_name}"
+    # currency / payment_method_code
+    field_name = next(iter(messages))
+    return f"Invalid {field_name}"
 
 
 @user_bp.route("/profile", methods=["GET"])
@@ -50,26 +119,21 @@ def get_profile():
                 ...
             }
         }
-        404: If user not found
     """
-    user_id = g.user_id
-
-    # Initialize services
-    user_repo = UserRepository(db.session)
-    user_details_repo = UserDetailsRepository(db.session)
-    user_service = UserService(
-        user_repository=user_repo, user_details_repository=user_details_repo
+    # require_auth already loaded the user with its details eager-joined
+    user = g.user
+    details = user.details
+
+    key = (
+        "profile",
+        user.id,
+        user.updated_at,
+        details.updated_at if details else None,
     )
-
-    # Get user and details
-    user = user_service.get_user(user_id)
-    if not user:
-        return jsonify({"error": "User not found"}), 404
-
-    details = user_service.get_user_details(user_id)
-
-    # Return profile
-    return jsonify(user_profile_schema.dump({"user": user, "details": details})), 200
+    body = user_body_cache.get(key) or user_body_cache.set(
+        key, dump_user_profile(user, details)
+    )
+    return current_app.response_class(body.body, mimetype="application/json")
 
 
 @user_bp.route("/details", methods=["GET"])
@@ -80,39 +144,19 @@ def get_details():
     Requires: Bearer token in Authorization header
 
     Returns:
-        200: UserDetails object
-        404: If details not found
+        200: UserDetails object, or empty fields if details are not yet created
     """
     user_id = g.user_id
 
-    # Initialize services
-    user_repo = UserRepository(db.session)
-    user_details_repo = UserDetailsRepository(db.session)
-    user_service = UserService(
-        user_repository=user_repo, user_details_repository=user_details_repo
-    )
+    # require_auth already loaded the user with its details eager-joined
+    details = g.user.details
 
-    # Get details — return empty object if not yet created (normal for new users)
-    details = user_service.get_user_details(user_id)
-    if not details:
-        return (
-            jsonify(
-                {
-                    "first_name": None,
-                    "last_name": None,
-                    "phone": None,
-                    "address_line1": None,
-                    "address_line2": None,
-                    "city": None,
-                    "state": None,
-                    "postal_code": None,
-                    "country": None,
-                }
-            ),
-            200,
-        )
-
-    return jsonify(user_details_schema.dump(details)), 200
+    # Return empty object if details are not yet created (normal for new users)
+    key = ("details", user_id, details.updated_at if details else None)
+    body = user_body_cache.get(key) or user_body_cache.set(
+        key, dump_user_details(details) if details else _EMPTY_DETAILS
+    )
+    return current_app.response_class(body.body, mimetype="application/json")
 
 
 @user_bp.route("/details", methods=["PUT"])
@@ -146,17 +190,11 @@ def update_details():
     except ValidationError as err:
         return jsonify({"error": err.messages}), 400
 
-    # Initialize services
-    user_repo = UserRepository(db.session)
-    user_details_repo = UserDetailsRepository(db.session)
-    user_service = UserService(
-        user_repository=user_repo, user_details_repository=user_details_repo
-    )
-
     # Update details
+    user_service = current_app.container.user_service()
     details = user_service.update_user_details(user_id, data)
 
-    return jsonify(user_details_schema.dump(details)), 200
+    return jsonify(dump_user_details(details)), 200
 
 
 @user_bp.route("/change-password", methods=["POST"])
@@ -176,31 +214,36 @@ def change_password():
         200: {"success": true}
         400: If validation fails or current password is wrong
     """
-    user_id = g.user_id
-    data = request.get_json() or {}
-
-    current_password = data.get("currentPassword")
-    new_password = data.get("newPassword")
-
-    if not current_password or not new_password:
+    try:
+        data = change_password_schema.load(request.get_json() or {})
+    except ValidationError:
         return jsonify({"error": "Current password and new password are required"}), 400
 
-    # Initialize services
-    user_repo = UserRepository(db.session)
-    auth_service = AuthService(user_repository=user_repo)
+    current_password = data["currentPassword"]
+    new_password = data["newPassword"]
 
-    # Get user
-    user = user_repo.find_by_id(user_id)
-    if not user:
-        return jsonify({"error": "User not found"}), 404
+    container = current_app.container
+    auth_service = container.auth_service()
+
+    # require_auth already loaded the user
+    user = g.user
 
     # Verify current password
     if not auth_service.verify_password(current_password, user.password_hash):
         return jsonify({"error": "Current password is incorrect"}), 400
 
+    # Same password with an up-to-date hash: the stored hash is already
+    # correct, so skip the costly rehash and write
+    if hmac.compare_digest(
+        new_password.encode(), current_password.encode()
+    ) and not auth_service.needs_rehash(user.password_hash):
+        return jsonify({"success": True}), 200
+
     # Update password
-    user.password_hash = auth_service.hash_password(new_password)
-    user_repo.save(user)
+    if not container.user_repository().update_password_hash(
+        user.id, auth_service.hash_password(new_password)
+    ):
+        return jsonify({"error": "User not found"}), 404
 
     return jsonify({"success": True}), 200
 
@@ -232,61 +275,21 @@ def checkout():
         404: If plan/bundle/addon not found
     """
     user_id = g.user_id
-    data = request.get_json() or {}
-
-    # Validate: at least one item required
-    plan_id = data.get("plan_id")
-    token_bundle_ids_raw = data.get("token_bundle_ids", [])
-    add_on_ids_raw = data.get("add_on_ids", [])
-
-    if not plan_id and not token_bundle_ids_raw and not add_on_ids_raw:
-        return (
-            jsonify(
-                {
-                    "error": "At least one item required (plan_id, token_bundle_ids, or add_on_ids)"
-                }
-            ),
-            400,
-        )
-
-    # Parse plan UUID (optional now)
-    plan_uuid = None
-    if plan_id:
-        try:
-            plan_uuid = UUID(plan_id) if isinstance(plan_id, str) else plan_id
-        except (ValueError, TypeError):
-            return jsonify({"error": "Invalid plan_id format"}), 400
 
-    # Parse optional token bundle IDs
-    token_bundle_ids = []
-    for bundle_id in token_bundle_ids_raw:
-        try:
-            token_bundle_ids.append(
-                UUID(bundle_id) if isinstance(bundle_id, str) else bundle_id
-            )
-        except (ValueError, TypeError):
-            return jsonify({"error": f"Invalid token_bundle_id: {bundle_id}"}), 400
-
-    # Parse optional add-on IDs
-    add_on_ids = []
-    for addon_id in add_on_ids_raw:
-        try:
-            add_on_ids.append(UUID(addon_id) if isinstance(addon_id, str) else addon_id)
-        except (ValueError, TypeError):
-            return jsonify({"error": f"Invalid add_on_id: {addon_id}"}), 400
-
-    # Get currency and payment method
-    currency = data.get("currency", "USD")
-    payment_method_code = data.get("payment_method_code")
+    payload = request.get_json() or {}
+    try:
+        data = checkout_schema.load(payload)
+    except ValidationError as err:
+        return jsonify({"error": _checkout_error_message(err.messages, payload)}), 400
 
     # Create checkout event
     event = CheckoutRequestedEvent(
-        user_id=UUID(user_id) if isinstance(user_id, str) else user_id,
-        plan_id=plan_uuid,
-        token_bundle_ids=token_bundle_ids,
-        add_on_ids=add_on_ids,
-        currency=currency,
-        payment_method_code=payment_method_code,
+        user_id=user_id,
+        plan_id=data["plan_id"],
+        token_bundle_ids=data["token_bundle_ids"],
+        add_on_ids=data["add_on_ids"],
+        currency=data["currency"],
+        payment_method_code=data["payment_method_code"],
     )
 
     # Dispatch event
@@ -321,35 +324,27 @@ def get_user_addons():
     Returns:
         200: {"addon_subscriptions": [...]}
     """
-    user_id = g.user_id
-    container = current_app.container
-
-    addon_sub_repo = container.addon_subscription_repository()
-
-    addon_subs = addon_sub_repo.find_by_user(
-        UUID(user_id) if isinstance(user_id, str) else user_id
-    )
+    addon_sub_repo = current_app.container.addon_subscription_repository()
+    rows = addon_sub_repo.find_rows_by_user(g.user_id)
 
     result = []
-    for addon_sub in addon_subs:
-        data = addon_sub.to_dict()
-        # Addon details are eager-loaded via relationship
-        if addon_sub.addon:
-            data["addon"] = {
-                "name": addon_sub.addon.name,
-                "slug": addon_sub.addon.slug,
-                "description": addon_sub.addon.description,
-                "price": str(addon_sub.addon.price) if addon_sub.addon.price else None,
-                "billing_period": addon_sub.addon.billing_period
-                if addon_sub.addon.billing_period
-                else None,
-            }
+    for row in rows:
+        data = AddOnSubscription.serialize(row)
+        data["addon"] = {
+            "name": row.addon_name,
+            "slug": row.addon_slug,
+            "description": row.addon_description,
+            "price": str(row.addon_price) if row.addon_price else None,
+            "billing_period": row.addon_billing_period
+            if row.addon_billing_period
+            else None,
+        }
         result.append(data)
 
     return jsonify({"addon_subscriptions": result}), 200
 
 
-@user_bp.route("/addons/<addon_sub_id>", methods=["GET"])
+@user_bp.route("/addons/<uuid:addon_sub_id>", methods=["GET"])
 @require_auth
 def get_addon_detail(addon_sub_id):
     """Get addon subscription detail with addon and invoice info.
@@ -368,12 +363,12 @@ def get_addon_detail(addon_sub_id):
     container = current_app.container
 
     addon_sub_repo = container.addon_subscription_repository()
-    addon_sub = addon_sub_repo.find_by_id(addon_sub_id)
+    addon_sub = addon_sub_repo.find_detail_by_id(addon_sub_id)
 
     if not addon_sub:
         return jsonify({"error": "Add-on subscription not found"}), 404
 
-    if str(addon_sub.user_id) != str(user_id):
+    if addon_sub.user_id != user_id:
         return jsonify({"error": "Access denied"}), 403
 
     data = addon_sub.to_dict()
@@ -393,7 +388,7 @@ def get_addon_detail(addon_sub_id):
     # Add invoice details
     if addon_sub.invoice_id:
         invoice_repo = container.invoice_repository()
-        invoice = invoice_repo.find_by_id(addon_sub.invoice_id)
+        invoice = invoice_repo.find_header_by_id(addon_sub.invoice_id)
         if invoice:
             data["invoice"] = {
                 "id": str(invoice.id),
@@ -406,7 +401,7 @@ def get_addon_detail(addon_sub_id):
     return jsonify({"addon_subscription": data}), 200
 
 
-@user_bp.route("/addons/<addon_sub_id>/cancel", methods=["POST"])
+@user_bp.route("/addons/<uuid:addon_sub_id>/cancel", methods=["POST"])
 @require_auth
 def cancel_addon(addon_sub_id):
     """Cancel an addon subscription.
@@ -422,26 +417,19 @@ def cancel_addon(addon_sub_id):
         403: Access denied (not owner)
         404: Addon subscription not found
     """
-    from vbwd.models.enums import SubscriptionStatus
-
     user_id = g.user_id
-    container = current_app.container
-
-    addon_sub_repo = container.addon_subscription_repository()
-    addon_sub = addon_sub_repo.find_by_id(addon_sub_id)
-
-    if not addon_sub:
-        return jsonify({"error": "Add-on subscription not found"}), 404
-
-    if str(addon_sub.user_id) != str(user_id):
-        return jsonify({"error": "Access denied"}), 403
-
-    if addon_sub.status not in (SubscriptionStatus.ACTIVE, SubscriptionStatus.PENDING):
+    addon_sub_repo = current_app.container.addon_subscription_repository()
+    addon_sub = addon_sub_repo.cancel_owned(addon_sub_id, user_id)
+
+    if addon_sub is None:
+        # Nothing was updated; look the row up only to pick the error
+        existing = addon_sub_repo.find_by_id(addon_sub_id)
+        if not existing:
+            return jsonify({"error": "Add-on subscription not found"}), 404
+        if existing.user_id != user_id:
+            return jsonify({"error": "Access denied"}), 403
         return jsonify({"error": "Add-on subscription cannot be cancelled"}), 400
 
-    addon_sub.cancel()
-    db.session.commit()
-
     return (
         jsonify(
             {
@@ -464,23 +452,11 @@ def get_token_balance():
     Returns:
         200: {"balance": 1000, "transactions": [...]}
     """
-    user_id = g.user_id
-    container = current_app.container
+    # The balance row hangs off the user require_auth already loaded, so it
+    # is read fresh from the database on every request
+    balance = g.user.token_balance
 
-    # Get balance
-    balance_repo = container.token_balance_repository()
-    balance = balance_repo.find_by_user_id(
-        UUID(user_id) if isinstance(user_id, str) else user_id
-    )
-
-    return (
-        jsonify(
-            {
-                "balance": balance.balance if balance else 0,
-            }
-        ),
-        200,
-    )
+    return jsonify({"balance": balance.balance if balance else 0}), 200
 
 
 @user_bp.route("/tokens/transactions", methods=["GET"])
@@ -494,34 +470,52 @@ def get_token_transactions():
     Query params:
         - limit: int (default 50)
         - offset: int (default 0)
+        - cursor: next_cursor from a previous page; replaces offset
 
     Returns:
-        200: {"transactions": [...], "total": 10}
+        200: {"transactions": [...], "next_cursor": "..." | null}
+        400: Invalid cursor
     """
     user_id = g.user_id
     limit = request.args.get("limit", 50, type=int)
     offset = request.args.get("offset", 0, type=int)
 
+    after = None
+    cursor = request.args.get("cursor")
+    if cursor:
+        try:
+            after = _decode_transaction_cursor(cursor)
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+
     container = current_app.container
     transaction_repo = container.token_transaction_repository()
 
-    transactions = transaction_repo.find_by_user_id(
-        UUID(user_id) if isinstance(user_id, str) else user_id,
+    rows = transaction_repo.find_rows_by_user_id(
+        user_id,
         limit=limit,
         offset=offset,
+        after=after,
+    )
+
+    # A full page may have more behind it; point the next request at the
+    # last row so it continues from there without an offset scan
+    next_cursor = (
+        _encode_transaction_cursor(rows[-1]) if rows and len(rows) == limit else None
     )
 
     return (
         jsonify(
             {
-                "transactions": [t.to_dict() for t in transactions],
+                "transactions": [TokenTransaction.serialize(row) for row in rows],
+                "next_cursor": next_cursor,
             }
         ),
         200,
     )
 
 
-@user_bp.route("/invoices/<invoice_id>/pay", methods=["POST"])
+@user_bp.route("/invoices/<uuid:invoice_id>/pay", methods=["POST"])
 @require_auth
 def pay_invoice(invoice_id):
     """
@@ -551,7 +545,7 @@ def pay_invoice(invoice_id):
         return jsonify({"error": "Invoice not found"}), 404
 
     # Verify the invoice belongs to the current user
-    if str(invoice.user_id) != str(user_id):
+    if invoice.user_id != user_id:
         return jsonify({"error": "Access denied"}), 403
 
     # Check if already paid
@@ -561,8 +555,8 @@ def pay_invoice(invoice_id):
     # Dispatch payment event to trigger full payment flow
     # (marks invoice paid, activates subscription, credits tokens, etc.)
     event = PaymentCapturedEvent(
-        invoice_id=UUID(invoice_id) if isinstance(invoice_id, str) else invoice_id,
-        payment_reference=f"user-payment-{invoice_id[:8]}",
+        invoice_id=invoice_id,
+        payment_reference=f"user-payment-{str(invoice_id)[:8]}",
         amount=str(invoice.amount),
         currency=invoice.currency or "USD",
     )
@@ -573,13 +567,12 @@ def pay_invoice(invoice_id):
     if not result.success:
         return jsonify({"error": result.error or "Payment failed"}), 400
 
-    # Get updated invoice
-    updated_invoice = invoice_service.get_by_id(invoice_id)
-
+    # The handler loaded and updated this same identity-mapped invoice, so
+    # no second lookup is needed; to_dict() refreshes it after the commit
     return (
         jsonify(
             {
-                "invoice": updated_invoice.to_dict() if updated_invoice else {},
+                "invoice": invoice.to_dict(),
                 "message": "Payment successful",
             }
         ),
@@ -1,10 +1,90 @@
 """Webhook routes for payment providers."""
-from flask import Blueprint, request, jsonify, current_app
-from uuid import UUID
+import hashlib
+import hmac
+from collections import deque
+from typing import Any, Deque, Dict, Iterator
+
+import orjson
+from flask import Blueprint, Response, request, jsonify, current_app
+from flask import stream_with_context
+from marshmallow import ValidationError
+from vbwd.config import DEFAULT_PAYMENT_BATCH_MAX_BYTES, DEFAULT_PAYMENT_BATCH_MAX_LINES
+from vbwd.events.domain import EventResult
 from vbwd.events.payment_events import PaymentCapturedEvent
+from vbwd.schemas.payment_schemas import PaymentWebhookRequestSchema
+from vbwd.utils.json_provider import dumps_json
 
 webhooks_bp = Blueprint("webhooks", __name__, url_prefix="/api/v1/webhooks")
 
+NDJSON_MIMETYPE = "application/x-ndjson"
+SIGNATURE_HEADER = "X-Webhook-Signature"
+
+# Initialize schemas
+payment_webhook_schema = PaymentWebhookRequestSchema()
+
+
+def _result_data(result: EventResult) -> Any:
+    """Handler data, unwrapping the single-item list from EventResult.combine()."""
+    data = result.data
+    if isinstance(data, list) and len(data) == 1:
+        return data[0]
+    return data
+
+
+# Opening of every /payment success body; the handler's fields follow
+_SUCCESS_PREFIX = b'{"status":"success"'
+
+
+def _success_fields(data: Any) -> Dict[str, Any]:
+    """Fields a success body carries: the handler's dict, else its data nested."""
+    if isinstance(data, dict):
+        return data
+    return {"data": data}
+
+
+def _success_response(data: Any) -> Response:
+    """
+    Build the /payment success response from the handler's result data.
+
+    A dict body is the status prefix spliced onto the serialized data, which
+    skips merging the two into a new dict.
+    """
+    if not isinstance(data, dict):
+        # Several handlers' results, or none: nest them rather than splice
+        return jsonify({"status": "success", "data": data})
+    if "status" in data:
+        # The handler's own status wins, as with a dict merge
+        return jsonify({"status": "success", **data})
+    body = dumps_json(data)
+    if body == b"{}":
+        body = _SUCCESS_PREFIX + b"}"
+    else:
+        body = _SUCCESS_PREFIX + b"," + body[1:]
+    return current_app.response_class(body, mimetype="application/json")
+
+
+def _validation_error_message(err: ValidationError) -> str:
+    """
+    Flatten webhook validation errors into a single string message.
+
+    Missing fields are reported before malformed ones, in field order,
+    matching the checks the route made before it used a schema.
+    """
+    messages = err.normalized_messages()
+    names = [name for name in payment_webhook_schema.fields if name in messages]
+    ordered = [messages[name][0] for name in names] or [
+        message for errors in messages.values() for message in errors
+    ]
+    for message in ordered:
+        if message.endswith(" is required"):
+            return message
+    return ordered[0]
+
+
+def _ndjson_line(payload: Dict[str, Any]) -> bytes:
+    """Serialize one newline-delimited JSON record."""
+    return dumps_json(payload) + b"\n"
+
 
 @webhooks_bp.route("/payment", methods=["POST"])
 def payment_webhook():
@@ -30,52 +110,125 @@ def payment_webhook():
         400: If validation fails or invoice not found
         500: Server error
     """
-    data = request.get_json() or {}
-
-    invoice_id = data.get("invoice_id")
-    payment_reference = data.get("payment_reference")
-    amount = data.get("amount")
-    currency = data.get("currency", "USD")
-
-    # Validate required fields
-    if not invoice_id:
-        return jsonify({"error": "invoice_id is required"}), 400
-    if not payment_reference:
-        return jsonify({"error": "payment_reference is required"}), 400
-    if not amount:
-        return jsonify({"error": "amount is required"}), 400
-
-    # Validate UUID format
     try:
-        invoice_uuid = UUID(invoice_id) if isinstance(invoice_id, str) else invoice_id
-    except (ValueError, TypeError):
-        return jsonify({"error": "Invalid invoice_id format"}), 400
+        data = payment_webhook_schema.load(request.get_json() or {})
+    except ValidationError as err:
+        return jsonify({"error": _validation_error_message(err)}), 400
 
-    try:
-        # Create payment event
-        event = PaymentCapturedEvent(
-            invoice_id=invoice_uuid,
-            payment_reference=payment_reference,
-            amount=str(amount),
-            currency=currency,
-        )
-
-        # Dispatch event
-        container = current_app.container
-        dispatcher = container.event_dispatcher()
-        result = dispatcher.emit(event)
-
-        if result.success:
-            # Unwrap single-item list from EventResult.combine()
-            data = result.data
-            if isinstance(data, list) and len(data) == 1:
-                data = data[0]
-            return jsonify({"status": "success", **data}), 200
-        else:
-            return jsonify({"error": result.error}), 400
-
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    # Handler exceptions are already turned into failed results by the
+    # dispatcher; anything else is a bug and goes to the app's 500 handler
+    event = PaymentCapturedEvent(
+        invoice_id=data["invoice_id"],
+        payment_reference=data["payment_reference"],
+        amount=str(data["amount"]),
+        currency=data["currency"],
+    )
+    result = current_app.container.event_dispatcher().emit(event)
+
+    if not result.success:
+        return jsonify({"error": result.error}), 400
+
+    return _success_response(_result_data(result))
+
+
+def _valid_batch_signature(body: bytes) -> bool:
+    """Whether the batch carries a valid HMAC-SHA256 signature of its body."""
+    secret = current_app.config.get("PAYMENT_WEBHOOK_SECRET", "")
+    if not secret:
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, request.headers.get(SIGNATURE_HEADER, ""))
+
+
+@webhooks_bp.route("/payment/batch", methods=["POST"])
+def payment_batch_webhook():
+    """
+    Handle a batch of payment captures sent as newline-delimited JSON.
+
+    Each line has the same shape as the /payment body. The body must be
+    signed like a provider webhook: the X-Webhook-Signature header holds
+    the hex HMAC-SHA256 of the raw body, keyed with PAYMENT_WEBHOOK_SECRET.
+    Batches are capped at PAYMENT_BATCH_MAX_BYTES and
+    PAYMENT_BATCH_MAX_LINES. Lines are dispatched in order and one
+    result line is streamed back per input line.
+
+    Request body (application/x-ndjson):
+        {"invoice_id": "uuid-1", "payment_reference": "PAY-1", "amount": "29.00"}
+        {"invoice_id": "uuid-2", "payment_reference": "PAY-2", "amount": "9.00"}
+
+    Returns:
+        200: application/x-ndjson, one line per non-blank input line:
+            {"line": 1, "status": "success", ...}
+            {"line": 2, "error": ...}
+        400: If the Content-Length header is missing
+        401: If the signature is missing or invalid
+        413: If the body or line count is over the cap
+        415: If the body is not application/x-ndjson
+    """
+    if request.mimetype != NDJSON_MIMETYPE:
+        return jsonify({"error": f"Content-Type must be {NDJSON_MIMETYPE}"}), 415
+
+    config = current_app.config
+    if request.content_length is None:
+        return jsonify({"error": "Content-Length is required"}), 400
+    if request.content_length > config.get(
+        "PAYMENT_BATCH_MAX_BYTES", DEFAULT_PAYMENT_BATCH_MAX_BYTES
+    ):
+        return jsonify({"error": "Batch is too large"}), 413
+
+    body = request.get_data()
+    if not _valid_batch_signature(body):
+        return jsonify({"error": "Invalid signature"}), 401
+
+    lines = body.splitlines()
+    if sum(1 for raw in lines if raw.strip()) > config.get(
+        "PAYMENT_BATCH_MAX_LINES", DEFAULT_PAYMENT_BATCH_MAX_LINES
+    ):
+        return jsonify({"error": "Batch has too many lines"}), 413
+
+    dispatcher = current_app.container.event_dispatcher()
+
+    @stream_with_context
+    def generate() -> Iterator[bytes]:
+        # Rejected lines are reported in input order, between the results
+        # of the events around them
+        rejected: Deque[bytes] = deque()
+        event_lines: Deque[int] = deque()
+
+        def events() -> Iterator[PaymentCapturedEvent]:
+            for line_no, raw in enumerate(lines, start=1):
+                if not raw.strip():
+                    continue
+                try:
+                    data = payment_webhook_schema.load(orjson.loads(raw))
+                except orjson.JSONDecodeError:
+                    error = "Invalid JSON"
+                except ValidationError as err:
+                    error = _validation_error_message(err)
+                else:
+                    event_lines.append(line_no)
+                    yield PaymentCapturedEvent(
+                        invoice_id=data["invoice_id"],
+                        payment_reference=data["payment_reference"],
+                        amount=str(data["amount"]),
+                        currency=data["currency"],
+                    )
+                    continue
+                rejected.append(_ndjson_line({"line": line_no, "error": error}))
+
+        for result in dispatcher.emit_many(events()):
+            while rejected:
+                yield rejected.popleft()
+            line_no = event_lines.popleft()
+            if result.success:
+                fields = _success_fields(_result_data(result))
+                yield _ndjson_line({"line": line_no, "status": "success", **fields})
+            else:
+                yield _ndjson_line({"line": line_no, "error": result.error})
+        while rejected:
+            yield rejected.popleft()
+
+    return Response(generate(), mimetype=NDJSON_MIMETYPE)
 
 
 @webhooks_bp.route("/payment/test", methods=["POST"])
@@ -1,8 +1,9 @@
-"""APScheduler for core background jobs (booking completion only).
+"""APScheduler for core background jobs (booking completion, plan pricing).
 
 Subscription lifecycle jobs moved to plugins/subscription/subscription/scheduler.py.
 """
 import logging
+from datetime import datetime
 from vbwd.extensions import db
 
 logger = logging.getLogger(__name__)
@@ -36,8 +37,33 @@ def _run_booking_completion_jobs(app):
             pass  # Booking plugin not installed
 
 
+def _run_plan_pricing_jobs(app):
+    """Pre-render public plan listings into Redis.
+
+    Every worker process schedules this job; a Redis claim held for just
+    under the interval lets only the first one per interval do the work.
+    """
+    with app.app_context():
+        from vbwd.routes.tarif_plans import (
+            PLANS_PRICING_WARM_INTERVAL,
+            warm_plan_pricing,
+        )
+        from vbwd.utils.redis_client import redis_client
+
+        try:
+            if not redis_client.claim(
+                "plan_pricing_warm", PLANS_PRICING_WARM_INTERVAL - 10
+            ):
+                return
+            warmed = warm_plan_pricing()
+            logger.info("[Scheduler] Warmed %d plan pricing listing(s)", warmed)
+        except Exception:
+            logger.exception("[Scheduler] Plan pricing warm-up failed")
+
+
 def start_booking_scheduler(app):
     from apscheduler.schedulers.background import BackgroundScheduler
+    from vbwd.routes.tarif_plans import PLANS_PRICING_WARM_INTERVAL
 
     scheduler = BackgroundScheduler()
     scheduler.add_job(
@@ -48,6 +74,17 @@ def start_booking_scheduler(app):
         id="booking_completion_jobs",
         replace_existing=True,
     )
+    scheduler.add_job(
+        _run_plan_pricing_jobs,
+        "interval",
+        seconds=PLANS_PRICING_WARM_INTERVAL,
+        args=[app],
+        id="plan_pricing_jobs",
+        replace_existing=True,
+        # Warm once at startup instead of serving cold listings until the
+        # first interval elapses
+        next_run_time=datetime.now(),
+    )
     scheduler.start()
     logger.info("[Scheduler] Booking completion scheduler started")
     return scheduler
@@ -4,19 +4,25 @@ from vbwd.schemas.auth_schemas import (
     LoginRequestSchema,
     AuthResponseSchema,
 )
+from vbwd.schemas.payment_schemas import PaymentWebhookRequestSchema
 from vbwd.schemas.user_schemas import (
     UserSchema,
     UserDetailsSchema,
     UserDetailsUpdateSchema,
     UserProfileSchema,
+    ChangePasswordRequestSchema,
+    CheckoutRequestSchema,
 )
 
 __all__ = [
     "RegisterRequestSchema",
     "LoginRequestSchema",
     "AuthResponseSchema",
+    "PaymentWebhookRequestSchema",
     "UserSchema",
     "UserDetailsSchema",
     "UserDetailsUpdateSchema",
     "UserProfileSchema",
+    "ChangePasswordRequestSchema",
+    "CheckoutRequestSchema",
 ]
@@ -0,0 +1,48 @@
+"""Payment-related schemas."""
+from marshmallow import EXCLUDE, Schema, fields, validate
+
+
+class PaymentWebhookRequestSchema(Schema):
+    """
+    Schema for payment webhook request.
+
+    invoice_id is loaded as a UUID and amount as a Decimal, so malformed
+    values are rejected before any event is built.
+    """
+
+    invoice_id = fields.UUID(
+        required=True,
+        error_messages={
+            "required": "invoice_id is required",
+            "null": "invoice_id is required",
+            "invalid_uuid": "Invalid invoice_id format",
+        },
+    )
+    payment_reference = fields.Str(
+        required=True,
+        validate=validate.Length(min=1, error="payment_reference is required"),
+        error_messages={
+            "required": "payment_reference is required",
+            "null": "payment_reference is required",
+        },
+    )
+    amount = fields.Decimal(
+        required=True,
+        allow_nan=False,
+        error_messages={
+            "required": "amount is required",
+            "null": "amount is required",
+            "invalid": "Invalid amount format",
+        },
+    )
+    currency = fields.Str(
+        load_default="USD",
+        validate=validate.Regexp(
+            r"^[A-Za-z]{3}$", error="currency must be a 3-letter ISO code"
+        ),
+    )
+
+    class Meta:
+        """Schema metadata."""
+
+        unknown = EXCLUDE
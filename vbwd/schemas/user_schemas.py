@@ -1,5 +1,14 @@
 """User-related schemas."""
-from marshmallow import Schema, fields, validate
+from typing import Any, Optional
+
+from marshmallow import (
+    EXCLUDE,
+    Schema,
+    ValidationError,
+    fields,
+    validate,
+    validates_schema,
+)
 
 
 class UserSchema(Schema):
@@ -72,3 +81,111 @@ class UserProfileSchema(Schema):
         """Schema metadata."""
 
         ordered = True
+
+
+class ChangePasswordRequestSchema(Schema):
+    """Schema for change password request."""
+
+    currentPassword = fields.Str(
+        required=True,
+        validate=validate.Length(min=1),
+        load_only=True,
+        error_messages={"required": "Current password is required"},
+    )
+    newPassword = fields.Str(
+        required=True,
+        validate=validate.Length(min=1),
+        load_only=True,
+        error_messages={"required": "New password is required"},
+    )
+
+    class Meta:
+        """Schema metadata."""
+
+        unknown = EXCLUDE
+
+
+class CheckoutRequestSchema(Schema):
+    """Schema for checkout request; IDs are loaded as UUIDs."""
+
+    plan_id = fields.UUID(load_default=None, allow_none=True)
+    token_bundle_ids = fields.List(fields.UUID(), load_default=list)
+    add_on_ids = fields.List(fields.UUID(), load_default=list)
+    currency = fields.Str(load_default="USD")
+    payment_method_code = fields.Str(load_default=None, allow_none=True)
+
+    class Meta:
+        """Schema metadata."""
+
+        unknown = EXCLUDE
+
+    @validates_schema
+    def validate_has_item(self, data, **kwargs):
+        """Require at least one item to check out.
+
+        Raises:
+            ValidationError: If plan, bundles and add-ons are all empty
+        """
+        if not (data["plan_id"] or data["token_bundle_ids"] or data["add_on_ids"]):
+            raise ValidationError(
+                "At least one item required (plan_id, token_bundle_ids, or add_on_ids)"
+            )
+
+
+# Plain-dict dumpers for the read-only user endpoints. They produce the same
+# output as UserSchema / UserDetailsSchema / UserProfileSchema without
+# marshmallow's per-field dispatch on every request.
+
+_USER_DETAILS_TEXT_FIELDS = (
+    "first_name",
+    "last_name",
+    "phone",
+    "company",
+    "tax_number",
+    "address_line_1",
+    "address_line_2",
+    "city",
+    "postal_code",
+    "country",
+)
+
+
+def _str_or_none(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _isoformat_or_none(value: Any) -> Optional[str]:
+    return None if value is None else value.isoformat()
+
+
+def dump_user(user: Any) -> dict:
+    """Serialize a user exactly like ``UserSchema().dump``."""
+    return {
+        "id": _str_or_none(user.id),
+        "email": _str_or_none(user.email),
+        "status": _str_or_none(user.status),
+        "role": _str_or_none(user.role),
+        "created_at": _isoformat_or_none(user.created_at),
+        "updated_at": _isoformat_or_none(user.updated_at),
+    }
+
+
+def dump_user_details(details: Any) -> dict:
+    """Serialize user details exactly like ``UserDetailsSchema().dump``."""
+    data = {
+        "id": _str_or_none(details.id),
+        "user_id": _str_or_none(details.user_id),
+    }
+    for name in _USER_DETAILS_TEXT_FIELDS:
+        data[name] = _str_or_none(getattr(details, name))
+    data["created_at"] = _isoformat_or_none(details.created_at)
+    data["updated_at"] = _isoformat_or_none(details.updated_at)
+    return data
+
+
+def dump_user_profile(user: Any, details: Any) -> dict:
+    """Serialize a profile exactly like ``UserProfileSchema().dump``."""
+    return {
+        "user": dump_user(user),
+        "details": dump_user_details(details) if details is not None else None,
+    }
@@ -1,10 +1,63 @@
 """Activity logging service for audit trail."""
+import atexit
 import logging
-from typing import Any, Dict, Optional
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from vbwd.utils.datetime_utils import utcnow
 
 logger = logging.getLogger(__name__)
 
+# Background thread delivering activity records, once started
+_listener: Optional[QueueListener] = None
+
+
+class _ParentHandler(logging.Handler):
+    """Pass records to the parent logger's handlers, as propagation would."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if logger.parent is not None:
+            logger.parent.handle(record)
+
+
+def start_background_logging() -> QueueListener:
+    """
+    Deliver activity records from a background thread.
+
+    ActivityLogger.log then only enqueues the record; the configured
+    handlers (file, syslog, remote) run on the listener thread instead of
+    blocking the request. Safe to call more than once.
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, _ParentHandler())
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+    _listener.start()
+    atexit.register(stop_background_logging)
+    return _listener
+
+
+def stop_background_logging() -> None:
+    """Flush queued activity records and log synchronously again."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    logger.propagate = True
+    _listener = None
+
 
 class ActivityLogger:
     """
@@ -13,6 +66,9 @@ class ActivityLogger:
     Provides audit trail for security-sensitive operations.
     """
 
+    # Shared read-only stand-in for missing metadata
+    _EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
     def __init__(self, log_to_db: bool = False):
         """
         Initialize activity logger.
@@ -36,19 +92,33 @@ class ActivityLogger:
             user_id: Optional user ID associated with the action
             metadata: Optional additional data to log
         """
-        log_entry = {
-            "timestamp": utcnow().isoformat(),
-            "action": action,
-            "user_id": user_id,
-            "metadata": metadata or {},
-        }
-
-        # Log to standard logger
-        logger.info(f"Activity: {action}", extra=log_entry)
+        # Skip building the entry when nothing would consume it
+        log_to_logger = logger.isEnabledFor(logging.INFO)
+        if not (log_to_logger or self._log_to_db):
+            return
+
+        # Log to standard logger; the record carries its own timestamp
+        if log_to_logger:
+            logger.info(
+                "Activity: %s",
+                action,
+                extra={
+                    "action": action,
+                    "user_id": user_id,
+                    "metadata": metadata or self._EMPTY_METADATA,
+                },
+            )
 
         # Future: Log to database for queryable audit trail
         if self._log_to_db:
-            self._persist_to_db(log_entry)
+            self._persist_to_db(
+                {
+                    "timestamp": utcnow().isoformat(),
+                    "action": action,
+                    "user_id": user_id,
+                    "metadata": metadata or {},
+                }
+            )
 
     def _persist_to_db(self, log_entry: Dict[str, Any]) -> None:
         """
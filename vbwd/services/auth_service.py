@@ -2,6 +2,8 @@
 import re
 import bcrypt
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError
 from datetime import timedelta
 from vbwd.utils.datetime_utils import utcnow
 from typing import Optional
@@ -12,6 +14,12 @@ from vbwd.models.user import User
 from vbwd.models.enums import UserStatus, UserRole
 from vbwd.config import get_config
 
+# argon2id hasher shared by all password writes; hashes made with other
+# parameters (or legacy bcrypt hashes) are upgraded on the next login
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
 
 class AuthService(IAuthService):
     """Service for user authentication and authorization."""
@@ -91,6 +99,11 @@ class AuthService(IAuthService):
         if not self.verify_password(password, user.password_hash):
             return AuthResult(success=False, error="Invalid credentials")
 
+        # Upgrade legacy or outdated hashes while the plaintext is at hand
+        if self.needs_rehash(user.password_hash):
+            user.password_hash = self.hash_password(password)
+            self._user_repo.save(user)
+
         # Generate token
         token = self._generate_token(user.id, user.email)  # type: ignore[arg-type]
 
@@ -133,36 +146,51 @@ class AuthService(IAuthService):
             return None
 
     def hash_password(self, password: str) -> str:
-        """Hash password using bcrypt.
+        """Hash password using argon2id.
 
         Args:
             password: Plaintext password
 
         Returns:
-            Bcrypt hashed password
+            Argon2id encoded hash
         """
-        password_bytes = password.encode("utf-8")
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password_bytes, salt)
-        return hashed.decode("utf-8")
+        return password_hasher.hash(password)
 
     def verify_password(self, password: str, hashed: str) -> bool:
         """Verify password against hash.
 
+        Accepts argon2id hashes and legacy bcrypt hashes.
+
         Args:
             password: Plaintext password
-            hashed: Bcrypt hashed password
+            hashed: Encoded password hash
 
         Returns:
             True if password matches hash, False otherwise
         """
         try:
-            password_bytes = password.encode("utf-8")
-            hashed_bytes = hashed.encode("utf-8")
-            return bcrypt.checkpw(password_bytes, hashed_bytes)
+            if hashed.startswith(_BCRYPT_PREFIXES):
+                return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+            return password_hasher.verify(hashed, password)
         except Exception:
             return False
 
+    def needs_rehash(self, hashed: str) -> bool:
+        """Check whether a stored hash should be replaced with a fresh argon2id one.
+
+        Args:
+            hashed: Encoded password hash
+
+        Returns:
+            True for bcrypt hashes and argon2 hashes with outdated parameters
+        """
+        if hashed.startswith(_BCRYPT_PREFIXES):
+            return True
+        try:
+            return password_hasher.check_needs_rehash(hashed)
+        except InvalidHashError:
+            return False
+
     def _generate_token(self, user_id: UUID, email: str) -> str:
         """Generate JWT token for user.
 
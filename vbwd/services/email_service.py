@@ -1,20 +1,46 @@
 """Email service for sending emails via SMTP."""
 import smtplib
 import logging
+import queue
 import re
-from typing import Optional, List, Dict, Any, Tuple
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+import threading
+import time
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
+from email.utils import formataddr
 from datetime import datetime
 from jinja2 import (
     Environment,
     FileSystemLoader,
+    Template,
     TemplateNotFound as Jinja2TemplateNotFound,
 )
 
 logger = logging.getLogger(__name__)
 
+# Authenticated SMTP connections kept open per EmailService
+SMTP_POOL_SIZE = 4
+# Idle connections older than this are closed rather than reused; servers
+# commonly drop idle sessions after 5-10 minutes
+SMTP_IDLE_TIMEOUT = 300
+# Messages held by buffered_send before an intermediate flush
+EMAIL_FLUSH_THRESHOLD = 100
+# Templates compiled when the service is created
+EMAIL_TEMPLATES = (
+    "welcome",
+    "subscription_activated",
+    "subscription_cancelled",
+    "payment_receipt",
+    "payment_failed",
+    "invoice",
+    "renewal_reminder",
+    "password_reset",
+    "password_changed",
+)
+
 
 class EmailConfigError(Exception):
     """Raised when email configuration is invalid."""
@@ -43,12 +69,80 @@ class EmailResult:
         self.error = error
 
 
+class _SMTPPool:
+    """
+    Pool of authenticated SMTP connections.
+
+    Reusing a connection skips the connect, STARTTLS and login round-trips
+    for every message after the first.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        max_size: int = SMTP_POOL_SIZE,
+        idle_timeout: float = SMTP_IDLE_TIMEOUT,
+    ):
+        self._host = host
+        self._port = port
+        self._user = user
+        self._password = password
+        self._idle_timeout = idle_timeout
+        # Most recently used first, so the freshest connection is reused and
+        # the rest age out
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=max_size)
+
+    def connect(self) -> smtplib.SMTP:
+        """Open a new authenticated connection."""
+        server = smtplib.SMTP(self._host, self._port)
+        try:
+            server.starttls()
+            server.login(self._user, self._password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def acquire(self) -> smtplib.SMTP:
+        """Return an idle connection, or a new one if none is fresh."""
+        while True:
+            try:
+                server, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self.connect()
+            if time.monotonic() - last_used < self._idle_timeout:
+                return server
+            self.discard(server)
+
+    def release(self, server: smtplib.SMTP) -> None:
+        """Return a healthy connection to the pool, closing it if full."""
+        try:
+            self._idle.put_nowait((server, time.monotonic()))
+        except queue.Full:
+            self.discard(server)
+
+    @staticmethod
+    def discard(server: smtplib.SMTP) -> None:
+        """Close a connection that will not be reused."""
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
 class EmailService:
     """Service for sending emails via SMTP."""
 
     # Email validation pattern
     EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
+    # Fixed subjects for template-based senders
+    WELCOME_SUBJECT = "Welcome to VBWD!"
+    PAYMENT_FAILED_SUBJECT = "Payment Failed - Action Required"
+
     def __init__(
         self,
         smtp_host: str,
@@ -58,6 +152,7 @@ class EmailService:
         from_email: str,
         from_name: str = "VBWD",
         template_dir: str = "src/templates/email",
+        executor: Optional[Executor] = None,
     ):
         """
         Initialize email service.
@@ -70,6 +165,9 @@ class EmailService:
             from_email: Default sender email address.
             from_name: Default sender name.
             template_dir: Directory containing email templates.
+            executor: Optional executor that delivers messages in the
+                background; send_email then returns once the message is
+                queued instead of waiting on SMTP.
 
         Raises:
             EmailConfigError: If configuration is invalid.
@@ -85,14 +183,31 @@ class EmailService:
         self._smtp_password = smtp_password
         self._from_email = from_email
         self._from_name = from_name
+        self._from_header = formataddr((from_name, from_email))
+        self._executor = executor
+        self._smtp_pool = _SMTPPool(smtp_host, smtp_port, smtp_user, smtp_password)
+        # Per-thread message buffer while inside buffered_send
+        self._buffers = threading.local()
 
         self._template_env: Optional[Environment] = None
+        # Compiled (text, html) templates by name
+        self._templates: Dict[str, Tuple[Template, Template]] = {}
         try:
+            # Templates ship with the release, so never re-stat them
             self._template_env = Environment(
-                loader=FileSystemLoader(template_dir), autoescape=True
+                loader=FileSystemLoader(template_dir),
+                autoescape=True,
+                auto_reload=False,
+                cache_size=-1,
             )
         except Exception as e:
             logger.warning(f"Could not load template directory: {e}")
+        else:
+            for name in EMAIL_TEMPLATES:
+                try:
+                    self._load_templates(name)
+                except TemplateNotFoundError:
+                    logger.debug("Email template %s not found", name)
 
     def _validate_config(
         self,
@@ -121,7 +236,14 @@ class EmailService:
 
     def _validate_email(self, email: str) -> bool:
         """Validate email address format."""
-        if not email:
+        # Cheap structural checks reject most bad input before the regex
+        if not email or len(email) > 254:
+            return False
+        at = email.rfind("@")
+        if at < 1:
+            return False
+        domain = email[at + 1 :]
+        if "." not in domain or len(domain) < 3:
             return False
         return bool(self.EMAIL_REGEX.match(email))
 
@@ -136,6 +258,10 @@ class EmailService:
         """
         Send email via SMTP.
 
+        With an executor configured the message is built here and handed off
+        for delivery, and the result only reports that it was queued;
+        delivery failures are logged by the background task.
+
         Args:
             to_email: Recipient email address.
             subject: Email subject.
@@ -146,53 +272,197 @@ class EmailService:
         Returns:
             EmailResult with success status.
         """
-        # Validate recipient email
-        if not self._validate_email(to_email):
-            return EmailResult(success=False, error="Invalid recipient email address")
+        message, error = self._prepare_message(
+            to_email, subject, body_text, body_html, attachments
+        )
+        if error is not None:
+            return error
+
+        buffer = getattr(self._buffers, "messages", None)
+        if buffer is not None:
+            buffer.append((to_email, message))
+            if len(buffer) >= self._buffers.flush_threshold:
+                self._flush(buffer)
+            return EmailResult(success=True)
 
-        try:
-            # Create message
-            if body_html or attachments:
-                msg = MIMEMultipart("alternative")
+        if self._executor is not None:
+            try:
+                self._executor.submit(self._deliver, to_email, message)
+            except RuntimeError as e:
+                # Executor shut down (e.g. worker exiting); send inline
+                logger.warning(f"Email queue unavailable, sending inline: {e}")
             else:
-                msg = MIMEMultipart()
-
-            msg["From"] = f"{self._from_name} <{self._from_email}>"
-            msg["To"] = to_email
-            msg["Subject"] = subject
-
-            # Add plain text body
-            text_part = MIMEText(body_text, "plain", "utf-8")
-            msg.attach(text_part)
-
-            # Add HTML body if provided
-            if body_html:
-                html_part = MIMEText(body_html, "html", "utf-8")
-                msg.attach(html_part)
-
-            # Add attachments if provided
-            if attachments:
-                for filename, data, mime_type in attachments:
-                    attachment = MIMEApplication(data)
-                    attachment.add_header(
-                        "Content-Disposition", "attachment", filename=filename
-                    )
-                    attachment.add_header("Content-Type", mime_type)
-                    msg.attach(attachment)
-
-            # Send email
-            with smtplib.SMTP(self._smtp_host, self._smtp_port) as server:
-                server.starttls()
-                server.login(self._smtp_user, self._smtp_password)
-                server.sendmail(self._from_email, to_email, msg.as_string())
-
-            logger.info(f"Email sent successfully to {to_email}")
-            return EmailResult(success=True)
+                return EmailResult(success=True)
+
+        return self._deliver(to_email, message)
 
+    @contextmanager
+    def buffered_send(
+        self, flush_threshold: int = EMAIL_FLUSH_THRESHOLD
+    ) -> Iterator[None]:
+        """
+        Collect messages sent in the block and deliver them over one session.
+
+        Inside the block send_email (and the send_* helpers) only build and
+        queue the message. Queued messages are delivered when the block
+        exits, or whenever ``flush_threshold`` are waiting, with one SMTP
+        session per flush. Delivery failures are logged. Nested blocks join
+        the outer one.
+
+        Args:
+            flush_threshold: Queued messages that trigger an early flush.
+        """
+        if getattr(self._buffers, "messages", None) is not None:
+            yield
+            return
+
+        self._buffers.messages = []
+        self._buffers.flush_threshold = flush_threshold
+        try:
+            yield
+        finally:
+            messages = self._buffers.messages
+            self._buffers.messages = None
+            self._flush(messages)
+
+    def _flush(self, messages: List[Tuple[str, bytes]]) -> None:
+        """Deliver and clear buffered messages."""
+        batch = list(messages)
+        messages.clear()
+        if not batch:
+            return
+
+        if self._executor is not None:
+            try:
+                self._executor.submit(self._deliver_batch, batch)
+                return
+            except RuntimeError as e:
+                logger.warning(f"Email queue unavailable, sending inline: {e}")
+
+        self._deliver_batch(batch)
+
+    def send_email_sync(
+        self,
+        to_email: str,
+        subject: str,
+        body_text: str,
+        body_html: Optional[str] = None,
+        attachments: Optional[List[Tuple[str, bytes, str]]] = None,
+    ) -> EmailResult:
+        """
+        Send email via SMTP and wait for the result, ignoring any executor.
+
+        Args:
+            to_email: Recipient email address.
+            subject: Email subject.
+            body_text: Plain text body.
+            body_html: Optional HTML body.
+            attachments: List of (filename, data, mime_type) tuples.
+
+        Returns:
+            EmailResult with success status.
+        """
+        message, error = self._prepare_message(
+            to_email, subject, body_text, body_html, attachments
+        )
+        if error is not None:
+            return error
+
+        return self._deliver(to_email, message)
+
+    def _prepare_message(
+        self,
+        to_email: str,
+        subject: str,
+        body_text: str,
+        body_html: Optional[str],
+        attachments: Optional[List[Tuple[str, bytes, str]]],
+    ) -> Tuple[bytes, Optional[EmailResult]]:
+        """Validate the recipient and build the message, or return the error."""
+        if not self._validate_email(to_email):
+            return b"", EmailResult(
+                success=False, error="Invalid recipient email address"
+            )
+
+        try:
+            message = self._build_message(
+                to_email, subject, body_text, body_html, attachments
+            )
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"Failed to send email to {to_email}: {error_msg}")
-            return EmailResult(success=False, error=error_msg)
+            logger.error(f"Failed to build email to {to_email}: {error_msg}")
+            return b"", EmailResult(success=False, error=error_msg)
+
+        return message, None
+
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        body_text: str,
+        body_html: Optional[str],
+        attachments: Optional[List[Tuple[str, bytes, str]]],
+    ) -> bytes:
+        """Build the MIME message and return it serialized for sendmail."""
+        msg = EmailMessage(policy=SMTP_POLICY)
+        msg["From"] = self._from_header
+        msg["To"] = to_email
+        msg["Subject"] = subject
+
+        msg.set_content(body_text)
+        if body_html:
+            msg.add_alternative(body_html, subtype="html")
+
+        if attachments:
+            for filename, data, mime_type in attachments:
+                maintype, _, subtype = mime_type.partition("/")
+                msg.add_attachment(
+                    data,
+                    maintype=maintype,
+                    subtype=subtype or "octet-stream",
+                    filename=filename,
+                )
+
+        # Single bytes-native serialization pass; sendmail accepts bytes
+        return msg.as_bytes()
+
+    def _deliver(self, to_email: str, message: bytes) -> EmailResult:
+        """Send a built message over a pooled SMTP connection."""
+        return self._deliver_batch([(to_email, message)])[0]
+
+    def _deliver_batch(self, messages: List[Tuple[str, bytes]]) -> List[EmailResult]:
+        """Send built messages in order, sharing one pooled SMTP connection."""
+        results = []
+        server = None
+        for to_email, message in messages:
+            try:
+                if server is None:
+                    server = self._smtp_pool.acquire()
+                try:
+                    server.sendmail(self._from_email, to_email, message)
+                except smtplib.SMTPServerDisconnected:
+                    # The server dropped the pooled session; retry once on a
+                    # fresh connection
+                    self._smtp_pool.discard(server)
+                    server = None
+                    server = self._smtp_pool.connect()
+                    server.sendmail(self._from_email, to_email, message)
+
+                logger.info("Email sent successfully to %s", to_email)
+                results.append(EmailResult(success=True))
+
+            except Exception as e:
+                if server is not None:
+                    # Session state after a failed transaction is unknown
+                    self._smtp_pool.discard(server)
+                    server = None
+                error_msg = str(e)
+                logger.error(f"Failed to send email to {to_email}: {error_msg}")
+                results.append(EmailResult(success=False, error=error_msg))
+
+        if server is not None:
+            self._smtp_pool.release(server)
+        return results
 
     def render_template(
         self, template_name: str, context: Dict[str, Any]
@@ -210,24 +480,30 @@ class EmailService:
         Raises:
             TemplateNotFoundError: If template is not found.
         """
+        templates = self._templates.get(template_name)
+        if templates is None:
+            templates = self._load_templates(template_name)
+
+        text_template, html_template = templates
+        return text_template.render(**context), html_template.render(**context)
+
+    def _load_templates(self, template_name: str) -> Tuple[Template, Template]:
+        """Compile and cache the text and HTML templates for a name."""
         if not self._template_env:
             raise TemplateNotFoundError("Template directory not configured")
 
         try:
-            # Try to load text template
             text_template = self._template_env.get_template(f"{template_name}.txt")
-            text_content = text_template.render(**context)
         except Jinja2TemplateNotFound:
             raise TemplateNotFoundError(f"Template '{template_name}.txt' not found")
 
         try:
-            # Try to load HTML template
             html_template = self._template_env.get_template(f"{template_name}.html")
-            html_content = html_template.render(**context)
         except Jinja2TemplateNotFound:
             raise TemplateNotFoundError(f"Template '{template_name}.html' not found")
 
-        return text_content, html_content
+        self._templates[template_name] = (text_template, html_template)
+        return text_template, html_template
 
     def send_welcome_email(self, to_email: str, first_name: str) -> EmailResult:
         """
@@ -250,7 +526,7 @@ class EmailService:
 
             return self.send_email(
                 to_email=to_email,
-                subject="Welcome to VBWD!",
+                subject=self.WELCOME_SUBJECT,
                 body_text=text_body,
                 body_html=html_body,
             )
@@ -399,7 +675,7 @@ class EmailService:
 
             return self.send_email(
                 to_email=to_email,
-                subject="Payment Failed - Action Required",
+                subject=self.PAYMENT_FAILED_SUBJECT,
                 body_text=text_body,
                 body_html=html_body,
             )
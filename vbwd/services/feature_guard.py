@@ -1,5 +1,5 @@
 """Feature guard service for tariff-based access control."""
-from typing import Optional, Dict, Tuple, Set
+from typing import Any, Optional, Dict, FrozenSet, Tuple
 from uuid import UUID
 from vbwd.repositories.subscription_repository import SubscriptionRepository
 from vbwd.repositories.feature_usage_repository import FeatureUsageRepository
@@ -11,14 +11,19 @@ class FeatureGuard:
 
     Handles feature gating based on subscription plans
     and usage limits.
+
+    The active subscription is looked up once per user and reused, so an
+    instance is meant to live for a single request.
     """
 
     # Free tier features available to all users
-    FREE_TIER_FEATURES: Set[str] = {
-        "basic_access",
-        "limited_uploads",
-        "standard_support",
-    }
+    FREE_TIER_FEATURES: FrozenSet[str] = frozenset(
+        {
+            "basic_access",
+            "limited_uploads",
+            "standard_support",
+        }
+    )
 
     def __init__(
         self,
@@ -34,6 +39,9 @@ class FeatureGuard:
         """
         self.subscription_repo = subscription_repo
         self.usage_repo = usage_repo
+        self._active_subscriptions: Dict[UUID, Optional[Any]] = {}
+        # Plan features merged with the free tier, by (plan id, version)
+        self._effective_features: Dict[Tuple[Any, Any], FrozenSet[str]] = {}
 
     def can_access_feature(self, user_id: UUID, feature_name: str) -> bool:
         """
@@ -48,7 +56,7 @@ class FeatureGuard:
         Returns:
             True if user can access the feature
         """
-        subscription = self.subscription_repo.find_active_by_user(user_id)
+        subscription = self._get_active_subscription(user_id)
 
         if not subscription:
             # No subscription - check free tier
@@ -68,7 +76,8 @@ class FeatureGuard:
         """
         Check if user is within usage limit for a feature.
 
-        Also increments usage if within limit.
+        Also increments usage if within limit; the check and increment are
+        a single atomic statement.
 
         Args:
             user_id: User UUID
@@ -79,7 +88,7 @@ class FeatureGuard:
             Tuple of (is_within_limit, remaining_usage)
             remaining_usage is None for unlimited features
         """
-        subscription = self.subscription_repo.find_active_by_user(user_id)
+        subscription = self._get_active_subscription(user_id)
         if not subscription:
             return False, None
 
@@ -89,21 +98,18 @@ class FeatureGuard:
             # Unlimited
             return True, None
 
-        # Get current usage
         period_start = subscription.current_period_start or subscription.start_date
+        new_usage = self.usage_repo.try_increment_within_limit(
+            user_id, feature_name, period_start, increment, limit
+        )
+        if new_usage is not None:
+            return True, limit - new_usage
+
+        # Rejected - report what is left without incrementing
         current_usage = self.usage_repo.get_monthly_usage(
             user_id, feature_name, period_start
         )
-
-        remaining = limit - current_usage
-        if remaining >= increment:
-            # Within limit - increment usage
-            self.usage_repo.increment_usage(
-                user_id, feature_name, period_start, increment
-            )
-            return True, remaining - increment
-
-        return False, remaining
+        return False, max(0, limit - current_usage)
 
     def get_feature_limits(self, user_id: UUID) -> Dict[str, dict]:
         """
@@ -115,7 +121,7 @@ class FeatureGuard:
         Returns:
             Dictionary of feature_name -> {limit, used, remaining}
         """
-        subscription = self.subscription_repo.find_active_by_user(user_id)
+        subscription = self._get_active_subscription(user_id)
         if not subscription:
             return {}
 
@@ -124,12 +130,13 @@ class FeatureGuard:
             return {}
 
         period_start = subscription.current_period_start or subscription.start_date
+        usages = self.usage_repo.get_monthly_usage_bulk(
+            user_id, list(limits.keys()), period_start
+        )
         result = {}
 
         for feature_name, limit in limits.items():
-            usage = self.usage_repo.get_monthly_usage(
-                user_id, feature_name, period_start
-            )
+            usage = usages.get(feature_name, 0)
             result[feature_name] = {
                 "limit": limit,
                 "used": usage,
@@ -138,7 +145,7 @@ class FeatureGuard:
 
         return result
 
-    def get_user_features(self, user_id: UUID) -> Set[str]:
+    def get_user_features(self, user_id: UUID) -> FrozenSet[str]:
         """
         Get all features available to a user.
 
@@ -146,15 +153,36 @@ class FeatureGuard:
             user_id: User UUID
 
         Returns:
-            Set of available feature names
+            Immutable set of available feature names
         """
-        subscription = self.subscription_repo.find_active_by_user(user_id)
+        subscription = self._get_active_subscription(user_id)
 
         if not subscription or subscription.is_expired:
-            return self.FREE_TIER_FEATURES.copy()
+            return self.FREE_TIER_FEATURES
+
+        tarif_plan = subscription.tarif_plan
+        key = (tarif_plan.id, tarif_plan.version)
+        features = self._effective_features.get(key)
+        if features is None:
+            features = self.FREE_TIER_FEATURES.union(tarif_plan.features or [])
+            self._effective_features[key] = features
+        return features
 
-        plan_features = set(subscription.tarif_plan.features or [])
-        return plan_features | self.FREE_TIER_FEATURES
+    def _get_active_subscription(self, user_id: UUID) -> Optional[Any]:
+        """
+        Get the user's active subscription, querying at most once.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Active Subscription or None
+        """
+        if user_id not in self._active_subscriptions:
+            self._active_subscriptions[
+                user_id
+            ] = self.subscription_repo.find_active_by_user(user_id)
+        return self._active_subscriptions[user_id]
 
     def _get_feature_limit(self, tarif_plan, feature_name: str) -> Optional[int]:
         """
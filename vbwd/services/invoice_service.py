@@ -2,17 +2,28 @@
 from decimal import Decimal
 from datetime import timedelta
 from vbwd.utils.datetime_utils import utcnow
-from typing import Optional, List
+from typing import Any, Callable, Iterator, Optional, List, Union
 from uuid import UUID
 
 from vbwd.repositories.invoice_repository import InvoiceRepository
+from vbwd.models.base import ConcurrentModificationError
 from vbwd.models.invoice import UserInvoice
 from vbwd.models.enums import InvoiceStatus
 
+# Attempts for a status change that keeps losing optimistic-lock races
+INVOICE_UPDATE_ATTEMPTS = 3
+
+
+def _as_uuid(value: Any) -> Any:
+    """Parse a string ID; UUIDs and None pass through unchanged."""
+    return UUID(value) if isinstance(value, str) else value
+
 
 class InvoiceResult:
     """Result of an invoice operation."""
 
+    __slots__ = ("success", "invoice", "error")
+
     def __init__(
         self,
         success: bool,
@@ -46,9 +57,9 @@ class InvoiceService:
 
     def create_invoice(
         self,
-        user_id: str,
-        subscription_id: str,
-        tarif_plan_id: str,
+        user_id: Union[str, UUID],
+        subscription_id: Union[str, UUID],
+        tarif_plan_id: Union[str, UUID],
         amount: Decimal,
         currency: str = "EUR",
         due_days: int = 30,
@@ -56,6 +67,9 @@ class InvoiceService:
         """
         Create a new invoice.
 
+        Accepts IDs as strings or UUIDs; callers that already hold UUIDs
+        can use create_invoice_from_uuids directly.
+
         Args:
             user_id: ID of the user.
             subscription_id: ID of the subscription.
@@ -68,20 +82,56 @@ class InvoiceService:
             InvoiceResult with the created invoice or error.
         """
         try:
+            user_uuid = _as_uuid(user_id)
+            subscription_uuid = _as_uuid(subscription_id)
+            tarif_plan_uuid = _as_uuid(tarif_plan_id)
+        except ValueError as e:
+            return InvoiceResult(success=False, error=str(e))
+
+        return self.create_invoice_from_uuids(
+            user_uuid,
+            subscription_uuid,
+            tarif_plan_uuid,
+            amount,
+            currency=currency,
+            due_days=due_days,
+        )
+
+    def create_invoice_from_uuids(
+        self,
+        user_id: UUID,
+        subscription_id: UUID,
+        tarif_plan_id: UUID,
+        amount: Decimal,
+        currency: str = "EUR",
+        due_days: int = 30,
+    ) -> InvoiceResult:
+        """
+        Create a new invoice from already-parsed IDs.
+
+        Args:
+            user_id: ID of the user.
+            subscription_id: ID of the subscription.
+            tarif_plan_id: ID of the tariff plan.
+            amount: Invoice amount.
+            currency: Currency code (default EUR).
+            due_days: Days until invoice expires (default 30).
+
+        Returns:
+            InvoiceResult with the created invoice or error.
+        """
+        try:
+            now = utcnow()
             invoice = UserInvoice(
-                user_id=UUID(user_id) if isinstance(user_id, str) else user_id,
-                subscription_id=UUID(subscription_id)
-                if isinstance(subscription_id, str)
-                else subscription_id,
-                tarif_plan_id=UUID(tarif_plan_id)
-                if isinstance(tarif_plan_id, str)
-                else tarif_plan_id,
+                user_id=user_id,
+                subscription_id=subscription_id,
+                tarif_plan_id=tarif_plan_id,
                 invoice_number=UserInvoice.generate_invoice_number(),
                 amount=amount,
                 currency=currency,
                 status=InvoiceStatus.PENDING,
-                invoiced_at=utcnow(),
-                expires_at=utcnow() + timedelta(days=due_days),
+                invoiced_at=now,
+                expires_at=now + timedelta(days=due_days),
             )
 
             saved_invoice = self._repo.save(invoice)
@@ -114,6 +164,20 @@ class InvoiceService:
         """
         return self._repo.find_by_user(user_id)
 
+    def iter_user_invoices(self, user_id: str) -> Iterator[UserInvoice]:
+        """
+        Stream all invoices for a user without loading them into a list.
+
+        For batch and reporting callers that go over the invoices once.
+
+        Args:
+            user_id: ID of the user.
+
+        Returns:
+            Iterator over the user's invoices, newest first.
+        """
+        return self._repo.iter_by_user(user_id)
+
     def get_subscription_invoices(self, subscription_id: str) -> List[UserInvoice]:
         """
         Get all invoices for a subscription.
@@ -126,6 +190,18 @@ class InvoiceService:
         """
         return self._repo.find_by_subscription(subscription_id)
 
+    def iter_subscription_invoices(self, subscription_id: str) -> Iterator[UserInvoice]:
+        """
+        Stream all invoices for a subscription without loading them into a list.
+
+        Args:
+            subscription_id: ID of the subscription.
+
+        Returns:
+            Iterator over the subscription's invoices, newest first.
+        """
+        return self._repo.iter_by_subscription(subscription_id)
+
     def mark_paid(
         self, invoice_id: str, payment_reference: str, payment_method: str
     ) -> InvoiceResult:
@@ -140,23 +216,24 @@ class InvoiceService:
         Returns:
             InvoiceResult with updated invoice or error.
         """
-        invoice = self._repo.find_by_id(invoice_id)
 
-        if not invoice:
-            return InvoiceResult(success=False, error="Invoice not found")
-
-        if invoice.status == InvoiceStatus.PAID:
-            return InvoiceResult(success=False, error="Invoice already paid")
-
-        if invoice.status != InvoiceStatus.PENDING:
-            return InvoiceResult(
-                success=False,
-                error=f"Cannot mark as paid: invoice status is {invoice.status.value}",
-            )
-
-        invoice.mark_paid(payment_reference, payment_method)
-        saved_invoice = self._repo.save(invoice)
-        return InvoiceResult(success=True, invoice=saved_invoice)
+        def pay(invoice: UserInvoice) -> Optional[str]:
+            if invoice.status == InvoiceStatus.PAID:
+                return "Invoice already paid"
+            if invoice.status != InvoiceStatus.PENDING:
+                return f"Cannot mark as paid: invoice status is {invoice.status.value}"
+            invoice.mark_paid(payment_reference, payment_method)
+            return None
+
+        return self._transition(
+            invoice_id,
+            InvoiceStatus.PENDING,
+            pay,
+            status=InvoiceStatus.PAID,
+            payment_ref=payment_reference,
+            payment_method=payment_method,
+            paid_at=utcnow(),
+        )
 
     def mark_failed(self, invoice_id: str) -> InvoiceResult:
         """
@@ -168,14 +245,12 @@ class InvoiceService:
         Returns:
             InvoiceResult with updated invoice or error.
         """
-        invoice = self._repo.find_by_id(invoice_id)
 
-        if not invoice:
-            return InvoiceResult(success=False, error="Invoice not found")
+        def fail(invoice: UserInvoice) -> Optional[str]:
+            invoice.mark_failed()
+            return None
 
-        invoice.mark_failed()
-        saved_invoice = self._repo.save(invoice)
-        return InvoiceResult(success=True, invoice=saved_invoice)
+        return self._transition(invoice_id, None, fail, status=InvoiceStatus.FAILED)
 
     def mark_cancelled(self, invoice_id: str) -> InvoiceResult:
         """
@@ -187,14 +262,14 @@ class InvoiceService:
         Returns:
             InvoiceResult with updated invoice or error.
         """
-        invoice = self._repo.find_by_id(invoice_id)
 
-        if not invoice:
-            return InvoiceResult(success=False, error="Invoice not found")
+        def cancel(invoice: UserInvoice) -> Optional[str]:
+            invoice.mark_cancelled()
+            return None
 
-        invoice.mark_cancelled()
-        saved_invoice = self._repo.save(invoice)
-        return InvoiceResult(success=True, invoice=saved_invoice)
+        return self._transition(
+            invoice_id, None, cancel, status=InvoiceStatus.CANCELLED
+        )
 
     def mark_refunded(self, invoice_id: str, refund_reference: str) -> InvoiceResult:
         """
@@ -207,19 +282,86 @@ class InvoiceService:
         Returns:
             InvoiceResult with updated invoice or error.
         """
-        invoice = self._repo.find_by_id(invoice_id)
 
-        if not invoice:
-            return InvoiceResult(success=False, error="Invoice not found")
+        def refund(invoice: UserInvoice) -> Optional[str]:
+            if invoice.status != InvoiceStatus.PAID:
+                return "Cannot refund: invoice is not paid"
+            invoice.mark_refunded()
+            return None
 
-        if invoice.status != InvoiceStatus.PAID:
-            return InvoiceResult(
-                success=False, error="Cannot refund: invoice is not paid"
-            )
+        return self._transition(
+            invoice_id, InvoiceStatus.PAID, refund, status=InvoiceStatus.REFUNDED
+        )
+
+    def _transition(
+        self,
+        invoice_id: str,
+        expected_status: Optional[InvoiceStatus],
+        change: Callable[[UserInvoice], Optional[str]],
+        **values: Any,
+    ) -> InvoiceResult:
+        """
+        Apply a status change as one conditional UPDATE.
+
+        If no row matches, the invoice is missing or in another status;
+        the read-validate-save path then reports which, or applies
+        ``change`` if the invoice moved back into an eligible status.
+
+        Args:
+            invoice_id: ID of the invoice.
+            expected_status: Status the invoice must be in, or None for any.
+            change: Fallback validation and mutation (see _update_invoice).
+            **values: Column values to set.
+
+        Returns:
+            InvoiceResult with updated invoice or error.
+        """
+        conditions = []
+        if expected_status is not None:
+            conditions.append(UserInvoice.status == expected_status)
+
+        invoice = self._repo.update_if(invoice_id, *conditions, **values)
+        if invoice is not None:
+            return InvoiceResult(success=True, invoice=invoice)
+        return self._update_invoice(invoice_id, change)
+
+    def _update_invoice(
+        self, invoice_id: str, change: Callable[[UserInvoice], Optional[str]]
+    ) -> InvoiceResult:
+        """
+        Apply a status change under optimistic locking.
+
+        If another transaction saved the invoice first, the invoice is
+        reloaded and ``change`` re-validates against the new state before
+        trying again.
+
+        Args:
+            invoice_id: ID of the invoice.
+            change: Validates and mutates the invoice; returns an error
+                message to abort, or None to save.
+
+        Returns:
+            InvoiceResult with updated invoice or error.
+        """
+        for _ in range(INVOICE_UPDATE_ATTEMPTS):
+            invoice = self._repo.find_by_id(invoice_id)
+
+            if not invoice:
+                return InvoiceResult(success=False, error="Invoice not found")
+
+            error = change(invoice)
+            if error:
+                return InvoiceResult(success=False, error=error)
+
+            try:
+                saved_invoice = self._repo.save(invoice)
+            except ConcurrentModificationError:
+                continue
+            return InvoiceResult(success=True, invoice=saved_invoice)
 
-        invoice.mark_refunded()
-        saved_invoice = self._repo.save(invoice)
-        return InvoiceResult(success=True, invoice=saved_invoice)
+        return InvoiceResult(
+            success=False, error="Invoice was modified concurrently, please retry"
+        )
 
     def get_pending_invoices(self) -> List[UserInvoice]:
         """
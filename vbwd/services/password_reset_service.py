@@ -10,7 +10,7 @@ from vbwd.repositories.password_reset_repository import PasswordResetRepository
 from vbwd.services.auth_service import AuthService
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResetRequestResult:
     """Result of password reset request."""
 
@@ -22,7 +22,7 @@ class ResetRequestResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResetResult:
     """Result of password reset execution."""
 
@@ -42,10 +42,26 @@ class PasswordResetService:
 
     TOKEN_EXPIRY_HOURS = 1
 
+    # Static outcomes are shared between calls; results are frozen
+    _NO_SUCH_EMAIL = ResetRequestResult(success=True)
+    _INVALID_TOKEN = ResetResult(
+        success=False, error="Invalid token", failure_reason="invalid"
+    )
+    _EXPIRED_TOKEN = ResetResult(
+        success=False, error="Token expired", failure_reason="expired"
+    )
+    _USED_TOKEN = ResetResult(
+        success=False, error="Token already used", failure_reason="already_used"
+    )
+    _USER_NOT_FOUND = ResetResult(
+        success=False, error="User not found", failure_reason="invalid"
+    )
+
     def __init__(
         self,
         user_repository: UserRepository,
         reset_repository: PasswordResetRepository,
+        auth_service: Optional[AuthService] = None,
     ):
         """
         Initialize service with repositories.
@@ -53,9 +69,12 @@ class PasswordResetService:
         Args:
             user_repository: Repository for user data access
             reset_repository: Repository for password reset tokens
+            auth_service: Service used to hash new passwords (built from
+                user_repository if omitted)
         """
         self._user_repo = user_repository
         self._reset_repo = reset_repository
+        self._auth = auth_service or AuthService(user_repository)
 
     def create_reset_token(self, email: str) -> ResetRequestResult:
         """
@@ -73,7 +92,7 @@ class PasswordResetService:
 
         if not user:
             # Don't reveal if email exists - return success but no data
-            return ResetRequestResult(success=True)
+            return self._NO_SUCH_EMAIL
 
         # Invalidate any existing tokens
         self._reset_repo.invalidate_tokens_for_user(user.id)  # type: ignore[arg-type]
@@ -107,30 +126,20 @@ class PasswordResetService:
         reset_token = self._reset_repo.find_by_token(token)
 
         if not reset_token:
-            return ResetResult(
-                success=False, error="Invalid token", failure_reason="invalid"
-            )
+            return self._INVALID_TOKEN
 
         if reset_token.expires_at < utcnow():
-            return ResetResult(
-                success=False, error="Token expired", failure_reason="expired"
-            )
+            return self._EXPIRED_TOKEN
 
         if reset_token.used_at is not None:
-            return ResetResult(
-                success=False, error="Token already used", failure_reason="already_used"
-            )
+            return self._USED_TOKEN
 
         # Get user and update password
         user = self._user_repo.find_by_id(reset_token.user_id)
         if not user:
-            return ResetResult(
-                success=False, error="User not found", failure_reason="invalid"
-            )
+            return self._USER_NOT_FOUND
 
-        # Hash new password using AuthService
-        auth_service = AuthService(self._user_repo)
-        user.password_hash = auth_service.hash_password(new_password)
+        user.password_hash = self._auth.hash_password(new_password)
 
         # Update user
         self._user_repo.update(user)
@@ -1,5 +1,5 @@
 """RBAC service for role-based access control."""
-from typing import List, Set
+from typing import Dict, FrozenSet, List, Tuple
 from uuid import UUID
 from vbwd.repositories.role_repository import RoleRepository
 
@@ -9,6 +9,11 @@ class RBACService:
     Service for role-based access control operations.
 
     Handles permission checking, role assignment, and revocation.
+
+    A user's admin status and permission set are loaded together with one
+    repository call and memoized for the lifetime of the service instance,
+    which the permission decorators scope to a single request. Assigning
+    or revoking a role drops the user's entry.
     """
 
     # Admin role has all permissions
@@ -22,6 +27,7 @@ class RBACService:
             role_repository: Repository for role operations
         """
         self.role_repo = role_repository
+        self._access: Dict[UUID, Tuple[FrozenSet[str], bool]] = {}
 
     def has_permission(self, user_id: UUID, permission_name: str) -> bool:
         """
@@ -36,12 +42,9 @@ class RBACService:
         Returns:
             True if user has the permission
         """
+        permissions, is_admin = self._load_access(user_id)
         # Admin has all permissions
-        if self.role_repo.user_has_role(user_id, self.ADMIN_ROLE):
-            return True
-
-        permissions = self.get_user_permissions(user_id)
-        return permission_name in permissions
+        return is_admin or permission_name in permissions
 
     def has_any_permission(self, user_id: UUID, permission_names: List[str]) -> bool:
         """
@@ -54,11 +57,8 @@ class RBACService:
         Returns:
             True if user has at least one permission
         """
-        if self.role_repo.user_has_role(user_id, self.ADMIN_ROLE):
-            return True
-
-        permissions = self.get_user_permissions(user_id)
-        return bool(permissions & set(permission_names))
+        permissions, is_admin = self._load_access(user_id)
+        return is_admin or any(name in permissions for name in permission_names)
 
     def has_all_permissions(self, user_id: UUID, permission_names: List[str]) -> bool:
         """
@@ -71,13 +71,10 @@ class RBACService:
         Returns:
             True if user has all permissions
         """
-        if self.role_repo.user_has_role(user_id, self.ADMIN_ROLE):
-            return True
-
-        permissions = self.get_user_permissions(user_id)
-        return set(permission_names).issubset(permissions)
+        permissions, is_admin = self._load_access(user_id)
+        return is_admin or all(name in permissions for name in permission_names)
 
-    def get_user_permissions(self, user_id: UUID) -> Set[str]:
+    def get_user_permissions(self, user_id: UUID) -> FrozenSet[str]:
         """
         Get all permissions for a user.
 
@@ -87,7 +84,7 @@ class RBACService:
         Returns:
             Set of permission names
         """
-        return self.role_repo.get_user_permissions(user_id)
+        return self._load_access(user_id)[0]
 
     def get_user_roles(self, user_id: UUID) -> List[str]:
         """
@@ -113,6 +110,7 @@ class RBACService:
         Returns:
             True if successful, False if role not found
         """
+        self._forget(user_id)
         return self.role_repo.assign_role(user_id, role_name)
 
     def revoke_role(self, user_id: UUID, role_name: str) -> bool:
@@ -126,6 +124,7 @@ class RBACService:
         Returns:
             True if successful
         """
+        self._forget(user_id)
         return self.role_repo.revoke_role(user_id, role_name)
 
     def has_role(self, user_id: UUID, role_name: str) -> bool:
@@ -151,4 +150,19 @@ class RBACService:
         Returns:
             True if user is admin
         """
-        return self.role_repo.user_has_role(user_id, self.ADMIN_ROLE)
+        return self._load_access(user_id)[1]
+
+    def _load_access(self, user_id: UUID) -> Tuple[FrozenSet[str], bool]:
+        """Return a user's (permissions, is_admin), loading both at once."""
+        access = self._access.get(user_id)
+        if access is None:
+            permissions, is_admin = self.role_repo.get_user_permissions_with_admin(
+                user_id, self.ADMIN_ROLE
+            )
+            access = (frozenset(permissions), is_admin)
+            self._access[user_id] = access
+        return access
+
+    def _forget(self, user_id: UUID) -> None:
+        """Drop memoized access data for a user whose roles are changing."""
+        self._access.pop(user_id, None)
@@ -1,5 +1,6 @@
 """Refund service — orchestrates full invoice refund."""
-from typing import Optional, Dict, Any
+from contextlib import nullcontext
+from typing import ContextManager, Optional, Dict, Any, List, Tuple
 from uuid import UUID
 
 from vbwd.events.line_item_registry import (
@@ -12,16 +13,21 @@ from vbwd.models.enums import (
     LineItemType,
     PurchaseStatus,
 )
+from vbwd.models.base import ConcurrentModificationError
 from vbwd.repositories.invoice_repository import InvoiceRepository
 from vbwd.repositories.token_bundle_purchase_repository import (
     TokenBundlePurchaseRepository,
 )
+from vbwd.services.invoice_service import INVOICE_UPDATE_ATTEMPTS
 from vbwd.services.token_service import TokenService
+from vbwd.utils.transaction import UnitOfWork
 
 
 class RefundResult:
     """Result of a refund operation."""
 
+    __slots__ = ("success", "invoice", "items_reversed", "error")
+
     def __init__(
         self,
         success: bool,
@@ -43,6 +49,9 @@ class RefundService:
     2. Pre-check token balance
     3. Mark invoice as REFUNDED
     4. Delegate line item reversal to registry
+
+    With a session, the whole refund runs in one UnitOfWork so the
+    invoice, purchase and token writes commit together.
     """
 
     def __init__(
@@ -52,53 +61,57 @@ class RefundService:
         purchase_repo: TokenBundlePurchaseRepository,
         container=None,
         registry: LineItemHandlerRegistry | None = None,
+        session=None,
     ):
         self._invoice_repo = invoice_repo
         self._token_service = token_service
         self._purchase_repo = purchase_repo
         self._container = container
         self._registry = registry or line_item_registry
+        self._session = session
 
     def process_refund(self, invoice_id: UUID, refund_reference: str) -> RefundResult:
         """Process a full refund for an invoice."""
-        # 1. Fetch and validate invoice
-        invoice = self._invoice_repo.find_by_id(str(invoice_id))
-        if not invoice:
+        with self._unit_of_work():
+            return self._refund(invoice_id)
+
+    def _unit_of_work(self) -> ContextManager:
+        """One transaction for the whole refund, if the service has a session."""
+        if self._session is None:
+            return nullcontext()
+        return UnitOfWork(self._session)
+
+    def _refund(self, invoice_id: UUID) -> RefundResult:
+        for _ in range(INVOICE_UPDATE_ATTEMPTS):
+            invoice, purchases, failure = self._validate_refund(invoice_id)
+            if failure:
+                return failure
+
+            # 3. Mark invoice as refunded; if another transaction saved the
+            # invoice first, re-validate against its new state
+            invoice.mark_refunded()
+            try:
+                self._invoice_repo.save(invoice)
+            except ConcurrentModificationError:
+                continue
+            break
+        else:
             return RefundResult(
                 success=False,
-                error=f"Invoice {invoice_id} not found",
+                error="Invoice was modified concurrently, please retry",
             )
 
-        if invoice.status != InvoiceStatus.PAID:
-            return RefundResult(
-                success=False,
-                error=f"Cannot refund: invoice status is {invoice.status.value}",
-            )
-
-        # 2. Pre-check: ensure user has enough tokens
-        total_tokens_to_debit = self._calculate_tokens_to_debit(invoice)
-        if total_tokens_to_debit > 0:
-            current_balance = self._token_service.get_balance(invoice.user_id)
-            if current_balance < total_tokens_to_debit:
-                return RefundResult(
-                    success=False,
-                    error=(
-                        f"Insufficient token balance for refund. "
-                        f"User has {current_balance} tokens but {total_tokens_to_debit} "
-                        f"need to be deducted. User must purchase more tokens first."
-                    ),
-                )
-
-        # 3. Mark invoice as refunded
-        invoice.mark_refunded()
-        self._invoice_repo.save(invoice)
-
         # 4. Delegate line item reversal to registry
+        status_updates: Dict[UUID, PurchaseStatus] = {}
         context = LineItemContext(
             invoice=invoice,
             user_id=invoice.user_id,
             container=self._container,
+            prefetched=purchases,
+            status_updates=status_updates,
         )
+        # Core handlers report IDs as UUIDs; the JSON provider stringifies
+        # them only if the result is sent in a response
         items_reversed: Dict[str, Any] = {
             "subscription": None,
             "token_bundles": [],
@@ -118,13 +131,95 @@ class RefundService:
                     items_reversed["add_ons"].append(data["addon_subscription_id"])
                 items_reversed["tokens_debited"] += data.get("tokens_debited", 0)
 
+        # 5. Write the purchase status changes the handlers deferred; if a
+        # purchase was refunded or restored concurrently, nothing is written
+        try:
+            self._apply_status_updates(status_updates)
+        except ConcurrentModificationError:
+            return RefundResult(
+                success=False,
+                error="Invoice was modified concurrently, please retry",
+            )
+
         return RefundResult(
             success=True,
             invoice=invoice,
             items_reversed=items_reversed,
         )
 
-    def _calculate_tokens_to_debit(self, invoice) -> int:
+    def _validate_refund(
+        self, invoice_id: UUID
+    ) -> Tuple[Any, Dict[UUID, Any], Optional[RefundResult]]:
+        """Load the invoice and check it can be refunded.
+
+        Returns:
+            (invoice, prefetched purchases, None), or a failed RefundResult
+            as the last element.
+        """
+        # 1. Fetch and validate invoice
+        invoice = self._invoice_repo.find_by_id(str(invoice_id))
+        if not invoice:
+            return (
+                None,
+                {},
+                RefundResult(
+                    success=False,
+                    error=f"Invoice {invoice_id} not found",
+                ),
+            )
+
+        if invoice.status != InvoiceStatus.PAID:
+            return (
+                None,
+                {},
+                RefundResult(
+                    success=False,
+                    error=f"Cannot refund: invoice status is {invoice.status.value}",
+                ),
+            )
+
+        # Load every token bundle purchase on the invoice in one query
+        purchases = self._purchase_repo.find_by_line_items(invoice.line_items)
+
+        # 2. Pre-check: ensure user has enough tokens
+        total_tokens_to_debit = self._calculate_tokens_to_debit(invoice, purchases)
+        if total_tokens_to_debit > 0:
+            current_balance = self._token_service.get_balance(invoice.user_id)
+            if current_balance < total_tokens_to_debit:
+                return (
+                    None,
+                    {},
+                    RefundResult(
+                        success=False,
+                        error=(
+                            f"Insufficient token balance for refund. "
+                            f"User has {current_balance} tokens but "
+                            f"{total_tokens_to_debit} need to be deducted. "
+                            f"User must purchase more tokens first."
+                        ),
+                    ),
+                )
+
+        return invoice, purchases, None
+
+    def _apply_status_updates(self, status_updates: Dict[UUID, PurchaseStatus]) -> None:
+        """Persist deferred purchase statuses with one UPDATE per status.
+
+        Reversal only touches COMPLETED purchases, so each UPDATE requires
+        that status to still be in place.
+
+        Raises:
+            ConcurrentModificationError: If a purchase is no longer COMPLETED.
+        """
+        ids_by_status: Dict[PurchaseStatus, List[UUID]] = {}
+        for purchase_id, status in status_updates.items():
+            ids_by_status.setdefault(status, []).append(purchase_id)
+        for status, purchase_ids in ids_by_status.items():
+            self._purchase_repo.bulk_update_status(
+                purchase_ids, status, expected_status=PurchaseStatus.COMPLETED
+            )
+
+    def _calculate_tokens_to_debit(self, invoice, purchases: Dict[UUID, Any]) -> int:
         """Calculate total tokens that need to be deducted for this refund.
 
         Only counts TOKEN_BUNDLE items (core). Subscription default_tokens
@@ -133,7 +228,7 @@ class RefundService:
         total = 0
         for line_item in invoice.line_items:
             if line_item.item_type == LineItemType.TOKEN_BUNDLE:
-                purchase = self._purchase_repo.find_by_id(line_item.item_id)
+                purchase = purchases.get(line_item.item_id)
                 if purchase and purchase.status == PurchaseStatus.COMPLETED:
                     total += purchase.token_amount
         return total
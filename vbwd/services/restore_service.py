@@ -1,18 +1,31 @@
 """Restore service — reverses a refund, restoring invoice and all items."""
-from typing import Optional, Dict, Any
-from uuid import UUID
+from contextlib import nullcontext
+from typing import ContextManager, Optional, Dict, Any
+from uuid import UUID, uuid4
 
 from vbwd.events.line_item_registry import (
     LineItemContext,
     LineItemHandlerRegistry,
     line_item_registry,
 )
-from vbwd.models.enums import InvoiceStatus
+from vbwd.models.enums import InvoiceStatus, TokenTransactionType
+from vbwd.models.user_token_balance import UserTokenBalance, TokenTransaction
+from vbwd.repositories.invoice_repository import InvoiceRepository
+from vbwd.repositories.token_bundle_purchase_repository import (
+    TokenBundlePurchaseRepository,
+)
+from vbwd.repositories.token_repository import (
+    TokenBalanceRepository,
+    TokenTransactionRepository,
+)
+from vbwd.utils.transaction import UnitOfWork
 
 
 class RestoreResult:
     """Result of a restore operation."""
 
+    __slots__ = ("success", "invoice", "items_restored", "error")
+
     def __init__(
         self,
         success: bool,
@@ -30,19 +43,42 @@ class RestoreService:
     """Service for restoring a refunded invoice.
 
     Reverses a refund — restores the invoice to PAID and delegates
-    line item restoration to the LineItemHandlerRegistry.
+    line item restoration to the LineItemHandlerRegistry. With a
+    session, the whole restore runs in one UnitOfWork and commits once.
     """
 
-    def __init__(self, container, registry: LineItemHandlerRegistry | None = None):
+    def __init__(
+        self,
+        invoice_repo: InvoiceRepository,
+        purchase_repo: TokenBundlePurchaseRepository,
+        token_balance_repo: TokenBalanceRepository,
+        token_transaction_repo: TokenTransactionRepository,
+        container=None,
+        registry: LineItemHandlerRegistry | None = None,
+        session=None,
+    ):
+        self._invoice_repo = invoice_repo
+        self._purchase_repo = purchase_repo
+        self._token_balance_repo = token_balance_repo
+        self._token_transaction_repo = token_transaction_repo
         self._container = container
         self._registry = registry or line_item_registry
+        self._session = session
 
     def process_restore(self, invoice_id: UUID, reason: str = "") -> RestoreResult:
         """Restore a refunded invoice back to PAID state."""
-        invoice_repo = self._container.invoice_repository()
+        with self._unit_of_work():
+            return self._restore(invoice_id)
+
+    def _unit_of_work(self) -> ContextManager:
+        """One transaction for the whole restore, if the service has a session."""
+        if self._session is None:
+            return nullcontext()
+        return UnitOfWork(self._session)
 
+    def _restore(self, invoice_id: UUID) -> RestoreResult:
         # 1. Fetch and validate invoice
-        invoice = invoice_repo.find_by_id(str(invoice_id))
+        invoice = self._invoice_repo.find_by_id(str(invoice_id))
         if not invoice:
             return RestoreResult(success=False, error=f"Invoice {invoice_id} not found")
 
@@ -54,14 +90,19 @@ class RestoreService:
 
         # 2. Mark invoice as paid again
         invoice.status = InvoiceStatus.PAID
-        invoice_repo.save(invoice)
+        self._invoice_repo.save(invoice)
 
         # 3. Delegate line item restoration to registry
+        token_credits: Dict[UUID, int] = {}
         context = LineItemContext(
             invoice=invoice,
             user_id=invoice.user_id,
             container=self._container,
+            prefetched=self._purchase_repo.find_by_line_items(invoice.line_items),
+            token_credits=token_credits,
         )
+        # Core handlers report IDs as UUIDs; the JSON provider stringifies
+        # them only if the result is sent in a response
         items_restored: Dict[str, Any] = {
             "subscription": None,
             "token_bundles": [],
@@ -69,7 +110,7 @@ class RestoreService:
             "tokens_credited": 0,
         }
 
-        for line_item in invoice.line_items:
+        for line_item in invoice.line_items:  # type: ignore[attr-defined]
             result = self._registry.process_restoration(line_item, context)
             if result.success and not result.skipped:
                 data = result.data
@@ -81,6 +122,38 @@ class RestoreService:
                     items_restored["add_ons"].append(data["addon_subscription_id"])
                 items_restored["tokens_credited"] += data.get("tokens_credited", 0)
 
+        # 4. Credit every restored bundle with one balance write
+        self._apply_token_credits(invoice.user_id, token_credits)
+
         return RestoreResult(
             success=True, invoice=invoice, items_restored=items_restored
         )
+
+    def _apply_token_credits(self, user_id, token_credits: Dict[UUID, int]) -> None:
+        """Add the deferred bundle credits to the balance in one save.
+
+        Each purchase still gets its own transaction row for the audit
+        trail; they are inserted together.
+        """
+        if not token_credits:
+            return
+
+        balance = self._token_balance_repo.find_by_user_id(user_id)
+        if not balance:
+            balance = UserTokenBalance(id=uuid4(), user_id=user_id, balance=0)
+        balance.balance += sum(token_credits.values())
+        self._token_balance_repo.save(balance)
+
+        self._token_transaction_repo.create_many(
+            [
+                TokenTransaction(
+                    id=uuid4(),
+                    user_id=user_id,
+                    amount=amount,
+                    transaction_type=TokenTransactionType.PURCHASE,
+                    reference_id=purchase_id,
+                    description=f"Refund reversed: {amount} tokens restored",
+                )
+                for purchase_id, amount in token_credits.items()
+            ]
+        )
@@ -2,8 +2,10 @@
 from datetime import timedelta
 from vbwd.utils.datetime_utils import utcnow
 from decimal import Decimal
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Callable, Iterator, Optional, List
 from uuid import UUID
+from sqlalchemy import Row, and_, case
 from vbwd.repositories.subscription_repository import SubscriptionRepository
 from vbwd.repositories.tarif_plan_repository import TarifPlanRepository
 from vbwd.models.subscription import Subscription
@@ -15,6 +17,32 @@ from vbwd.models.enums import (
     TokenTransactionType,
 )
 
+# Duration in days for each billing period; read-only so the shared table
+# cannot drift between callers
+_PERIOD_DAYS = MappingProxyType(
+    {
+        BillingPeriod.DAILY: 1,
+        BillingPeriod.WEEKLY: 7,
+        BillingPeriod.MONTHLY: 30,
+        BillingPeriod.QUARTERLY: 90,
+        BillingPeriod.YEARLY: 365,
+        BillingPeriod.ONE_TIME: 36500,  # ~100 years for lifetime
+    }
+)
+
+# Duration used for a billing period missing from the table
+DEFAULT_PERIOD_DAYS = 30
+
+# Subscriptions expired per UPDATE/transaction by expire_subscriptions
+EXPIRY_BATCH_SIZE = 4096
+
+
+def period_days(billing_period: Optional[BillingPeriod]) -> int:
+    """Number of days one billing period lasts."""
+    if billing_period is None:
+        return DEFAULT_PERIOD_DAYS
+    return _PERIOD_DAYS.get(billing_period, DEFAULT_PERIOD_DAYS)
+
 
 class SubscriptionResult:
     """Result of a subscription operation."""
@@ -62,15 +90,7 @@ class SubscriptionService:
     Handles subscription creation, activation, cancellation, and retrieval.
     """
 
-    # Duration in days for each billing period
-    PERIOD_DAYS = {
-        BillingPeriod.DAILY: 1,
-        BillingPeriod.WEEKLY: 7,
-        BillingPeriod.MONTHLY: 30,
-        BillingPeriod.QUARTERLY: 90,
-        BillingPeriod.YEARLY: 365,
-        BillingPeriod.ONE_TIME: 36500,  # ~100 years for lifetime
-    }
+    PERIOD_DAYS = _PERIOD_DAYS
 
     DUNNING_DAYS = [3, 7]
 
@@ -103,7 +123,7 @@ class SubscriptionService:
         return self._subscription_repo.find_all_active_by_user(user_id)
 
     def get_active_subscription(self, user_id: UUID) -> Optional[Subscription]:
-        """Get user's active subscription.
+        """Get user's active subscription with its plans loaded.
 
         Args:
             user_id: User UUID
@@ -111,7 +131,7 @@ class SubscriptionService:
         Returns:
             Active subscription if found, None otherwise
         """
-        return self._subscription_repo.find_active_by_user(user_id)
+        return self._subscription_repo.find_active_by_user_with_plans(user_id)
 
     def get_user_subscriptions(self, user_id: UUID) -> List[Subscription]:
         """Get all user subscriptions.
@@ -124,6 +144,17 @@ class SubscriptionService:
         """
         return self._subscription_repo.find_by_user(user_id)
 
+    def iter_user_subscription_rows(self, user_id: UUID) -> Iterator[Row]:
+        """Stream all user subscriptions as column rows for list serialization.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Iterator over rows accepted by Subscription.serialize, newest first
+        """
+        return self._subscription_repo.iter_rows_by_user(user_id)
+
     def create_subscription(
         self,
         user_id: UUID,
@@ -234,7 +265,7 @@ class SubscriptionService:
 
         # Get plan for duration
         plan = subscription.tarif_plan
-        duration_days = self.PERIOD_DAYS.get(plan.billing_period, 30)
+        duration_days = period_days(plan.billing_period)
 
         # Activate using model method
         subscription.activate(duration_days)
@@ -296,7 +327,7 @@ class SubscriptionService:
 
         # Get plan for duration
         plan = subscription.tarif_plan
-        duration_days = self.PERIOD_DAYS.get(plan.billing_period, 30)
+        duration_days = period_days(plan.billing_period)
 
         # Reactivate
         subscription.activate(duration_days)
@@ -317,20 +348,31 @@ class SubscriptionService:
         """
         return self._subscription_repo.find_expiring_soon(days)
 
-    def expire_subscriptions(self) -> List[Subscription]:
+    def expire_subscriptions(
+        self, on_expired: Optional[Callable[[UUID], None]] = None
+    ) -> List[UUID]:
         """
-        Find and mark expired subscriptions.
+        Mark expired subscriptions with bulk updates.
 
-        Returns:
-            List of expired subscriptions
-        """
-        expired = self._subscription_repo.find_expired()
+        Rows are expired EXPIRY_BATCH_SIZE at a time, one transaction per
+        batch, so a large backlog never holds all its row locks at once.
 
-        for subscription in expired:
-            subscription.expire()
-            self._subscription_repo.save(subscription)
+        Args:
+            on_expired: Optional callback run for each expired subscription ID
+                once its batch is committed (e.g. to send notifications)
 
-        return expired
+        Returns:
+            IDs of the subscriptions that were expired
+        """
+        expired_ids: List[UUID] = []
+        while True:
+            batch = self._subscription_repo.bulk_expire(limit=EXPIRY_BATCH_SIZE)
+            if on_expired is not None:
+                for subscription_id in batch:
+                    on_expired(subscription_id)
+            expired_ids.extend(batch)
+            if len(batch) < EXPIRY_BATCH_SIZE:
+                return expired_ids
 
     def expire_trials(self, invoice_repo) -> list:
         """
@@ -496,7 +538,7 @@ class SubscriptionService:
             return None
 
         days_remaining = max(0, (subscription.expires_at - utcnow()).days)
-        total_days = self.PERIOD_DAYS.get(current_plan.billing_period, 30)
+        total_days = period_days(current_plan.billing_period)
 
         # Credit for unused time
         daily_rate = current_plan.price / Decimal(total_days)
@@ -577,3 +619,168 @@ class SubscriptionService:
         saved = self._subscription_repo.save(subscription)
 
         return SubscriptionResult(success=True, subscription=saved)
+
+    def _owned_fallback(
+        self,
+        subscription_id: UUID,
+        user_id: UUID,
+        action: Callable[[UUID], SubscriptionResult],
+    ) -> Optional[SubscriptionResult]:
+        """
+        Explain why a guarded owned update matched no row.
+
+        Returns None when the subscription is missing or not owned by the
+        user; otherwise runs ``action`` so its usual checks produce the error.
+        """
+        subscription = self._subscription_repo.find_by_id(subscription_id)
+        if not subscription or subscription.user_id != user_id:
+            return None
+        return action(subscription_id)
+
+    def cancel_subscription_owned(
+        self, subscription_id: UUID, user_id: UUID
+    ) -> Optional[SubscriptionResult]:
+        """
+        Cancel a subscription owned by the user in one statement.
+
+        Args:
+            subscription_id: Subscription UUID
+            user_id: Owner UUID
+
+        Returns:
+            SubscriptionResult with cancelled subscription, or None if the
+            subscription is not found or not owned by the user
+        """
+        subscription = self._subscription_repo.update_owned(
+            subscription_id,
+            user_id,
+            status=SubscriptionStatus.CANCELLED,
+            cancelled_at=utcnow(),
+        )
+        if subscription is None:
+            return None
+        return SubscriptionResult(success=True, subscription=subscription)
+
+    def pause_subscription_owned(
+        self, subscription_id: UUID, user_id: UUID
+    ) -> Optional[SubscriptionResult]:
+        """
+        Pause an active subscription owned by the user.
+
+        Args:
+            subscription_id: Subscription UUID
+            user_id: Owner UUID
+
+        Returns:
+            SubscriptionResult, or None if not found or not owned by the user
+        """
+        subscription = self._subscription_repo.update_owned(
+            subscription_id,
+            user_id,
+            Subscription.status == SubscriptionStatus.ACTIVE,
+            status=SubscriptionStatus.PAUSED,
+            paused_at=utcnow(),
+        )
+        if subscription is None:
+            return self._owned_fallback(
+                subscription_id, user_id, self.pause_subscription
+            )
+        return SubscriptionResult(success=True, subscription=subscription)
+
+    def resume_subscription_owned(
+        self, subscription_id: UUID, user_id: UUID
+    ) -> Optional[SubscriptionResult]:
+        """
+        Resume a paused subscription owned by the user.
+
+        The expiration is extended by the pause duration in the same UPDATE.
+
+        Args:
+            subscription_id: Subscription UUID
+            user_id: Owner UUID
+
+        Returns:
+            SubscriptionResult, or None if not found or not owned by the user
+        """
+        now = utcnow()
+        subscription = self._subscription_repo.update_owned(
+            subscription_id,
+            user_id,
+            Subscription.status == SubscriptionStatus.PAUSED,
+            status=SubscriptionStatus.ACTIVE,
+            paused_at=None,
+            expires_at=case(
+                (
+                    and_(
+                        Subscription.paused_at.isnot(None),
+                        Subscription.expires_at.isnot(None),
+                    ),
+                    Subscription.expires_at + (now - Subscription.paused_at),
+                ),
+                else_=Subscription.expires_at,
+            ),
+        )
+        if subscription is None:
+            return self._owned_fallback(
+                subscription_id, user_id, self.resume_subscription
+            )
+        return SubscriptionResult(success=True, subscription=subscription)
+
+    def upgrade_subscription_owned(
+        self, subscription_id: UUID, user_id: UUID, new_plan_id: UUID
+    ) -> Optional[SubscriptionResult]:
+        """
+        Upgrade a subscription owned by the user immediately.
+
+        Args:
+            subscription_id: Subscription UUID
+            user_id: Owner UUID
+            new_plan_id: New plan UUID
+
+        Returns:
+            SubscriptionResult, or None if not found or not owned by the user
+        """
+        subscription = self._subscription_repo.update_owned(
+            subscription_id,
+            user_id,
+            Subscription.status == SubscriptionStatus.ACTIVE,
+            Subscription.tarif_plan_id != new_plan_id,
+            tarif_plan_id=new_plan_id,
+            pending_plan_id=None,
+        )
+        if subscription is None:
+            return self._owned_fallback(
+                subscription_id,
+                user_id,
+                lambda sub_id: self.upgrade_subscription(sub_id, new_plan_id),
+            )
+        return SubscriptionResult(success=True, subscription=subscription)
+
+    def downgrade_subscription_owned(
+        self, subscription_id: UUID, user_id: UUID, new_plan_id: UUID
+    ) -> Optional[SubscriptionResult]:
+        """
+        Schedule a downgrade at next renewal for a subscription owned by the user.
+
+        Args:
+            subscription_id: Subscription UUID
+            user_id: Owner UUID
+            new_plan_id: New plan UUID
+
+        Returns:
+            SubscriptionResult, or None if not found or not owned by the user
+        """
+        subscription = self._subscription_repo.update_owned(
+            subscription_id,
+            user_id,
+            Subscription.status == SubscriptionStatus.ACTIVE,
+            Subscription.tarif_plan_id != new_plan_id,
+            pending_plan_id=new_plan_id,
+        )
+        if subscription is None:
+            return self._owned_fallback(
+                subscription_id,
+                user_id,
+                lambda sub_id: self.downgrade_subscription(sub_id, new_plan_id),
+            )
+        return SubscriptionResult(success=True, subscription=subscription)
@@ -76,6 +76,27 @@ class TarifPlanService:
         Returns:
             Dictionary with plan details and pricing information
         """
+        return self.get_plans_with_pricing([plan], currency_code, country_code)[0]
+
+    def get_plans_with_pricing(
+        self,
+        plans: List[TarifPlan],
+        currency_code: str,
+        country_code: Optional[str] = None,
+    ) -> List[dict]:
+        """Get several plans with pricing details in specified currency.
+
+        The currency and the applicable tax are resolved once for the whole
+        list rather than once per plan.
+
+        Args:
+            plans: TarifPlan objects
+            currency_code: ISO currency code for display
+            country_code: Optional ISO country code for tax calculation
+
+        Returns:
+            List of dictionaries with plan details and pricing information
+        """
         if not self._currency_service:
             raise ValueError("Currency service required for pricing calculations")
 
@@ -83,26 +104,33 @@ class TarifPlanService:
         if not currency:
             raise ValueError(f"Unknown currency: {currency_code}")
 
-        result = {
-            "id": str(plan.id),
-            "name": plan.name,
-            "slug": plan.slug,
-            "display_currency": currency.code,
-            "display_price": plan.price_float,
-        }
-
-        # Add tax breakdown if country code provided
-        if country_code and self._tax_service:
-            tax_breakdown = self._tax_service.get_tax_breakdown(
-                Decimal(str(plan.price_float)), country_code
-            )
-            result.update(
-                {
-                    "net_price": tax_breakdown["net_amount"],
-                    "tax_amount": tax_breakdown["tax_amount"],
-                    "gross_price": tax_breakdown["gross_amount"],
-                    "tax_rate": tax_breakdown["tax_rate"],
-                }
-            )
-
-        return result
+        with_tax = bool(country_code and self._tax_service)
+        tax = self._tax_service.get_applicable_tax(country_code) if with_tax else None
+
+        results = []
+        for plan in plans:
+            result = {
+                "id": str(plan.id),
+                "name": plan.name,
+                "slug": plan.slug,
+                "display_currency": currency.code,
+                "display_price": plan.price_float,
+            }
+
+            # Add tax breakdown if country code provided
+            if with_tax:
+                tax_breakdown = self._tax_service.breakdown_for_tax(
+                    Decimal(str(plan.price_float)), tax
+                )
+                result.update(
+                    {
+                        "net_price": tax_breakdown["net_amount"],
+                        "tax_amount": tax_breakdown["tax_amount"],
+                        "gross_price": tax_breakdown["gross_amount"],
+                        "tax_rate": tax_breakdown["tax_rate"],
+                    }
+                )
+
+            results.append(result)
+
+        return results
@@ -105,7 +105,20 @@ class TaxService:
             Dictionary with net, tax, gross, and tax details
         """
         tax = self.get_applicable_tax(country_code, region_code)
+        return self.breakdown_for_tax(net_amount, tax)
 
+    @staticmethod
+    def breakdown_for_tax(net_amount: Decimal, tax: Optional[Tax]) -> dict:
+        """
+        Get detailed tax breakdown for an amount using an already resolved tax.
+
+        Args:
+            net_amount: Amount before tax
+            tax: Applicable Tax, or None when no tax applies
+
+        Returns:
+            Dictionary with net, tax, gross, and tax details
+        """
         if not tax:
             return {
                 "net_amount": net_amount,
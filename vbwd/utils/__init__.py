@@ -1,6 +1,11 @@
 """Utility modules."""
 from .redis_client import redis_client, RedisClient
-from .transaction import TransactionContext, UnitOfWork, transactional
+from .transaction import (
+    TransactionContext,
+    UnitOfWork,
+    in_unit_of_work,
+    transactional,
+)
 from .startup_check import validate_environment, get_missing_vars
 
 __all__ = [
@@ -8,6 +13,7 @@ __all__ = [
     "RedisClient",
     "TransactionContext",
     "UnitOfWork",
+    "in_unit_of_work",
     "transactional",
     "validate_environment",
     "get_missing_vars",
@@ -0,0 +1,155 @@
+"""HTTP caching helpers for public read-only endpoints.
+
+Provides strong-ETag JSON responses with conditional-GET (304) handling and
+a small process-local TTL cache for pre-serialized response bodies.
+"""
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from flask import Response, request
+
+from vbwd.utils.json_provider import dumps_json
+from vbwd.utils.redis_client import redis_client
+
+
+def serialize_json(payload: Any) -> bytes:
+    """Serialize a payload to compact JSON bytes, matching ``jsonify`` output."""
+    return dumps_json(payload)
+
+
+def compute_etag(body: bytes) -> str:
+    """Compute a strong ETag for a response body."""
+    return hashlib.sha256(body).hexdigest()[:16]
+
+
+class CachedJSON:
+    """Pre-serialized JSON body with its ETag."""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, payload: Any):
+        self.body = serialize_json(payload)
+        self.etag = compute_etag(self.body)
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "CachedJSON":
+        """Wrap an already-serialized JSON body (e.g. read from Redis)."""
+        cached = cls.__new__(cls)
+        cached.body = body
+        cached.etag = compute_etag(body)
+        return cached
+
+
+def conditional_json_response(
+    cached: CachedJSON, max_age: int = 3600, public: bool = True
+) -> Response:
+    """
+    Build a JSON response from a pre-serialized body.
+
+    Returns 304 Not Modified when the request's If-None-Match matches.
+
+    Args:
+        cached: Pre-serialized body and ETag
+        max_age: Cache-Control max-age in seconds
+        public: Whether shared caches may store the response
+
+    Returns:
+        Flask Response (200 with body, or empty 304)
+    """
+    if cached.etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(cached.body, mimetype="application/json")
+    response.set_etag(cached.etag)
+    response.cache_control.max_age = max_age
+    if public:
+        response.cache_control.public = True
+    else:
+        response.cache_control.private = True
+    return response
+
+
+class ResponseCache:
+    """
+    Thread-safe process-local TTL cache of pre-serialized JSON bodies.
+
+    Each worker process holds its own copy, so invalidation only reaches
+    the current process; the TTL bounds staleness for the others.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 256):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, CachedJSON]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CachedJSON]:
+        """Return the cached body for key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, cached = entry
+        if expires_at < time.monotonic():
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        return cached
+
+    def set(self, key: Hashable, payload: Any) -> CachedJSON:
+        """Serialize payload, store it under key and return it."""
+        cached = CachedJSON(payload)
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                self._entries.clear()
+            self._entries[key] = (time.monotonic() + self._ttl, cached)
+        return cached
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _redis_json_response(body: str, max_age: Optional[int]) -> Response:
+    """Wrap a JSON body from Redis, conditionally when max_age is given."""
+    if max_age is None:
+        return Response(body, mimetype="application/json")
+    cached = CachedJSON.from_body(body.encode("utf-8"))
+    return conditional_json_response(cached, max_age=max_age)
+
+
+def get_redis_json_response(
+    key: str, max_age: Optional[int] = None
+) -> Optional[Response]:
+    """
+    Return a JSON response for a body cached in Redis, or None on miss.
+
+    Args:
+        key: Redis cache key
+        max_age: When given, the response carries a strong ETag and this
+            public Cache-Control max-age, and a matching If-None-Match
+            gets an empty 304
+    """
+    body = redis_client.cache_get(key)
+    if body is None:
+        return None
+    return _redis_json_response(body, max_age)
+
+
+def set_redis_json_response(
+    key: str, payload: Any, ttl: int, max_age: Optional[int] = None
+) -> Response:
+    """
+    Serialize payload, cache the body in Redis and return it as a response.
+
+    Args:
+        key: Redis cache key
+        payload: JSON-serializable response payload
+        ttl: Time to live in seconds
+        max_age: As for ``get_redis_json_response``
+    """
+    body = serialize_json(payload).decode("utf-8")
+    redis_client.cache_set(key, body, ttl)
+    return _redis_json_response(body, max_age)
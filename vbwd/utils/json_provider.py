@@ -0,0 +1,77 @@
+"""orjson-backed JSON encoding and decoding for Flask.
+
+Output matches Flask's ``DefaultJSONProvider``: sorted keys, compact
+separators, and the same handling of dates, Decimal, UUID and dataclasses.
+Request bodies are parsed with orjson, falling back to the stdlib for the
+few inputs only it accepts.
+"""
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date
+from typing import Any
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+# Dates are passed through to _json_default so they keep Flask's HTTP-date
+# format instead of orjson's RFC 3339 output
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+
+def _json_default(o: Any) -> Any:
+    """Encode the same extra types as Flask's default JSON provider."""
+    if isinstance(o, date):
+        return http_date(o)
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps_json(payload: Any) -> bytes:
+    """Serialize a payload to compact, key-sorted JSON bytes."""
+    try:
+        return orjson.dumps(payload, default=_json_default, option=_ORJSON_OPTIONS)
+    except TypeError:
+        # orjson rejects a few values stdlib json accepts (e.g. integers
+        # wider than 64 bits); fall back rather than fail the response
+        return json.dumps(
+            payload, separators=(",", ":"), sort_keys=True, default=_json_default
+        ).encode("utf-8")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize to a string; custom json.dumps arguments use the stdlib."""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return dumps_json(obj).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON; custom json.loads arguments use the stdlib."""
+        if not kwargs:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                # NaN/Infinity and integers wider than 64 bits are rejected by
+                # orjson; the stdlib accepts them or raises the usual error
+                pass
+        return super().loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response; pretty-printed debug output uses the stdlib."""
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_json(obj), mimetype=self.mimetype)
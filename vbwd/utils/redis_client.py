@@ -60,18 +60,35 @@ class RedisClient:
         try:
             acquired = lock.acquire(blocking=True)
             if acquired:
-                logger.debug(f"Lock acquired: {key}")
+                logger.debug("Lock acquired: %s", key)
                 yield True
             else:
-                logger.warning(f"Failed to acquire lock: {key}")
+                logger.warning("Failed to acquire lock: %s", key)
                 yield False
         finally:
             if acquired:
                 try:
                     lock.release()
-                    logger.debug(f"Lock released: {key}")
+                    logger.debug("Lock released: %s", key)
                 except redis.exceptions.LockNotOwnedError:
-                    logger.warning(f"Lock expired before release: {key}")
+                    logger.warning("Lock expired before release: %s", key)
+
+    def claim(self, key: str, ttl: int) -> bool:
+        """
+        Claim a key for ``ttl`` seconds; only the first caller gets it.
+
+        Unlike ``lock``, a claim is never released; it lapses after ``ttl``.
+        That suits periodic jobs scheduled in every process that should
+        run once per interval.
+
+        Args:
+            key: Claim key name (e.g., "plan_pricing_warm")
+            ttl: Seconds the claim is held
+
+        Returns:
+            True if this caller holds the claim, False otherwise
+        """
+        return bool(self._client.set(f"claim:{key}", "1", ex=ttl, nx=True))
 
     def set_idempotency_key(
         self,
@@ -102,6 +119,67 @@ class RedisClient:
         """Get cached response for idempotency key."""
         return self._client.get(f"idempotency:{key}")
 
+    def cache_get(self, key: str) -> Optional[str]:
+        """
+        Get a cached value.
+
+        Cache reads fail open: if Redis is unavailable the caller simply
+        recomputes the value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached string or None on miss/error
+        """
+        try:
+            return self._client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+            return None
+
+    def cache_set(self, key: str, value: str, ttl: int) -> None:
+        """
+        Store a value with an expiry, ignoring Redis errors.
+
+        Args:
+            key: Cache key
+            value: Serialized value
+            ttl: Time to live in seconds
+        """
+        try:
+            self._client.set(key, value, ex=ttl)
+        except redis.RedisError as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+
+    def cache_delete(self, *keys: str) -> None:
+        """
+        Delete cache keys, ignoring Redis errors.
+
+        Args:
+            *keys: Cache keys to delete
+        """
+        try:
+            self._client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"Cache invalidation failed for {keys}: {e}")
+
+    def cache_delete_pattern(self, pattern: str) -> None:
+        """
+        Delete all keys matching a glob pattern, ignoring Redis errors.
+
+        Uses SCAN so large keyspaces are not blocked.
+
+        Args:
+            pattern: Glob pattern (e.g., "plans:v1:*")
+        """
+        try:
+            keys = list(self._client.scan_iter(match=pattern, count=500))
+            if keys:
+                self._client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"Cache invalidation failed for {pattern}: {e}")
+
     def ping(self) -> bool:
         """Test Redis connection."""
         try:
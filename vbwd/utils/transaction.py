@@ -2,6 +2,14 @@
 from functools import wraps
 from typing import Callable, Any, Union
 
+# Key in ``session.info`` under which the active UnitOfWork is recorded
+_UNIT_OF_WORK_KEY = "vbwd.unit_of_work"
+
+
+def in_unit_of_work(session) -> bool:
+    """Whether a UnitOfWork currently owns ``session``'s transaction."""
+    return isinstance(session.info.get(_UNIT_OF_WORK_KEY), UnitOfWork)
+
 
 class TransactionContext:
     """
@@ -82,6 +90,11 @@ class UnitOfWork:
                 uow.rollback()
             else:
                 uow.commit()
+
+    While a unit of work is open, repositories only flush their writes
+    (see ``BaseRepository._commit``); the unit of work commits them all
+    at once. A unit of work opened inside another one defers to the
+    outer one and neither commits nor rolls back itself.
     """
 
     def __init__(self, session):
@@ -94,13 +107,20 @@ class UnitOfWork:
         self._session = session
         self._committed = False
         self._rolled_back = False
+        self._outermost = False
 
     def __enter__(self):
         """Enter unit of work context."""
+        if not in_unit_of_work(self._session):
+            self._session.info[_UNIT_OF_WORK_KEY] = self
+            self._outermost = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit unit of work with auto-commit or rollback."""
+        if not self._outermost:
+            return False
+        self._session.info.pop(_UNIT_OF_WORK_KEY, None)
         if exc_type is not None:
             # Exception occurred - rollback if not already done
             if not self._rolled_back: